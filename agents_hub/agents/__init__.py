@@ -4,5 +4,15 @@ Agent implementations for the Agents Hub framework.
 
 from agents_hub.agents.base import Agent
 from agents_hub.agents.cognitive import CognitiveAgent
+from agents_hub.agents.batch import AgentBatch, BatchResult, BatchSummary
+from agents_hub.agents.context import ContextBuilder, ContextBuildResult
 
-__all__ = ["Agent", "CognitiveAgent"]
+__all__ = [
+    "Agent",
+    "CognitiveAgent",
+    "AgentBatch",
+    "BatchResult",
+    "BatchSummary",
+    "ContextBuilder",
+    "ContextBuildResult",
+]
@@ -3,14 +3,32 @@ Base Agent class for the Agents Hub framework.
 """
 
 import json
-from typing import Dict, List, Any, Optional, Literal
+import time
+import asyncio
+from typing import (
+    Dict,
+    List,
+    Any,
+    Optional,
+    Literal,
+    Tuple,
+    AsyncIterator,
+    Iterable,
+)
 from pydantic import BaseModel, Field
-from agents_hub.llm.base import BaseLLM
+from agents_hub.agents.batch import AgentBatch, BatchInput
+from agents_hub.agents.context import ContextBuilder
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.tokens import get_token_counter
 from agents_hub.memory.base import BaseMemory
 from agents_hub.tools.base import BaseTool
+from agents_hub.tools.cache import ToolResultCache
 from agents_hub.moderation.base import BaseContentModerator
 from agents_hub.moderation.middleware import ModerationMiddleware
 from agents_hub.monitoring.base import BaseMonitor
+from agents_hub.monitoring.blocking import blocking_scope
+from agents_hub.monitoring.dispatcher import BackgroundMonitor
+from agents_hub.utils.deadline import Deadline, DeadlineExceededError
 
 
 class AgentConfig(BaseModel):
@@ -33,6 +51,21 @@ class AgentConfig(BaseModel):
         "block", description="Action to take on moderation violation"
     )
     monitoring_enabled: bool = Field(False, description="Whether monitoring is enabled")
+    parallel_tool_calls: bool = Field(
+        False, description="Whether to run the tool calls of a response concurrently"
+    )
+    max_concurrent_tools: int = Field(
+        4, description="Maximum number of tool calls to run at the same time"
+    )
+    tool_timeout: Optional[float] = Field(
+        None, description="Default timeout in seconds for a single tool call"
+    )
+    max_input_tokens: Optional[int] = Field(
+        None, description="Token budget for the messages sent to the LLM"
+    )
+    max_tool_rounds: int = Field(
+        5, description="Maximum number of tool rounds before a final answer is forced"
+    )
 
 
 class Agent:
@@ -55,6 +88,13 @@ class Agent:
         moderation: Optional[BaseContentModerator] = None,
         on_moderation_violation: Literal["block", "warn", "log"] = "block",
         monitor: Optional[BaseMonitor] = None,
+        parallel_tool_calls: bool = False,
+        max_concurrent_tools: int = 4,
+        tool_timeout: Optional[float] = None,
+        background_monitoring: bool = False,
+        max_input_tokens: Optional[int] = None,
+        max_tool_rounds: int = 5,
+        tool_cache: Optional[ToolResultCache] = None,
     ):
         """
         Initialize an agent.
@@ -68,6 +108,23 @@ class Agent:
             description: Description of the agent's purpose and capabilities
             temperature: Temperature for LLM generation
             max_tokens: Maximum tokens for LLM generation
+            moderation: Content moderator
+            on_moderation_violation: Action to take on moderation violation
+            monitor: Monitor for tracking agent interactions
+            parallel_tool_calls: Whether to run the tool calls of a response concurrently
+            max_concurrent_tools: Maximum number of tool calls to run at the same time
+            tool_timeout: Default timeout in seconds for a single tool call
+                (a tool's own ``timeout`` attribute takes precedence)
+            background_monitoring: Whether to wrap the monitor in a
+                BackgroundMonitor so tracking never blocks the run; call
+                ``flush_monitoring()`` before reading conversation data back
+                from the monitor or shutting down
+            max_input_tokens: Optional token budget for the messages sent to the
+                LLM; older history turns are compacted or dropped to fit it
+            max_tool_rounds: Maximum number of rounds of tool calls per run; once
+                reached, the LLM must answer without tools
+            tool_cache: Optional cache for the results of cacheable tools; it can
+                be shared between agents
         """
         self.config = AgentConfig(
             name=name,
@@ -79,12 +136,23 @@ class Agent:
             moderation_enabled=moderation is not None,
             on_moderation_violation=on_moderation_violation,
             monitoring_enabled=monitor is not None,
+            parallel_tool_calls=parallel_tool_calls,
+            max_concurrent_tools=max_concurrent_tools,
+            tool_timeout=tool_timeout,
+            max_input_tokens=max_input_tokens,
+            max_tool_rounds=max_tool_rounds,
         )
 
         self.llm = llm
         self.memory = memory
         self.tools = tools or []
         self._tool_map = {tool.name: tool for tool in self.tools}
+        self.tool_cache = tool_cache
+
+        # Set up token-budgeted context assembly if a budget is given
+        self.context_builder = None
+        if max_input_tokens:
+            self.context_builder = ContextBuilder(llm, max_input_tokens)
 
         # Set up moderation if provided
         self.moderation = moderation
@@ -97,7 +165,13 @@ class Agent:
         else:
             self.moderation_middleware = None
 
-        # Set up monitoring if provided
+        # Set up monitoring if provided, delivering events in the background
+        if (
+            background_monitoring
+            and isinstance(monitor, BaseMonitor)
+            and not isinstance(monitor, BackgroundMonitor)
+        ):
+            monitor = BackgroundMonitor(monitor)
         self.monitor = monitor
 
     async def run(
@@ -106,6 +180,17 @@ class Agent:
         """
         Run the agent on the given input text.
 
+        A deadline for the whole run can be given in the context, either as a
+        ``Deadline`` under ``deadline`` or as a number of seconds under
+        ``timeout``. Every stage of the run is bounded by it, and the run raises
+        ``DeadlineExceededError`` once it passes. Cancelling the task running
+        the agent aborts the in-flight LLM call and tools. Both are recorded as
+        a cancellation by the monitor.
+
+        A ``response_schema`` in the context, a JSON Schema dictionary or a
+        pydantic model class, has the LLM answer with a JSON document that
+        follows it, using the provider's structured output.
+
         Args:
             input_text: The input text to process
             context: Optional context information
@@ -113,73 +198,57 @@ class Agent:
         Returns:
             The agent's response
         """
-        context = context or {}
-        conversation_id = context.get("conversation_id", "default")
+        context = self._prepare_context(context)
+        started_at = time.monotonic()
 
-        # Start monitoring if enabled
-        if self.config.monitoring_enabled and self.monitor:
-            # Start a conversation trace with user_id
-            await self.monitor.start_conversation(
-                conversation_id=conversation_id,
-                agent_name=self.config.name,
-                user_id=context.get("user_id"),
-                metadata=context.get("metadata"),
-            )
-
-            # Track the user message
-            await self.monitor.track_user_message(
-                message=input_text,
-                conversation_id=conversation_id,
-                agent_name=self.config.name,
-                user_id=context.get("user_id"),
-                metadata=context.get("metadata"),
-            )
+        try:
+            with blocking_scope("agent", self.config.name):
+                return await self._run(input_text, context)
+        except (asyncio.CancelledError, DeadlineExceededError) as e:
+            await self._track_cancellation(e, context, started_at)
+            raise
 
-        # Apply moderation to input if enabled
-        if self.config.moderation_enabled and self.moderation_middleware:
-            moderated_input = await self.moderation_middleware.process_input(input_text)
-            if moderated_input != input_text:
-                # Input was blocked by moderation
-                if self.config.monitoring_enabled and self.monitor:
-                    await self.monitor.track_error(
-                        error="Input blocked by moderation",
-                        conversation_id=conversation_id,
-                        agent_name=self.config.name,
-                    )
-                return moderated_input
-            input_text = moderated_input
+    async def _run(self, input_text: str, context: Dict[str, Any]) -> str:
+        """
+        Run the agent on the given input text (implementation).
 
-        # Get conversation history from memory if available
-        history = []
-        if self.memory:
-            history = await self.memory.get_history(conversation_id)
+        Args:
+            input_text: The input text to process
+            context: Context information
 
-        # Prepare messages for the LLM
-        messages = self._prepare_messages(input_text, history)
+        Returns:
+            The agent's response
+        """
+        conversation_id = context.get("conversation_id", "default")
 
-        # Track LLM call if monitoring is enabled
-        if self.config.monitoring_enabled and self.monitor:
-            await self.monitor.track_llm_call(
-                provider=self.llm.__class__.__name__,
-                model=getattr(self.llm, "model", "unknown"),
-                messages=messages,
-                conversation_id=conversation_id,
-                agent_name=self.config.name,
-                user_id=context.get("user_id"),
-                input_tokens=context.get("input_tokens"),
-            )
+        input_text, messages, blocked_response = await self._prepare_run(
+            input_text, context
+        )
+        if blocked_response is not None:
+            return blocked_response
 
         try:
             # Get response from LLM
-            response = await self.llm.generate(
-                messages=messages,
-                tools=self.tools if self.config.tools_enabled else None,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
+            with blocking_scope("provider", type(self.llm).__name__):
+                response = await self._wait(
+                    self.llm.generate(
+                        messages=messages,
+                        tools=self.tools if self.config.tools_enabled else None,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens,
+                        **self._generation_options(context),
+                    ),
+                    context,
+                    "LLM call",
+                )
+
+            self._calibrate_token_counter(
+                messages, response, bool(self.tools and self.config.tools_enabled)
             )
 
             # Track LLM result if monitoring is enabled
             if self.config.monitoring_enabled and self.monitor:
+                cached_tokens, cache_write_tokens = self._cache_usage(response)
                 await self.monitor.track_llm_result(
                     provider=self.llm.__class__.__name__,
                     model=getattr(self.llm, "model", "unknown"),
@@ -188,22 +257,29 @@ class Agent:
                     agent_name=self.config.name,
                     user_id=context.get("user_id"),
                     input_tokens=context.get("input_tokens"),
+                    cached_tokens=cached_tokens,
+                    cache_write_tokens=cache_write_tokens,
+                    from_cache=response.cached,
                 )
 
             # Process tool calls if any
             if response.tool_calls and self.config.tools_enabled:
                 final_response = await self._process_tool_calls(
-                    response.tool_calls, messages, context
+                    response.tool_calls, messages, context, response.content
                 )
             else:
                 final_response = response.content
 
             # Apply moderation to output if enabled
             if self.config.moderation_enabled and self.moderation_middleware:
-                final_response = await self.moderation_middleware.process_output(
-                    final_response
+                final_response = await self._wait(
+                    self.moderation_middleware.process_output(final_response),
+                    context,
+                    "output moderation",
                 )
 
+        except DeadlineExceededError:
+            raise
         except Exception as e:
             # Track error if monitoring is enabled
             if self.config.monitoring_enabled and self.monitor:
@@ -215,14 +291,474 @@ class Agent:
                 )
             raise
 
-        # Save to memory if available
+        await self._finalize_run(input_text, final_response, context)
+
+        return final_response
+
+    def run_many(
+        self,
+        inputs: Iterable[BatchInput],
+        concurrency: int = 8,
+        return_exceptions: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AgentBatch:
+        """
+        Run the agent on many independent inputs with bounded concurrency.
+
+        The runs share this agent's LLM client and tool instances. Iterate the
+        returned batch to receive results as they finish; its ``summary``
+        reports throughput and latency percentiles.
+
+        Args:
+            inputs: Input texts, or (input text, context) tuples
+            concurrency: Maximum number of runs in flight
+            return_exceptions: Whether failed runs are yielded as results with
+                ``error`` set instead of aborting the batch
+            context: Optional context shared by all runs
+
+        Returns:
+            AgentBatch to iterate over
+        """
+        return AgentBatch(
+            self,
+            inputs,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+            context=context,
+        )
+
+    async def run_stream(
+        self, input_text: str, context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Run the agent on the given input text, streaming the response.
+
+        Text is yielded as the LLM produces it. If the LLM requests tools, they
+        are executed and the follow-up answer is streamed in turn. When output
+        moderation is enabled the response is moderated as a whole before it is
+        yielded, since moderation cannot judge a partial response.
+
+        The complete response is still written to memory and monitoring.
+
+        Deadlines and cancellation are handled as in ``run``.
+
+        Args:
+            input_text: The input text to process
+            context: Optional context information
+
+        Yields:
+            Fragments of the agent's response
+        """
+        context = self._prepare_context(context)
+        started_at = time.monotonic()
+        stream = self._run_stream(input_text, context)
+
+        try:
+            while True:
+                # Scoped per fragment, so the consumer's code between the
+                # fragments is not attributed to the agent
+                with blocking_scope("agent", self.config.name):
+                    try:
+                        part = await stream.__anext__()
+                    except StopAsyncIteration:
+                        break
+                yield part
+        except (asyncio.CancelledError, DeadlineExceededError) as e:
+            await self._track_cancellation(e, context, started_at)
+            raise
+        finally:
+            await stream.aclose()
+
+    async def _run_stream(
+        self, input_text: str, context: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """
+        Run the agent on the given input text, streaming the response
+        (implementation).
+
+        Args:
+            input_text: The input text to process
+            context: Context information
+
+        Yields:
+            Fragments of the agent's response
+        """
+        conversation_id = context.get("conversation_id", "default")
+        deadline = context.get("deadline")
+
+        input_text, messages, blocked_response = await self._prepare_run(
+            input_text, context
+        )
+        if blocked_response is not None:
+            yield blocked_response
+            return
+
+        buffer_output = bool(
+            self.config.moderation_enabled and self.moderation_middleware
+        )
+        parts: List[str] = []
+        tools = self.tools if self.config.tools_enabled else None
+        tool_round = 0
+
+        try:
+            while True:
+                tool_calls = None
+                raw_response = None
+                from_cache = False
+                round_parts: List[str] = []
+                stream = self.llm.stream(
+                    messages=messages,
+                    tools=tools,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens,
+                    **self._generation_options(context),
+                )
+                while True:
+                    # Bound the wait for every chunk by the deadline
+                    try:
+                        if deadline:
+                            chunk = await deadline.wait_for(
+                                stream.__anext__(), "LLM stream"
+                            )
+                        else:
+                            chunk = await stream.__anext__()
+                    except StopAsyncIteration:
+                        break
+
+                    if chunk.content:
+                        round_parts.append(chunk.content)
+                        if not buffer_output:
+                            yield chunk.content
+                    if chunk.done:
+                        tool_calls = chunk.tool_calls
+                        raw_response = chunk.raw_response
+                        from_cache = chunk.cached
+
+                round_response = "".join(round_parts)
+                parts.append(round_response)
+                self._calibrate_token_counter(
+                    messages, LLMResponse(raw_response=raw_response), bool(tools)
+                )
+
+                # Track LLM result if monitoring is enabled
+                if self.config.monitoring_enabled and self.monitor:
+                    cached_tokens, cache_write_tokens = self._cache_usage(
+                        LLMResponse(raw_response=raw_response)
+                    )
+                    await self.monitor.track_llm_result(
+                        provider=self.llm.__class__.__name__,
+                        model=getattr(self.llm, "model", "unknown"),
+                        result={
+                            "content": round_response,
+                            "tool_calls": tool_calls,
+                        },
+                        conversation_id=conversation_id,
+                        agent_name=self.config.name,
+                        user_id=context.get("user_id"),
+                        input_tokens=context.get("input_tokens"),
+                        cached_tokens=cached_tokens,
+                        cache_write_tokens=cache_write_tokens,
+                        metadata={"tool_round": tool_round},
+                        from_cache=from_cache,
+                    )
+
+                if not (tool_calls and tools):
+                    break
+
+                # Run the tools, then stream the follow-up answer
+                tool_round += 1
+                results = await self._run_tool_calls(tool_calls, context)
+                self._append_tool_results(messages, results, round_response)
+                if tool_round >= max(1, self.config.max_tool_rounds):
+                    # Out of rounds, so the LLM has to answer without tools
+                    tools = None
+
+            final_response = "".join(parts)
+
+            # Apply moderation to output if enabled
+            if buffer_output:
+                final_response = await self._wait(
+                    self.moderation_middleware.process_output(final_response),
+                    context,
+                    "output moderation",
+                )
+                yield final_response
+
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            # Track error if monitoring is enabled
+            if self.config.monitoring_enabled and self.monitor:
+                await self.monitor.track_error(
+                    error=str(e),
+                    conversation_id=conversation_id,
+                    agent_name=self.config.name,
+                    user_id=context.get("user_id"),
+                )
+            raise
+
+        await self._finalize_run(input_text, final_response, context)
+
+    async def _prepare_run(
+        self, input_text: str, context: Dict[str, Any]
+    ) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+        """
+        Run the steps that precede the LLM call as a staged pipeline.
+
+        Input moderation, the history lookup and the tracking of the user
+        message are independent of each other, so they run concurrently; only
+        the moderation and history results gate the prompt. The tracking is
+        awaited before the LLM call is tracked, so events keep their order.
+        With ``background_monitoring`` the events are handed to a background
+        dispatcher (see ``BackgroundMonitor``) and never wait on the backend.
+
+        Args:
+            input_text: The input text to process
+            context: Context information
+
+        Returns:
+            Tuple of (moderated input text, messages for the LLM, blocked
+            response). The blocked response is None unless moderation blocked
+            the input, in which case it should be returned to the user as is.
+        """
+        conversation_id = context.get("conversation_id", "default")
+
+        # Start monitoring if enabled, alongside moderation and history
+        monitoring_task = None
+        if self.config.monitoring_enabled and self.monitor:
+            monitoring_task = asyncio.ensure_future(
+                self._track_user_message(input_text, context)
+            )
+
+        # Moderate the input and load the history concurrently
+        moderation_task = None
+        if self.config.moderation_enabled and self.moderation_middleware:
+            moderation_task = asyncio.ensure_future(
+                self.moderation_middleware.process_input(input_text)
+            )
+        history_task = None
         if self.memory:
-            await self.memory.add_interaction(
+            with blocking_scope("memory", type(self.memory).__name__):
+                history_task = asyncio.ensure_future(
+                    self.memory.get_history(conversation_id)
+                )
+
+        pending = [task for task in (moderation_task, history_task) if task]
+        try:
+            if pending:
+                await self._wait(
+                    asyncio.gather(*pending), context, "input moderation and history"
+                )
+        except BaseException:
+            for task in pending + [monitoring_task]:
+                if task is not None:
+                    task.cancel()
+            raise
+
+        # The conversation trace must exist before the next events
+        if monitoring_task is not None:
+            await monitoring_task
+
+        # Apply moderation to input if enabled
+        if moderation_task is not None:
+            moderated_input = moderation_task.result()
+            if moderated_input is not None and moderated_input != input_text:
+                # Input was blocked by moderation
+                if self.config.monitoring_enabled and self.monitor:
+                    await self.monitor.track_error(
+                        error="Input blocked by moderation",
+                        conversation_id=conversation_id,
+                        agent_name=self.config.name,
+                    )
+                return input_text, [], moderated_input
+
+        # Get conversation history from memory if available
+        history = history_task.result() if history_task is not None else []
+
+        # Prepare messages for the LLM, within the token budget if one is set
+        input_tokens = context.get("input_tokens")
+        metadata = None
+        if self.context_builder:
+            built = self.context_builder.build(
+                self.config.system_prompt, history, input_text
+            )
+            messages = built.messages
+            input_tokens = input_tokens or built.input_tokens
+            metadata = {
+                "context_tokens": built.input_tokens,
+                "trimmed_tokens": built.trimmed_tokens,
+                "dropped_turns": built.dropped_turns,
+                "compacted_turns": built.compacted_turns,
+            }
+        else:
+            messages = self._prepare_messages(input_text, history)
+
+        # Track LLM call if monitoring is enabled
+        if self.config.monitoring_enabled and self.monitor:
+            await self.monitor.track_llm_call(
+                provider=self.llm.__class__.__name__,
+                model=getattr(self.llm, "model", "unknown"),
+                messages=messages,
                 conversation_id=conversation_id,
-                user_message=input_text,
-                assistant_message=final_response,
+                agent_name=self.config.name,
+                user_id=context.get("user_id"),
+                input_tokens=input_tokens,
+                metadata=metadata,
             )
 
+        return input_text, messages, None
+
+    async def _track_user_message(
+        self, input_text: str, context: Dict[str, Any]
+    ) -> None:
+        """
+        Start the conversation trace and track the user message.
+
+        Args:
+            input_text: The input text to process
+            context: Context information
+        """
+        conversation_id = context.get("conversation_id", "default")
+
+        # Start a conversation trace with user_id
+        await self.monitor.start_conversation(
+            conversation_id=conversation_id,
+            agent_name=self.config.name,
+            user_id=context.get("user_id"),
+            metadata=context.get("metadata"),
+        )
+
+        # Track the user message
+        await self.monitor.track_user_message(
+            message=input_text,
+            conversation_id=conversation_id,
+            agent_name=self.config.name,
+            user_id=context.get("user_id"),
+            metadata=context.get("metadata"),
+        )
+
+    def _prepare_context(self, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Resolve the deadline of a run and store it in its context.
+
+        The caller's context is not modified.
+
+        Args:
+            context: Optional context information
+
+        Returns:
+            Context for the run, with a ``Deadline`` under ``deadline`` if the
+            run has one
+        """
+        context = dict(context or {})
+        deadline = Deadline.from_context(context)
+        if deadline is not None:
+            context["deadline"] = deadline
+        return context
+
+    def _generation_options(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the per-run generation options of the LLM calls from the context.
+
+        Args:
+            context: Context information
+
+        Returns:
+            Keyword arguments for the LLM, with the ``response_schema`` if the
+            run has one
+        """
+        response_schema = context.get("response_schema")
+        if response_schema is None:
+            return {}
+        return {"response_schema": response_schema}
+
+    async def _wait(
+        self, awaitable: Any, context: Dict[str, Any], operation: str
+    ) -> Any:
+        """
+        Await a stage of the run, bounded by the run's deadline if it has one.
+
+        Args:
+            awaitable: Stage to await
+            context: Context information
+            operation: Name of the stage, used in the error message
+
+        Returns:
+            Result of the stage
+        """
+        deadline = context.get("deadline")
+        if deadline is None:
+            return await awaitable
+        return await deadline.wait_for(awaitable, operation)
+
+    async def _track_cancellation(
+        self, error: BaseException, context: Dict[str, Any], started_at: float
+    ) -> None:
+        """
+        Track a run that was cancelled or ran past its deadline.
+
+        Args:
+            error: The CancelledError or DeadlineExceededError
+            context: Context information
+            started_at: Monotonic time at which the run started
+        """
+        if not (self.config.monitoring_enabled and self.monitor):
+            return
+
+        if isinstance(error, DeadlineExceededError):
+            reason = "deadline_exceeded"
+            metadata = {"operation": error.operation}
+        else:
+            reason = "cancelled"
+            metadata = None
+
+        await self.monitor.track_cancellation(
+            reason=reason,
+            conversation_id=context.get("conversation_id", "default"),
+            agent_name=self.config.name,
+            user_id=context.get("user_id"),
+            elapsed=time.monotonic() - started_at,
+            metadata=metadata,
+        )
+
+    async def flush_monitoring(self) -> None:
+        """
+        Wait until all monitoring events of this agent have been delivered.
+
+        Call this before shutting down to avoid losing the last events.
+        """
+        if isinstance(self.monitor, BackgroundMonitor):
+            await self.monitor.flush()
+
+    async def _finalize_run(
+        self,
+        input_text: str,
+        final_response: str,
+        context: Dict[str, Any],
+    ) -> None:
+        """
+        Run the steps that follow a completed response.
+
+        Args:
+            input_text: The (moderated) input text
+            final_response: The agent's final response
+            context: Context information
+        """
+        conversation_id = context.get("conversation_id", "default")
+
+        # Save to memory if available
+        if self.memory:
+            with blocking_scope("memory", type(self.memory).__name__):
+                await self._wait(
+                    self.memory.add_interaction(
+                        conversation_id=conversation_id,
+                        user_message=input_text,
+                        assistant_message=final_response,
+                    ),
+                    context,
+                    "memory write",
+                )
+
         # Track assistant message if monitoring is enabled
         if self.config.monitoring_enabled and self.monitor:
             await self.monitor.track_assistant_message(
@@ -233,14 +769,16 @@ class Agent:
                 metadata=context.get("metadata"),
             )
 
-        return final_response
-
     def _prepare_messages(
         self, input_text: str, history: List[Dict[str, str]]
     ) -> List[Dict[str, str]]:
         """
         Prepare messages for the LLM.
 
+        The messages are ordered from the most to the least stable (system
+        prompt, history, new input), so a turn repeats the previous turn's
+        messages verbatim as its prefix, which providers can cache.
+
         Args:
             input_text: The input text to process
             history: Conversation history
@@ -271,106 +809,256 @@ class Agent:
         tool_calls: List[Dict[str, Any]],
         messages: List[Dict[str, Any]],
         context: Dict[str, Any],
+        content: Optional[str] = None,
     ) -> str:
         """
-        Process tool calls from the LLM.
+        Process tool calls from the LLM in a loop of tool rounds.
+
+        Each round runs the requested tools, appends them to the messages, and
+        asks the LLM again with the tools still available, so it can chain
+        tools. The loop ends when the LLM answers without tool calls, or after
+        ``max_tool_rounds`` rounds, when the LLM is asked to answer without
+        tools. The token and latency figures of every round are tracked by the
+        monitor.
 
         Args:
             tool_calls: List of tool calls from the LLM
             messages: Current message history
             context: Context information
+            content: Optional text that accompanied the tool calls
 
         Returns:
             Final response after processing tool calls
         """
-        conversation_id = context.get("conversation_id", "default")
+        tools = self.tools if self.config.tools_enabled else None
+        max_rounds = max(1, self.config.max_tool_rounds)
 
-        # Process each tool call
-        for tool_call in tool_calls:
-            # Ensure tool call has the required fields
-            if "type" not in tool_call:
-                tool_call["type"] = "function"
+        for tool_round in range(1, max_rounds + 1):
+            # Run the tools, concurrently if enabled
+            started_at = time.perf_counter()
+            results = await self._run_tool_calls(tool_calls, context)
+            tool_latency = time.perf_counter() - started_at
+            self._append_tool_results(messages, results, content)
 
-            # Create an assistant message with this tool call
-            assistant_message = {
-                "role": "assistant",
-                "content": None,
-                "tool_calls": [tool_call],
+            round_metadata = {
+                "tool_round": tool_round,
+                "tool_calls": len(tool_calls),
+                "tool_latency": tool_latency,
             }
+            await self._track_round_call(messages, context, round_metadata)
 
-            # Add the assistant message with the tool call
-            messages.append(assistant_message)
+            # Ask the LLM again, without tools once the rounds are used up
+            started_at = time.perf_counter()
+            with blocking_scope("provider", type(self.llm).__name__):
+                response = await self._wait(
+                    self.llm.generate(
+                        messages=messages,
+                        tools=tools if tool_round < max_rounds else None,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens,
+                        **self._generation_options(context),
+                    ),
+                    context,
+                    "LLM call",
+                )
+            round_metadata["llm_latency"] = time.perf_counter() - started_at
+            self._calibrate_token_counter(
+                messages, response, bool(tools and tool_round < max_rounds)
+            )
+            await self._track_round_result(response, context, round_metadata)
 
-            # Get tool details
-            tool_name = tool_call.get("function", {}).get("name")
-            tool_args_str = tool_call.get("function", {}).get("arguments", "{}")
+            if not response.tool_calls:
+                break
+            tool_calls = response.tool_calls
+            content = response.content
 
-            # Parse tool arguments
-            try:
-                if isinstance(tool_args_str, str):
-                    tool_args = json.loads(tool_args_str)
-                else:
-                    tool_args = tool_args_str
-            except json.JSONDecodeError:
-                tool_args = {"query": tool_args_str}  # Fallback for non-JSON strings
+        return response.content
 
-            # Get the tool
-            tool = self._tool_map.get(tool_name)
-            if not tool:
-                tool_result = {"error": f"Tool '{tool_name}' not found"}
+    async def _track_round_call(
+        self,
+        messages: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        metadata: Dict[str, Any],
+    ) -> None:
+        """
+        Track the LLM call that follows a tool round.
 
-                # Track error if monitoring is enabled
-                if self.config.monitoring_enabled and self.monitor:
-                    await self.monitor.track_error(
-                        error=f"Tool '{tool_name}' not found",
-                        conversation_id=conversation_id,
-                        agent_name=self.config.name,
-                    )
-            else:
-                try:
-                    # Track tool call if monitoring is enabled
-                    if self.config.monitoring_enabled and self.monitor:
-                        await self.monitor.track_tool_usage(
-                            tool_name=tool_name,
-                            input_data=tool_args,
-                            output_data=None,  # Will be updated after tool execution
-                            conversation_id=conversation_id,
-                            agent_name=self.config.name,
-                            user_id=context.get("user_id"),
-                        )
-
-                    # Run the tool
-                    tool_result = await tool.run(tool_args, context)
-
-                    # Track tool result if monitoring is enabled
-                    if self.config.monitoring_enabled and self.monitor:
-                        await self.monitor.track_tool_usage(
-                            tool_name=tool_name,
-                            input_data=tool_args,
-                            output_data=tool_result,
-                            conversation_id=conversation_id,
-                            agent_name=self.config.name,
-                            user_id=context.get("user_id"),
-                        )
-                except Exception as e:
-                    error_message = f"Error running tool '{tool_name}': {str(e)}"
-                    tool_result = {"error": error_message}
-
-                    # Track error if monitoring is enabled
-                    if self.config.monitoring_enabled and self.monitor:
-                        await self.monitor.track_error(
-                            error=error_message,
-                            conversation_id=conversation_id,
-                            agent_name=self.config.name,
-                            user_id=context.get("user_id"),
-                        )
+        Args:
+            messages: Messages sent to the LLM
+            context: Context information
+            metadata: Figures of the tool round
+        """
+        if not (self.config.monitoring_enabled and self.monitor):
+            return
+
+        await self.monitor.track_llm_call(
+            provider=self.llm.__class__.__name__,
+            model=getattr(self.llm, "model", "unknown"),
+            messages=messages,
+            conversation_id=context.get("conversation_id", "default"),
+            agent_name=self.config.name,
+            user_id=context.get("user_id"),
+            metadata=dict(metadata),
+        )
+
+    async def _track_round_result(
+        self,
+        response: LLMResponse,
+        context: Dict[str, Any],
+        metadata: Dict[str, Any],
+    ) -> None:
+        """
+        Track the LLM result of a tool round, with its token and latency figures.
+
+        Args:
+            response: Response from the LLM
+            context: Context information
+            metadata: Figures of the tool round
+        """
+        if not (self.config.monitoring_enabled and self.monitor):
+            return
+
+        input_tokens, output_tokens = self._token_usage(response)
+        cached_tokens, cache_write_tokens = self._cache_usage(response)
+        await self.monitor.track_llm_result(
+            provider=self.llm.__class__.__name__,
+            model=getattr(self.llm, "model", "unknown"),
+            result=response.model_dump(),
+            conversation_id=context.get("conversation_id", "default"),
+            agent_name=self.config.name,
+            user_id=context.get("user_id"),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=(
+                input_tokens + output_tokens
+                if input_tokens is not None and output_tokens is not None
+                else None
+            ),
+            cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
+            metadata=dict(metadata),
+            from_cache=response.cached,
+        )
+
+    def _token_usage(
+        self, response: LLMResponse
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get the token usage reported by the provider for a response.
+
+        Args:
+            response: Response from the LLM
+
+        Returns:
+            Tuple of (input tokens, output tokens), None where not reported
+        """
+        raw = response.raw_response or {}
+        usage = raw.get("usage") or {}
+        if "prompt_tokens" in usage:
+            return usage.get("prompt_tokens"), usage.get("completion_tokens")
+        if "input_tokens" in usage:
+            # Claude leaves the tokens read from or written to the cache out
+            # of the input tokens
+            input_tokens = (
+                usage["input_tokens"]
+                + (usage.get("cache_read_input_tokens") or 0)
+                + (usage.get("cache_creation_input_tokens") or 0)
+            )
+            return input_tokens, usage.get("output_tokens")
+
+        gemini_usage = raw.get("usage_metadata") or {}
+        if "prompt_token_count" in gemini_usage:
+            return (
+                gemini_usage.get("prompt_token_count"),
+                gemini_usage.get("candidates_token_count"),
+            )
+
+        # Ollama reports evaluation counts at the top level
+        return raw.get("prompt_eval_count"), raw.get("eval_count")
+
+    def _calibrate_token_counter(
+        self,
+        messages: List[Dict[str, Any]],
+        response: LLMResponse,
+        tools_sent: bool,
+    ) -> None:
+        """
+        Calibrate the token estimate of the LLM with the usage it reported.
 
+        Args:
+            messages: Messages sent to the LLM
+            response: Response from the LLM
+            tools_sent: Whether tool definitions were sent, which count as
+                input tokens that are not part of the messages
+        """
+        input_tokens, _ = self._token_usage(response)
+        if tools_sent or not input_tokens:
+            return
+
+        try:
+            provider = self.llm.provider_name
+        except NotImplementedError:
+            provider = type(self.llm).__name__
+        get_token_counter().calibrate_messages(
+            messages, getattr(self.llm, "model", ""), provider, input_tokens
+        )
+
+    def _cache_usage(
+        self, response: LLMResponse
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get the prompt caching figures reported by the provider for a response.
+
+        Args:
+            response: Response from the LLM
+
+        Returns:
+            Tuple of (input tokens read from the cache, input tokens written
+            to the cache), None where not reported
+        """
+        usage = (response.raw_response or {}).get("usage") or {}
+        if "prompt_tokens" in usage:
+            # OpenAI caches prefixes automatically and only reports reads
+            details = usage.get("prompt_tokens_details") or {}
+            return details.get("cached_tokens"), None
+        return (
+            usage.get("cache_read_input_tokens"),
+            usage.get("cache_creation_input_tokens"),
+        )
+
+    def _append_tool_results(
+        self,
+        messages: List[Dict[str, Any]],
+        results: List[Tuple[Dict[str, Any], Any]],
+        content: Optional[str] = None,
+    ) -> None:
+        """
+        Append a round of tool calls and their results to the message history.
+
+        All calls of the round are packed into a single assistant message,
+        followed by one tool message per call.
+
+        Args:
+            messages: Current message history
+            results: List of (tool_call, tool_result) pairs in call order
+            content: Optional text that accompanied the tool calls
+        """
+        # Create one assistant message carrying all tool calls of the round
+        messages.append(
+            {
+                "role": "assistant",
+                "content": content or None,
+                "tool_calls": [tool_call for tool_call, _ in results],
+            }
+        )
+
+        for tool_call, tool_result in results:
             # Get the tool call ID
             tool_call_id = tool_call.get("id")
             if not tool_call_id:
                 continue  # Skip if no ID
 
-            # Add the tool result message immediately after the assistant message
+            # Add the tool result messages in call order
             tool_result_str = (
                 json.dumps(tool_result)
                 if isinstance(tool_result, dict)
@@ -384,14 +1072,163 @@ class Agent:
                 }
             )
 
-        # Get final response from LLM
-        final_response = await self.llm.generate(
-            messages=messages,
-            temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens,
-        )
+    async def _run_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        context: Dict[str, Any],
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        Run a batch of tool calls.
+
+        When parallel tool calls are enabled the calls run concurrently, bounded
+        by ``max_concurrent_tools``. Results are always returned in the order of
+        the original calls.
+
+        Args:
+            tool_calls: List of tool calls from the LLM
+            context: Context information
+
+        Returns:
+            List of (tool_call, tool_result) pairs in call order
+        """
+        if not self.config.parallel_tool_calls or len(tool_calls) < 2:
+            return [
+                (tool_call, await self._execute_tool_call(tool_call, context))
+                for tool_call in tool_calls
+            ]
+
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_tools))
+
+        async def run_with_limit(tool_call: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._execute_tool_call(tool_call, context)
+
+        tasks = [
+            asyncio.ensure_future(run_with_limit(tool_call)) for tool_call in tool_calls
+        ]
+        try:
+            tool_results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Abort the calls still running, e.g. when the deadline passed
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(zip(tool_calls, tool_results))
+
+    async def _execute_tool_call(
+        self, tool_call: Dict[str, Any], context: Dict[str, Any]
+    ) -> Any:
+        """
+        Execute a single tool call, including timeout handling and monitoring.
+
+        Errors are never raised; they are returned as ``{"error": ...}`` results
+        so the LLM can see them.
+
+        Args:
+            tool_call: Tool call from the LLM
+            context: Context information
+
+        Returns:
+            Result of the tool call
+        """
+        conversation_id = context.get("conversation_id", "default")
+
+        # Ensure tool call has the required fields
+        if "type" not in tool_call:
+            tool_call["type"] = "function"
+
+        # Get tool details
+        tool_name = tool_call.get("function", {}).get("name")
+        tool_args_str = tool_call.get("function", {}).get("arguments", "{}")
+
+        # Parse tool arguments
+        try:
+            if isinstance(tool_args_str, str):
+                tool_args = json.loads(tool_args_str)
+            else:
+                tool_args = tool_args_str
+        except json.JSONDecodeError:
+            tool_args = {"query": tool_args_str}  # Fallback for non-JSON strings
+
+        # Get the tool
+        tool = self._tool_map.get(tool_name)
+        if not tool:
+            # Track error if monitoring is enabled
+            if self.config.monitoring_enabled and self.monitor:
+                await self.monitor.track_error(
+                    error=f"Tool '{tool_name}' not found",
+                    conversation_id=conversation_id,
+                    agent_name=self.config.name,
+                )
+            return {"error": f"Tool '{tool_name}' not found"}
+
+        timeout = getattr(tool, "timeout", None) or self.config.tool_timeout
+        deadline = context.get("deadline")
+
+        try:
+            # Track tool call if monitoring is enabled
+            if self.config.monitoring_enabled and self.monitor:
+                await self.monitor.track_tool_usage(
+                    tool_name=tool_name,
+                    input_data=tool_args,
+                    output_data=None,  # Will be updated after tool execution
+                    conversation_id=conversation_id,
+                    agent_name=self.config.name,
+                    user_id=context.get("user_id"),
+                )
+
+            # Run the tool through its result cache, bounded by its timeout and
+            # the run's deadline
+            cache = self.tool_cache or tool.result_cache
+            with blocking_scope("tool", tool_name):
+                if deadline:
+                    hit, tool_result = await deadline.wait_for(
+                        tool.run_cached(tool_args, context, cache),
+                        f"tool '{tool_name}'",
+                        timeout,
+                    )
+                elif timeout:
+                    hit, tool_result = await asyncio.wait_for(
+                        tool.run_cached(tool_args, context, cache), timeout=timeout
+                    )
+                else:
+                    hit, tool_result = await tool.run_cached(tool_args, context, cache)
+
+            cache_metadata = None
+            if hit is not None:
+                cache_metadata = {"cache_hit": hit, **cache.tool_stats(tool_name)}
+
+            # Track tool result if monitoring is enabled
+            if self.config.monitoring_enabled and self.monitor:
+                await self.monitor.track_tool_usage(
+                    tool_name=tool_name,
+                    input_data=tool_args,
+                    output_data=tool_result,
+                    conversation_id=conversation_id,
+                    agent_name=self.config.name,
+                    user_id=context.get("user_id"),
+                    metadata=cache_metadata,
+                )
+        except DeadlineExceededError:
+            # The run is out of time, so there is no point in asking the LLM
+            raise
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                error_message = f"Tool '{tool_name}' timed out after {timeout} seconds"
+            else:
+                error_message = f"Error running tool '{tool_name}': {str(e)}"
+            tool_result = {"error": error_message}
+
+            # Track error if monitoring is enabled
+            if self.config.monitoring_enabled and self.monitor:
+                await self.monitor.track_error(
+                    error=error_message,
+                    conversation_id=conversation_id,
+                    agent_name=self.config.name,
+                    user_id=context.get("user_id"),
+                )
 
-        return final_response.content
+        return tool_result
 
     def add_tool(self, tool: BaseTool) -> None:
         """
@@ -0,0 +1,266 @@
+"""
+Batch execution of agent runs for the Agents Hub framework.
+"""
+
+from typing import (
+    Dict,
+    List,
+    Any,
+    Optional,
+    Union,
+    Tuple,
+    Iterable,
+    AsyncIterator,
+    TYPE_CHECKING,
+)
+import asyncio
+import time
+import uuid
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from agents_hub.agents.base import Agent
+
+
+BatchInput = Union[str, Tuple[str, Dict[str, Any]]]
+
+
+class BatchResult(BaseModel):
+    """Result of a single run within a batch."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(..., description="Position of the input in the batch")
+    input: str = Field(..., description="Input text of the run")
+    output: Optional[str] = Field(None, description="Response of the agent")
+    error: Optional[BaseException] = Field(
+        None, description="Exception raised by the run"
+    )
+    latency: float = Field(0.0, description="Duration of the run in seconds")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the run succeeded."""
+        return self.error is None
+
+
+class BatchSummary(BaseModel):
+    """Throughput and latency summary of a batch."""
+
+    total: int = Field(0, description="Number of finished runs")
+    succeeded: int = Field(0, description="Number of successful runs")
+    failed: int = Field(0, description="Number of failed runs")
+    elapsed: float = Field(
+        0.0, description="Wall-clock duration of the batch in seconds"
+    )
+    throughput: float = Field(0.0, description="Finished runs per second")
+    latency_mean: float = Field(0.0, description="Mean run latency in seconds")
+    latency_p50: float = Field(0.0, description="Median run latency in seconds")
+    latency_p95: float = Field(
+        0.0, description="95th percentile run latency in seconds"
+    )
+    latency_p99: float = Field(
+        0.0, description="99th percentile run latency in seconds"
+    )
+    latency_max: float = Field(0.0, description="Maximum run latency in seconds")
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Get a percentile of a list of values using nearest-rank interpolation.
+
+    Args:
+        values: Values to summarize
+        fraction: Percentile as a fraction between 0 and 1
+
+    Returns:
+        The percentile, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+class AgentBatch:
+    """
+    A batch of independent runs of one agent.
+
+    Inputs are pulled lazily by a fixed pool of workers, so at most
+    ``concurrency`` runs are in flight and large input iterables are never
+    materialized. Results are yielded as they finish, not in input order; use
+    ``BatchResult.index`` to match them to their inputs.
+
+    Every run gets its own conversation ID unless the input's context sets one,
+    so batch items never share memory history.
+
+    Example:
+        ```python
+        batch = agent.run_many(prompts, concurrency=16, return_exceptions=True)
+        async for result in batch:
+            print(result.index, result.output or result.error)
+        print(batch.summary)
+        ```
+    """
+
+    def __init__(
+        self,
+        agent: "Agent",
+        inputs: Iterable[BatchInput],
+        concurrency: int = 8,
+        return_exceptions: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the batch.
+
+        Args:
+            agent: Agent that runs the inputs
+            inputs: Input texts, or (input text, context) tuples
+            concurrency: Maximum number of runs in flight
+            return_exceptions: Whether failed runs are yielded as results with
+                ``error`` set instead of aborting the batch
+            context: Optional context shared by all runs
+        """
+        self.agent = agent
+        self.inputs = inputs
+        self.concurrency = max(1, concurrency)
+        self.return_exceptions = return_exceptions
+        self.context = context or {}
+        self.batch_id = str(uuid.uuid4())
+
+        self._latencies: List[float] = []
+        self._succeeded = 0
+        self._failed = 0
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._consumed = False
+
+    def __aiter__(self) -> AsyncIterator[BatchResult]:
+        if self._consumed:
+            raise RuntimeError("An AgentBatch can only be iterated once")
+        self._consumed = True
+        return self._iterate()
+
+    async def collect(self) -> List[BatchResult]:
+        """
+        Run the whole batch and return the results in input order.
+
+        Returns:
+            List of results
+        """
+        results = [result async for result in self]
+        return sorted(results, key=lambda result: result.index)
+
+    @property
+    def summary(self) -> BatchSummary:
+        """
+        Get the throughput and latency summary of the runs finished so far.
+
+        Returns:
+            BatchSummary object
+        """
+        total = self._succeeded + self._failed
+        elapsed = 0.0
+        if self._started_at is not None:
+            elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+
+        latencies = self._latencies
+        return BatchSummary(
+            total=total,
+            succeeded=self._succeeded,
+            failed=self._failed,
+            elapsed=elapsed,
+            throughput=total / elapsed if elapsed > 0 else 0.0,
+            latency_mean=sum(latencies) / len(latencies) if latencies else 0.0,
+            latency_p50=percentile(latencies, 0.50),
+            latency_p95=percentile(latencies, 0.95),
+            latency_p99=percentile(latencies, 0.99),
+            latency_max=max(latencies) if latencies else 0.0,
+        )
+
+    async def _iterate(self) -> AsyncIterator[BatchResult]:
+        """Run the workers and yield results as they finish."""
+        self._started_at = time.perf_counter()
+        inputs = enumerate(self.inputs)
+
+        # Bounded so that a slow consumer pauses the workers
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def worker() -> None:
+            for index, item in inputs:
+                await results.put(await self._run_one(index, item))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+
+        async def close_when_done() -> Optional[BaseException]:
+            # Runs catch their own errors, so a worker only fails on the inputs
+            outcomes = await asyncio.gather(*workers, return_exceptions=True)
+            await results.put(None)
+            return next((o for o in outcomes if isinstance(o, BaseException)), None)
+
+        closer = asyncio.ensure_future(close_when_done())
+
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    error = await closer
+                    if error is not None:
+                        raise error
+                    break
+
+                self._latencies.append(result.latency)
+                if result.ok:
+                    self._succeeded += 1
+                else:
+                    self._failed += 1
+                    if not self.return_exceptions:
+                        raise result.error
+
+                yield result
+        finally:
+            self._finished_at = time.perf_counter()
+            for task in workers + [closer]:
+                task.cancel()
+            await asyncio.gather(*workers, closer, return_exceptions=True)
+
+    async def _run_one(self, index: int, item: BatchInput) -> BatchResult:
+        """
+        Run a single input through the agent.
+
+        Args:
+            index: Position of the input in the batch
+            item: Input text, or (input text, context) tuple
+
+        Returns:
+            BatchResult for the run
+        """
+        if isinstance(item, tuple):
+            input_text, item_context = item
+        else:
+            input_text, item_context = item, {}
+
+        context = {
+            "conversation_id": f"batch-{self.batch_id}-{index}",
+            **self.context,
+            **(item_context or {}),
+        }
+
+        start = time.perf_counter()
+        try:
+            output = await self.agent.run(input_text, context)
+            error = None
+        except Exception as e:
+            output = None
+            error = e
+
+        return BatchResult(
+            index=index,
+            input=input_text,
+            output=output,
+            error=error,
+            latency=time.perf_counter() - start,
+        )
@@ -51,6 +51,7 @@ class CognitiveAgent(Agent):
         monitor: Optional[BaseMonitor] = None,
         cognitive_architecture: Optional[CognitiveArchitecture] = None,
         cognitive_config: Optional[Dict[str, Any]] = None,
+        **kwargs,
     ):
         """
         Initialize the cognitive agent.
@@ -69,6 +70,7 @@ class CognitiveAgent(Agent):
             monitor: Monitor for tracking agent interactions
             cognitive_architecture: Cognitive architecture configuration
             cognitive_config: Cognitive agent configuration
+            **kwargs: Additional keyword arguments passed to the base Agent
         """
         super().__init__(
             name=name,
@@ -82,6 +84,7 @@ class CognitiveAgent(Agent):
             moderation=moderation,
             on_moderation_violation=on_moderation_violation,
             monitor=monitor,
+            **kwargs,
         )
 
         # Initialize cognitive architecture
@@ -221,20 +224,21 @@ class CognitiveAgent(Agent):
         metacognition = cognitive_result.get("metacognition", {})
 
         # Create a prompt for the LLM to generate a direct response
+        # The fixed instructions come first so that they form a prefix the
+        # provider can cache across questions
         prompt = f"""You are an intelligent assistant with advanced cognitive capabilities.
 
-        USER QUESTION: {input_text}
-
-        Based on the following reasoning and metacognition, provide a direct, clear answer to the question.
+        Based on the reasoning and metacognition below, provide a direct, clear answer to the user question.
         Do NOT repeat the question in your answer. Focus on providing a helpful, accurate response.
+        Your response should be concise, accurate, and directly address the question.
+
+        USER QUESTION: {input_text}
 
         REASONING:
         {json.dumps(reasoning, indent=2)}
 
         METACOGNITION:
         {json.dumps(metacognition, indent=2)}
-
-        Your response should be concise, accurate, and directly address the question.
         """
 
         # Generate a response using the LLM
@@ -256,6 +260,7 @@ class CognitiveAgent(Agent):
         tool_calls: List[Dict[str, Any]],
         messages: List[Dict[str, Any]],
         context: Dict[str, Any],
+        content: Optional[str] = None,
     ) -> str:
         """
         Process tool calls with cognitive awareness.
@@ -264,9 +269,12 @@ class CognitiveAgent(Agent):
             tool_calls: Tool calls from the LLM
             messages: Messages for the LLM
             context: Context information
+            content: Optional text that accompanied the tool calls
 
         Returns:
             Final response after processing tool calls
         """
         # Use the base implementation for tool calls
-        return await super()._process_tool_calls(tool_calls, messages, context)
+        return await super()._process_tool_calls(
+            tool_calls, messages, context, content
+        )
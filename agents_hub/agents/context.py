@@ -0,0 +1,238 @@
+"""
+Token-budgeted context assembly for the Agents Hub framework.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import logging
+from pydantic import BaseModel, Field
+from agents_hub.llm.base import BaseLLM
+from agents_hub.llm.tokens import get_token_counter
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class ContextBuildResult(BaseModel):
+    """Result of assembling the context for an LLM call."""
+
+    messages: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Messages to send to the LLM"
+    )
+    input_tokens: int = Field(0, description="Token count of the assembled messages")
+    trimmed_tokens: int = Field(
+        0, description="Tokens of history left out by dropping or compacting turns"
+    )
+    dropped_turns: int = Field(0, description="Number of history turns dropped")
+    compacted_turns: int = Field(0, description="Number of history turns compacted")
+
+
+class ContextBuilder:
+    """
+    Builds LLM messages from conversation history within a token budget.
+
+    Tokens are counted with the LLM provider's tokenizer, which memoizes them
+    in the shared ``TokenCounter``. The newest turns are kept first; when a turn no longer fits, it is
+    compacted (its messages are truncated) if that makes it fit, otherwise it is
+    dropped together with every older turn.
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        max_input_tokens: int,
+        compact_turns: bool = True,
+        compacted_message_tokens: int = 200,
+        message_overhead_tokens: int = 4,
+    ):
+        """
+        Initialize the context builder.
+
+        Args:
+            llm: LLM provider whose tokenizer is used for counting
+            max_input_tokens: Token budget for the assembled messages
+            compact_turns: Whether to compact turns that do not fit instead of
+                dropping them right away
+            compacted_message_tokens: Maximum tokens per message of a compacted turn
+            message_overhead_tokens: Tokens added per message for role and framing
+        """
+        self.llm = llm
+        self.max_input_tokens = max_input_tokens
+        self.compact_turns = compact_turns
+        self.compacted_message_tokens = compacted_message_tokens
+        self.message_overhead_tokens = message_overhead_tokens
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the tokens in a text.
+
+        Args:
+            text: Text to count tokens for
+
+        Returns:
+            Number of tokens
+        """
+        if not text:
+            return 0
+
+        try:
+            return self.llm.get_token_count(text)
+        except NotImplementedError:
+            # Without a tokenizer, estimate with the shared counter
+            return get_token_counter().count(
+                text, getattr(self.llm, "model", ""), type(self.llm).__name__
+            )
+
+    def count_message_tokens(self, message: Dict[str, Any]) -> int:
+        """
+        Count the tokens of a single message, including framing overhead.
+
+        Args:
+            message: Message to count
+
+        Returns:
+            Number of tokens
+        """
+        content = message.get("content") or ""
+        if not isinstance(content, str):
+            content = str(content)
+        return self.count_tokens(content) + self.message_overhead_tokens
+
+    def build(
+        self,
+        system_prompt: str,
+        history: List[Dict[str, Any]],
+        input_text: str,
+    ) -> ContextBuildResult:
+        """
+        Assemble the messages for an LLM call within the token budget.
+
+        The system prompt and the current input are always included, even if
+        they alone exceed the budget.
+
+        Args:
+            system_prompt: System prompt for the agent
+            history: Conversation history, oldest interaction first
+            input_text: The current user input
+
+        Returns:
+            ContextBuildResult with the messages and trimming statistics
+        """
+        head = []
+        if system_prompt:
+            head.append({"role": "system", "content": system_prompt})
+        tail = [{"role": "user", "content": input_text}]
+
+        used = sum(self.count_message_tokens(message) for message in head + tail)
+        remaining = self.max_input_tokens - used
+
+        kept_turns: List[List[Dict[str, Any]]] = []
+        trimmed_tokens = 0
+        compacted_turns = 0
+        dropped_turns = 0
+
+        # Walk the history from newest to oldest
+        for index in range(len(history) - 1, -1, -1):
+            turn = self._turn_messages(history[index])
+            turn_tokens = sum(self.count_message_tokens(message) for message in turn)
+
+            if dropped_turns == 0 and turn_tokens <= remaining:
+                kept_turns.append(turn)
+                remaining -= turn_tokens
+                continue
+
+            if dropped_turns == 0 and self.compact_turns:
+                compacted, compacted_tokens = self._compact_turn(turn)
+                if compacted_tokens <= remaining:
+                    kept_turns.append(compacted)
+                    remaining -= compacted_tokens
+                    trimmed_tokens += turn_tokens - compacted_tokens
+                    compacted_turns += 1
+                    continue
+
+            # Drop this turn and, to keep the history contiguous, all older ones
+            dropped_turns += 1
+            trimmed_tokens += turn_tokens
+
+        messages = list(head)
+        for turn in reversed(kept_turns):
+            messages.extend(turn)
+        messages.extend(tail)
+
+        if trimmed_tokens:
+            logger.debug(
+                f"Context trimmed by {trimmed_tokens} tokens "
+                f"({dropped_turns} turns dropped, {compacted_turns} compacted)"
+            )
+
+        return ContextBuildResult(
+            messages=messages,
+            input_tokens=self.max_input_tokens - remaining,
+            trimmed_tokens=trimmed_tokens,
+            dropped_turns=dropped_turns,
+            compacted_turns=compacted_turns,
+        )
+
+    def _turn_messages(self, entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Convert a history entry into its user and assistant messages.
+
+        Args:
+            entry: History entry
+
+        Returns:
+            List of messages for the turn
+        """
+        return [
+            {"role": "user", "content": entry["user_message"]},
+            {"role": "assistant", "content": entry["assistant_message"]},
+        ]
+
+    def _compact_turn(
+        self, turn: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Compact a turn by truncating its long messages.
+
+        Args:
+            turn: Messages of the turn
+
+        Returns:
+            Tuple of (compacted messages, token count of the compacted turn)
+        """
+        compacted = []
+        for message in turn:
+            content = message.get("content") or ""
+            compacted.append(
+                {
+                    **message,
+                    "content": self._truncate(content, self.compacted_message_tokens),
+                }
+            )
+
+        tokens = sum(self.count_message_tokens(message) for message in compacted)
+        return compacted, tokens
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate a text to at most the given number of tokens.
+
+        Args:
+            text: Text to truncate
+            max_tokens: Maximum number of tokens
+
+        Returns:
+            The text itself if it fits, otherwise its truncated head
+        """
+        tokens = self.count_tokens(text)
+        if tokens <= max_tokens:
+            return text
+
+        marker = " [...]"
+        length = int(len(text) * max_tokens / tokens)
+        while length > 0:
+            candidate = text[:length].rstrip() + marker
+            if self.count_tokens(candidate) <= max_tokens:
+                return candidate
+            length = int(length * 0.9)
+
+        return marker.strip()
@@ -0,0 +1,17 @@
+"""
+Key/value cache backends for the Agents Hub framework.
+
+The backends are shared by the tool result cache and the LLM response cache.
+"""
+
+from agents_hub.cache.base import BaseCacheBackend
+from agents_hub.cache.in_memory import InMemoryCacheBackend
+from agents_hub.cache.disk import DiskCacheBackend
+from agents_hub.cache.redis import RedisCacheBackend
+
+__all__ = [
+    "BaseCacheBackend",
+    "InMemoryCacheBackend",
+    "DiskCacheBackend",
+    "RedisCacheBackend",
+]
@@ -0,0 +1,57 @@
+"""
+Key/value cache backends for the Agents Hub framework.
+"""
+
+from typing import Any, Optional, Tuple
+
+
+class BaseCacheBackend:
+    """
+    Base class for cache backends.
+
+    Entries are grouped in namespaces (one per tool or model), each with its own size
+    limit. Backends evict the least recently used entries of a namespace once
+    it is full, and never return entries whose TTL has passed.
+    """
+
+    async def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+
+        Returns:
+            Tuple of (whether the entry was found, cached value)
+        """
+        raise NotImplementedError("Subclasses must implement get()")
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+            value: Value to cache
+            ttl: Optional time to live in seconds (None for no expiry)
+            max_entries: Optional maximum number of entries in the namespace
+        """
+        raise NotImplementedError("Subclasses must implement set()")
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove cached entries.
+
+        Args:
+            namespace: Namespace to clear (None for all namespaces)
+        """
+        raise NotImplementedError("Subclasses must implement clear()")
@@ -0,0 +1,168 @@
+"""
+On-disk cache backend for the Agents Hub framework.
+"""
+
+from typing import Any, Optional, Tuple
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from agents_hub.cache.base import BaseCacheBackend
+
+
+class DiskCacheBackend(BaseCacheBackend):
+    """
+    On-disk cache backend.
+
+    Entries are stored as JSON in a SQLite database, so they survive restarts
+    and can be shared by several processes on the same host. Database access
+    runs in a worker thread to keep the event loop free. Results that cannot
+    be serialized to JSON are not cached.
+    """
+
+    def __init__(self, path: str = "cache.db"):
+        """
+        Initialize the on-disk cache backend.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """)
+
+    async def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+
+        Returns:
+            Tuple of (whether the entry was found, cached value)
+        """
+        return await asyncio.to_thread(self._get, namespace, key)
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+            value: Value to cache
+            ttl: Optional time to live in seconds (None for no expiry)
+            max_entries: Optional maximum number of entries in the namespace
+        """
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+
+        await asyncio.to_thread(self._set, namespace, key, serialized, ttl, max_entries)
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove cached entries.
+
+        Args:
+            namespace: Namespace to clear (None for all namespaces)
+        """
+        await asyncio.to_thread(self._clear, namespace)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return False, None
+
+            value, expires_at = row
+            if expires_at is not None and now >= expires_at:
+                self._connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+                return False, None
+
+            self._connection.execute(
+                "UPDATE cache_entries SET accessed_at = ? "
+                "WHERE namespace = ? AND key = ?",
+                (now, namespace, key),
+            )
+
+        return True, json.loads(value)
+
+    def _set(
+        self,
+        namespace: str,
+        key: str,
+        value: str,
+        ttl: Optional[float],
+        max_entries: Optional[int],
+    ) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, value, expires_at, now),
+            )
+
+            # Drop expired entries, then the least recently used ones
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+                (namespace, now),
+            )
+            if max_entries is not None:
+                self._connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                    "SELECT key FROM cache_entries WHERE namespace = ? "
+                    "ORDER BY accessed_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                    (namespace, namespace, max_entries),
+                )
+
+    def _clear(self, namespace: Optional[str]) -> None:
+        with self._lock, self._connection:
+            if namespace is None:
+                self._connection.execute("DELETE FROM cache_entries")
+            else:
+                self._connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
+                )
@@ -0,0 +1,84 @@
+"""
+In-memory cache backend for the Agents Hub framework.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import time
+from agents_hub.cache.base import BaseCacheBackend
+
+
+class InMemoryCacheBackend(BaseCacheBackend):
+    """
+    In-memory cache backend.
+
+    Each namespace is an LRU dictionary. Cached values are shared by reference,
+    so callers must not modify them. Entries are lost when the process ends.
+    """
+
+    def __init__(self):
+        """Initialize the in-memory cache backend."""
+        # namespace -> key -> (expires_at, value)
+        self._entries: Dict[str, "OrderedDict[str, Tuple[Optional[float], Any]]"] = {}
+
+    async def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+
+        Returns:
+            Tuple of (whether the entry was found, cached value)
+        """
+        entries = self._entries.get(namespace)
+        if not entries or key not in entries:
+            return False, None
+
+        expires_at, value = entries[key]
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del entries[key]
+            return False, None
+
+        entries.move_to_end(key)
+        return True, value
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+            value: Value to cache
+            ttl: Optional time to live in seconds (None for no expiry)
+            max_entries: Optional maximum number of entries in the namespace
+        """
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        entries[key] = (expires_at, value)
+        entries.move_to_end(key)
+
+        if max_entries is not None:
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove cached entries.
+
+        Args:
+            namespace: Namespace to clear (None for all namespaces)
+        """
+        if namespace is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(namespace, None)
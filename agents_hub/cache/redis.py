@@ -0,0 +1,153 @@
+"""
+Redis cache backend for the Agents Hub framework.
+"""
+
+from typing import Any, Optional, Tuple
+import json
+import time
+from agents_hub.cache.base import BaseCacheBackend
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """
+    Redis cache backend.
+
+    Entries are stored as JSON strings with a native Redis expiry, so they can
+    be shared by every process and host using the same Redis server. Each
+    namespace keeps a sorted set of its keys by last access, which is used to
+    evict the least recently used entries. Values that cannot be serialized
+    to JSON are not cached.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        prefix: str = "agents_hub:cache:",
+        client: Optional[Any] = None,
+        **kwargs,
+    ):
+        """
+        Initialize the Redis cache backend.
+
+        Args:
+            host: Redis host
+            port: Redis port
+            db: Redis database number
+            password: Optional Redis password
+            prefix: Prefix of every key written by the backend
+            client: Optional ``redis.asyncio.Redis`` compatible client to use
+                instead of connecting to ``host``
+            **kwargs: Additional parameters for the Redis client
+        """
+        if client is None:
+            import redis.asyncio as aioredis
+
+            client = aioredis.Redis(
+                host=host, port=port, db=db, password=password, **kwargs
+            )
+
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}{namespace}:{key}"
+
+    def _index(self, namespace: str) -> str:
+        return f"{self.prefix}{namespace}:__index__"
+
+    async def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """
+        Get a cached value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+
+        Returns:
+            Tuple of (whether the entry was found, cached value)
+        """
+        value = await self.client.get(self._key(namespace, key))
+        if value is None:
+            # Expired or evicted; drop it from the LRU index
+            await self.client.zrem(self._index(namespace), key)
+            return False, None
+
+        await self.client.zadd(self._index(namespace), {key: time.time()})
+        return True, json.loads(value)
+
+    async def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Namespace of the entry
+            key: Key of the entry
+            value: Value to cache
+            ttl: Optional time to live in seconds (None for no expiry)
+            max_entries: Optional maximum number of entries in the namespace
+        """
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+
+        if ttl is not None and ttl <= 0:
+            return
+
+        index = self._index(namespace)
+        await self.client.set(
+            self._key(namespace, key),
+            serialized,
+            px=int(ttl * 1000) if ttl is not None else None,
+        )
+        await self.client.zadd(index, {key: time.time()})
+        await self.client.sadd(f"{self.prefix}__namespaces__", namespace)
+
+        if max_entries is not None:
+            excess = await self.client.zcard(index) - max_entries
+            if excess > 0:
+                victims = [
+                    victim.decode() if isinstance(victim, bytes) else victim
+                    for victim in await self.client.zrange(index, 0, excess - 1)
+                ]
+                await self.client.delete(
+                    *(self._key(namespace, victim) for victim in victims)
+                )
+                await self.client.zrem(index, *victims)
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove cached entries.
+
+        Args:
+            namespace: Namespace to clear (None for all namespaces)
+        """
+        if namespace is None:
+            namespaces = await self.client.smembers(f"{self.prefix}__namespaces__")
+            for name in namespaces:
+                await self.clear(name.decode() if isinstance(name, bytes) else name)
+            await self.client.delete(f"{self.prefix}__namespaces__")
+            return
+
+        index = self._index(namespace)
+        keys = [
+            key.decode() if isinstance(key, bytes) else key
+            for key in await self.client.zrange(index, 0, -1)
+        ]
+        await self.client.delete(index, *(self._key(namespace, key) for key in keys))
+
+    async def close(self) -> None:
+        """Close the connection to Redis."""
+        # redis-py 5 renamed close() to aclose()
+        close = getattr(self.client, "aclose", None) or self.client.close
+        await close()
@@ -6,6 +6,7 @@ specialized agents for software development.
 """
 
 import os
+import json
 import datetime
 import logging
 from typing import Dict, List, Any, Optional
@@ -34,6 +35,9 @@ from agents_hub.tools.coding import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Response schema of generated JSON files, whose structure is up to the agent
+JSON_FILE_SCHEMA = {"type": "object"}
+
 class CodingWorkforce(AgentWorkforce):
     """
     A specialized workforce for software development with optimized LLMs.
@@ -186,10 +190,6 @@ class CodingWorkforce(AgentWorkforce):
                 self.security_engineer,
                 self.qa_tester,
             ],
-            router_config={
-                "default_agent": self.project_manager.name,
-                "routing_strategy": "round_robin",
-            },
         )
     
     async def develop_project(self) -> str:
@@ -285,6 +285,27 @@ class CodingWorkforce(AgentWorkforce):
             }
         )
     
+    async def _generate_json_file(self, agent: Any, prompt: str) -> str:
+        """
+        Generate the content of a JSON file, such as package.json.
+        
+        The agent is asked for a JSON response with the provider's structured
+        output, so the file does not contain Markdown fences or explanations.
+        
+        Args:
+            agent: Agent that writes the file
+            prompt: Description of the file
+            
+        Returns:
+            Content of the file, pretty-printed when it is valid JSON
+        """
+        content = await agent.run(prompt, {"response_schema": JSON_FILE_SCHEMA})
+        try:
+            return json.dumps(json.loads(content), indent=2) + "\n"
+        except json.JSONDecodeError:
+            logger.warning("Generated JSON file is not valid JSON, writing it as is")
+            return content
+    
     async def _generate_backend_code(self, api_structure: str) -> None:
         """
         Generate backend code based on API structure.
@@ -351,7 +372,8 @@ class CodingWorkforce(AgentWorkforce):
         logger.info(f"Generating frontend code for {self.project_name}")
         
         # Create package.json
-        package_json_content = await self.frontend_developer.run(
+        package_json_content = await self._generate_json_file(
+            self.frontend_developer,
             f"Create a package.json file for a React application with TypeScript based on the following component structure:\n\n{component_structure}"
         )
         
@@ -362,7 +384,8 @@ class CodingWorkforce(AgentWorkforce):
         })
         
         # Create tsconfig.json
-        tsconfig_content = await self.frontend_developer.run(
+        tsconfig_content = await self._generate_json_file(
+            self.frontend_developer,
             "Create a tsconfig.json file for a React application with TypeScript."
         )
         
@@ -429,7 +452,8 @@ class CodingWorkforce(AgentWorkforce):
         })
         
         # Create package.json for CDK
-        package_json_content = await self.devops_engineer.run(
+        package_json_content = await self._generate_json_file(
+            self.devops_engineer,
             "Create a package.json file for an AWS CDK application with TypeScript."
         )
         
@@ -440,7 +464,8 @@ class CodingWorkforce(AgentWorkforce):
         })
         
         # Create tsconfig.json for CDK
-        tsconfig_content = await self.devops_engineer.run(
+        tsconfig_content = await self._generate_json_file(
+            self.devops_engineer,
             "Create a tsconfig.json file for an AWS CDK application with TypeScript."
         )
         
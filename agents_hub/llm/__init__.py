@@ -2,6 +2,49 @@
 LLM providers for the Agents Hub framework.
 """
 
-from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk, LLMWrapper
+from agents_hub.llm.cache import CachedEmbeddings, CachedLLM, SemanticCachedLLM
+from agents_hub.llm.fallback import LLMWithFallback
+from agents_hub.llm.rate_limit import RateLimiter, get_rate_limiter
+from agents_hub.llm.replay import (
+    RecordingLLM,
+    ReplayLLM,
+    ReplayMissError,
+    lognormal_latency,
+    recorded_llm,
+)
+from agents_hub.llm.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientLLM,
+    RetryBudget,
+    get_circuit_breaker,
+)
+from agents_hub.llm.single_flight import SingleFlightLLM
+from agents_hub.llm.tokens import TokenCounter, get_token_counter
 
-__all__ = ["BaseLLM", "LLMResponse"]
+__all__ = [
+    "BaseLLM",
+    "LLMResponse",
+    "LLMStreamChunk",
+    "LLMWrapper",
+    "CachedEmbeddings",
+    "CachedLLM",
+    "SemanticCachedLLM",
+    "LLMWithFallback",
+    "RateLimiter",
+    "get_rate_limiter",
+    "RecordingLLM",
+    "ReplayLLM",
+    "ReplayMissError",
+    "lognormal_latency",
+    "recorded_llm",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ResilientLLM",
+    "RetryBudget",
+    "get_circuit_breaker",
+    "SingleFlightLLM",
+    "TokenCounter",
+    "get_token_counter",
+]
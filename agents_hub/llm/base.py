@@ -2,8 +2,11 @@
 Base LLM interface for the Agents Hub framework.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator
+from contextlib import asynccontextmanager
+import asyncio
 from pydantic import BaseModel, Field
+from agents_hub.llm.rate_limit import RateLimiter
 
 
 class LLMResponse(BaseModel):
@@ -11,6 +14,16 @@ class LLMResponse(BaseModel):
     content: str = Field("", description="The text content of the response")
     tool_calls: Optional[List[Dict[str, Any]]] = Field(None, description="Tool calls requested by the LLM")
     raw_response: Optional[Dict[str, Any]] = Field(None, description="Raw response from the LLM provider")
+    cached: bool = Field(False, description="Whether the response was served from a response cache")
+
+
+class LLMStreamChunk(BaseModel):
+    """A chunk of a streamed response from an LLM."""
+    content: str = Field("", description="Text delta contained in this chunk")
+    tool_calls: Optional[List[Dict[str, Any]]] = Field(None, description="Fully assembled tool calls (final chunk only)")
+    done: bool = Field(False, description="Whether this is the final chunk of the stream")
+    raw_response: Optional[Dict[str, Any]] = Field(None, description="Raw chunk or final response from the LLM provider")
+    cached: bool = Field(False, description="Whether the response was served from a response cache")
 
 
 class BaseLLM:
@@ -20,6 +33,13 @@ class BaseLLM:
     This abstract class defines the interface that all LLM providers must implement.
     """
     
+    # Limits of a single embedding request; providers with a batch API raise them
+    embedding_batch_size: int = 1
+    embedding_batch_tokens: Optional[int] = None
+    
+    # Optional limiter, shared by all providers that draw from the same quota
+    rate_limiter: Optional[RateLimiter] = None
+    
     async def generate(
         self,
         messages: List[Dict[str, str]],
@@ -36,13 +56,57 @@ class BaseLLM:
             tools: Optional list of tools available to the LLM
             temperature: Temperature for generation
             max_tokens: Maximum tokens to generate
-            **kwargs: Additional provider-specific parameters
+            **kwargs: Additional provider-specific parameters; providers with
+                structured output accept ``response_schema``, a JSON Schema
+                dictionary or pydantic model class the response content must
+                be a JSON document of (see ``agents_hub.llm.structured``)
             
         Returns:
             LLMResponse object containing the generated text and any tool calls
         """
         raise NotImplementedError("Subclasses must implement generate()")
     
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the LLM token by token.
+        
+        Text deltas are yielded as they arrive. The last chunk has ``done`` set
+        and carries any tool calls, assembled from the provider's deltas.
+        
+        The default implementation falls back to ``generate()`` and yields the
+        complete response as a single chunk, so every provider can be streamed.
+        
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            LLMStreamChunk objects
+        """
+        response = await self.generate(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        yield LLMStreamChunk(
+            content=response.content,
+            tool_calls=response.tool_calls,
+            done=True,
+            raw_response=response.raw_response,
+        )
+    
     async def get_embedding(self, text: str) -> List[float]:
         """
         Get an embedding for the given text.
@@ -55,6 +119,162 @@ class BaseLLM:
         """
         raise NotImplementedError("Subclasses must implement get_embedding()")
     
+    async def get_embeddings(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        concurrency: int = 4,
+    ) -> List[List[float]]:
+        """
+        Get embeddings for a list of texts.
+        
+        The texts are split into batches of at most ``batch_size`` items and
+        ``max_batch_tokens`` tokens, and up to ``concurrency`` batches are
+        embedded at a time. Providers with a batch API embed each batch in a
+        single request by overriding ``_embed_batch()``; the default embeds the
+        items of a batch one by one with ``get_embedding()``.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum number of texts per request (defaults to the
+                provider's ``embedding_batch_size``)
+            max_batch_tokens: Maximum number of tokens per request (defaults to
+                the provider's ``embedding_batch_tokens``)
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            List of embeddings, in the order of the texts
+        """
+        if not texts:
+            return []
+        
+        batches = self._split_embedding_batches(
+            texts,
+            batch_size or self.embedding_batch_size,
+            max_batch_tokens or self.embedding_batch_tokens,
+        )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def embed(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._embed_batch(batch)
+        
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+        return [embedding for batch in results for embedding in batch]
+    
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for one batch of texts.
+        
+        Args:
+            texts: Texts to embed, within the provider's batch limits
+            
+        Returns:
+            List of embeddings, in the order of the texts
+        """
+        return [await self.get_embedding(text) for text in texts]
+    
+    def _split_embedding_batches(
+        self,
+        texts: List[str],
+        batch_size: int,
+        max_batch_tokens: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Split texts into batches by item count and token size.
+        
+        A text larger than ``max_batch_tokens`` on its own gets a batch of its
+        own, so the provider decides how to handle it.
+        
+        Args:
+            texts: Texts to split
+            batch_size: Maximum number of texts per batch
+            max_batch_tokens: Optional maximum number of tokens per batch
+            
+        Returns:
+            List of batches, preserving the order of the texts
+        """
+        batch_size = max(1, batch_size)
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        
+        for text in texts:
+            tokens = self._count_tokens(text) if max_batch_tokens else 0
+            if batch and (
+                len(batch) >= batch_size
+                or (max_batch_tokens and batch_tokens + tokens > max_batch_tokens)
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens of a text, approximating if the provider cannot."""
+        try:
+            return self.get_token_count(text)
+        except NotImplementedError:
+            return len(text) // 4
+    
+    def _request_tokens(self, messages: List[Dict[str, Any]], max_tokens: int = 0) -> int:
+        """
+        Estimate the tokens a request counts against a tokens-per-minute quota.
+        
+        Providers count the prompt and the maximum completion length.
+        
+        Args:
+            messages: List of messages in the conversation
+            max_tokens: Maximum tokens to generate
+            
+        Returns:
+            Estimated number of tokens
+        """
+        return max_tokens + self.get_message_token_count(messages)
+    
+    @asynccontextmanager
+    async def _rate_limited(self, tokens: int = 0):
+        """
+        Hold a request to the provider's rate limiter, if it has one.
+        
+        Args:
+            tokens: Estimated number of tokens of the request
+        """
+        if self.rate_limiter is None:
+            yield
+            return
+        
+        async with self.rate_limiter.limit(tokens):
+            yield
+    
+    async def _create(self, resource: Any, **params) -> Any:
+        """
+        Call the ``create`` method of an SDK resource, such as
+        ``client.chat.completions``.
+        
+        With a rate limiter, the raw response is requested so that the rate
+        limit headers of successful responses reach the limiter, which slows
+        down before the provider starts throttling.
+        
+        Args:
+            resource: SDK resource with ``create`` and ``with_raw_response``
+            **params: Parameters of the request
+            
+        Returns:
+            Parsed response, or stream for streamed requests
+        """
+        if self.rate_limiter is None:
+            return await resource.create(**params)
+        
+        raw_response = await resource.with_raw_response.create(**params)
+        self.rate_limiter.update_from_headers(raw_response.headers)
+        return raw_response.parse()
+    
     def get_token_count(self, text: str) -> int:
         """
         Get the number of tokens in the given text.
@@ -67,6 +287,24 @@ class BaseLLM:
         """
         raise NotImplementedError("Subclasses must implement get_token_count()")
     
+    def get_message_token_count(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Get the number of prompt tokens of a list of messages.
+        
+        The default sums the tokens of the message contents; providers
+        override it to also count the framing of each message.
+        
+        Args:
+            messages: List of messages in the conversation
+            
+        Returns:
+            Number of tokens
+        """
+        return sum(
+            self._count_tokens(str(message.get("content") or ""))
+            for message in messages
+        )
+    
     @property
     def provider_name(self) -> str:
         """
@@ -86,3 +324,90 @@ class BaseLLM:
             Model name
         """
         raise NotImplementedError("Subclasses must implement model_name()")
+
+
+class LLMWrapper(BaseLLM):
+    """
+    Base class for LLMs that add behavior around another LLM.
+    
+    Every call is delegated to the wrapped LLM; subclasses override the calls
+    they change. Attributes that are not defined by the wrapper, such as a
+    provider's ``model``, are read from the wrapped LLM, so a wrapper can be
+    used wherever the wrapped LLM is.
+    """
+    
+    def __init__(self, llm: BaseLLM):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            llm: LLM to wrap
+        """
+        self.llm = llm
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper does not define
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+    
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs
+    ) -> LLMResponse:
+        """Generate a response with the wrapped LLM."""
+        return await self.llm.generate(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+    
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a response from the wrapped LLM."""
+        async for chunk in self.llm.stream(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        ):
+            yield chunk
+    
+    async def get_embedding(self, text: str) -> List[float]:
+        """Get an embedding from the wrapped LLM."""
+        return await self.llm.get_embedding(text)
+    
+    async def get_embeddings(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """Get embeddings from the wrapped LLM, with its batching."""
+        return await self.llm.get_embeddings(texts, **kwargs)
+    
+    def get_token_count(self, text: str) -> int:
+        """Count tokens with the wrapped LLM."""
+        return self.llm.get_token_count(text)
+    
+    def get_message_token_count(self, messages: List[Dict[str, Any]]) -> int:
+        """Count message tokens with the wrapped LLM."""
+        return self.llm.get_message_token_count(messages)
+    
+    @property
+    def provider_name(self) -> str:
+        """Get the provider name of the wrapped LLM."""
+        return self.llm.provider_name
+    
+    @property
+    def model_name(self) -> str:
+        """Get the model name of the wrapped LLM."""
+        return self.llm.model_name
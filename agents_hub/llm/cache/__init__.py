@@ -0,0 +1,9 @@
+"""
+Caching layers for LLM providers in the Agents Hub framework.
+"""
+
+from agents_hub.llm.cache.embeddings import CachedEmbeddings, DiskEmbeddingStore
+from agents_hub.llm.cache.responses import CachedLLM
+from agents_hub.llm.cache.semantic import SemanticCachedLLM
+
+__all__ = ["CachedEmbeddings", "DiskEmbeddingStore", "CachedLLM", "SemanticCachedLLM"]
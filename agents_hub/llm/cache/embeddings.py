@@ -0,0 +1,291 @@
+"""
+Content-addressed embedding cache for the Agents Hub framework.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+from agents_hub.llm.base import BaseLLM, LLMWrapper
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class DiskEmbeddingStore:
+    """
+    Persistent store of embeddings in a SQLite database.
+
+    Vectors are stored as raw float32 bytes, a quarter of the size of their
+    JSON form. Entries are content-addressed, so they never go stale and have
+    no TTL. Database access runs in a worker thread to keep the event loop
+    free.
+    """
+
+    def __init__(self, path: str = "embedding_cache.db"):
+        """
+        Initialize the embedding store.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    model TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (model, hash)
+                )
+                """)
+
+    async def get_many(
+        self, model: str, hashes: Sequence[str]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get the stored embeddings of several texts.
+
+        Args:
+            model: Embedding model the vectors belong to
+            hashes: Content hashes of the texts
+
+        Returns:
+            Dictionary of the found vectors by content hash
+        """
+        if not hashes:
+            return {}
+        return await asyncio.to_thread(self._get_many, model, list(hashes))
+
+    async def set_many(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        """
+        Store several embeddings.
+
+        Args:
+            model: Embedding model the vectors belong to
+            vectors: Vectors by content hash
+        """
+        if vectors:
+            await asyncio.to_thread(self._set_many, model, vectors)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _get_many(self, model: str, hashes: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            # Stay below SQLite's limit on the number of query parameters
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                rows = self._connection.execute(
+                    "SELECT hash, vector FROM embedding_cache WHERE model = ? "
+                    f"AND hash IN ({','.join('?' * len(chunk))})",
+                    (model, *chunk),
+                ).fetchall()
+                for content_hash, vector in rows:
+                    found[content_hash] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def _set_many(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(model, hash, vector, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    (model, content_hash, vector.tobytes(), now)
+                    for content_hash, vector in vectors.items()
+                ],
+            )
+
+
+class CachedEmbeddings(LLMWrapper):
+    """
+    LLM wrapper that caches embeddings by model and content hash.
+
+    Lookups go through an in-process LRU tier, then an optional persistent
+    on-disk tier. All texts missing from both are embedded with a single
+    ``get_embeddings()`` call on the wrapped LLM. Vectors are kept as float32,
+    which halves their memory use at a precision far below what similarity
+    search can tell apart. Generation calls pass straight through to the
+    wrapped LLM.
+
+    Example:
+        ```python
+        llm = CachedEmbeddings(OpenAIProvider(api_key=...), path="~/.cache/agents_hub/embeddings.db")
+        vector_store = PGVector(llm=llm, ...)
+        ```
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        path: Optional[str] = None,
+        max_memory_entries: int = 10000,
+        model: Optional[str] = None,
+    ):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            llm: LLM used to compute embeddings on a cache miss
+            path: Optional path of the SQLite database of the on-disk tier
+                (memory only if not provided)
+            max_memory_entries: Maximum number of vectors in the in-process tier
+            model: Optional name of the embedding model used in the cache key
+                (derived from the wrapped LLM if not provided)
+        """
+        super().__init__(llm)
+        self.store = DiskEmbeddingStore(path) if path else None
+        self.max_memory_entries = max_memory_entries
+        self.embedding_model = model or self._default_model(llm)
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    @staticmethod
+    def _default_model(llm: BaseLLM) -> str:
+        """Name the embedding model of an LLM for the cache key."""
+        model = getattr(llm, "_embedding_model", None)
+        if model is None:
+            try:
+                model = llm.model_name
+            except NotImplementedError:
+                model = type(llm).__name__
+        try:
+            return f"{llm.provider_name}:{model}"
+        except NotImplementedError:
+            return model
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """
+        Hash a text for the cache key.
+
+        Args:
+            text: Text to hash
+
+        Returns:
+            Hex digest of the SHA-256 of the text
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """
+        Get an embedding for the given text, from the cache if possible.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            List of floats representing the embedding
+        """
+        return (await self.get_embeddings([text]))[0]
+
+    async def get_embeddings(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """
+        Get embeddings for a list of texts, from the cache if possible.
+
+        Args:
+            texts: Texts to embed
+            **kwargs: Batching options for the wrapped LLM's ``get_embeddings()``
+
+        Returns:
+            List of embeddings, in the order of the texts
+        """
+        hashes = [self.content_hash(text) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+
+        # In-process tier
+        for content_hash in hashes:
+            if content_hash in vectors:
+                continue
+            vector = self._memory.get(content_hash)
+            if vector is not None:
+                self._memory.move_to_end(content_hash)
+                vectors[content_hash] = vector
+                self._stats["memory_hits"] += 1
+
+        # On-disk tier
+        missing = list(dict.fromkeys(h for h in hashes if h not in vectors))
+        if missing and self.store is not None:
+            try:
+                found = await self.store.get_many(self.embedding_model, missing)
+            except Exception as e:
+                logger.warning(f"Error reading embedding cache: {e}")
+                found = {}
+            self._stats["disk_hits"] += len(found)
+            for content_hash, vector in found.items():
+                self._remember(content_hash, vector)
+            vectors.update(found)
+            missing = [h for h in missing if h not in found]
+
+        # Embed the remaining texts in one batched call
+        if missing:
+            self._stats["misses"] += len(missing)
+            texts_by_hash = dict(zip(hashes, texts))
+            embeddings = await self.llm.get_embeddings(
+                [texts_by_hash[h] for h in missing], **kwargs
+            )
+            computed = {
+                content_hash: np.asarray(embedding, dtype=np.float32)
+                for content_hash, embedding in zip(missing, embeddings)
+            }
+            for content_hash, vector in computed.items():
+                self._remember(content_hash, vector)
+            vectors.update(computed)
+
+            if self.store is not None:
+                try:
+                    await self.store.set_many(self.embedding_model, computed)
+                except Exception as e:
+                    logger.warning(f"Error writing embedding cache: {e}")
+
+        return [vectors[content_hash].tolist() for content_hash in hashes]
+
+    def _remember(self, content_hash: str, vector: np.ndarray) -> None:
+        """Add a vector to the in-process tier, evicting the oldest entries."""
+        self._memory[content_hash] = vector
+        self._memory.move_to_end(content_hash)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def clear_memory(self) -> None:
+        """Empty the in-process tier."""
+        self._memory.clear()
+
+    def close(self) -> None:
+        """Close the on-disk tier."""
+        if self.store is not None:
+            self.store.close()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            Dictionary with hits per tier, misses, hit rate and the number of
+            vectors in the in-process tier
+        """
+        hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
@@ -0,0 +1,359 @@
+"""
+LLM response cache for the Agents Hub framework.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+import hashlib
+import json
+import logging
+from agents_hub.llm.base import BaseLLM, LLMWrapper, LLMResponse, LLMStreamChunk
+from agents_hub.llm.structured import json_schema
+from agents_hub.cache import (
+    BaseCacheBackend,
+    InMemoryCacheBackend,
+    DiskCacheBackend,
+    RedisCacheBackend,
+)
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Token usage reported by the providers: OpenAI and Claude, Gemini, Ollama
+USAGE_KEYS = ("usage", "usage_metadata", "prompt_eval_count", "eval_count")
+
+CACHE_BACKENDS = {
+    "memory": InMemoryCacheBackend,
+    "disk": DiskCacheBackend,
+    "redis": RedisCacheBackend,
+}
+
+
+def request_key(
+    namespace: str,
+    messages: List[Dict[str, Any]],
+    tools: Optional[List[Any]],
+    temperature: float,
+    max_tokens: int,
+    **kwargs,
+) -> str:
+    """
+    Build the canonical key of a generation request.
+
+    Args:
+        namespace: Provider and model the request is sent to
+        messages: List of messages in the conversation
+        tools: Optional list of tools available to the LLM
+        temperature: Temperature for generation
+        max_tokens: Maximum tokens to generate
+        **kwargs: Additional generation parameters
+
+    Returns:
+        Hex digest of the SHA-256 of the canonical request
+    """
+    if kwargs.get("response_schema") is not None:
+        # A pydantic model is keyed by its schema, not by its class name
+        kwargs["response_schema"] = json_schema(kwargs["response_schema"])
+    request = {
+        "model": namespace,
+        "messages": messages,
+        "tools": [
+            (
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                }
+                if hasattr(tool, "parameters")
+                else tool
+            )
+            for tool in tools or []
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "kwargs": kwargs,
+    }
+    canonical = json.dumps(
+        request,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def served_from_cache(response: LLMResponse) -> LLMResponse:
+    """
+    Mark a cached response as such, without the usage of the original call.
+
+    A cache hit does not reach the provider, so it must not be reported with
+    the tokens and cost of the call it was cached from.
+
+    Args:
+        response: Cached response
+
+    Returns:
+        Copy of the response with ``cached`` set and the usage removed
+    """
+    raw_response = response.raw_response
+    if raw_response is not None:
+        raw_response = {
+            key: value for key, value in raw_response.items() if key not in USAGE_KEYS
+        }
+    return response.model_copy(update={"cached": True, "raw_response": raw_response})
+
+
+class CachedLLM(LLMWrapper):
+    """
+    LLM wrapper that caches responses.
+
+    Responses are keyed by a canonical hash of the messages, tools, model,
+    temperature, max_tokens and any other generation parameters, so an
+    identical request is answered without calling the provider. By default
+    only deterministic requests (temperature 0) are cached, since sampling at
+    a higher temperature is expected to give varied answers; raise
+    ``max_temperature`` to cache those too.
+
+    Example:
+        ```python
+        cached_llm = CachedLLM(
+            llm=openai_llm,
+            cache_type="redis",
+            cache_config={"host": "localhost", "port": 6379, "ttl": 3600},
+        )
+        orchestrator = Agent(name="orchestrator", llm=cached_llm, temperature=0)
+        ```
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        cache_type: str = "memory",
+        cache_config: Optional[Dict[str, Any]] = None,
+        backend: Optional[BaseCacheBackend] = None,
+        ttl: Optional[float] = 3600.0,
+        max_entries: int = 1024,
+        max_temperature: Optional[float] = 0.0,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            llm: LLM to cache the responses of
+            cache_type: Backend to create, one of "memory", "disk" or "redis"
+            cache_config: Optional parameters for the backend (``path`` for
+                "disk", ``host``, ``port``, ``db`` and ``password`` for
+                "redis"); may also set ``ttl`` and ``max_entries``
+            backend: Optional backend instance, used instead of ``cache_type``
+            ttl: Time to live of a response in seconds (None for no expiry)
+            max_entries: Maximum number of cached responses per model
+            max_temperature: Highest temperature whose responses are cached
+                (None to cache every temperature)
+        """
+        super().__init__(llm)
+        cache_config = dict(cache_config or {})
+        self.ttl = cache_config.pop("ttl", ttl)
+        self.max_entries = cache_config.pop("max_entries", max_entries)
+        self.max_temperature = max_temperature
+
+        if backend is None:
+            if cache_type not in CACHE_BACKENDS:
+                raise ValueError(
+                    f"Unknown cache type '{cache_type}', expected one of "
+                    f"{', '.join(CACHE_BACKENDS)}"
+                )
+            backend = CACHE_BACKENDS[cache_type](**cache_config)
+
+        self.backend = backend
+        self._stats = {"hits": 0, "misses": 0, "bypassed": 0}
+
+    @property
+    def namespace(self) -> str:
+        """Namespace of the cached responses, one per provider and model."""
+        try:
+            return f"{self.llm.provider_name}:{self.llm.model_name}"
+        except NotImplementedError:
+            return type(self.llm).__name__
+
+    def make_key(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Any]],
+        temperature: float,
+        max_tokens: int,
+        **kwargs,
+    ) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional generation parameters
+
+        Returns:
+            Hex digest of the SHA-256 of the canonical request
+        """
+        return request_key(
+            self.namespace, messages, tools, temperature, max_tokens, **kwargs
+        )
+
+    def _should_cache(self, temperature: float, kwargs: Dict[str, Any]) -> bool:
+        """Decide whether a request goes through the cache."""
+        if kwargs.pop("cache", True) is False:
+            return False
+        return self.max_temperature is None or temperature <= self.max_temperature
+
+    async def _lookup(self, key: str) -> Optional[LLMResponse]:
+        """Look up a cached response, treating backend errors as misses."""
+        try:
+            hit, value = await self.backend.get(self.namespace, key)
+        except Exception as e:
+            logger.warning(f"Error reading LLM response cache: {e}")
+            hit, value = False, None
+
+        self._stats["hits" if hit else "misses"] += 1
+        return served_from_cache(LLMResponse(**value)) if hit else None
+
+    async def _store(self, key: str, response: LLMResponse) -> None:
+        """Cache a response, logging backend errors."""
+        try:
+            await self.backend.set(
+                self.namespace,
+                key,
+                response.model_dump(),
+                ttl=self.ttl,
+                max_entries=self.max_entries,
+            )
+        except Exception as e:
+            logger.warning(f"Error writing LLM response cache: {e}")
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate a response, from the cache if possible.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters; ``cache=False``
+                bypasses the cache for this call
+
+        Returns:
+            LLMResponse object containing the generated text and any tool calls
+        """
+        if not self._should_cache(temperature, kwargs):
+            self._stats["bypassed"] += 1
+            return await self.llm.generate(
+                messages=messages,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+
+        key = self.make_key(messages, tools, temperature, max_tokens, **kwargs)
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+
+        response = await self.llm.generate(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        await self._store(key, response)
+        return response
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response, from the cache if possible.
+
+        A cached response is yielded as a single final chunk. On a miss the
+        provider's chunks are passed through and the assembled response is
+        cached once the stream completes.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters; ``cache=False``
+                bypasses the cache for this call
+
+        Yields:
+            LLMStreamChunk objects
+        """
+        use_cache = self._should_cache(temperature, kwargs)
+        key = None
+        if use_cache:
+            key = self.make_key(messages, tools, temperature, max_tokens, **kwargs)
+            cached = await self._lookup(key)
+            if cached is not None:
+                yield LLMStreamChunk(
+                    content=cached.content,
+                    tool_calls=cached.tool_calls,
+                    done=True,
+                    raw_response=cached.raw_response,
+                    cached=True,
+                )
+                return
+        else:
+            self._stats["bypassed"] += 1
+
+        content = ""
+        async for chunk in self.llm.stream(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        ):
+            content += chunk.content
+            if chunk.done and key is not None:
+                await self._store(
+                    key,
+                    LLMResponse(
+                        content=content,
+                        tool_calls=chunk.tool_calls,
+                        raw_response=chunk.raw_response,
+                    ),
+                )
+            yield chunk
+
+    async def clear(self) -> None:
+        """Remove the cached responses of the wrapped model."""
+        await self.backend.clear(self.namespace)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, bypassed requests and the hit rate
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,359 @@
+"""
+Semantic LLM response cache for the Agents Hub framework.
+"""
+
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from collections import deque
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+import numpy as np
+from agents_hub.llm.base import BaseLLM, LLMWrapper, LLMResponse
+from agents_hub.llm.cache.responses import served_from_cache
+from agents_hub.llm.structured import ResponseSchema, json_schema
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class _ScopeIndex:
+    """Vector index of the cached prompts of one scope."""
+
+    def __init__(self, dimension: int):
+        self.vectors = np.zeros((0, dimension), dtype=np.float32)
+        self.prompts: List[str] = []
+        self.responses: List[LLMResponse] = []
+        self.created_at: List[float] = []
+        self.used_at: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+    def search(self, vector: np.ndarray) -> Tuple[int, float]:
+        """Find the most similar prompt, returning (index, cosine similarity)."""
+        if not self.prompts:
+            return -1, 0.0
+        similarities = self.vectors @ vector
+        index = int(np.argmax(similarities))
+        return index, float(similarities[index])
+
+    def add(self, vector: np.ndarray, prompt: str, response: LLMResponse) -> None:
+        now = time.monotonic()
+        self.vectors = np.vstack([self.vectors, vector[np.newaxis, :]])
+        self.prompts.append(prompt)
+        self.responses.append(response)
+        self.created_at.append(now)
+        self.used_at.append(now)
+
+    def remove(self, indices: List[int]) -> None:
+        removed = set(indices)
+        keep = [i for i in range(len(self.prompts)) if i not in removed]
+        self.vectors = self.vectors[keep]
+        for name in ("prompts", "responses", "created_at", "used_at"):
+            values = getattr(self, name)
+            setattr(self, name, [values[i] for i in keep])
+
+
+class SemanticCachedLLM(LLMWrapper):
+    """
+    LLM wrapper that answers paraphrased questions from a semantic cache.
+
+    The last user message of a request is embedded and compared with the
+    cached prompts of the same scope (model, system prompt, tools and response
+    schema). If the most similar prompt reaches ``similarity_threshold``, its
+    response is returned without calling the provider. Only requests without
+    prior conversation history are eligible by default, since a paraphrase is
+    only equivalent when the question stands on its own.
+
+    A fraction ``audit_rate`` of the hits is re-generated in the background and
+    the two answers compared, to estimate how often the threshold lets through
+    a question that should have had a different answer.
+
+    Example:
+        ```python
+        llm = SemanticCachedLLM(openai_llm, embedder=CachedEmbeddings(openai_llm), similarity_threshold=0.92)
+        agent = Agent(name="faq", llm=llm, system_prompt="Answer questions about our product.")
+        ```
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        embedder: Optional[BaseLLM] = None,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 1000,
+        ttl: Optional[float] = 3600.0,
+        max_history_messages: int = 0,
+        audit_rate: float = 0.0,
+        false_hit_threshold: float = 0.8,
+        max_samples: int = 100,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            llm: LLM to cache the responses of
+            embedder: LLM used to embed prompts (the wrapped LLM if not provided)
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached prompts per scope; the least
+                recently used are evicted first
+            ttl: Time to live of a response in seconds (None for no expiry)
+            max_history_messages: Maximum number of earlier user, assistant or
+                tool messages for a request to be eligible
+            audit_rate: Fraction of the hits re-generated to check for false hits
+            false_hit_threshold: Audited hits whose cached and fresh answers are
+                less similar than this are counted as false hits
+            max_samples: Number of audited hits kept for review
+        """
+        super().__init__(llm)
+        self.embedder = embedder or llm
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_history_messages = max_history_messages
+        self.audit_rate = audit_rate
+        self.false_hit_threshold = false_hit_threshold
+
+        self._scopes: Dict[str, _ScopeIndex] = {}
+        self._similarities: Deque[float] = deque(maxlen=1000)
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=max_samples)
+        self._audits: Set[asyncio.Task] = set()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "audited": 0,
+            "false_hits": 0,
+        }
+
+    def _scope(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Any]],
+        response_schema: Optional[ResponseSchema] = None,
+    ) -> str:
+        """Build the scope of a request: model, system prompt, tools and schema."""
+        try:
+            model = f"{self.llm.provider_name}:{self.llm.model_name}"
+        except NotImplementedError:
+            model = type(self.llm).__name__
+        scope = {
+            "model": model,
+            "system": [m.get("content") for m in messages if m.get("role") == "system"],
+            "tools": sorted(getattr(tool, "name", str(tool)) for tool in tools or []),
+            "schema": json_schema(response_schema) if response_schema else None,
+        }
+        canonical = json.dumps(scope, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _prompt(self, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """Get the prompt of an eligible request, or None if it is not eligible."""
+        conversation = [m for m in messages if m.get("role") != "system"]
+        if not conversation or conversation[-1].get("role") != "user":
+            return None
+        if len(conversation) - 1 > self.max_history_messages:
+            return None
+        content = conversation[-1].get("content")
+        return content if isinstance(content, str) and content.strip() else None
+
+    async def _embed(self, text: str) -> np.ndarray:
+        """Embed a text as a unit float32 vector."""
+        vector = np.asarray(await self.embedder.get_embedding(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _expire(self, index: _ScopeIndex) -> None:
+        """Remove the expired entries of a scope."""
+        if self.ttl is None:
+            return
+        deadline = time.monotonic() - self.ttl
+        expired = [
+            i for i, created in enumerate(index.created_at) if created < deadline
+        ]
+        if expired:
+            index.remove(expired)
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate a response, from the semantic cache if possible.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters; ``cache=False``
+                bypasses the cache for this call
+
+        Returns:
+            LLMResponse object containing the generated text and any tool calls
+        """
+        use_cache = kwargs.pop("cache", True) is not False
+        prompt = self._prompt(messages) if use_cache else None
+        request = dict(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        if prompt is None:
+            self._stats["bypassed"] += 1
+            return await self.llm.generate(**request)
+
+        try:
+            vector = await self._embed(prompt)
+        except Exception as e:
+            logger.warning(f"Error embedding prompt for the semantic cache: {e}")
+            self._stats["bypassed"] += 1
+            return await self.llm.generate(**request)
+
+        scope = self._scope(messages, tools, kwargs.get("response_schema"))
+        index = self._scopes.get(scope)
+        if index is not None:
+            self._expire(index)
+            position, similarity = index.search(vector)
+            if position >= 0:
+                self._similarities.append(similarity)
+            if position >= 0 and similarity >= self.similarity_threshold:
+                self._stats["hits"] += 1
+                index.used_at[position] = time.monotonic()
+                cached = index.responses[position]
+                if self.audit_rate and random.random() < self.audit_rate:
+                    self._start_audit(
+                        request, prompt, index.prompts[position], similarity, cached
+                    )
+                return served_from_cache(cached)
+
+        self._stats["misses"] += 1
+        response = await self.llm.generate(**request)
+
+        # Tool calls depend on the exact arguments asked for, so never reuse them
+        if not response.tool_calls and response.content:
+            if index is None:
+                index = self._scopes[scope] = _ScopeIndex(len(vector))
+            index.add(vector, prompt, response)
+            if len(index) > self.max_entries:
+                lru = int(np.argmin(index.used_at))
+                index.remove([lru])
+
+        return response
+
+    def _start_audit(
+        self,
+        request: Dict[str, Any],
+        prompt: str,
+        cached_prompt: str,
+        similarity: float,
+        cached: LLMResponse,
+    ) -> None:
+        """Re-generate a hit in the background to check it was not a false hit."""
+        task = asyncio.ensure_future(
+            self._audit(request, prompt, cached_prompt, similarity, cached)
+        )
+        self._audits.add(task)
+        task.add_done_callback(self._audits.discard)
+
+    async def _audit(
+        self,
+        request: Dict[str, Any],
+        prompt: str,
+        cached_prompt: str,
+        similarity: float,
+        cached: LLMResponse,
+    ) -> None:
+        try:
+            fresh = await self.llm.generate(**request)
+            answer_similarity = float(
+                np.dot(
+                    await self._embed(cached.content), await self._embed(fresh.content)
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Error auditing a semantic cache hit: {e}")
+            return
+
+        false_hit = answer_similarity < self.false_hit_threshold
+        self._stats["audited"] += 1
+        self._stats["false_hits"] += int(false_hit)
+        self._samples.append(
+            {
+                "prompt": prompt,
+                "cached_prompt": cached_prompt,
+                "similarity": similarity,
+                "cached_response": cached.content,
+                "fresh_response": fresh.content,
+                "answer_similarity": answer_similarity,
+                "false_hit": false_hit,
+            }
+        )
+
+    async def wait_for_audits(self) -> None:
+        """Wait for the running audits of cache hits to finish."""
+        if self._audits:
+            await asyncio.gather(*self._audits, return_exceptions=True)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._scopes.clear()
+
+    @property
+    def samples(self) -> List[Dict[str, Any]]:
+        """
+        Get the most recent audited hits for review.
+
+        Returns:
+            List of dictionaries with both prompts, their similarity, both
+            answers, the answers' similarity and whether it was a false hit
+        """
+        return list(self._samples)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+
+        ``similarity`` describes the best match similarity of recent lookups:
+        its percentiles and a histogram in 0.05 wide buckets keyed by their
+        lower bound. ``false_hit_rate`` is estimated from the audited hits.
+
+        Returns:
+            Dictionary with hits, misses, bypassed requests, hit rate,
+            similarity distribution, audit counters and number of entries
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        similarity: Dict[str, Any] = {}
+        if self._similarities:
+            values = np.asarray(self._similarities)
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            buckets = np.clip(np.floor(values / 0.05), -20, 19).astype(int)
+            similarity = {
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
+                "histogram": {
+                    f"{bucket * 0.05:.2f}": int(count)
+                    for bucket, count in zip(*np.unique(buckets, return_counts=True))
+                },
+            }
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "false_hit_rate": (
+                self._stats["false_hits"] / self._stats["audited"]
+                if self._stats["audited"]
+                else 0.0
+            ),
+            "similarity": similarity,
+            "entries": sum(len(index) for index in self._scopes.values()),
+        }
@@ -0,0 +1,341 @@
+"""
+Fallback and hedged requests across LLM providers for the Agents Hub framework.
+"""
+
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+from collections import deque
+import asyncio
+import logging
+import time
+import numpy as np
+from agents_hub.llm.base import BaseLLM, LLMWrapper, LLMResponse, LLMStreamChunk
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf"))
+
+
+class ProviderStats:
+    """Latency and outcome statistics of one provider."""
+
+    def __init__(self, window: int):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.histogram = [0] * len(LATENCY_BUCKETS)
+        self.calls = 0
+        self.wins = 0
+        self.errors = 0
+        self.cancelled = 0
+
+    def record(self, latency: float) -> None:
+        self.latencies.append(latency)
+        for bucket, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.histogram[bucket] += 1
+                break
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        return float(np.percentile(np.asarray(self.latencies), fraction * 100))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "wins": self.wins,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+            "win_rate": self.wins / self.calls if self.calls else 0.0,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "histogram": {
+                f"le_{bound:g}": count
+                for bound, count in zip(LATENCY_BUCKETS, self.histogram)
+            },
+        }
+
+
+class LLMWithFallback(LLMWrapper):
+    """
+    LLM that fails over to other providers and can hedge slow requests.
+
+    Requests go to the primary LLM. If it fails, the fallbacks are tried in
+    order. With ``hedge`` enabled, a second request is sent to the next
+    provider when the primary has not answered within the ``hedge_percentile``
+    of its recent latencies; the first successful answer wins and the other
+    request is cancelled. This bounds the tail latency at the cost of a few
+    extra requests.
+
+    Embeddings are always taken from the primary LLM, since vectors from
+    different models cannot be compared.
+
+    Example:
+        ```python
+        llm = LLMWithFallback(
+            primary=openai_llm,
+            fallbacks=[claude_llm, gemini_llm],
+            hedge=True,
+            hedge_percentile=0.95,
+        )
+        print(llm.stats["providers"])
+        ```
+    """
+
+    def __init__(
+        self,
+        primary: BaseLLM,
+        fallbacks: Optional[List[BaseLLM]] = None,
+        max_retries: Optional[int] = None,
+        hedge: bool = False,
+        hedge_percentile: float = 0.95,
+        hedge_delay: Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 500,
+    ):
+        """
+        Initialize the fallback LLM.
+
+        Args:
+            primary: LLM used first for every request
+            fallbacks: LLMs tried in order when the previous ones fail
+            max_retries: Maximum number of fallbacks tried for a request
+                (all of them if not provided, and at most all of them)
+            hedge: Whether to send a hedged request to the first fallback when
+                the primary is slow
+            hedge_percentile: Percentile of the primary's recent latencies after
+                which a request is hedged
+            hedge_delay: Optional fixed delay in seconds after which a request
+                is hedged, instead of the learned percentile
+            min_samples: Number of primary latencies needed before hedging on
+                the learned percentile
+            window: Number of recent latencies kept per provider
+        """
+        super().__init__(primary)
+        self.primary = primary
+        self.fallbacks = list(fallbacks or [])
+        self.max_retries = (
+            len(self.fallbacks)
+            if max_retries is None
+            else min(len(self.fallbacks), max(0, max_retries))
+        )
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay = hedge_delay
+        self.min_samples = min_samples
+
+        self.providers = [self.primary] + self.fallbacks
+        self.labels = self._label_providers(self.providers)
+        self._provider_stats = [ProviderStats(window) for _ in self.providers]
+        self._stats = {"requests": 0, "failovers": 0, "hedges": 0, "hedge_wins": 0}
+
+    @staticmethod
+    def _label_providers(providers: List[BaseLLM]) -> List[str]:
+        """Name each provider for the statistics, keeping the names unique."""
+        labels = []
+        for index, llm in enumerate(providers):
+            try:
+                label = f"{llm.provider_name}:{llm.model_name}"
+            except NotImplementedError:
+                label = type(llm).__name__
+            labels.append(label if label not in labels else f"{label}#{index}")
+        return labels
+
+    def current_hedge_delay(self) -> Optional[float]:
+        """
+        Get the delay after which a request to the primary is hedged.
+
+        Returns:
+            Delay in seconds, or None if hedging is off or not enough latencies
+            of the primary have been recorded yet
+        """
+        if not self.hedge or not self.fallbacks:
+            return None
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        stats = self._provider_stats[0]
+        if len(stats.latencies) < self.min_samples:
+            return None
+        return stats.percentile(self.hedge_percentile)
+
+    async def _timed_generate(self, index: int, request: Dict[str, Any]) -> LLMResponse:
+        """
+        Call one provider, recording its latency and outcome.
+
+        A cancelled request, such as the loser of a hedge, records the time it
+        ran as a lower bound of its latency. Leaving it out would keep only
+        the fast requests, and lower the learned hedge delay over time.
+        """
+        stats = self._provider_stats[index]
+        stats.calls += 1
+        started_at = time.monotonic()
+        try:
+            response = await self.providers[index].generate(**request)
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            stats.record(time.monotonic() - started_at)
+            raise
+        except Exception:
+            stats.errors += 1
+            raise
+        stats.record(time.monotonic() - started_at)
+        return response
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate a response, failing over and hedging across providers.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse object from the first provider to answer successfully
+
+        Raises:
+            Exception: The last provider's error if every provider failed
+        """
+        request = dict(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        self._stats["requests"] += 1
+        candidates = iter(range(self.max_retries + 1))
+        pending: Dict[asyncio.Future, int] = {}
+        last_error: Optional[Exception] = None
+
+        def start_next() -> Optional[int]:
+            index = next(candidates, None)
+            if index is not None:
+                task = asyncio.ensure_future(self._timed_generate(index, request))
+                pending[task] = index
+            return index
+
+        start_next()
+        hedge_delay = self.current_hedge_delay()
+        hedged_index = None
+        try:
+            while pending:
+                # Only the primary's first attempt is hedged
+                timeout = hedge_delay if list(pending.values()) == [0] else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedge_delay = None
+                    hedged_index = start_next()
+                    if hedged_index is not None:
+                        self._stats["hedges"] += 1
+                    continue
+
+                for task in done:
+                    index = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(f"LLM provider {self.labels[index]} failed: {e}")
+                        if not pending and start_next() is not None:
+                            self._stats["failovers"] += 1
+                        continue
+
+                    self._provider_stats[index].wins += 1
+                    if index == hedged_index:
+                        self._stats["hedge_wins"] += 1
+                    return response
+        finally:
+            # Cancel the losers of a hedged request
+            for task in pending:
+                task.cancel()
+
+        raise last_error
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response, failing over to the next provider on an error.
+
+        Streams are not hedged. A provider that fails after yielding its first
+        chunk is not replaced, since part of its answer was already used.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            LLMStreamChunk objects
+        """
+        self._stats["requests"] += 1
+        last_error: Optional[Exception] = None
+        for index in range(self.max_retries + 1):
+            stats = self._provider_stats[index]
+            stats.calls += 1
+            started_at = time.monotonic()
+            started = False
+            try:
+                async for chunk in self.providers[index].stream(
+                    messages=messages,
+                    tools=tools,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                ):
+                    started = True
+                    yield chunk
+            except Exception as e:
+                stats.errors += 1
+                if started:
+                    raise
+                last_error = e
+                logger.warning(f"LLM provider {self.labels[index]} failed: {e}")
+                if index < self.max_retries:
+                    self._stats["failovers"] += 1
+                continue
+
+            stats.record(time.monotonic() - started_at)
+            stats.wins += 1
+            return
+
+        raise last_error
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the failover, hedging and per-provider statistics.
+
+        Returns:
+            Dictionary with request, failover and hedge counters, the current
+            hedge delay, and per provider its calls, wins, win rate, errors,
+            cancelled requests, latency percentiles and latency histogram
+        """
+        return {
+            **self._stats,
+            "hedge_delay": self.current_hedge_delay(),
+            "providers": {
+                label: stats.to_dict()
+                for label, stats in zip(self.labels, self._provider_stats)
+            },
+        }
@@ -2,11 +2,14 @@
 Anthropic Claude LLM provider for the Agents Hub framework.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator
 import json
 import httpx
 from anthropic import AsyncAnthropic
-from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.rate_limit import RateLimiter
+from agents_hub.llm.structured import ResponseSchema, inline_refs, json_schema
+from agents_hub.llm.tokens import get_token_counter
 from agents_hub.tools.base import BaseTool
 
 
@@ -15,17 +18,43 @@ class ClaudeProvider(BaseLLM):
     Anthropic Claude LLM provider.
 
     This class implements the BaseLLM interface for Anthropic Claude models.
+
+    With prompt caching, cache breakpoints are placed after the tools, the
+    system prompt and the last two user messages, so that the next turn of a
+    conversation reads its whole prefix from the cache: the tools and system
+    prompt, and the history up to the previous user message. Prefixes shorter
+    than the model's minimum cacheable length are not cached by the API.
+
+    Claude has no JSON mode, so a ``response_schema`` is enforced by offering
+    a tool whose input schema is the response schema and forcing its use. The
+    input of that tool call is returned as the JSON content of the response.
     """
 
-    def __init__(self, api_key: str, model: str = "claude-3-haiku-20240307", **kwargs):
+    # Name of the tool a structured response is given through
+    RESPONSE_TOOL = "structured_response"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-3-haiku-20240307",
+        rate_limiter: Optional[RateLimiter] = None,
+        prompt_caching: bool = True,
+        **kwargs,
+    ):
         """
         Initialize the Claude provider.
 
         Args:
             api_key: Anthropic API key
             model: Model to use for generation
+            rate_limiter: Optional rate limiter shared with other providers
+                using the same quota
+            prompt_caching: Whether to mark the stable prefix of requests
+                for caching
             **kwargs: Additional parameters to pass to the AsyncAnthropic client
         """
+        self.rate_limiter = rate_limiter
+        self.prompt_caching = prompt_caching
         self._model = model
         self._client = AsyncAnthropic(api_key=api_key, **kwargs)
 
@@ -45,52 +74,49 @@ class ClaudeProvider(BaseLLM):
             tools: Optional list of tools available to the model
             temperature: Temperature for generation
             max_tokens: Maximum tokens to generate
-            **kwargs: Additional parameters to pass to the API
+            **kwargs: Additional parameters to pass to the API; a
+                ``response_schema`` is enforced through a forced tool call
 
         Returns:
             LLMResponse object containing the generated text and any tool calls
         """
-        # Prepare tools for Claude format if provided
-        claude_tools = None
-        if tools:
-            claude_tools = [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.parameters,
-                }
-                for tool in tools
-            ]
+        # Prepare the system prompt, messages and tools, with cache breakpoints
+        response_schema = kwargs.pop("response_schema", None)
+        request = self._format_request(messages, tools, response_schema)
 
         # Make the API call
-        response = await self._client.messages.create(
-            model=self._model,
-            messages=messages,
-            tools=claude_tools,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
-        )
-
-        # Extract the response content and tool calls
-        content = response.content[0].text
+        async with self._rate_limited(self._request_tokens(messages, max_tokens)):
+            response = await self._create(
+                self._client.messages,
+                model=self._model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **request,
+                **kwargs,
+            )
 
-        # Process tool calls if any
+        # Extract the text and tool calls from the content blocks
+        content = ""
         tool_calls = None
-        if response.tool_use:
-            tool_calls = []
-            for tool_use in response.tool_use:
-                # Parse the arguments from JSON string to dict
-                try:
-                    arguments = json.loads(tool_use.input)
-                except json.JSONDecodeError:
-                    arguments = tool_use.input
-
+        for block in response.content:
+            if block.type == "text":
+                content += block.text
+            elif block.type == "tool_use" and block.name == self.RESPONSE_TOOL:
+                # The structured response replaces any text around it
+                return LLMResponse(
+                    content=json.dumps(block.input),
+                    raw_response=response.model_dump(),
+                )
+            elif block.type == "tool_use":
+                tool_calls = tool_calls or []
                 tool_calls.append(
                     {
-                        "id": tool_use.id,
-                        "name": tool_use.name,
-                        "arguments": arguments,
+                        "id": block.id,
+                        "type": "function",
+                        "function": {
+                            "name": block.name,
+                            "arguments": json.dumps(block.input),
+                        },
                     }
                 )
 
@@ -100,6 +126,205 @@ class ClaudeProvider(BaseLLM):
             raw_response=response.model_dump(),
         )
 
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[BaseTool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the Claude model.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the model
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters to pass to the API
+
+        Yields:
+            LLMStreamChunk objects; the final chunk carries assembled tool calls
+        """
+        if kwargs.get("response_schema") is not None:
+            # A structured response arrives as a tool input, not as text deltas
+            async for chunk in super().stream(
+                messages, tools, temperature, max_tokens, **kwargs
+            ):
+                yield chunk
+            return
+
+        request = self._format_request(messages, tools)
+
+        async with self._rate_limited(self._request_tokens(messages, max_tokens)):
+            stream = await self._create(
+                self._client.messages,
+                model=self._model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **request,
+                **kwargs,
+            )
+
+            # Tool use blocks arrive as a start event followed by partial JSON deltas
+            partial_tool_calls: Dict[int, Dict[str, Any]] = {}
+            stop_reason = None
+            usage: Dict[str, Any] = {}
+
+            async for event in stream:
+                if event.type == "message_start":
+                    # Input and cache token counts arrive with the first event
+                    usage.update(event.message.usage.model_dump(exclude_none=True))
+                elif event.type == "content_block_start":
+                    block = event.content_block
+                    if block.type == "tool_use":
+                        partial_tool_calls[event.index] = {
+                            "id": block.id,
+                            "name": block.name,
+                            "input_json": "",
+                        }
+                elif event.type == "content_block_delta":
+                    delta = event.delta
+                    if delta.type == "text_delta":
+                        yield LLMStreamChunk(content=delta.text)
+                    elif delta.type == "input_json_delta":
+                        partial = partial_tool_calls[event.index]
+                        partial["input_json"] += delta.partial_json
+                elif event.type == "message_delta":
+                    stop_reason = getattr(event.delta, "stop_reason", stop_reason)
+                    if getattr(event, "usage", None) is not None:
+                        usage.update(event.usage.model_dump(exclude_none=True))
+
+        tool_calls = None
+        if partial_tool_calls:
+            tool_calls = []
+            for index in sorted(partial_tool_calls):
+                partial = partial_tool_calls[index]
+                tool_calls.append(
+                    {
+                        "id": partial["id"],
+                        "type": "function",
+                        "function": {
+                            "name": partial["name"],
+                            "arguments": partial["input_json"] or "{}",
+                        },
+                    }
+                )
+
+        yield LLMStreamChunk(
+            tool_calls=tool_calls,
+            done=True,
+            raw_response={"stop_reason": stop_reason, "usage": usage},
+        )
+
+    def _format_request(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[BaseTool]],
+        response_schema: Optional[ResponseSchema] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the system prompt, messages and tools of a request.
+
+        System messages are moved to the system prompt, since Claude takes it
+        as a separate parameter. The input messages are not modified.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the model
+            response_schema: Optional schema of a structured response
+
+        Returns:
+            Dictionary of request parameters
+        """
+        system = [
+            {"type": "text", "text": message["content"]}
+            for message in messages
+            if message.get("role") == "system" and message.get("content")
+        ]
+        conversation = [
+            dict(message) for message in messages if message.get("role") != "system"
+        ]
+        claude_tools = self._format_tools(tools)
+        tool_choice = None
+        if response_schema is not None:
+            claude_tools = (claude_tools or []) + [
+                {
+                    "name": self.RESPONSE_TOOL,
+                    "description": "Give the final response in this structure.",
+                    "input_schema": inline_refs(json_schema(response_schema)),
+                }
+            ]
+            # With other tools, the model may still call them before responding
+            tool_choice = (
+                {"type": "any"}
+                if tools
+                else {"type": "tool", "name": self.RESPONSE_TOOL}
+            )
+
+        if self.prompt_caching:
+            # Claude caches the prefix up to each breakpoint, in the order
+            # tools, system prompt, messages; at most four breakpoints are used
+            if claude_tools:
+                claude_tools[-1]["cache_control"] = {"type": "ephemeral"}
+            if system:
+                system[-1]["cache_control"] = {"type": "ephemeral"}
+            user_indexes = [
+                index
+                for index, message in enumerate(conversation)
+                if message.get("role") == "user"
+            ]
+            for index in user_indexes[-2:]:
+                conversation[index] = self._with_cache_control(conversation[index])
+
+        request: Dict[str, Any] = {"messages": conversation}
+        if system:
+            request["system"] = system
+        if claude_tools:
+            request["tools"] = claude_tools
+        if tool_choice:
+            request["tool_choice"] = tool_choice
+        return request
+
+    def _with_cache_control(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark the last content block of a message as a cache breakpoint."""
+        content = message.get("content")
+        if isinstance(content, str) and content:
+            blocks = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            blocks = [dict(block) for block in content]
+        else:
+            return message
+
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        return {**message, "content": blocks}
+
+    def _format_tools(
+        self, tools: Optional[List[BaseTool]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Convert tools to the Claude tool use format.
+
+        Args:
+            tools: Optional list of tools
+
+        Returns:
+            List of Claude tool definitions, or None if no tools were given
+        """
+        if not tools:
+            return None
+
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.parameters,
+            }
+            for tool in tools
+        ]
+
     async def get_embedding(self, text: str) -> List[float]:
         """
         Get an embedding for the given text.
@@ -119,16 +344,31 @@ class ClaudeProvider(BaseLLM):
         """
         Get the number of tokens in the given text.
 
-        This is an approximation as Claude doesn't provide a direct way to count tokens.
+        Claude's tokenizer is not public, so the count is estimated
+        with a characters-per-token ratio that agents calibrate with
+        the usage the API reports.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Approximate number of tokens
+            Number of tokens
+        """
+        return get_token_counter().count(text, self._model, self.provider_name)
+
+    def get_message_token_count(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Get the number of prompt tokens of a list of messages.
+
+        Args:
+            messages: List of messages in the conversation
+
+        Returns:
+            Number of tokens, including the framing of each message
         """
-        # Simple approximation: 1 token ≈ 4 characters for English text
-        return len(text) // 4
+        return get_token_counter().count_messages(
+            messages, self._model, self.provider_name
+        )
 
     @property
     def provider_name(self) -> str:
@@ -2,10 +2,13 @@
 Google Gemini LLM provider for the Agents Hub framework.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator
 import json
 import google.generativeai as genai
-from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.rate_limit import RateLimiter
+from agents_hub.llm.structured import ResponseSchema, gemini_response_schema
+from agents_hub.llm.tokens import get_token_counter
 from agents_hub.tools.base import BaseTool
 
 
@@ -16,15 +19,27 @@ class GeminiProvider(BaseLLM):
     This class implements the BaseLLM interface for Google Gemini models.
     """
 
-    def __init__(self, api_key: str, model: str = "gemini-pro", **kwargs):
+    # Limit of the batchEmbedContents endpoint per request
+    embedding_batch_size = 100
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-pro",
+        rate_limiter: Optional[RateLimiter] = None,
+        **kwargs,
+    ):
         """
         Initialize the Gemini provider.
 
         Args:
             api_key: Google API key
             model: Model to use for generation
+            rate_limiter: Optional rate limiter shared with other providers
+                using the same quota
             **kwargs: Additional parameters to pass to the Gemini client
         """
+        self.rate_limiter = rate_limiter
         self._model = model
         genai.configure(api_key=api_key)
         self._client = genai.GenerativeModel(model_name=model, **kwargs)
@@ -45,12 +60,151 @@ class GeminiProvider(BaseLLM):
             tools: Optional list of tools available to the model
             temperature: Temperature for generation
             max_tokens: Maximum tokens to generate
-            **kwargs: Additional parameters to pass to the API
+            **kwargs: Additional parameters to pass to the API; a
+                ``response_schema`` is set in the generation config
 
         Returns:
             LLMResponse object containing the generated text and any tool calls
         """
         # Convert messages to Gemini format
+        gemini_messages = self._convert_messages(messages)
+
+        # Prepare function declarations if tools are provided
+        function_declarations = self._format_tools(tools)
+
+        # Make the API call
+        chat = self._client.start_chat(history=gemini_messages[:-1])
+        async with self._rate_limited(self._request_tokens(messages, max_tokens)):
+            response = await chat.send_message_async(
+                gemini_messages[-1]["parts"][0],
+                generation_config=self._generation_config(
+                    temperature,
+                    max_tokens,
+                    function_declarations,
+                    kwargs.pop("response_schema", None),
+                ),
+                **kwargs,
+            )
+
+        # Extract the response content and function calls, if any
+        content = ""
+        tool_calls = []
+        for candidate in getattr(response, "candidates", None) or []:
+            parts = getattr(getattr(candidate, "content", None), "parts", None)
+            for part in parts or []:
+                function_call = getattr(part, "function_call", None)
+                if function_call and function_call.name:
+                    tool_calls.append(
+                        self._format_tool_call(len(tool_calls), function_call)
+                    )
+                elif getattr(part, "text", None):
+                    content += part.text
+
+        return LLMResponse(
+            content=content,
+            tool_calls=tool_calls or None,
+            raw_response=self._raw_response(response),
+        )
+
+    @staticmethod
+    def _raw_response(response: Any) -> Optional[Dict[str, Any]]:
+        """Get the first candidate of a response, with the token usage."""
+        if not getattr(response, "candidates", None):
+            return None
+        raw = response.candidates[0].model_dump()
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            raw["usage_metadata"] = {
+                "prompt_token_count": usage.prompt_token_count,
+                "candidates_token_count": usage.candidates_token_count,
+            }
+        return raw
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[BaseTool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the Gemini model.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the model
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters to pass to the API
+
+        Yields:
+            LLMStreamChunk objects; the final chunk carries assembled tool calls
+        """
+        gemini_messages = self._convert_messages(messages)
+        function_declarations = self._format_tools(tools)
+
+        async with self._rate_limited(self._request_tokens(messages, max_tokens)):
+            chat = self._client.start_chat(history=gemini_messages[:-1])
+            response = await chat.send_message_async(
+                gemini_messages[-1]["parts"][0],
+                generation_config=self._generation_config(
+                    temperature,
+                    max_tokens,
+                    function_declarations,
+                    kwargs.pop("response_schema", None),
+                ),
+                stream=True,
+                **kwargs,
+            )
+
+            tool_calls = []
+            async for chunk in response:
+                for candidate in getattr(chunk, "candidates", None) or []:
+                    content = getattr(candidate, "content", None)
+                    for part in getattr(content, "parts", None) or []:
+                        function_call = getattr(part, "function_call", None)
+                        if function_call and function_call.name:
+                            # Gemini sends each function call whole, never in fragments
+                            tool_calls.append(
+                                self._format_tool_call(len(tool_calls), function_call)
+                            )
+                        elif getattr(part, "text", None):
+                            yield LLMStreamChunk(content=part.text)
+
+        yield LLMStreamChunk(tool_calls=tool_calls or None, done=True)
+
+    @staticmethod
+    def _format_tool_call(index: int, function_call: Any) -> Dict[str, Any]:
+        """
+        Format a Gemini function call as an OpenAI-style tool call.
+
+        Args:
+            index: Position of the call in the response
+            function_call: Function call of a response part
+
+        Returns:
+            Tool call with JSON-encoded arguments
+        """
+        return {
+            "id": f"call_{index}",
+            "type": "function",
+            "function": {
+                "name": function_call.name,
+                "arguments": json.dumps(dict(function_call.args or {})),
+            },
+        }
+
+    def _convert_messages(self, messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Convert messages to the Gemini chat format.
+
+        Args:
+            messages: List of messages in the conversation
+
+        Returns:
+            List of Gemini chat messages
+        """
         gemini_messages = []
         for message in messages:
             role = message["role"]
@@ -76,65 +230,67 @@ class GeminiProvider(BaseLLM):
                     {"role": "user", "parts": [f"TOOL RESPONSE: {content}"]}
                 )
 
-        # Prepare function declarations if tools are provided
-        function_declarations = None
-        if tools:
-            function_declarations = [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                }
-                for tool in tools
-            ]
+        return gemini_messages
 
-        # Make the API call
-        chat = self._client.start_chat(history=gemini_messages[:-1])
-        response = await chat.send_message_async(
-            gemini_messages[-1]["parts"][0],
-            generation_config={
-                "temperature": temperature,
-                "max_output_tokens": max_tokens,
-                "function_calling_config": (
-                    {"functions": function_declarations}
-                    if function_declarations
-                    else None
-                ),
-            },
-            **kwargs,
-        )
+    def _format_tools(
+        self, tools: Optional[List[BaseTool]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Convert tools to Gemini function declarations.
 
-        # Extract the response content
-        content = response.text
+        Args:
+            tools: Optional list of tools
 
-        # Process function calls if any
-        tool_calls = None
-        if hasattr(response, "function_calls") and response.function_calls:
-            tool_calls = []
-            for function_call in response.function_calls:
-                # Parse the arguments from JSON string to dict
-                try:
-                    arguments = json.loads(function_call.args)
-                except json.JSONDecodeError:
-                    arguments = function_call.args
-
-                tool_calls.append(
-                    {
-                        "id": f"call_{len(tool_calls)}",
-                        "name": function_call.name,
-                        "arguments": arguments,
-                    }
-                )
+        Returns:
+            List of function declarations, or None if no tools were given
+        """
+        if not tools:
+            return None
 
-        return LLMResponse(
-            content=content,
-            tool_calls=tool_calls,
-            raw_response=(
-                response.candidates[0].model_dump()
-                if hasattr(response, "candidates")
-                else None
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.parameters,
+            }
+            for tool in tools
+        ]
+
+    def _generation_config(
+        self,
+        temperature: float,
+        max_tokens: int,
+        function_declarations: Optional[List[Dict[str, Any]]],
+        response_schema: Optional[ResponseSchema] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the generation config for a request.
+
+        Gemini does not combine JSON output with function calling, so the
+        response schema is only applied to requests without functions.
+
+        Args:
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            function_declarations: Optional function declarations
+            response_schema: Optional schema of a structured response
+
+        Returns:
+            Generation config dictionary
+        """
+        config = {
+            "temperature": temperature,
+            "max_output_tokens": max_tokens,
+            "function_calling_config": (
+                {"functions": function_declarations} if function_declarations else None
             ),
-        )
+        }
+        if response_schema is not None and not function_declarations:
+            config["response_mime_type"] = "application/json"
+            schema = gemini_response_schema(response_schema)
+            if schema is not None:
+                config["response_schema"] = schema
+        return config
 
     async def get_embedding(self, text: str) -> List[float]:
         """
@@ -146,27 +302,61 @@ class GeminiProvider(BaseLLM):
         Returns:
             List of floats representing the embedding
         """
-        embedding = genai.embed_content(
-            model="models/embedding-001",
-            content=text,
-            task_type="retrieval_query",
-        )
+        async with self._rate_limited(self._count_tokens(text)):
+            embedding = genai.embed_content(
+                model="models/embedding-001",
+                content=text,
+                task_type="retrieval_query",
+            )
         return embedding["embedding"]
 
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for a batch of texts in a single batchEmbedContents request.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embeddings, in the order of the texts
+        """
+        async with self._rate_limited(sum(map(self._count_tokens, texts))):
+            embeddings = await genai.embed_content_async(
+                model="models/embedding-001",
+                content=texts,
+                task_type="retrieval_query",
+            )
+        return embeddings["embedding"]
+
     def get_token_count(self, text: str) -> int:
         """
         Get the number of tokens in the given text.
 
-        This is an approximation as Gemini doesn't provide a direct way to count tokens.
+        Counting with the API would cost a round trip, so the count
+        is estimated with a characters-per-token ratio that agents
+        calibrate with the usage the API reports.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Approximate number of tokens
+            Number of tokens
+        """
+        return get_token_counter().count(text, self._model, self.provider_name)
+
+    def get_message_token_count(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Get the number of prompt tokens of a list of messages.
+
+        Args:
+            messages: List of messages in the conversation
+
+        Returns:
+            Number of tokens, including the framing of each message
         """
-        # Simple approximation: 1 token ≈ 4 characters for English text
-        return len(text) // 4
+        return get_token_counter().count_messages(
+            messages, self._model, self.provider_name
+        )
 
     @property
     def provider_name(self) -> str:
@@ -2,10 +2,19 @@
 Ollama LLM provider for the Agents Hub framework.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator, Sequence, Tuple
+from contextlib import asynccontextmanager
 import json
 import httpx
-from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.providers.ollama_pool import (
+    FAILOVER_ERRORS,
+    OllamaEndpoint,
+    OllamaEndpointPool,
+)
+from agents_hub.llm.rate_limit import RateLimiter
+from agents_hub.llm.structured import is_free_form, json_schema
+from agents_hub.llm.tokens import get_token_counter
 from agents_hub.tools.base import BaseTool
 
 
@@ -14,23 +23,208 @@ class OllamaProvider(BaseLLM):
     Ollama LLM provider.
 
     This class implements the BaseLLM interface for local Ollama models.
+
+    Requests share one pooled HTTP client per node, so connections are kept
+    alive between calls. Close the provider when done with it, or use it as an
+    async context manager.
+
+    Given several base URLs, the provider balances requests between the
+    nodes, preferring nodes where the model is loaded, ejects failing nodes
+    and re-admits them once healthy (see ``OllamaEndpointPool``). Requests
+    that cannot connect to a node are sent to another one.
     """
 
+    embedding_batch_size = 256
+
     def __init__(
-        self, model: str = "llama3", base_url: str = "http://localhost:11434", **kwargs
+        self,
+        model: str = "llama3",
+        base_url: Union[str, Sequence[str]] = "http://localhost:11434",
+        timeout: float = 60.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        balancing: str = "least_outstanding",
+        model_affinity: bool = False,
+        health_check_interval: Optional[float] = 15.0,
+        failure_threshold: int = 3,
+        ejection_time: float = 30.0,
+        **kwargs,
     ):
         """
         Initialize the Ollama provider.
 
         Args:
             model: Model to use for generation
-            base_url: Base URL for Ollama API
+            base_url: Base URL for Ollama API, or a list of base URLs of
+                several nodes to balance requests between
+            timeout: Default timeout in seconds for a chat request; a ``timeout``
+                keyword argument to ``generate`` or ``stream`` overrides it
+            max_connections: Maximum number of concurrent connections per
+                node; further requests wait for a free connection
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive for reuse
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Whether to use HTTP/2 (requires ``pip install httpx[http2]``)
+            rate_limiter: Optional rate limiter shared with other providers
+                using the same nodes
+            balancing: How requests are balanced between several nodes:
+                ``"least_outstanding"`` (fewest requests in flight) or
+                ``"latency"`` (lowest average latency times requests in flight)
+            model_affinity: Whether to prefer nodes where the model is already
+                loaded, until their connections are all in use
+            health_check_interval: Seconds between health checks of several
+                nodes (None to only eject nodes on request failures)
+            failure_threshold: Consecutive failures that eject a node
+            ejection_time: Seconds an ejected node waits before a probe request
             **kwargs: Additional parameters for Ollama
         """
+        self.rate_limiter = rate_limiter
         self._model = model
-        self._base_url = base_url.rstrip("/")
+        base_urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        self._base_url = base_urls[0].rstrip("/") if base_urls else ""
+        self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
         self._additional_params = kwargs
 
+        self._pool = OllamaEndpointPool(
+            base_urls,
+            self._limits,
+            timeout=timeout,
+            http2=http2,
+            balancing=balancing,
+            model_affinity=model_affinity,
+            health_check_interval=health_check_interval,
+            failure_threshold=failure_threshold,
+            ejection_time=ejection_time,
+        )
+        self._in_flight = 0
+        self._pool_stats = {
+            "requests": 0,
+            "saturated_requests": 0,
+            "peak_in_flight": 0,
+        }
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client of the first node, creating it on first use.
+
+        A client is bound to the event loop it was created in, so a new one is
+        created when the provider is used from another event loop.
+
+        Returns:
+            Pooled HTTP client
+        """
+        return self._pool.endpoints[0].client
+
+    @property
+    def endpoint_pool(self) -> OllamaEndpointPool:
+        """Get the pool of nodes the requests are balanced between."""
+        return self._pool
+
+    @property
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool usage statistics.
+
+        A request is saturated when it starts while all ``max_connections``
+        connections to its node are in use, so it has to wait for a free one.
+        A high ``saturation`` means the pool is too small for the load.
+
+        Returns:
+            Dictionary with the pool limits, in-flight and peak in-flight
+            requests, request counts and the saturated fraction of requests,
+            and with several nodes the balancing statistics of each node
+        """
+        requests = self._pool_stats["requests"]
+        stats = {
+            "max_connections": self._limits.max_connections,
+            "max_keepalive_connections": self._limits.max_keepalive_connections,
+            "in_flight": self._in_flight,
+            **self._pool_stats,
+            "clients_created": sum(
+                endpoint.clients_created for endpoint in self._pool.endpoints
+            ),
+            "saturation": (
+                self._pool_stats["saturated_requests"] / requests if requests else 0.0
+            ),
+        }
+        if self._pool.balanced:
+            stats.update(self._pool.stats)
+        return stats
+
+    @asynccontextmanager
+    async def _track_request(self, exclude: Sequence[OllamaEndpoint] = ()):
+        """
+        Hold a node for a request, counting it for the saturation statistics.
+
+        Args:
+            exclude: Nodes not to send the request to
+
+        Yields:
+            The node to send the request to
+        """
+        async with self._pool.request(self._model, exclude) as endpoint:
+            max_connections = self._limits.max_connections
+            if max_connections is not None and endpoint.in_flight > max_connections:
+                self._pool_stats["saturated_requests"] += 1
+            self._pool_stats["requests"] += 1
+            self._in_flight += 1
+            self._pool_stats["peak_in_flight"] = max(
+                self._pool_stats["peak_in_flight"], self._in_flight
+            )
+            try:
+                yield endpoint
+            finally:
+                self._in_flight -= 1
+
+    async def _post(
+        self, path: str, payload: Dict[str, Any], timeout: float
+    ) -> Dict[str, Any]:
+        """
+        Send a request to a node, failing over to another node on connect errors.
+
+        Args:
+            path: Path of the API endpoint
+            payload: JSON payload
+            timeout: Request timeout in seconds
+
+        Returns:
+            JSON response
+        """
+        failed: List[OllamaEndpoint] = []
+        while True:
+            try:
+                async with self._track_request(failed) as endpoint:
+                    response = await endpoint.client.post(
+                        path, json=payload, timeout=timeout
+                    )
+                    response.raise_for_status()
+                    return response.json()
+            except FAILOVER_ERRORS:
+                failed.append(endpoint)
+                if not self._pool.can_fail_over(failed):
+                    raise
+
+    async def close(self) -> None:
+        """Close the pooled HTTP clients and their connections."""
+        await self._pool.close()
+
+    async def __aenter__(self) -> "OllamaProvider":
+        """Enter the async context, returning the provider."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit the async context, closing the pooled HTTP client."""
+        await self.close()
+
     async def generate(
         self,
         messages: List[Dict[str, str]],
@@ -47,24 +241,151 @@ class OllamaProvider(BaseLLM):
             tools: Optional list of tools available to the model
             temperature: Temperature for generation
             max_tokens: Maximum tokens to generate
-            **kwargs: Additional parameters to pass to the API
+            **kwargs: Additional parameters to pass to the API; ``timeout``
+                sets the request timeout in seconds
 
         Returns:
             LLMResponse object containing the generated text and any tool calls
         """
         # Prepare the request payload
+        timeout = kwargs.pop("timeout", None) or self._timeout
+        payload = self._build_payload(
+            messages, tools, temperature, max_tokens, stream=False, **kwargs
+        )
+
+        # Make the API call
+        tokens = self._request_tokens(messages, max_tokens)
+        async with self._rate_limited(tokens):
+            result = await self._post("/api/chat", payload, timeout)
+
+        # Extract the response content
+        content = result["message"]["content"]
+
+        # Check if the response contains a tool call (in JSON format)
+        tool_calls = self._tool_calls(content) if tools else None
+        if tool_calls:
+            # Set content to empty as it's a tool call
+            content = ""
+
+        return LLMResponse(
+            content=content,
+            tool_calls=tool_calls,
+            raw_response=result,
+        )
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[BaseTool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the Ollama model.
+
+        Ollama streams newline-delimited JSON objects, each carrying a fragment
+        of the assistant message, with ``done`` set on the last one.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the model
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters to pass to the API; ``timeout``
+                sets the request timeout in seconds
+
+        Yields:
+            LLMStreamChunk objects; the final chunk carries any tool call
+        """
+        timeout = kwargs.pop("timeout", None) or self._timeout
+        payload = self._build_payload(
+            messages, tools, temperature, max_tokens, stream=True, **kwargs
+        )
+
+        content = ""
+        final_result = None
+        failed: List[OllamaEndpoint] = []
+        tokens = self._request_tokens(messages, max_tokens)
+        async with self._rate_limited(tokens):
+            while True:
+                try:
+                    async with self._track_request(failed) as endpoint:
+                        async with endpoint.client.stream(
+                            "POST", "/api/chat", json=payload, timeout=timeout
+                        ) as response:
+                            response.raise_for_status()
+                            async for line in response.aiter_lines():
+                                if not line.strip():
+                                    continue
+
+                                result = json.loads(line)
+                                delta = result.get("message", {}).get("content", "")
+                                if delta:
+                                    content += delta
+                                    yield LLMStreamChunk(content=delta)
+
+                                if result.get("done"):
+                                    final_result = result
+                                    break
+                    break
+                except FAILOVER_ERRORS:
+                    # Raised when opening the stream, before any chunk
+                    failed.append(endpoint)
+                    if not self._pool.can_fail_over(failed):
+                        raise
+
+        # Tool calls are only recognizable once the whole message has arrived
+        tool_calls = self._tool_calls(content) if tools else None
+
+        yield LLMStreamChunk(
+            tool_calls=tool_calls, done=True, raw_response=final_result
+        )
+
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[BaseTool]],
+        temperature: float,
+        max_tokens: int,
+        stream: bool,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Build the request payload for the chat endpoint.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the model
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            stream: Whether to request a streamed response
+            **kwargs: Additional model options, and an optional
+                ``response_schema`` sent as the ``format`` of the response
+
+        Returns:
+            Request payload
+        """
+        response_schema = kwargs.pop("response_schema", None)
         payload = {
             "model": self._model,
-            "messages": messages,
+            # Copy the messages so the tool prompt never leaks into the caller's list
+            "messages": [dict(message) for message in messages],
             "options": {
                 "temperature": temperature,
                 "num_predict": max_tokens,
                 **self._additional_params,
                 **kwargs,
             },
-            "stream": False,
+            "stream": stream,
         }
 
+        # Tool calls are JSON requested by the prompt, so they cannot be
+        # constrained to the response schema as well
+        if response_schema is not None and not tools:
+            schema = json_schema(response_schema)
+            payload["format"] = "json" if is_free_form(schema) else schema
+
         # If tools are provided, add them to the system prompt
         if tools:
             # Find the system message or create one
@@ -98,42 +419,59 @@ class OllamaProvider(BaseLLM):
 
             system_message["content"] += tools_description
 
-        # Make the API call
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self._base_url}/api/chat", json=payload, timeout=60.0
-            )
-            response.raise_for_status()
-            result = response.json()
+        return payload
 
-        # Extract the response content
-        content = result["message"]["content"]
+    def _parse_tool_call(self, content: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Parse a JSON tool call from the model's response content.
 
-        # Check if the response contains a tool call (in JSON format)
-        tool_calls = None
-        if tools and content.strip().startswith("{") and content.strip().endswith("}"):
-            try:
-                tool_call_data = json.loads(content)
-                if "tool" in tool_call_data and "parameters" in tool_call_data:
-                    # Extract the tool call
-                    tool_calls = [
-                        {
-                            "id": "call_0",
-                            "name": tool_call_data["tool"],
-                            "arguments": tool_call_data["parameters"],
-                        }
-                    ]
-                    # Set content to empty as it's a tool call
-                    content = ""
-            except json.JSONDecodeError:
-                # Not a valid JSON, so it's a regular response
-                pass
+        Args:
+            content: Response content
 
-        return LLMResponse(
-            content=content,
-            tool_calls=tool_calls,
-            raw_response=result,
-        )
+        Returns:
+            Tuple of (tool name, parameters), or None if the content is not a tool call
+        """
+        stripped = content.strip()
+        if not (stripped.startswith("{") and stripped.endswith("}")):
+            return None
+
+        try:
+            tool_call_data = json.loads(stripped)
+        except json.JSONDecodeError:
+            # Not a valid JSON, so it's a regular response
+            return None
+
+        if "tool" in tool_call_data and "parameters" in tool_call_data:
+            return tool_call_data["tool"], tool_call_data["parameters"]
+
+        return None
+
+    def _tool_calls(self, content: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the tool calls of the model's response content.
+
+        Args:
+            content: Response content
+
+        Returns:
+            Tool calls in the OpenAI format, or None if the content is not a
+            tool call
+        """
+        tool_call_data = self._parse_tool_call(content)
+        if not tool_call_data:
+            return None
+
+        tool_name, tool_parameters = tool_call_data
+        return [
+            {
+                "id": "call_0",
+                "type": "function",
+                "function": {
+                    "name": tool_name,
+                    "arguments": json.dumps(tool_parameters),
+                },
+            }
+        ]
 
     async def get_embedding(self, text: str) -> List[float]:
         """
@@ -150,29 +488,62 @@ class OllamaProvider(BaseLLM):
             "prompt": text,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self._base_url}/api/embeddings", json=payload, timeout=30.0
-            )
-            response.raise_for_status()
-            result = response.json()
+        tokens = self._count_tokens(text)
+        async with self._rate_limited(tokens):
+            result = await self._post("/api/embeddings", payload, 30.0)
 
         return result["embedding"]
 
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for a batch of texts in a single request to ``/api/embed``.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embeddings, in the order of the texts
+        """
+        payload = {
+            "model": self._model,
+            "input": texts,
+        }
+
+        tokens = sum(map(self._count_tokens, texts))
+        async with self._rate_limited(tokens):
+            result = await self._post("/api/embed", payload, 60.0)
+
+        return result["embeddings"]
+
     def get_token_count(self, text: str) -> int:
         """
         Get the number of tokens in the given text.
 
-        This is an approximation as Ollama doesn't provide a direct way to count tokens.
+        Ollama does not expose its tokenizers, so the count is
+        estimated with a characters-per-token ratio that agents
+        calibrate with the usage the API reports.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Approximate number of tokens
+            Number of tokens
         """
-        # Simple approximation: 1 token ≈ 4 characters for English text
-        return len(text) // 4
+        return get_token_counter().count(text, self._model, self.provider_name)
+
+    def get_message_token_count(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Get the number of prompt tokens of a list of messages.
+
+        Args:
+            messages: List of messages in the conversation
+
+        Returns:
+            Number of tokens, including the framing of each message
+        """
+        return get_token_counter().count_messages(
+            messages, self._model, self.provider_name
+        )
 
     @property
     def provider_name(self) -> str:
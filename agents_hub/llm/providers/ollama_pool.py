@@ -0,0 +1,399 @@
+"""
+Load-balanced pool of Ollama endpoints for the Agents Hub framework.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+import time
+import httpx
+from agents_hub.llm.resilience import CircuitBreaker, CircuitOpenError, is_retryable
+
+logger = logging.getLogger(__name__)
+
+BALANCING_STRATEGIES = ("least_outstanding", "latency")
+
+# Errors raised before a request reached the node, so it can go to another one
+FAILOVER_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def model_tag(model: str) -> str:
+    """Get the full name of a model as Ollama lists it, with its tag."""
+    return model if ":" in model else f"{model}:latest"
+
+
+class OllamaEndpoint:
+    """
+    One Ollama node of a pool, with its own HTTP client and health state.
+
+    The endpoint is ejected from the pool by its circuit breaker after
+    consecutive failures, and re-admitted by a passing health check or a
+    successful probe request once the ejection time has passed.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        limits: httpx.Limits,
+        timeout: float,
+        http2: bool = False,
+        failure_threshold: int = 3,
+        ejection_time: float = 30.0,
+        latency_decay: float = 0.3,
+    ):
+        """
+        Initialize the endpoint.
+
+        Args:
+            base_url: Base URL of the Ollama API of the node
+            limits: Connection limits of the node's HTTP client
+            timeout: Default request timeout in seconds
+            http2: Whether to use HTTP/2
+            failure_threshold: Consecutive failures that eject the node
+            ejection_time: Seconds an ejected node waits before a probe request
+            latency_decay: Weight of the latest request in the latency average
+        """
+        self.base_url = base_url.rstrip("/")
+        self.limits = limits
+        self.timeout = timeout
+        self.http2 = http2
+        self.latency_decay = latency_decay
+        self.breaker = CircuitBreaker(
+            name=f"ollama:{self.base_url}",
+            failure_threshold=failure_threshold,
+            recovery_timeout=ejection_time,
+        )
+        self.models: Set[str] = set()
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.clients_created = 0
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client of the node, creating it on first use.
+
+        A client is bound to the event loop it was created in, so a new one is
+        created when the endpoint is used from another event loop.
+
+        Returns:
+            Pooled HTTP client
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout,
+            )
+            self._client_loop = loop
+            self.clients_created += 1
+        return self._client
+
+    def observe(self, seconds: float) -> None:
+        """Add the duration of a successful request to the latency average."""
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += self.latency_decay * (seconds - self.latency)
+
+    def has_model(self, model: str) -> bool:
+        """Whether the model is loaded on the node, as far as the pool knows."""
+        return model_tag(model) in self.models
+
+    async def close(self) -> None:
+        """Close the HTTP client of the node and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the statistics of the node.
+
+        Returns:
+            Dictionary with the URL, the breaker state, the in-flight
+            requests, the request and failure counts, the average latency in
+            milliseconds and the loaded models
+        """
+        return {
+            "url": self.base_url,
+            "state": self.breaker.state,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "latency_ms": self.latency * 1000 if self.latency is not None else None,
+            "models": sorted(self.models),
+        }
+
+
+class OllamaEndpointPool:
+    """
+    Pool of Ollama nodes that balances requests between them.
+
+    Each request goes to the available node with the fewest requests in
+    flight (``least_outstanding``), or with the lowest expected wait, its
+    average latency times its requests in flight plus one (``latency``).
+    With ``model_affinity``, nodes where the model is already loaded are
+    preferred, so requests do not wait for a cold model load, until all of
+    them have every connection in use; requests then spill over to the other
+    nodes, which load the model too.
+
+    Nodes that fail repeatedly are ejected, and are re-admitted when a health
+    check or a probe request succeeds. Health checks poll ``/api/ps`` in the
+    background, which also tells which models each node has loaded.
+    """
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        limits: httpx.Limits,
+        timeout: float = 60.0,
+        http2: bool = False,
+        balancing: str = "least_outstanding",
+        model_affinity: bool = False,
+        health_check_interval: Optional[float] = 15.0,
+        health_check_timeout: float = 5.0,
+        failure_threshold: int = 3,
+        ejection_time: float = 30.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            base_urls: Base URLs of the Ollama APIs of the nodes
+            limits: Connection limits of each node's HTTP client
+            timeout: Default request timeout in seconds
+            http2: Whether to use HTTP/2
+            balancing: ``"least_outstanding"`` or ``"latency"``
+            model_affinity: Whether to prefer nodes with the model loaded
+            health_check_interval: Seconds between health checks (None to
+                only rely on request failures)
+            health_check_timeout: Timeout of a health check in seconds
+            failure_threshold: Consecutive failures that eject a node
+            ejection_time: Seconds an ejected node waits before a probe request
+        """
+        if not base_urls:
+            raise ValueError("At least one Ollama base URL is required")
+        if balancing not in BALANCING_STRATEGIES:
+            raise ValueError(
+                f"Unknown balancing strategy '{balancing}', "
+                f"expected one of {', '.join(BALANCING_STRATEGIES)}"
+            )
+
+        self.endpoints = [
+            OllamaEndpoint(
+                url,
+                limits,
+                timeout,
+                http2=http2,
+                failure_threshold=failure_threshold,
+                ejection_time=ejection_time,
+            )
+            for url in base_urls
+        ]
+        self.balancing = balancing
+        self.model_affinity = model_affinity
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._health_task: Optional["asyncio.Task"] = None
+        self._stats = {"affinity_hits": 0, "failovers": 0, "health_checks": 0}
+
+    @property
+    def balanced(self) -> bool:
+        """Whether the pool has several nodes to balance between."""
+        return len(self.endpoints) > 1
+
+    def _score(self, endpoint: OllamaEndpoint) -> Tuple[float, int]:
+        """Sort key of a node; the lowest is chosen."""
+        if self.balancing == "latency":
+            # Nodes without a latency yet are tried first, to measure them
+            expected = (endpoint.latency or 0.0) * (endpoint.in_flight + 1)
+            return (expected, endpoint.requests)
+        return (endpoint.in_flight, endpoint.requests)
+
+    def select(
+        self, model: str, exclude: Sequence[OllamaEndpoint] = ()
+    ) -> OllamaEndpoint:
+        """
+        Choose the node for a request.
+
+        Args:
+            model: Model the request is for
+            exclude: Nodes not to choose, e.g. ones that just failed
+
+        Returns:
+            The chosen node
+
+        Raises:
+            CircuitOpenError: If every node is ejected or excluded
+        """
+        if not self.balanced:
+            # A single node is never ejected, there is nowhere else to go
+            return self.endpoints[0]
+
+        candidates = [
+            endpoint
+            for endpoint in self.endpoints
+            if endpoint not in exclude and endpoint.breaker.available
+        ]
+        if not candidates:
+            retry_in = min(endpoint.breaker.retry_in for endpoint in self.endpoints)
+            raise CircuitOpenError("ollama", retry_in)
+
+        if self.model_affinity:
+            max_connections = self.endpoints[0].limits.max_connections
+            loaded = [
+                endpoint
+                for endpoint in candidates
+                if endpoint.has_model(model)
+                and (max_connections is None or endpoint.in_flight < max_connections)
+            ]
+            if loaded:
+                self._stats["affinity_hits"] += 1
+                candidates = loaded
+
+        return min(candidates, key=self._score)
+
+    def can_fail_over(self, exclude: Sequence[OllamaEndpoint]) -> bool:
+        """Whether another node than the excluded ones is available."""
+        return self.balanced and any(
+            endpoint not in exclude and endpoint.breaker.available
+            for endpoint in self.endpoints
+        )
+
+    @asynccontextmanager
+    async def request(self, model: str, exclude: Sequence[OllamaEndpoint] = ()):
+        """
+        Hold a node for a request, recording its outcome and latency.
+
+        Args:
+            model: Model the request is for
+            exclude: Nodes not to choose
+
+        Yields:
+            The chosen node
+
+        Raises:
+            CircuitOpenError: If every node is ejected or excluded
+        """
+        self._ensure_health_checks()
+        endpoint = self.select(model, exclude)
+        breaker = endpoint.breaker if self.balanced else None
+        if breaker is not None:
+            breaker.acquire()
+        if exclude:
+            self._stats["failovers"] += 1
+
+        endpoint.requests += 1
+        endpoint.in_flight += 1
+        started_at = time.monotonic()
+        try:
+            yield endpoint
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception as e:
+            retryable = is_retryable(e)
+            endpoint.failures += retryable
+            if breaker is not None and retryable:
+                breaker.record_failure()
+            elif breaker is not None:
+                # The node answered, the request itself was invalid
+                breaker.record_success()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            endpoint.observe(time.monotonic() - started_at)
+            endpoint.models.add(model_tag(model))
+        finally:
+            endpoint.in_flight -= 1
+
+    def _ensure_health_checks(self) -> None:
+        """Start the health checks in the running event loop if needed."""
+        if not self.health_check_interval or not self.balanced:
+            return
+        task = self._health_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._health_task = asyncio.ensure_future(self._run_health_checks())
+
+    async def _run_health_checks(self) -> None:
+        """Check the health of every node, every ``health_check_interval``."""
+        while True:
+            await self.check_health()
+            await asyncio.sleep(self.health_check_interval)
+
+    async def check_health(self) -> None:
+        """
+        Check the health of every node and refresh its loaded models.
+
+        A node that answers is re-admitted if it was ejected; a node that does
+        not counts a failure towards its ejection.
+        """
+        await asyncio.gather(
+            *(self._check_endpoint(endpoint) for endpoint in self.endpoints)
+        )
+
+    async def _check_endpoint(self, endpoint: OllamaEndpoint) -> None:
+        """Check the health of one node."""
+        self._stats["health_checks"] += 1
+        try:
+            response = await endpoint.client.get(
+                "/api/ps", timeout=self.health_check_timeout
+            )
+            response.raise_for_status()
+            models = response.json().get("models") or []
+        except Exception as e:
+            logger.debug(f"Health check of {endpoint.base_url} failed: {e}")
+            endpoint.breaker.record_failure()
+            return
+
+        endpoint.models = {model.get("name", "") for model in models}
+        if endpoint.breaker.state != CircuitBreaker.CLOSED:
+            logger.info(f"Ollama node {endpoint.base_url} is healthy again")
+        endpoint.breaker.record_success()
+
+    async def close(self) -> None:
+        """Stop the health checks and close the connections of every node."""
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            if task.get_loop() is asyncio.get_running_loop():
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        for endpoint in self.endpoints:
+            await endpoint.close()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the statistics of the pool.
+
+        Returns:
+            Dictionary with the affinity hits, failovers and health checks,
+            and the statistics of each node
+        """
+        return {
+            **self._stats,
+            "endpoints": [endpoint.stats for endpoint in self.endpoints],
+        }
@@ -2,11 +2,14 @@
 OpenAI LLM provider for the Agents Hub framework.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator
 import json
 import httpx
 from openai import AsyncOpenAI
-from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.rate_limit import RateLimiter
+from agents_hub.llm.structured import openai_response_format
+from agents_hub.llm.tokens import get_token_counter
 from agents_hub.tools.base import BaseTool
 
 
@@ -17,12 +20,17 @@ class OpenAIProvider(BaseLLM):
     This class implements the BaseLLM interface for OpenAI models.
     """
 
+    # Limits of the embeddings endpoint per request
+    embedding_batch_size = 2048
+    embedding_batch_tokens = 300_000
+
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4o-mini",
         base_url: Optional[str] = None,
         embedding_model: str = "text-embedding-3-small",
+        rate_limiter: Optional[RateLimiter] = None,
         **kwargs,
     ):
         """
@@ -33,8 +41,11 @@ class OpenAIProvider(BaseLLM):
             model: Model to use for generation
             base_url: Optional base URL for API requests
             embedding_model: Model to use for embeddings
+            rate_limiter: Optional rate limiter shared with other providers
+                using the same quota
             **kwargs: Additional parameters to pass to the AsyncOpenAI client
         """
+        self.rate_limiter = rate_limiter
         self._model = model
         self._embedding_model = embedding_model
         self._client = AsyncOpenAI(api_key=api_key, base_url=base_url, **kwargs)
@@ -55,35 +66,27 @@ class OpenAIProvider(BaseLLM):
             tools: Optional list of tools available to the model
             temperature: Temperature for generation
             max_tokens: Maximum tokens to generate
-            **kwargs: Additional parameters to pass to the API
+            **kwargs: Additional parameters to pass to the API; a
+                ``response_schema`` is sent as the ``response_format``
 
         Returns:
             LLMResponse object containing the generated text and any tool calls
         """
         # Prepare tools for OpenAI format if provided
-        openai_tools = None
-        if tools:
-            openai_tools = [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.parameters,
-                    },
-                }
-                for tool in tools
-            ]
+        openai_tools = self._format_tools(tools)
+        self._set_response_format(kwargs)
 
         # Make the API call
-        response = await self._client.chat.completions.create(
-            model=self._model,
-            messages=messages,
-            tools=openai_tools,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs,
-        )
+        async with self._rate_limited(self._request_tokens(messages, max_tokens)):
+            response = await self._create(
+                self._client.chat.completions,
+                model=self._model,
+                messages=messages,
+                tools=openai_tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
 
         # Extract the response content and tool calls
         message = response.choices[0].message
@@ -121,6 +124,128 @@ class OpenAIProvider(BaseLLM):
             raw_response=response.model_dump(),
         )
 
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[BaseTool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the OpenAI model.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the model
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional parameters to pass to the API
+
+        Yields:
+            LLMStreamChunk objects; the final chunk carries assembled tool calls
+            and the token usage, including cached prompt tokens
+        """
+        # Have the API report the usage in a last chunk without choices
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        self._set_response_format(kwargs)
+
+        async with self._rate_limited(self._request_tokens(messages, max_tokens)):
+            stream = await self._create(
+                self._client.chat.completions,
+                model=self._model,
+                messages=messages,
+                tools=self._format_tools(tools),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs,
+            )
+
+            # Tool call deltas arrive in fragments keyed by index
+            partial_tool_calls: Dict[int, Dict[str, Any]] = {}
+            finish_reason = None
+            usage = None
+
+            async for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage.model_dump()
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                delta = choice.delta
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+                if delta.tool_calls:
+                    for tool_call_delta in delta.tool_calls:
+                        partial = partial_tool_calls.setdefault(
+                            tool_call_delta.index,
+                            {
+                                "id": None,
+                                "type": "function",
+                                "function": {"name": "", "arguments": ""},
+                            },
+                        )
+                        if tool_call_delta.id:
+                            partial["id"] = tool_call_delta.id
+                        function_delta = tool_call_delta.function
+                        if function_delta:
+                            function = partial["function"]
+                            if function_delta.name:
+                                function["name"] += function_delta.name
+                            if function_delta.arguments:
+                                function["arguments"] += function_delta.arguments
+
+                if delta.content:
+                    yield LLMStreamChunk(content=delta.content)
+
+        tool_calls = None
+        if partial_tool_calls:
+            tool_calls = [
+                partial_tool_calls[index] for index in sorted(partial_tool_calls)
+            ]
+
+        yield LLMStreamChunk(
+            tool_calls=tool_calls,
+            done=True,
+            raw_response={"finish_reason": finish_reason, "usage": usage},
+        )
+
+    def _set_response_format(self, kwargs: Dict[str, Any]) -> None:
+        """Replace the ``response_schema`` of request parameters by its format."""
+        response_schema = kwargs.pop("response_schema", None)
+        if response_schema is not None:
+            kwargs["response_format"] = openai_response_format(response_schema)
+
+    def _format_tools(
+        self, tools: Optional[List[BaseTool]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Convert tools to the OpenAI function calling format.
+
+        Args:
+            tools: Optional list of tools
+
+        Returns:
+            List of OpenAI tool definitions, or None if no tools were given
+        """
+        if not tools:
+            return None
+
+        return [
+            {
+                "type": "function",
+                "function": {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                },
+            }
+            for tool in tools
+        ]
+
     async def get_embedding(self, text: str) -> List[float]:
         """
         Get an embedding for the given text using OpenAI's embedding model.
@@ -131,26 +256,60 @@ class OpenAIProvider(BaseLLM):
         Returns:
             List of floats representing the embedding
         """
-        response = await self._client.embeddings.create(
-            model=self._embedding_model,
-            input=text,
-        )
+        async with self._rate_limited(self._count_tokens(text)):
+            response = await self._create(
+                self._client.embeddings,
+                model=self._embedding_model,
+                input=text,
+            )
         return response.data[0].embedding
 
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for a batch of texts in a single request.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embeddings, in the order of the texts
+        """
+        async with self._rate_limited(sum(map(self._count_tokens, texts))):
+            response = await self._create(
+                self._client.embeddings,
+                model=self._embedding_model,
+                input=texts,
+            )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
     def get_token_count(self, text: str) -> int:
         """
         Get the number of tokens in the given text.
 
-        This is an approximation as OpenAI doesn't provide a direct way to count tokens.
+        tiktoken encodes the text exactly; without tiktoken or its
+        encoding files the count is estimated.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Approximate number of tokens
+            Number of tokens
+        """
+        return get_token_counter().count(text, self._model, self.provider_name)
+
+    def get_message_token_count(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Get the number of prompt tokens of a list of messages.
+
+        Args:
+            messages: List of messages in the conversation
+
+        Returns:
+            Number of tokens, including the framing of each message
         """
-        # Simple approximation: 1 token ≈ 4 characters for English text
-        return len(text) // 4
+        return get_token_counter().count_messages(
+            messages, self._model, self.provider_name
+        )
 
     @property
     def provider_name(self) -> str:
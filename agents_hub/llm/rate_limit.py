@@ -0,0 +1,469 @@
+"""
+Client-side rate limiting for LLM providers in the Agents Hub framework.
+"""
+
+from typing import Any, Dict, Mapping, Optional
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import asyncio
+import logging
+import re
+import time
+import weakref
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    A request larger than the bucket is let through once the bucket is full,
+    leaving it in debt, so oversized requests are slowed down but not blocked.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the token bucket.
+
+        Args:
+            per_minute: Refill rate per minute
+            capacity: Maximum number of tokens (one minute's worth by default)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self._updated_at = time.monotonic()
+        # Lock of each event loop, see _lock
+        self._locks = weakref.WeakKeyDictionary()
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        # A lock is bound to the event loop it is first used in, and a shared
+        # bucket may be used from several loops, so each loop gets its own
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until enough are available.
+
+        Args:
+            amount: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        # The lock makes waiters take their turn in order
+        async with self._lock:
+            while True:
+                self._refill()
+                needed = min(amount, self.capacity)
+                if self.tokens >= needed:
+                    self.tokens -= amount
+                    return waited
+                delay = (needed - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def limit_to(self, remaining: float) -> None:
+        """
+        Lower the available tokens to what the provider reports as remaining.
+
+        Args:
+            remaining: Tokens remaining according to the provider
+        """
+        self._refill()
+        self.tokens = min(self.tokens, remaining)
+
+
+class RateLimiter:
+    """
+    Adaptive client-side rate limiter for LLM providers.
+
+    Requests wait for a requests-per-minute and a tokens-per-minute token
+    bucket, and for a free slot under an adaptive concurrency limit. The limit
+    grows by ``increase`` per round of successful requests and is multiplied
+    by ``decrease`` when the provider throttles or is overloaded (AIMD), so it
+    settles just under what the provider accepts. The rate limit headers of
+    the provider's responses, successful or not, lower the buckets to the
+    remaining quota and pause all requests until an exhausted limit resets.
+
+    Share one limiter between all the providers that draw from the same quota,
+    for example with ``get_rate_limiter("openai", ...)``, so the agents of a
+    workforce do not overrun it together.
+
+    Example:
+        ```python
+        limiter = get_rate_limiter("openai", requests_per_minute=500, tokens_per_minute=200_000)
+        llm = OpenAIProvider(api_key=..., rate_limiter=limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 32,
+        min_concurrency: int = 1,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        default_retry_after: float = 1.0,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Optional maximum number of requests per minute
+            tokens_per_minute: Optional maximum number of tokens per minute
+            max_concurrency: Maximum (and initial) number of concurrent requests
+            min_concurrency: Minimum number of concurrent requests
+            increase: Concurrency added per round of successful requests
+            decrease: Factor applied to the concurrency on throttling
+            default_retry_after: Seconds to pause after a 429 response without
+                a ``retry-after`` header
+        """
+        self.requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(1, min_concurrency)
+        self.increase = increase
+        self.decrease = decrease
+        self.default_retry_after = default_retry_after
+
+        self._concurrency = float(max_concurrency)
+        self._in_flight = 0
+        # Slot condition of each event loop, see _slots
+        self._conditions = weakref.WeakKeyDictionary()
+        # Sequence number of the last request acquired before the last decrease
+        self._decreased_at = 0
+        self._blocked_until = 0.0
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "overloaded": 0,
+            "wait_time": 0.0,
+        }
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_concurrency, int(self._concurrency))
+
+    @property
+    def _slots(self) -> asyncio.Condition:
+        # Created lazily per event loop, since a condition is bound to the loop
+        # it is first used in and a shared limiter may be used from several
+        loop = asyncio.get_running_loop()
+        condition = self._conditions.get(loop)
+        if condition is None:
+            condition = self._conditions[loop] = asyncio.Condition()
+        return condition
+
+    async def acquire(self, tokens: int = 0) -> int:
+        """
+        Wait until a request may be sent, and take a concurrency slot.
+
+        Args:
+            tokens: Estimated number of tokens of the request
+
+        Returns:
+            Sequence number of the request
+        """
+        started_at = time.monotonic()
+
+        pause = self._blocked_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        if self.requests is not None:
+            await self.requests.acquire(1)
+        if self.tokens is not None and tokens:
+            await self.tokens.acquire(tokens)
+
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < self.concurrency_limit)
+            self._in_flight += 1
+
+        self._stats["requests"] += 1
+        self._stats["wait_time"] += time.monotonic() - started_at
+        return self._stats["requests"]
+
+    async def release(self) -> None:
+        """Give back a concurrency slot."""
+        current = asyncio.get_running_loop()
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+        # Wake the requests waiting for a slot in the other event loops too
+        for loop, condition in list(self._conditions.items()):
+            if loop is not current and not loop.is_closed():
+                loop.call_soon_threadsafe(
+                    asyncio.ensure_future, self._notify(condition)
+                )
+
+    @staticmethod
+    async def _notify(condition: asyncio.Condition) -> None:
+        """Wake the requests waiting on a condition."""
+        async with condition:
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 0):
+        """
+        Limit one request, adapting to its outcome.
+
+        Args:
+            tokens: Estimated number of tokens of the request
+        """
+        sequence = await self.acquire(tokens)
+        try:
+            yield
+        except Exception as e:
+            self.record_error(e, sequence)
+            raise
+        else:
+            self.record_success()
+        finally:
+            await self.release()
+
+    def record_success(self) -> None:
+        """Grow the concurrency limit after a successful request."""
+        self._concurrency = min(
+            self.max_concurrency,
+            self._concurrency + self.increase / max(1.0, self._concurrency),
+        )
+
+    def record_error(self, error: Exception, sequence: Optional[int] = None) -> None:
+        """
+        Back off if an error shows the provider is throttling or overloaded.
+
+        The concurrency limit is lowered at most once per window of requests
+        in flight: errors of requests sent before the last decrease belong to
+        the same burst and do not lower it again.
+
+        Args:
+            error: Error raised by the provider call
+            sequence: Sequence number of the failed request, as returned by
+                ``acquire()`` (None to always lower the limit)
+        """
+        status = error_status(error)
+        headers = error_headers(error)
+        if headers:
+            self.update_from_headers(headers)
+
+        # 429 is throttling; 5xx (and Anthropic's 529) means overloaded
+        if status is None or (status != 429 and status < 500):
+            return
+
+        if status == 429:
+            self._stats["throttled"] += 1
+            retry_after = parse_retry_after(headers or {})
+            self.pause(
+                retry_after if retry_after is not None else self.default_retry_after
+            )
+        else:
+            self._stats["overloaded"] += 1
+
+        if sequence is not None and sequence <= self._decreased_at:
+            # Sent before the last decrease, so part of the same burst
+            return
+        self._concurrency = max(
+            float(self.min_concurrency), self._concurrency * self.decrease
+        )
+        self._decreased_at = self._stats["requests"]
+        logger.warning(
+            f"Provider returned {status}; concurrency limit lowered to "
+            f"{self.concurrency_limit}"
+        )
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all new requests for a while.
+
+        Args:
+            seconds: Seconds to pause for
+        """
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, Any]) -> None:
+        """
+        Apply the rate limit headers of a provider response.
+
+        Understands the ``x-ratelimit-*`` headers of OpenAI, the
+        ``anthropic-ratelimit-*`` headers of Anthropic and ``retry-after``.
+
+        Args:
+            headers: Response headers
+        """
+        headers = {str(key).lower(): value for key, value in headers.items()}
+        for kind, bucket in (("requests", self.requests), ("tokens", self.tokens)):
+            remaining = _first(
+                headers,
+                f"x-ratelimit-remaining-{kind}",
+                f"anthropic-ratelimit-{kind}-remaining",
+            )
+            if remaining is None:
+                continue
+            try:
+                remaining = float(remaining)
+            except ValueError:
+                continue
+
+            if bucket is not None:
+                bucket.limit_to(remaining)
+            if remaining <= 0:
+                reset = parse_reset(
+                    _first(
+                        headers,
+                        f"x-ratelimit-reset-{kind}",
+                        f"anthropic-ratelimit-{kind}-reset",
+                    )
+                )
+                self.pause(reset if reset is not None else self.default_retry_after)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the rate limiter statistics.
+
+        Returns:
+            Dictionary with request, throttle and overload counters, total
+            wait time, in-flight requests and the current concurrency limit
+        """
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "concurrency_limit": self.concurrency_limit,
+            "paused_for": max(0.0, self._blocked_until - time.monotonic()),
+        }
+
+
+_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str, **kwargs) -> RateLimiter:
+    """
+    Get the process-wide rate limiter of a quota, creating it on first use.
+
+    Args:
+        name: Name of the quota, e.g. "openai" or "anthropic"
+        **kwargs: Parameters for the RateLimiter when it is created
+
+    Returns:
+        The shared RateLimiter
+    """
+    if name not in _RATE_LIMITERS:
+        _RATE_LIMITERS[name] = RateLimiter(**kwargs)
+    return _RATE_LIMITERS[name]
+
+
+def error_status(error: Exception) -> Optional[int]:
+    """
+    Get the HTTP status code of a provider error.
+
+    Works with the OpenAI and Anthropic SDK errors, ``httpx.HTTPStatusError``
+    and Google API errors.
+
+    Args:
+        error: Error raised by a provider call
+
+    Returns:
+        Status code, or None if the error has none
+    """
+    for candidate in (
+        getattr(error, "status_code", None),
+        getattr(getattr(error, "response", None), "status_code", None),
+        getattr(error, "code", None),
+    ):
+        if isinstance(candidate, int):
+            return candidate
+    return None
+
+
+def error_headers(error: Exception) -> Optional[Mapping[str, Any]]:
+    """
+    Get the response headers of a provider error.
+
+    Args:
+        error: Error raised by a provider call
+
+    Returns:
+        Response headers, or None if the error has none
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    return headers if isinstance(headers, Mapping) else None
+
+
+def parse_retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """
+    Get the delay requested by a ``retry-after`` or ``retry-after-ms`` header.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Delay in seconds, or None if there is no such header
+    """
+    headers = {str(key).lower(): value for key, value in headers.items()}
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        return None
+    return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate limit reset header into seconds from now.
+
+    Accepts durations such as ``"1s"``, ``"6m0s"`` or ``"20ms"`` (OpenAI) and
+    RFC 3339 timestamps (Anthropic).
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds until the reset, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+
+    matches = _DURATION_PATTERN.findall(value)
+    if matches and "".join(number + unit for number, unit in matches) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in matches)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _first(headers: Dict[str, Any], *names: str) -> Optional[str]:
+    for name in names:
+        if name in headers:
+            return headers[name]
+    return None
@@ -0,0 +1,787 @@
+"""
+Record and replay of LLM calls for the Agents Hub framework.
+
+A ``RecordingLLM`` writes every request and response of the LLM it wraps to a
+recording, and a ``ReplayLLM`` serves the recorded responses without a
+provider, so workflows can be run and load-tested offline and
+deterministically.
+
+A recording is a JSON Lines file (gzip-compressed when the path ends with
+``.gz``) with one record per call. Generation records hold the key of the
+request, the response and the latency of the call; embedding records hold the
+key of the text and the vector as base64-encoded float32.
+"""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    IO,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import array
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import time
+from agents_hub.llm.base import BaseLLM, LLMWrapper, LLMResponse, LLMStreamChunk
+from agents_hub.llm.cache.responses import request_key
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Namespace of the request keys, so a recording replays whatever the model
+NAMESPACE = "replay"
+
+# Raw response fields kept by default, the ones the framework reads usage from
+RAW_RESPONSE_FIELDS = ("usage", "model", "prompt_eval_count", "eval_count")
+
+Latency = Union[str, float, Callable[[Dict[str, Any]], float]]
+
+
+class ReplayMissError(LookupError):
+    """Raised when a replayed request is not in the recording."""
+
+    def __init__(self, kind: str, key: str):
+        self.kind = kind
+        self.key = key
+        super().__init__(f"No recorded {kind} response for request {key[:12]}")
+
+
+def text_key(text: str) -> str:
+    """
+    Build the key of an embedded text.
+
+    Args:
+        text: Embedded text
+
+    Returns:
+        Hex digest of the SHA-256 of the text
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def prompt_key(messages: List[Dict[str, Any]]) -> str:
+    """
+    Build the fallback key of a generation request from its last message.
+
+    Requests whose earlier messages differ between runs, for example because
+    they contain timestamps or paths, can still be matched by their prompt.
+
+    Args:
+        messages: List of messages in the conversation
+
+    Returns:
+        Hex digest of the SHA-256 of the role and content of the last message
+    """
+    last = messages[-1] if messages else {}
+    canonical = json.dumps(
+        [last.get("role"), last.get("content")], sort_keys=True, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def encode_vector(vector: List[float]) -> str:
+    """Encode an embedding as base64 float32."""
+    return base64.b64encode(array.array("f", vector).tobytes()).decode("ascii")
+
+
+def decode_vector(data: str) -> List[float]:
+    """Decode an embedding encoded by ``encode_vector``."""
+    vector = array.array("f")
+    vector.frombytes(base64.b64decode(data))
+    return vector.tolist()
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """Open a recording, compressed when the path ends with ``.gz``."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def load_recording(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the records of a recording.
+
+    Args:
+        path: Path of the recording
+
+    Returns:
+        Records, in the order they were written
+    """
+    with _open(path, "r") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def lognormal_latency(
+    median: float, sigma: float = 0.5, seed: Optional[int] = None
+) -> Callable[[Dict[str, Any]], float]:
+    """
+    Build a synthetic latency distribution for a ``ReplayLLM``.
+
+    Provider latencies are right-skewed, which a log-normal distribution
+    models well: most calls take about the median and a few take much longer.
+
+    Args:
+        median: Median latency in seconds
+        sigma: Standard deviation of the logarithm of the latency
+        seed: Optional seed, for a reproducible sequence of latencies
+
+    Returns:
+        Function that returns the latency of a replayed record
+    """
+    generator = random.Random(seed)
+    mu = math.log(median) if median > 0 else 0.0
+
+    def latency(record: Dict[str, Any]) -> float:
+        return generator.lognormvariate(mu, sigma) if median > 0 else 0.0
+
+    return latency
+
+
+class RecordingLLM(LLMWrapper):
+    """
+    LLM wrapper that records every call to a file for later replay.
+
+    Generation and stream requests, including their tool calls, and
+    embeddings are recorded with the latency of the call. Records are
+    appended and flushed as calls complete, so a recording is usable even if
+    the process is interrupted.
+
+    Example:
+        ```python
+        llm = RecordingLLM(OpenAIProvider(api_key="your-openai-api-key"), "run.jsonl.gz")
+        await workforce.execute(task)  # with agents using llm
+        llm.close()
+
+        replay = ReplayLLM("run.jsonl.gz")
+        ```
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        path: str,
+        record_requests: bool = False,
+        raw_response_fields: Optional[Iterable[str]] = RAW_RESPONSE_FIELDS,
+    ):
+        """
+        Initialize the recording wrapper.
+
+        Args:
+            llm: LLM whose calls to record
+            path: Path of the recording; records are appended to an existing
+                file, compressed when the path ends with ``.gz``
+            record_requests: Whether to also store the messages of each
+                request, to inspect the recording (keys are always stored)
+            raw_response_fields: Fields of the raw responses to keep (None to
+                keep the whole raw response)
+        """
+        super().__init__(llm)
+        self.path = path
+        self.record_requests = record_requests
+        self.raw_response_fields = (
+            tuple(raw_response_fields) if raw_response_fields is not None else None
+        )
+        self.records = 0
+        self._file: Optional[IO[str]] = None
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """Append a record to the recording."""
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = _open(self.path, "a")
+            header = {"kind": "header", "version": FORMAT_VERSION, "time": time.time()}
+            try:
+                header["provider"] = self.llm.provider_name
+                header["model"] = self.llm.model_name
+            except NotImplementedError:
+                pass
+            self._file.write(json.dumps(header) + "\n")
+
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        self._file.flush()
+        self.records += 1
+
+    def _raw_response(self, raw: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Keep the configured fields of a raw response."""
+        if raw is None or self.raw_response_fields is None:
+            return raw
+        kept = {key: raw[key] for key in self.raw_response_fields if key in raw}
+        return kept or None
+
+    def _record_generation(
+        self,
+        kind: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Any]],
+        temperature: float,
+        max_tokens: int,
+        kwargs: Dict[str, Any],
+        response: LLMResponse,
+        latency: float,
+        first_chunk: Optional[float] = None,
+    ) -> None:
+        """Record a generation or stream call."""
+        record: Dict[str, Any] = {
+            "kind": kind,
+            "key": request_key(
+                NAMESPACE, messages, tools, temperature, max_tokens, **kwargs
+            ),
+            "prompt": prompt_key(messages),
+            "response": {
+                "content": response.content,
+                "tool_calls": response.tool_calls,
+                "raw_response": self._raw_response(response.raw_response),
+            },
+            "latency": round(latency, 6),
+        }
+        if first_chunk is not None:
+            record["first_chunk"] = round(first_chunk, 6)
+        if self.record_requests:
+            record["messages"] = messages
+        self._write(record)
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate a response with the wrapped LLM and record it.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse object containing the generated text and any tool calls
+        """
+        started_at = time.perf_counter()
+        response = await self.llm.generate(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        self._record_generation(
+            "generate",
+            messages,
+            tools,
+            temperature,
+            max_tokens,
+            kwargs,
+            response,
+            time.perf_counter() - started_at,
+        )
+        return response
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the wrapped LLM and record it once complete.
+
+        The assembled response is recorded with the time to the first chunk
+        and the total time of the stream. Streams that do not complete are not
+        recorded.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            LLMStreamChunk objects
+        """
+        started_at = time.perf_counter()
+        first_chunk: Optional[float] = None
+        content: List[str] = []
+
+        async for chunk in self.llm.stream(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        ):
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - started_at
+            content.append(chunk.content)
+            if chunk.done:
+                self._record_generation(
+                    "stream",
+                    messages,
+                    tools,
+                    temperature,
+                    max_tokens,
+                    kwargs,
+                    LLMResponse(
+                        content="".join(content),
+                        tool_calls=chunk.tool_calls,
+                        raw_response=chunk.raw_response,
+                    ),
+                    time.perf_counter() - started_at,
+                    first_chunk,
+                )
+            yield chunk
+
+    def _record_embedding(self, text: str, vector: List[float], latency: float) -> None:
+        """Record the embedding of a text."""
+        record: Dict[str, Any] = {
+            "kind": "embedding",
+            "key": text_key(text),
+            "vector": encode_vector(vector),
+            "latency": round(latency, 6),
+        }
+        if self.record_requests:
+            record["text"] = text
+        self._write(record)
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """
+        Get an embedding from the wrapped LLM and record it.
+
+        Args:
+            text: Text to get embedding for
+
+        Returns:
+            Embedding vector
+        """
+        started_at = time.perf_counter()
+        vector = await self.llm.get_embedding(text)
+        self._record_embedding(text, vector, time.perf_counter() - started_at)
+        return vector
+
+    async def get_embeddings(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """
+        Get embeddings from the wrapped LLM and record them.
+
+        Each text is recorded on its own with the latency of the whole call,
+        so the texts can be replayed one by one or in batches.
+
+        Args:
+            texts: Texts to get embeddings for
+            **kwargs: Batching options passed to the wrapped LLM
+
+        Returns:
+            Embedding vectors, in the order of the texts
+        """
+        started_at = time.perf_counter()
+        vectors = await self.llm.get_embeddings(texts, **kwargs)
+        latency = time.perf_counter() - started_at
+        for text, vector in zip(texts, vectors):
+            self._record_embedding(text, vector, latency)
+        return vectors
+
+    def close(self) -> None:
+        """Close the recording file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def __aenter__(self) -> "RecordingLLM":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ReplayLLM(BaseLLM):
+    """
+    LLM provider that serves the responses of a recording, without a network.
+
+    Requests are matched by the same canonical key they were recorded with.
+    A request that was recorded several times gets the recorded responses in
+    order, then starts over, so a replayed run follows the recorded one and a
+    load test can replay it any number of times. A request that is not in the
+    recording is matched by its last message, for requests whose context
+    changes between runs.
+
+    Each response is delayed by its recorded latency, by a latency sampled
+    from the recorded ones, or by a synthetic latency, so replayed workloads
+    keep the concurrency profile of real providers.
+
+    Example:
+        ```python
+        llm = ReplayLLM("run.jsonl.gz", latency="sampled", seed=42)
+        workforce = AgentWorkforce(agents=[Agent(name="researcher", llm=llm)])
+        await workforce.execute(task)
+        print(llm.stats)  # {"hits": ..., "fallback_hits": ..., "misses": ...}
+        ```
+    """
+
+    def __init__(
+        self,
+        recording: Union[str, List[Dict[str, Any]]],
+        latency: Latency = "recorded",
+        latency_scale: float = 1.0,
+        strict: bool = True,
+        default_response: str = "",
+        seed: Optional[int] = None,
+        stream_chunk_size: int = 16,
+    ):
+        """
+        Initialize the replay provider.
+
+        Args:
+            recording: Path of a recording, or its records
+            latency: ``"recorded"`` to wait the recorded latency of each
+                response, ``"sampled"`` to draw latencies from the recorded
+                ones, a number of seconds, or a function of the record that
+                returns the latency (see ``lognormal_latency``)
+            latency_scale: Factor applied to every latency (0 to not wait)
+            strict: Whether a request missing from the recording raises
+                ``ReplayMissError``; otherwise it gets ``default_response``,
+                or a deterministic embedding derived from the text
+            default_response: Content of the response to missing requests
+            seed: Seed of the latency sampling and of missing embeddings
+            stream_chunk_size: Characters per chunk of a replayed stream
+        """
+        self.path = recording if isinstance(recording, str) else None
+        records = load_recording(recording) if self.path else recording
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self.default_response = default_response
+        self.stream_chunk_size = max(1, stream_chunk_size)
+        self._random = random.Random(seed)
+        self._seed = seed or 0
+
+        self._model = "replay"
+        self._generations: Dict[str, List[Dict[str, Any]]] = {}
+        self._prompts: Dict[str, List[Dict[str, Any]]] = {}
+        self._embeddings: Dict[str, Dict[str, Any]] = {}
+        self._latencies: Dict[str, List[float]] = {"generate": [], "embedding": []}
+        self._positions: Dict[str, int] = {}
+        self._dimensions = 0
+        self._stats = {"hits": 0, "fallback_hits": 0, "misses": 0}
+
+        for record in records:
+            kind = record.get("kind")
+            if kind == "header":
+                self._model = record.get("model") or self._model
+            elif kind in ("generate", "stream"):
+                self._generations.setdefault(record["key"], []).append(record)
+                self._prompts.setdefault(record["prompt"], []).append(record)
+                self._latencies["generate"].append(record.get("latency", 0.0))
+            elif kind == "embedding":
+                self._embeddings[record["key"]] = record
+                self._latencies["embedding"].append(record.get("latency", 0.0))
+
+    def reset(self) -> None:
+        """Replay the recording from the start, and reset the statistics."""
+        self._positions.clear()
+        self._stats = {key: 0 for key in self._stats}
+
+    def _next(
+        self, index: str, key: str, records: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Get the next response recorded for a request, starting over at the end."""
+        position = self._positions.get(index + key, 0)
+        self._positions[index + key] = position + 1
+        return records[position % len(records)]
+
+    def _find(
+        self, messages: List[Dict[str, Any]], key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Find the record of a generation request, by key then by prompt."""
+        if key in self._generations:
+            self._stats["hits"] += 1
+            return self._next("key:", key, self._generations[key])
+
+        prompt = prompt_key(messages)
+        if prompt in self._prompts:
+            self._stats["fallback_hits"] += 1
+            return self._next("prompt:", prompt, self._prompts[prompt])
+
+        self._stats["misses"] += 1
+        if self.strict:
+            raise ReplayMissError("generate", key)
+        logger.debug(f"Request {key[:12]} is not in the recording")
+        return None
+
+    def _delay(self, kind: str, record: Optional[Dict[str, Any]]) -> float:
+        """Get the latency of a replayed response, in seconds."""
+        if record is None:
+            return 0.0
+        if callable(self.latency):
+            latency = self.latency(record)
+        elif self.latency == "recorded":
+            latency = record.get("latency", 0.0)
+        elif self.latency == "sampled":
+            latencies = self._latencies[kind]
+            latency = self._random.choice(latencies) if latencies else 0.0
+        else:
+            latency = float(self.latency)
+        return max(0.0, latency * self.latency_scale)
+
+    def _response(self, record: Optional[Dict[str, Any]]) -> LLMResponse:
+        """Build the response of a record, or the default response."""
+        if record is None:
+            return LLMResponse(content=self.default_response)
+        response = json.loads(json.dumps(record["response"]))
+        return LLMResponse(**response)
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Serve the recorded response of a request.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse object containing the recorded text and tool calls
+
+        Raises:
+            ReplayMissError: If the request is not in the recording and the
+                provider is strict
+        """
+        key = request_key(NAMESPACE, messages, tools, temperature, max_tokens, **kwargs)
+        record = self._find(messages, key)
+        await asyncio.sleep(self._delay("generate", record))
+        return self._response(record)
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream the recorded response of a request.
+
+        The first chunk comes after the recorded time to the first chunk
+        (scaled to the replayed latency), and the rest of the content is
+        spread evenly over the remaining time.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            LLMStreamChunk objects
+
+        Raises:
+            ReplayMissError: If the request is not in the recording and the
+                provider is strict
+        """
+        key = request_key(NAMESPACE, messages, tools, temperature, max_tokens, **kwargs)
+        record = self._find(messages, key)
+        response = self._response(record)
+        total = self._delay("generate", record)
+
+        first_chunk = total
+        if record is not None and record.get("first_chunk") is not None:
+            recorded = record.get("latency") or 0.0
+            share = record["first_chunk"] / recorded if recorded > 0 else 1.0
+            first_chunk = total * min(1.0, share)
+
+        content = response.content
+        size = self.stream_chunk_size
+        pieces = [content[i : i + size] for i in range(0, len(content), size)]
+        interval = (total - first_chunk) / len(pieces) if pieces else 0.0
+
+        await asyncio.sleep(first_chunk)
+        for index, piece in enumerate(pieces):
+            if index:
+                await asyncio.sleep(interval)
+            yield LLMStreamChunk(content=piece)
+        yield LLMStreamChunk(
+            tool_calls=response.tool_calls,
+            done=True,
+            raw_response=response.raw_response,
+        )
+
+    def _embedding(self, text: str) -> Tuple[List[float], float]:
+        """Get the recorded embedding of a text and its latency."""
+        key = text_key(text)
+        record = self._embeddings.get(key)
+        if record is not None:
+            self._stats["hits"] += 1
+            vector = decode_vector(record["vector"])
+            self._dimensions = self._dimensions or len(vector)
+            return vector, self._delay("embedding", record)
+
+        self._stats["misses"] += 1
+        if self.strict:
+            raise ReplayMissError("embedding", key)
+        logger.debug(f"Text {key[:12]} is not in the recording")
+
+        # A deterministic unit vector, so missing texts still get stable results
+        generator = random.Random(f"{self._seed}:{key}")
+        if not self._dimensions and self._embeddings:
+            first = next(iter(self._embeddings.values()))
+            self._dimensions = len(decode_vector(first["vector"]))
+        vector = [generator.gauss(0.0, 1.0) for _ in range(self._dimensions or 1536)]
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector], 0.0
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """
+        Serve the recorded embedding of a text.
+
+        Args:
+            text: Text to get embedding for
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            ReplayMissError: If the text is not in the recording and the
+                provider is strict
+        """
+        vector, latency = self._embedding(text)
+        await asyncio.sleep(latency)
+        return vector
+
+    async def get_embeddings(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """
+        Serve the recorded embeddings of texts, as one call.
+
+        The call waits for the longest latency of the texts, since recorded
+        batches share the latency of their call.
+
+        Args:
+            texts: Texts to get embeddings for
+            **kwargs: Ignored batching options
+
+        Returns:
+            Embedding vectors, in the order of the texts
+
+        Raises:
+            ReplayMissError: If a text is not in the recording and the
+                provider is strict
+        """
+        results = [self._embedding(text) for text in texts]
+        await asyncio.sleep(max((latency for _, latency in results), default=0.0))
+        return [vector for vector, _ in results]
+
+    def get_token_count(self, text: str) -> int:
+        """
+        Count tokens with the 4 characters per token approximation.
+
+        Args:
+            text: Text to count tokens for
+
+        Returns:
+            Number of tokens
+        """
+        return len(text) // 4
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Statistics of the replay: hits, hits by prompt, and misses."""
+        stats: Dict[str, Any] = dict(self._stats)
+        total = sum(self._stats.values())
+        stats["hit_rate"] = (
+            (self._stats["hits"] + self._stats["fallback_hits"]) / total
+            if total
+            else 0.0
+        )
+        stats["recorded_generations"] = sum(len(r) for r in self._generations.values())
+        stats["recorded_embeddings"] = len(self._embeddings)
+        return stats
+
+    @property
+    def provider_name(self) -> str:
+        """Get the provider name."""
+        return "Replay"
+
+    @property
+    def model_name(self) -> str:
+        """Get the name of the recorded model."""
+        return self._model
+
+    @property
+    def model(self) -> str:
+        """Get the name of the recorded model."""
+        return self._model
+
+
+def recorded_llm(
+    name: str,
+    create_llm: Callable[[], BaseLLM],
+    mode: Optional[str] = None,
+    directory: Optional[str] = None,
+) -> BaseLLM:
+    """
+    Create an LLM that is live, recorded or replayed depending on the environment.
+
+    Lets an application or example be recorded once against real providers
+    and then replayed without them:
+
+    - ``AGENTS_HUB_LLM_MODE``: ``live`` (default), ``record`` or ``replay``
+    - ``AGENTS_HUB_RECORDINGS``: directory of the recordings (``recordings``)
+    - ``AGENTS_HUB_REPLAY_LATENCY``: ``recorded`` (default), ``sampled``, or
+      a number of seconds
+
+    Args:
+        name: Name of the recording, e.g. the role of the LLM
+        create_llm: Function that creates the live LLM; not called in replay
+            mode, so no credentials are needed
+        mode: Mode, overriding ``AGENTS_HUB_LLM_MODE``
+        directory: Directory, overriding ``AGENTS_HUB_RECORDINGS``
+
+    Returns:
+        The live LLM, a ``RecordingLLM`` wrapping it, or a ``ReplayLLM``
+    """
+    mode = (mode or os.environ.get("AGENTS_HUB_LLM_MODE") or "live").lower()
+    directory = directory or os.environ.get("AGENTS_HUB_RECORDINGS") or "recordings"
+    path = os.path.join(directory, f"{name}.jsonl.gz")
+
+    if mode == "replay":
+        latency: Latency = os.environ.get("AGENTS_HUB_REPLAY_LATENCY") or "recorded"
+        if latency not in ("recorded", "sampled"):
+            latency = float(latency)
+        return ReplayLLM(path, latency=latency)
+    if mode == "record":
+        return RecordingLLM(create_llm(), path)
+    if mode != "live":
+        raise ValueError(f"Unknown LLM mode '{mode}', expected live, record or replay")
+    return create_llm()
@@ -0,0 +1,641 @@
+"""
+Retries, backoff and circuit breaking for LLM providers in the Agents Hub framework.
+"""
+
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set
+from collections import deque
+import asyncio
+import logging
+import random
+import time
+import weakref
+import httpx
+from agents_hub.llm.base import BaseLLM, LLMWrapper, LLMResponse, LLMStreamChunk
+from agents_hub.llm.rate_limit import error_headers, error_status, parse_retry_after
+from agents_hub.monitoring.base import BaseMonitor, MonitoringEvent
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Status codes of errors that a later attempt may not get
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# SDK errors without a status code that are raised for network failures
+RETRYABLE_ERROR_NAMES = {"APIConnectionError", "APITimeoutError"}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(
+            f"Circuit breaker '{name}' is open, retry in {retry_in:.1f} seconds"
+        )
+        self.name = name
+        self.retry_in = retry_in
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classify a provider error as retryable or fatal.
+
+    Rate limits, timeouts, overload and server errors are retryable, as are
+    network errors. Other client errors, such as invalid requests or
+    authentication failures, are fatal.
+
+    Args:
+        error: Error raised by a provider call
+
+    Returns:
+        Whether the call may succeed if retried
+    """
+    if isinstance(error, (CircuitOpenError, asyncio.CancelledError)):
+        return False
+
+    status = error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+
+    return isinstance(
+        error, (asyncio.TimeoutError, ConnectionError, httpx.TransportError)
+    ) or any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+class RetryBudget:
+    """
+    Limit on retries relative to the number of requests.
+
+    Retries are allowed while they stay under ``ratio`` of the requests of the
+    last ``window`` seconds, plus ``min_retries_per_second``. When a provider
+    fails every request, retries then add a bounded share of extra load
+    instead of multiplying it.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+    ):
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Maximum retries per request
+            min_retries_per_second: Retries allowed regardless of the ratio
+            window: Period in seconds over which requests and retries are counted
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        """Forget the requests and retries older than the window."""
+        for events in (self._requests, self._retries):
+            while events and events[0] <= now - self.window:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Record a request."""
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """
+        Spend a retry from the budget.
+
+        Returns:
+            Whether the budget allowed the retry
+        """
+        now = time.monotonic()
+        self._prune(now)
+        allowed = self.min_retries_per_second * self.window + self.ratio * len(
+            self._requests
+        )
+        if len(self._retries) >= allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the calls to one provider.
+
+    The breaker opens after ``failure_threshold`` consecutive retryable
+    failures and then rejects calls for ``recovery_timeout`` seconds, so a
+    degraded provider fails fast instead of tying up workers. It then turns
+    half-open and lets ``half_open_max_calls`` probe calls through: a success
+    closes it, a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str = "default",
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Name of the breaker, used in errors and monitoring
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds the breaker stays open before probing
+            half_open_max_calls: Probe calls allowed at once when half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._listeners: List[Callable[["CircuitBreaker", str, str], None]] = []
+        self._monitors: "weakref.WeakSet[BaseMonitor]" = weakref.WeakSet()
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        """Get the state of the breaker: "closed", "open" or "half_open"."""
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._set_state(self.HALF_OPEN)
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        """Whether a call would be let through now."""
+        state = self.state
+        return state == self.CLOSED or (
+            state == self.HALF_OPEN and self._probes < self.half_open_max_calls
+        )
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets probe calls through."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def add_listener(
+        self, listener: Callable[["CircuitBreaker", str, str], None]
+    ) -> None:
+        """
+        Register a function called with (breaker, old state, new state) on
+        every state change.
+
+        Args:
+            listener: Function to call
+        """
+        self._listeners.append(listener)
+
+    def add_monitor(self, monitor: BaseMonitor) -> None:
+        """
+        Report every state change to a monitor as a custom event.
+
+        A monitor is registered once however many wrappers share the breaker,
+        and is held weakly, so the breaker does not keep it alive.
+
+        Args:
+            monitor: Monitor to report to
+        """
+        self._monitors.add(monitor)
+
+    def _report(self, previous: str, state: str) -> None:
+        """Send a state change to the monitors in the background."""
+        data = {
+            "event": "circuit_breaker",
+            "name": self.name,
+            "previous_state": previous,
+            "state": state,
+        }
+        for monitor in list(self._monitors):
+            try:
+                task = asyncio.ensure_future(
+                    monitor.track_event(event_type=MonitoringEvent.CUSTOM, data=data)
+                )
+            except RuntimeError:
+                # No running event loop, e.g. the state changed outside one
+                return
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _set_state(self, state: str) -> None:
+        """Change the state and notify the listeners."""
+        previous, self._state = self._state, state
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            self._stats["opened"] += 1
+        if state != self.HALF_OPEN:
+            self._probes = 0
+        if state != previous:
+            logger.info(f"Circuit breaker '{self.name}' is {state}")
+            for listener in self._listeners:
+                try:
+                    listener(self, previous, state)
+                except Exception as e:
+                    logger.warning(f"Error in circuit breaker listener: {e}")
+            self._report(previous, state)
+
+    def acquire(self) -> None:
+        """
+        Let a call through, or reject it.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all
+                probe calls in flight
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return
+
+        self._stats["rejected"] += 1
+        raise CircuitOpenError(self.name, self.retry_in)
+
+    def release(self) -> None:
+        """Give back a probe slot of a call that ended without an outcome."""
+        if self._state == self.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy provider."""
+        self._failures = 0
+        if self._state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a call that failed with a retryable error."""
+        self._failures += 1
+        if self._state == self.HALF_OPEN or (
+            self._state == self.CLOSED and self._failures >= self.failure_threshold
+        ):
+            self._set_state(self.OPEN)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the breaker statistics.
+
+        Returns:
+            Dictionary with the state, the consecutive failures, how often the
+            breaker opened and how many calls it rejected
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            **self._stats,
+        }
+
+
+_CIRCUIT_BREAKERS: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker of a provider, creating it on first use.
+
+    Args:
+        name: Name of the provider, e.g. "OpenAI"
+        **kwargs: Parameters for the CircuitBreaker when it is created
+
+    Returns:
+        The shared CircuitBreaker
+    """
+    if name not in _CIRCUIT_BREAKERS:
+        _CIRCUIT_BREAKERS[name] = CircuitBreaker(name=name, **kwargs)
+    return _CIRCUIT_BREAKERS[name]
+
+
+class ResilientLLM(LLMWrapper):
+    """
+    LLM wrapper that retries failed calls behind a circuit breaker.
+
+    Retryable errors (see ``is_retryable``) are retried with exponential
+    backoff and full jitter, waiting at least as long as a ``retry-after``
+    header asks, while the retry budget allows it. Fatal errors are raised
+    right away. Every wrapper of the same provider shares its circuit
+    breaker by default, so once the provider is failing all of them fail fast
+    with ``CircuitOpenError`` until a probe call succeeds.
+
+    Streams are retried only until their first chunk.
+
+    Example:
+        ```python
+        llm = ResilientLLM(
+            OpenAIProvider(api_key="your-openai-api-key", max_retries=0),
+            max_retries=3,
+            monitor=monitor,
+        )
+        print(llm.stats)  # retries, failures, ..., circuit
+        ```
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        monitor: Optional[BaseMonitor] = None,
+        retryable: Callable[[BaseException], bool] = is_retryable,
+    ):
+        """
+        Initialize the resilient LLM.
+
+        Args:
+            llm: LLM whose calls to retry
+            max_retries: Maximum retries per call
+            base_delay: Backoff delay of the first retry in seconds, doubled
+                for every further retry
+            max_delay: Maximum backoff delay in seconds
+            retry_budget: Optional retry budget, shared by the wrappers that
+                should draw from it (a budget of its own by default)
+            circuit_breaker: Optional circuit breaker (the process-wide breaker
+                of the provider by default)
+            monitor: Optional monitor that receives a custom event for every
+                retry and circuit breaker state change
+            retryable: Function that classifies errors as retryable
+        """
+        super().__init__(llm)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget or RetryBudget()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(
+            self._provider_name()
+        )
+        self.monitor = monitor
+        self.retryable = retryable
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {
+            "calls": 0,
+            "retries": 0,
+            "failures": 0,
+            "retries_exhausted": 0,
+            "budget_exhausted": 0,
+            "rejected": 0,
+        }
+        if monitor is not None:
+            self.circuit_breaker.add_monitor(monitor)
+
+    def _provider_name(self) -> str:
+        """Name of the wrapped provider."""
+        try:
+            return self.llm.provider_name
+        except NotImplementedError:
+            return type(self.llm).__name__
+
+    def backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Get the delay before a retry.
+
+        Args:
+            attempt: Number of the retry, starting at 0
+            error: Optional error that caused the retry
+
+        Returns:
+            Delay in seconds
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        headers = error_headers(error) if error is not None else None
+        retry_after = parse_retry_after(headers) if headers else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    async def _call(self, operation: str, call: Callable[[], Any]) -> Any:
+        """
+        Make a call, retrying retryable errors.
+
+        Args:
+            operation: Name of the operation, for logging and monitoring
+            call: Function that makes the call and returns an awaitable
+
+        Returns:
+            Result of the call
+        """
+        self._stats["calls"] += 1
+        self.retry_budget.record_request()
+        attempt = 0
+
+        while True:
+            try:
+                self.circuit_breaker.acquire()
+            except CircuitOpenError:
+                self._stats["rejected"] += 1
+                raise
+
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                self.circuit_breaker.release()
+                raise
+            except Exception as e:
+                if not await self._should_retry(operation, e, attempt):
+                    raise
+                attempt += 1
+                continue
+
+            self.circuit_breaker.record_success()
+            return result
+
+    async def _should_retry(
+        self, operation: str, error: Exception, attempt: int
+    ) -> bool:
+        """
+        Record a failed attempt and wait before the retry if there is one.
+
+        Args:
+            operation: Name of the operation
+            error: Error of the attempt
+            attempt: Number of retries made so far
+
+        Returns:
+            Whether to retry
+        """
+        if not self.retryable(error):
+            # The provider answered, so it counts as healthy
+            self.circuit_breaker.record_success()
+            self._stats["failures"] += 1
+            return False
+
+        self.circuit_breaker.record_failure()
+        if attempt >= self.max_retries:
+            self._stats["failures"] += 1
+            self._stats["retries_exhausted"] += 1
+            return False
+        if not self.retry_budget.try_retry():
+            self._stats["failures"] += 1
+            self._stats["budget_exhausted"] += 1
+            return False
+
+        delay = self.backoff(attempt, error)
+        self._stats["retries"] += 1
+        logger.warning(
+            f"{operation} failed on {self._provider_name()} ({error}), "
+            f"retry {attempt + 1}/{self.max_retries} in {delay:.2f} seconds"
+        )
+        self._track(
+            {
+                "event": "llm_retry",
+                "provider": self._provider_name(),
+                "operation": operation,
+                "attempt": attempt + 1,
+                "delay": delay,
+                "error": str(error),
+                "status_code": error_status(error),
+            }
+        )
+        await asyncio.sleep(delay)
+        return True
+
+    def _track(self, data: Dict[str, Any]) -> None:
+        """Send a custom event to the monitor in the background."""
+        if self.monitor is None:
+            return
+        try:
+            task = asyncio.ensure_future(
+                self.monitor.track_event(event_type=MonitoringEvent.CUSTOM, data=data)
+            )
+        except RuntimeError:
+            # No running event loop, e.g. the breaker changed state outside one
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate a response, retrying retryable errors.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse object containing the generated text and any tool calls
+        """
+        return await self._call(
+            "generate",
+            lambda: self.llm.generate(
+                messages=messages,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            ),
+        )
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response, retrying retryable errors before the first chunk.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            LLMStreamChunk objects
+        """
+
+        async def start():
+            stream = self.llm.stream(
+                messages=messages,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, None
+
+        stream, first = await self._call("stream", start)
+        if first is None:
+            return
+        yield first
+
+        try:
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            if self.retryable(e):
+                self.circuit_breaker.record_failure()
+            raise
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """
+        Get an embedding, retrying retryable errors.
+
+        Args:
+            text: Text to get embedding for
+
+        Returns:
+            Embedding vector
+        """
+        return await self._call("get_embedding", lambda: self.llm.get_embedding(text))
+
+    async def get_embeddings(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """
+        Get the embeddings of texts, retrying retryable errors.
+
+        Args:
+            texts: Texts to get embeddings for
+            **kwargs: Batching options passed to the wrapped LLM
+
+        Returns:
+            Embedding vectors, in the order of the texts
+        """
+        return await self._call(
+            "get_embeddings", lambda: self.llm.get_embeddings(texts, **kwargs)
+        )
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the retry and circuit breaker statistics.
+
+        Returns:
+            Dictionary with the calls, retries, failed calls, calls that ran out
+            of retries or retry budget, calls rejected by the open breaker, and
+            the breaker statistics under ``circuit``
+        """
+        return {**self._stats, "circuit": self.circuit_breaker.stats}
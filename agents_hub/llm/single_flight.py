@@ -0,0 +1,222 @@
+"""
+Single-flight request coalescing for the Agents Hub framework.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+from agents_hub.llm.base import BaseLLM, LLMWrapper, LLMResponse
+from agents_hub.llm.cache.responses import request_key
+
+OPERATIONS = ("generate", "get_embedding", "get_embeddings")
+
+
+class _Flight:
+    """An upstream call shared by every caller of the same request."""
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlightLLM(LLMWrapper):
+    """
+    LLM wrapper that coalesces identical concurrent requests.
+
+    While a request is in flight, identical requests (same canonical key) wait
+    for it instead of calling the provider again, and get the same response or
+    exception. Nothing is kept once the call completes, so it complements
+    rather than replaces a response cache: wrap a ``CachedLLM`` to also
+    answer repeated requests after the first one finished.
+
+    The upstream call is cancelled only when every caller waiting for it has
+    been cancelled. Streams are not coalesced.
+
+    Example:
+        ```python
+        llm = SingleFlightLLM(OpenAIProvider(api_key="your-openai-api-key"))
+        responses = await asyncio.gather(*(agent.run(question) for _ in range(50)))
+        print(llm.stats)  # {"calls": ..., "upstream_calls": ..., "collapsed": ...}
+        ```
+    """
+
+    def __init__(self, llm: BaseLLM, max_temperature: Optional[float] = None):
+        """
+        Initialize the single-flight wrapper.
+
+        Args:
+            llm: LLM whose requests to coalesce
+            max_temperature: Highest temperature at which generation requests
+                are coalesced (None to coalesce every temperature)
+        """
+        super().__init__(llm)
+        self.max_temperature = max_temperature
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self._stats = {
+            operation: {"calls": 0, "collapsed": 0} for operation in OPERATIONS
+        }
+
+    @property
+    def namespace(self) -> str:
+        """Namespace of the coalesced requests, one per provider and model."""
+        try:
+            return f"{self.llm.provider_name}:{self.llm.model_name}"
+        except NotImplementedError:
+            return type(self.llm).__name__
+
+    async def _single_flight(
+        self,
+        operation: str,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        copy: Callable[[Any], Any],
+    ) -> Any:
+        """
+        Run a call, or join the identical call already in flight.
+
+        Args:
+            operation: Name of the operation, for the statistics
+            key: Canonical key of the request
+            call: Function that makes the upstream call
+            copy: Function that copies the result for a joining caller, so
+                callers cannot modify each other's results
+
+        Returns:
+            Result of the call
+        """
+        self._stats[operation]["calls"] += 1
+        flight_key = (operation, key)
+        flight = self._flights.get(flight_key)
+        joined = flight is not None
+
+        if joined:
+            self._stats[operation]["collapsed"] += 1
+        else:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[flight_key] = flight
+            flight.task.add_done_callback(lambda task: self._finish(flight_key, flight))
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            flight.waiters -= 1
+            if flight.waiters == 0:
+                flight.task.cancel()
+            raise
+        flight.waiters -= 1
+        return copy(result) if joined else result
+
+    def _finish(self, flight_key: Tuple[str, str], flight: _Flight) -> None:
+        """Forget a completed flight so later requests make a new call."""
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+        if not flight.task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled
+            flight.task.exception()
+
+    async def generate(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate a response, sharing the call with identical requests.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters;
+                ``single_flight=False`` always makes a separate call
+
+        Returns:
+            LLMResponse object containing the generated text and any tool calls
+        """
+
+        async def call() -> LLMResponse:
+            return await self.llm.generate(
+                messages=messages,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+
+        coalesce = kwargs.pop("single_flight", True) is not False and (
+            self.max_temperature is None or temperature <= self.max_temperature
+        )
+        if not coalesce:
+            return await call()
+
+        key = request_key(
+            self.namespace, messages, tools, temperature, max_tokens, **kwargs
+        )
+        return await self._single_flight(
+            "generate", key, call, lambda response: response.model_copy(deep=True)
+        )
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """
+        Get the embedding of a text, sharing the call with identical requests.
+
+        Args:
+            text: Text to get embedding for
+
+        Returns:
+            Embedding vector
+        """
+        key = hashlib.sha256(f"{self.namespace}\n{text}".encode("utf-8")).hexdigest()
+        return await self._single_flight(
+            "get_embedding", key, lambda: self.llm.get_embedding(text), list
+        )
+
+    async def get_embeddings(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """
+        Get the embeddings of texts, sharing the call with identical batches.
+
+        Args:
+            texts: Texts to get embeddings for
+            **kwargs: Batching options passed to the wrapped LLM
+
+        Returns:
+            Embedding vectors, in the order of the texts
+        """
+        canonical = json.dumps(
+            [self.namespace, texts, kwargs], sort_keys=True, default=str
+        )
+        key = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return await self._single_flight(
+            "get_embeddings",
+            key,
+            lambda: self.llm.get_embeddings(texts, **kwargs),
+            lambda vectors: [list(vector) for vector in vectors],
+        )
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the coalescing statistics.
+
+        Returns:
+            Dictionary with the calls, upstream calls and collapsed calls, the
+            share of calls collapsed, the requests in flight and the same
+            counters per operation
+        """
+        calls = sum(stats["calls"] for stats in self._stats.values())
+        collapsed = sum(stats["collapsed"] for stats in self._stats.values())
+        return {
+            "calls": calls,
+            "upstream_calls": calls - collapsed,
+            "collapsed": collapsed,
+            "collapse_rate": collapsed / calls if calls else 0.0,
+            "in_flight": len(self._flights),
+            "operations": {
+                operation: dict(stats) for operation, stats in self._stats.items()
+            },
+        }
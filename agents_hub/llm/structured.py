@@ -0,0 +1,187 @@
+"""
+Structured output helpers for the Agents Hub framework.
+
+A response schema is passed to ``BaseLLM.generate(response_schema=...)`` as a
+JSON Schema dictionary or a pydantic model class. Each provider translates it
+into its native structured output feature, so the response content is a JSON
+document that follows the schema. A schema without properties, such as
+``{"type": "object"}``, asks for any JSON object.
+"""
+
+from typing import Any, Dict, Optional, Type, Union
+import copy
+import re
+from pydantic import BaseModel
+
+ResponseSchema = Union[Dict[str, Any], Type[BaseModel]]
+
+# Keywords the Gemini API does not accept in a response schema
+GEMINI_UNSUPPORTED_KEYWORDS = {
+    "$schema",
+    "$defs",
+    "definitions",
+    "additionalProperties",
+    "title",
+    "default",
+    "examples",
+}
+
+
+def json_schema(response_schema: ResponseSchema) -> Dict[str, Any]:
+    """
+    Get the JSON Schema of a response schema.
+
+    Args:
+        response_schema: JSON Schema dictionary or pydantic model class
+
+    Returns:
+        JSON Schema dictionary
+    """
+    if isinstance(response_schema, type) and issubclass(response_schema, BaseModel):
+        return response_schema.model_json_schema()
+    return response_schema
+
+
+def schema_name(response_schema: ResponseSchema, default: str = "response") -> str:
+    """
+    Get a name for a response schema, as the providers require one.
+
+    Args:
+        response_schema: JSON Schema dictionary or pydantic model class
+        default: Name of schemas without a title
+
+    Returns:
+        Name made of letters, digits, underscores and dashes
+    """
+    title = json_schema(response_schema).get("title") or default
+    return re.sub(r"[^a-zA-Z0-9_-]", "_", title)[:64]
+
+
+def is_free_form(schema: Dict[str, Any]) -> bool:
+    """Whether a schema asks for any JSON object rather than a given shape."""
+    return not schema.get("properties") and not schema.get("$ref")
+
+
+def is_strict(schema: Any) -> bool:
+    """
+    Whether a schema can be enforced exactly by OpenAI's strict mode.
+
+    Strict mode requires every object to list all its properties as required
+    and to forbid additional properties.
+
+    Args:
+        schema: JSON Schema, or part of one
+
+    Returns:
+        Whether the schema is strict-compatible
+    """
+    if isinstance(schema, list):
+        return all(is_strict(item) for item in schema)
+    if not isinstance(schema, dict):
+        return True
+    properties = schema.get("properties")
+    if properties is not None and (
+        schema.get("additionalProperties") is not False
+        or set(schema.get("required", [])) != set(properties)
+    ):
+        return False
+    return all(is_strict(value) for value in schema.values())
+
+
+def inline_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the local ``$ref`` references of a schema by their definitions.
+
+    Recursive definitions are left as references.
+
+    Args:
+        schema: JSON Schema with ``$defs`` or ``definitions``
+
+    Returns:
+        Copy of the schema without references
+    """
+    definitions = {
+        **schema.get("definitions", {}),
+        **schema.get("$defs", {}),
+    }
+
+    def resolve(node: Any, seen: frozenset) -> Any:
+        if isinstance(node, list):
+            return [resolve(item, seen) for item in node]
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/"):
+            name = ref.rsplit("/", 1)[-1]
+            if name in definitions and name not in seen:
+                return resolve(definitions[name], seen | {name})
+        return {
+            key: resolve(value, seen)
+            for key, value in node.items()
+            if key not in ("$defs", "definitions")
+        }
+
+    return resolve(copy.deepcopy(schema), frozenset())
+
+
+def openai_response_format(response_schema: ResponseSchema) -> Dict[str, Any]:
+    """
+    Build the OpenAI ``response_format`` of a response schema.
+
+    Args:
+        response_schema: JSON Schema dictionary or pydantic model class
+
+    Returns:
+        ``json_schema`` response format, strict when the schema allows it, or
+        the ``json_object`` format for a free-form schema
+    """
+    schema = json_schema(response_schema)
+    if is_free_form(schema):
+        return {"type": "json_object"}
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema_name(response_schema),
+            "schema": schema,
+            "strict": is_strict(schema),
+        },
+    }
+
+
+def gemini_response_schema(
+    response_schema: ResponseSchema,
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the Gemini ``response_schema`` of a response schema.
+
+    Gemini accepts a subset of JSON Schema without references, so references
+    are inlined and unsupported keywords are removed.
+
+    Args:
+        response_schema: JSON Schema dictionary or pydantic model class
+
+    Returns:
+        Gemini response schema, or None for a free-form schema
+    """
+    schema = json_schema(response_schema)
+    if is_free_form(schema):
+        return None
+
+    def clean(node: Any) -> Any:
+        if isinstance(node, list):
+            return [clean(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        cleaned = {
+            key: clean(value)
+            for key, value in node.items()
+            if key not in GEMINI_UNSUPPORTED_KEYWORDS and key != "properties"
+        }
+        if isinstance(node.get("properties"), dict):
+            # Property names are kept even when they look like keywords
+            cleaned["properties"] = {
+                name: clean(value) for name, value in node["properties"].items()
+            }
+        return cleaned
+
+    return clean(inline_refs(schema))
@@ -0,0 +1,343 @@
+"""
+Token counting for the Agents Hub framework.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import logging
+import math
+import threading
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Try to import tiktoken for exact OpenAI token counting
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+    logger.warning(
+        "tiktoken is not installed. Token counting for OpenAI models will be approximate. "
+        "Install tiktoken for accurate token counting: pip install tiktoken"
+    )
+
+# Characters per token of English text for each model family. Characters
+# outside ASCII are counted as one token each, which is close for CJK text and
+# conservative for accented Latin text.
+CHARS_PER_TOKEN = {
+    "openai": 4.0,
+    "anthropic": 3.5,
+    "gemini": 4.0,
+    "llama": 3.8,
+    "default": 4.0,
+}
+
+# Framing tokens added per chat message, and once to prime the reply
+MESSAGE_OVERHEAD = {"openai": 3, "anthropic": 4, "gemini": 4, "llama": 4, "default": 4}
+REPLY_OVERHEAD = 3
+
+_PROVIDER_FAMILIES = {
+    "openai": "openai",
+    "openaiprovider": "openai",
+    "anthropic": "anthropic",
+    "claude": "anthropic",
+    "claudeprovider": "anthropic",
+    "google": "gemini",
+    "gemini": "gemini",
+    "geminiprovider": "gemini",
+    "ollama": "llama",
+    "ollamaprovider": "llama",
+}
+
+
+def model_family(model: str, provider: Optional[str] = None) -> str:
+    """
+    Get the tokenizer family of a model.
+
+    Args:
+        model: Model name
+        provider: Optional provider name, used when the model name is unknown
+
+    Returns:
+        One of "openai", "anthropic", "gemini", "llama" or "default"
+    """
+    name = (model or "").lower()
+    if name.startswith(("gpt-", "o1", "o3", "o4", "text-embedding-", "text-davinci-")):
+        return "openai"
+    if name.startswith("claude"):
+        return "anthropic"
+    if name.startswith(("gemini", "models/gemini")):
+        return "gemini"
+    if provider:
+        return _PROVIDER_FAMILIES.get(provider.lower(), "default")
+    return "default"
+
+
+class TokenCounter:
+    """
+    Token counting service with cached encoders and memoized counts.
+
+    OpenAI models are counted exactly with tiktoken; its encoders are loaded
+    once per model. Other models, and OpenAI models when tiktoken or its
+    encoding files are unavailable, are counted with a per-family estimate of
+    characters per token, which can be calibrated with the token counts the
+    providers report. Counts are memoized by model family and content hash.
+
+    Use the process-wide instance from ``get_token_counter()``.
+    """
+
+    def __init__(self, cache_size: int = 10000):
+        """
+        Initialize the token counter.
+
+        Args:
+            cache_size: Maximum number of memoized counts
+        """
+        self.cache_size = cache_size
+        self.chars_per_token = dict(CHARS_PER_TOKEN)
+        self._encoders: Dict[str, Any] = {}
+        self._counts: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get_encoder(self, model: str) -> Optional[Any]:
+        """
+        Get the tiktoken encoder of an OpenAI model, loading it once.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Encoder, or None if tiktoken cannot count for the model
+        """
+        if model in self._encoders:
+            return self._encoders[model]
+
+        encoder = None
+        if TIKTOKEN_AVAILABLE and model_family(model) == "openai":
+            try:
+                try:
+                    encoder = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    # Models newer than the installed tiktoken
+                    encoder = tiktoken.get_encoding(
+                        "o200k_base"
+                        if model.startswith(("gpt-4o", "gpt-4.1", "o"))
+                        else "cl100k_base"
+                    )
+            except Exception as e:
+                # Usually the encoding file could not be downloaded; estimate
+                # instead of retrying on every call
+                logger.warning(f"Error loading tiktoken encoding for {model}: {e}")
+
+        self._encoders[model] = encoder
+        return encoder
+
+    def _key(self, model: str, provider: Optional[str]) -> str:
+        """Key under which the counts of a model are memoized."""
+        encoder = self.get_encoder(model)
+        if encoder is not None:
+            return f"tiktoken:{encoder.name}"
+        family = model_family(model, provider)
+        return f"{family}:{self.chars_per_token[family]}"
+
+    def estimate(self, text: str, family: str = "default") -> int:
+        """
+        Estimate the number of tokens of a text.
+
+        Args:
+            text: Text to count tokens for
+            family: Model family whose characters per token to use
+
+        Returns:
+            Estimated number of tokens
+        """
+        if not text:
+            return 0
+        non_ascii = sum(1 for char in text if ord(char) > 127)
+        ascii_chars = len(text) - non_ascii
+        ratio = self.chars_per_token.get(family, self.chars_per_token["default"])
+        return math.ceil(ascii_chars / ratio) + non_ascii
+
+    def count(self, text: str, model: str, provider: Optional[str] = None) -> int:
+        """
+        Count the tokens of a text for a model.
+
+        Args:
+            text: Text to count tokens for
+            model: Model name
+            provider: Optional provider name, used to pick the estimate for
+                models unknown by name
+
+        Returns:
+            Number of tokens
+        """
+        if not text:
+            return 0
+
+        key = (
+            self._key(model, provider),
+            hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        )
+        with self._lock:
+            if key in self._counts:
+                self._counts.move_to_end(key)
+                self._stats["hits"] += 1
+                return self._counts[key]
+
+        encoder = self.get_encoder(model)
+        if encoder is not None:
+            count = len(encoder.encode(text, disallowed_special=()))
+        else:
+            count = self.estimate(text, model_family(model, provider))
+
+        with self._lock:
+            self._stats["misses"] += 1
+            self._counts[key] = count
+            if len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+        return count
+
+    def count_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        provider: Optional[str] = None,
+    ) -> int:
+        """
+        Count the prompt tokens of a list of chat messages.
+
+        Each message is counted once and memoized, so counting a conversation
+        that grew by one turn only counts the new message.
+
+        Args:
+            messages: List of messages
+            model: Model name
+            provider: Optional provider name
+
+        Returns:
+            Number of tokens, including the framing of each message
+        """
+        if not messages:
+            return 0
+
+        family = model_family(model, provider)
+        overhead = MESSAGE_OVERHEAD[family]
+        total = REPLY_OVERHEAD
+        for message in messages:
+            total += overhead
+            for key, value in message.items():
+                if value is None:
+                    continue
+                total += self.count(_message_text(value), model, provider)
+                if key == "name":
+                    total += 1
+        return total
+
+    def calibrate(
+        self,
+        family: str,
+        text: str,
+        actual_tokens: int,
+        weight: float = 0.1,
+    ) -> None:
+        """
+        Adjust the characters per token of a family to a reported count.
+
+        Args:
+            family: Model family, as returned by ``model_family()``
+            text: Text that was counted
+            actual_tokens: Number of tokens the provider reported for the text
+            weight: Weight of the new observation in the moving average
+        """
+        ascii_chars = sum(1 for char in text if ord(char) <= 127)
+        ascii_tokens = actual_tokens - (len(text) - ascii_chars)
+        if ascii_chars <= 0 or ascii_tokens <= 0:
+            return
+
+        current = self.chars_per_token.get(family, self.chars_per_token["default"])
+        observed = ascii_chars / ascii_tokens
+        # Rounded so that small adjustments don't invalidate the memoized counts
+        self.chars_per_token[family] = round(
+            (1 - weight) * current + weight * observed, 2
+        )
+
+    def calibrate_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        provider: Optional[str],
+        actual_tokens: int,
+        weight: float = 0.1,
+    ) -> None:
+        """
+        Adjust the estimate of a model to the prompt tokens a provider reported.
+
+        Models counted exactly with tiktoken are left unchanged.
+
+        Args:
+            messages: Messages that were sent
+            model: Model name
+            provider: Optional provider name
+            actual_tokens: Number of input tokens the provider reported
+            weight: Weight of the new observation in the moving average
+        """
+        if not messages or self.get_encoder(model) is not None:
+            return
+
+        family = model_family(model, provider)
+        text = "".join(
+            _message_text(value)
+            for message in messages
+            for value in message.values()
+            if value is not None
+        )
+        framing = REPLY_OVERHEAD + MESSAGE_OVERHEAD[family] * len(messages)
+        self.calibrate(family, text, actual_tokens - framing, weight)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the memoization statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate and memoized counts
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "cached": len(self._counts),
+        }
+
+
+def _message_text(value: Any) -> str:
+    """Get the text of a message field, including multi-part content."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return "".join(
+            part.get("text", "") if isinstance(part, dict) else str(part)
+            for part in value
+        )
+    return str(value)
+
+
+_TOKEN_COUNTER: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """
+    Get the process-wide token counter.
+
+    Returns:
+        The shared TokenCounter
+    """
+    global _TOKEN_COUNTER
+    if _TOKEN_COUNTER is None:
+        _TOKEN_COUNTER = TokenCounter()
+    return _TOKEN_COUNTER
@@ -3,6 +3,12 @@ Monitoring components for the Agents Hub framework.
 """
 
 from agents_hub.monitoring.base import BaseMonitor, MonitoringEvent, MonitoringLevel
+from agents_hub.monitoring.blocking import (
+    BlockingEvent,
+    LoopBlockingDetector,
+    blocking_scope,
+)
+from agents_hub.monitoring.dispatcher import BackgroundMonitor
 from agents_hub.monitoring.langfuse import LangfuseMonitor
 from agents_hub.monitoring.registry import MonitoringRegistry
 
@@ -12,4 +18,8 @@ __all__ = [
     "MonitoringLevel",
     "LangfuseMonitor",
     "MonitoringRegistry",
+    "BackgroundMonitor",
+    "BlockingEvent",
+    "LoopBlockingDetector",
+    "blocking_scope",
 ]
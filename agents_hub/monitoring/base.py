@@ -170,6 +170,19 @@ class BaseMonitor:
         """
         raise NotImplementedError("Subclasses must implement _track_event()")
 
+    async def _track_events(self, events: List[EventData]) -> None:
+        """
+        Track a batch of events (implementation).
+
+        The default implementation tracks the events one by one, in order.
+        Monitors whose backend supports batching can override this.
+
+        Args:
+            events: List of event data
+        """
+        for event_data in events:
+            await self._track_event(event_data)
+
     async def start_conversation(
         self,
         conversation_id: Optional[str] = None,
@@ -384,6 +397,9 @@ class BaseMonitor:
         total_tokens: Optional[int] = None,
         cost: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        cached_tokens: Optional[int] = None,
+        cache_write_tokens: Optional[int] = None,
+        from_cache: bool = False,
     ) -> Optional[str]:
         """
         Track an LLM result.
@@ -400,10 +416,29 @@ class BaseMonitor:
             total_tokens: Optional total number of tokens
             cost: Optional estimated cost of the operation
             metadata: Optional metadata for the LLM result
+            cached_tokens: Optional number of input tokens read from the
+                provider's prompt cache
+            cache_write_tokens: Optional number of input tokens written to
+                the provider's prompt cache
+            from_cache: Whether the result was served from a response cache,
+                in which case it used no tokens and cost nothing
 
         Returns:
             Optional event ID
         """
+        if from_cache:
+            input_tokens = output_tokens = total_tokens = 0
+            cost = 0.0
+            metadata = {**(metadata or {}), "from_cache": True}
+
+        # Prompt cache figures are recorded with the metadata of the result
+        if cached_tokens is not None or cache_write_tokens is not None:
+            metadata = dict(metadata or {})
+            if cached_tokens is not None:
+                metadata["cached_tokens"] = cached_tokens
+            if cache_write_tokens is not None:
+                metadata["cache_write_tokens"] = cache_write_tokens
+
         return await self.track_event(
             event_type=MonitoringEvent.LLM_RESULT,
             conversation_id=conversation_id,
@@ -451,6 +486,45 @@ class BaseMonitor:
             metadata=metadata,
         )
 
+    async def track_cancellation(
+        self,
+        reason: str,
+        conversation_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        user_id: Optional[str] = None,
+        elapsed: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Track a run that was aborted before it finished.
+
+        Cancellations are tracked as error events so that they show up at every
+        monitoring level.
+
+        Args:
+            reason: Why the run was aborted ("cancelled" or "deadline_exceeded")
+            conversation_id: Optional ID of the conversation
+            agent_name: Optional name of the agent
+            user_id: Optional ID of the user
+            elapsed: Optional number of seconds the run took before it was aborted
+            metadata: Optional metadata for the cancellation
+
+        Returns:
+            Optional event ID
+        """
+        data = {"error": f"Run aborted: {reason}", "reason": reason}
+        if elapsed is not None:
+            data["elapsed"] = elapsed
+
+        return await self.track_event(
+            event_type=MonitoringEvent.ERROR,
+            conversation_id=conversation_id,
+            agent_name=agent_name,
+            user_id=user_id,
+            data=data,
+            metadata={**(metadata or {}), "cancelled": True},
+        )
+
     async def track_custom_event(
         self,
         event_name: str,
@@ -0,0 +1,377 @@
+"""
+Event loop blocking detection for the Agents Hub framework.
+"""
+
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import asyncio.events
+import logging
+import sys
+import threading
+import time
+import traceback
+import numpy as np
+from pydantic import BaseModel, Field
+from agents_hub.monitoring.base import BaseMonitor, MonitoringEvent
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Calls of the framework that the current code runs under, outermost first
+_scope: ContextVar[Tuple[str, ...]] = ContextVar("agents_hub_scope", default=())
+
+# Detectors by the event loop they watch, and the unpatched Handle._run
+_DETECTORS: Dict[asyncio.AbstractEventLoop, "LoopBlockingDetector"] = {}
+_original_run = asyncio.events.Handle._run
+
+
+@contextmanager
+def blocking_scope(kind: str, name: str) -> Iterator[None]:
+    """
+    Attribute the code run inside the block, and the tasks it starts, to a call.
+
+    The agent wraps its LLM, tool and memory calls in a scope, so that a
+    ``LoopBlockingDetector`` can report which of them blocked the event loop.
+
+    Args:
+        kind: Kind of call, e.g. "agent", "tool", "provider" or "memory"
+        name: Name of the agent, tool, provider or memory
+    """
+    token = _scope.set(_scope.get() + (f"{kind}:{name}",))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def current_scope() -> Tuple[str, ...]:
+    """
+    Get the calls the current code runs under.
+
+    Returns:
+        Scopes, outermost first, e.g. ("agent:researcher", "tool:web_search")
+    """
+    return _scope.get()
+
+
+def _patched_run(handle: asyncio.Handle) -> None:
+    """Run a loop callback, timing it if its loop is watched."""
+    detector = _DETECTORS.get(handle._loop)
+    if detector is None:
+        return _original_run(handle)
+    return detector._run_handle(handle)
+
+
+class BlockingEvent(BaseModel):
+    """A loop callback that blocked the event loop."""
+
+    duration: float = Field(..., description="Time the loop was blocked in seconds")
+    scope: List[str] = Field(
+        default_factory=list, description="Calls the callback ran under"
+    )
+    callback: str = Field(..., description="Coroutine or callback that blocked")
+    stacks: List[str] = Field(
+        default_factory=list, description="Stacks sampled while the loop was blocked"
+    )
+    timestamp: float = Field(
+        default_factory=time.time, description="Timestamp of the event"
+    )
+
+
+class _Slice:
+    """A callback that is running on the watched loop."""
+
+    __slots__ = ("context", "scope", "started_at", "stacks")
+
+    def __init__(self, handle: asyncio.Handle):
+        # Tasks run every step in their own context, so the scope can be read
+        # from it, also by the sampler thread while the step blocks the loop
+        self.context = getattr(handle, "_context", None)
+        self.scope = self.get_scope()
+        self.started_at = time.perf_counter()
+        self.stacks: List[str] = []
+
+    def get_scope(self) -> Tuple[str, ...]:
+        """Get the scope the callback currently runs under."""
+        return self.context.get(_scope, ()) if self.context is not None else ()
+
+    def update_scope(self) -> None:
+        """Keep the innermost scope seen while the callback ran."""
+        scope = self.get_scope()
+        if len(scope) > len(self.scope):
+            self.scope = scope
+
+
+class LoopBlockingDetector:
+    """
+    Detector of code that blocks the event loop.
+
+    It measures the event loop lag, the delay with which a periodic timer
+    fires, which is cheap enough for production. In audit mode it also times
+    every callback the loop runs; callbacks that run longer than the
+    threshold, usually synchronous I/O inside ``async def``, are recorded
+    with the calls they ran under (see ``blocking_scope``) and stacks of the
+    loop thread sampled while it was blocked.
+
+    Audit mode requires the default asyncio event loop; with other loops,
+    such as uvloop, only the lag is measured.
+
+    Example:
+        ```python
+        async with LoopBlockingDetector(threshold=0.05) as detector:
+            await asyncio.gather(*(agent.run(question) for question in questions))
+
+        print(detector.report())
+        ```
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: float = 0.05,
+        audit: bool = True,
+        sample_interval: float = 0.02,
+        max_samples: int = 5,
+        max_events: int = 100,
+        window: int = 1000,
+        monitor: Optional[BaseMonitor] = None,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            threshold: Shortest callback duration in seconds that counts as
+                blocking the loop
+            interval: Period of the lag measurement timer in seconds
+            audit: Whether to time callbacks and attribute blocking to calls
+            sample_interval: Period in seconds at which the stack of a
+                blocked loop is sampled
+            max_samples: Maximum number of stacks sampled per blocking event
+            max_events: Number of most recent blocking events kept
+            window: Number of most recent lag measurements kept
+            monitor: Optional monitor that receives a custom event for every
+                blocking event
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.audit = audit
+        self.sample_interval = sample_interval
+        self.max_samples = max_samples
+        self.monitor = monitor
+        self.events: Deque[BlockingEvent] = deque(maxlen=max_events)
+        self._lags: Deque[float] = deque(maxlen=window)
+        self._scopes: Dict[str, Dict[str, Any]] = {}
+        self._blocked = {"count": 0, "time": 0.0}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._current: Optional[_Slice] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        if self._loop is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        self._heartbeat = self._loop.create_task(self._measure_lag())
+
+        if self.audit:
+            if not isinstance(self._loop, asyncio.BaseEventLoop):
+                logger.warning(
+                    f"Cannot audit callbacks of {type(self._loop).__name__}; "
+                    "only the event loop lag is measured"
+                )
+            elif self._loop in _DETECTORS:
+                raise RuntimeError("The event loop is already audited")
+            else:
+                _DETECTORS[self._loop] = self
+                asyncio.events.Handle._run = _patched_run
+                self._sampler = threading.Thread(
+                    target=self._sample, name="agents-hub-loop-sampler", daemon=True
+                )
+                self._sampler.start()
+
+    async def stop(self) -> None:
+        """Stop watching the event loop."""
+        if self._loop is None:
+            return
+
+        self._stopped.set()
+        if _DETECTORS.get(self._loop) is self:
+            del _DETECTORS[self._loop]
+            if not _DETECTORS:
+                asyncio.events.Handle._run = _original_run
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+        if self._sampler is not None:
+            await asyncio.to_thread(self._sampler.join)
+
+        self._loop = None
+        self._heartbeat = None
+        self._sampler = None
+
+    async def __aenter__(self) -> "LoopBlockingDetector":
+        """Start watching the running event loop."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop watching the event loop."""
+        await self.stop()
+
+    async def _measure_lag(self) -> None:
+        """Measure how late a periodic timer fires."""
+        while True:
+            scheduled_at = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self._lags.append(max(0.0, time.perf_counter() - scheduled_at))
+
+    def _sample(self) -> None:
+        """Sample the stack of the loop thread while a callback blocks it."""
+        while not self._stopped.wait(self.sample_interval):
+            current = self._current
+            if (
+                current is None
+                or len(current.stacks) >= self.max_samples
+                or time.perf_counter() - current.started_at < self.threshold
+            ):
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None and self._current is current:
+                current.stacks.append("".join(traceback.format_stack(frame)))
+                current.update_scope()
+
+    def _run_handle(self, handle: asyncio.Handle) -> None:
+        """Run a loop callback and record it if it blocked the loop."""
+        current = _Slice(handle)
+        self._current = current
+        try:
+            _original_run(handle)
+        finally:
+            self._current = None
+            current.update_scope()
+            duration = time.perf_counter() - current.started_at
+            if duration >= self.threshold:
+                self._record(handle, current, duration)
+
+    def _record(self, handle: asyncio.Handle, current: _Slice, duration: float) -> None:
+        """Record a callback that blocked the loop."""
+        scope = list(current.scope)
+        event = BlockingEvent(
+            duration=duration,
+            scope=scope,
+            callback=_describe(handle),
+            stacks=current.stacks,
+        )
+        self.events.append(event)
+
+        self._blocked["count"] += 1
+        self._blocked["time"] += duration
+        name = " > ".join(scope) or "unattributed"
+        totals = self._scopes.setdefault(name, {"count": 0, "time": 0.0, "max": 0.0})
+        totals["count"] += 1
+        totals["time"] += duration
+        totals["max"] = max(totals["max"], duration)
+
+        logger.warning(
+            f"Event loop blocked for {duration * 1000:.0f} ms by {event.callback} "
+            f"({name})"
+        )
+        if self.monitor is not None:
+            self._loop.create_task(self._track(event))
+
+    async def _track(self, event: BlockingEvent) -> None:
+        """Send a blocking event to the monitor."""
+        try:
+            await self.monitor.track_event(
+                event_type=MonitoringEvent.CUSTOM,
+                data={"event": "event_loop_blocked", **event.model_dump()},
+            )
+        except Exception as e:
+            logger.warning(f"Error tracking event loop blocking: {e}")
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the lag and blocking statistics.
+
+        Returns:
+            Dictionary with the lag percentiles and maximum in seconds, the
+            number and total duration of blocking events, and the same
+            figures per scope, slowest first
+        """
+        lag_p50, lag_p99, lag_max = (
+            np.percentile(np.asarray(self._lags), [50, 99, 100]).tolist()
+            if self._lags
+            else (0.0, 0.0, 0.0)
+        )
+        return {
+            "lag_p50": lag_p50,
+            "lag_p99": lag_p99,
+            "lag_max": lag_max,
+            "blocking_events": self._blocked["count"],
+            "blocked_time": self._blocked["time"],
+            "by_scope": dict(
+                sorted(
+                    self._scopes.items(),
+                    key=lambda item: item[1]["time"],
+                    reverse=True,
+                )
+            ),
+        }
+
+    def report(self, top: int = 5) -> str:
+        """
+        Summarize the lag and the calls that blocked the loop the longest.
+
+        Args:
+            top: Number of scopes to include
+
+        Returns:
+            Human-readable report, with a sampled stack for every scope
+        """
+        stats = self.stats
+        lines = [
+            f"Event loop lag: p50 {stats['lag_p50'] * 1000:.1f} ms, "
+            f"p99 {stats['lag_p99'] * 1000:.1f} ms, "
+            f"max {stats['lag_max'] * 1000:.1f} ms",
+            f"Blocking events: {stats['blocking_events']} "
+            f"({stats['blocked_time'] * 1000:.0f} ms blocked)",
+        ]
+
+        for name, totals in list(stats["by_scope"].items())[:top]:
+            lines.append(
+                f"\n{name}: {totals['count']} events, "
+                f"{totals['time'] * 1000:.0f} ms total, "
+                f"{totals['max'] * 1000:.0f} ms max"
+            )
+            for event in reversed(self.events):
+                if (" > ".join(event.scope) or "unattributed") == name:
+                    lines.append(f"  in {event.callback}")
+                    if event.stacks:
+                        lines.append(event.stacks[-1].rstrip())
+                    break
+
+        return "\n".join(lines)
+
+
+def _describe(handle: asyncio.Handle) -> str:
+    """Name the coroutine or function a loop callback runs."""
+    callback = handle._callback
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coroutine = owner.get_coro()
+        return getattr(coroutine, "__qualname__", repr(coroutine))
+    return getattr(callback, "__qualname__", repr(callback))
@@ -0,0 +1,233 @@
+"""
+Background monitoring dispatch for the Agents Hub framework.
+"""
+
+from typing import Dict, List, Any, Optional, Literal
+import asyncio
+import logging
+from agents_hub.monitoring.base import BaseMonitor, MonitoringEvent, EventData
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class BackgroundMonitor(BaseMonitor):
+    """
+    Monitor that delivers events to another monitor in the background.
+
+    Tracking an event only puts it on a bounded in-process queue, so callers
+    never wait on the monitoring backend. A worker task drains the queue in
+    batches and hands the events to the wrapped monitor in order.
+
+    Example:
+        ```python
+        monitor = BackgroundMonitor(LangfuseMonitor(...), max_queue_size=5000)
+        agent = Agent(name="assistant", llm=llm, monitor=monitor)
+        ...
+        await monitor.close()  # Flush remaining events on shutdown
+        ```
+    """
+
+    def __init__(
+        self,
+        monitor: BaseMonitor,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        overflow_policy: Literal["drop_oldest", "block"] = "drop_oldest",
+    ):
+        """
+        Initialize the background monitor.
+
+        Args:
+            monitor: Monitor that receives the events
+            max_queue_size: Maximum number of events waiting to be delivered
+            batch_size: Maximum number of events delivered per batch
+            overflow_policy: What to do when the queue is full: drop the oldest
+                queued event, or block the caller until there is room
+        """
+        super().__init__(monitor.level, monitor.include_events, monitor.exclude_events)
+        self.monitor = monitor
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(1, batch_size)
+        self.overflow_policy = overflow_policy
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.enqueued_events = 0
+        self.delivered_events = 0
+        self.dropped_events = 0
+        self.failed_events = 0
+
+    def should_track(self, event_type: MonitoringEvent) -> bool:
+        """
+        Check if an event should be tracked by the wrapped monitor.
+
+        Args:
+            event_type: Type of the event
+
+        Returns:
+            True if the event should be tracked, False otherwise
+        """
+        return self.monitor.should_track(event_type)
+
+    async def _track_event(self, event_data: EventData) -> Optional[str]:
+        """
+        Queue an event for background delivery.
+
+        Args:
+            event_data: Event data
+
+        Returns:
+            None, since the event has not been delivered yet
+        """
+        queue = self._ensure_worker()
+
+        if queue.full():
+            if self.overflow_policy == "block":
+                await queue.put(event_data)
+                self.enqueued_events += 1
+                return None
+
+            # Drop the oldest event to make room for the new one
+            try:
+                queue.get_nowait()
+                queue.task_done()
+                self.dropped_events += 1
+            except asyncio.QueueEmpty:
+                pass
+
+        queue.put_nowait(event_data)
+        self.enqueued_events += 1
+        return None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """
+        Make sure the queue and worker exist for the running event loop.
+
+        Returns:
+            The event queue
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues and tasks are bound to their loop, so start fresh
+            if self._queue is not None and self._queue.qsize():
+                logger.warning(
+                    f"Discarding {self._queue.qsize()} monitoring events queued "
+                    "on a previous event loop"
+                )
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._worker = None
+
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run_worker())
+
+        return self._queue
+
+    async def _run_worker(self) -> None:
+        """Drain the queue in batches and deliver the events."""
+        queue = self._queue
+        while True:
+            batch: List[EventData] = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self.monitor._track_events(batch)
+                self.delivered_events += len(batch)
+            except Exception as e:
+                self.failed_events += len(batch)
+                logger.exception(
+                    f"Error in monitor {self.monitor.__class__.__name__}: {e}"
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until all queued events have been delivered."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush the queued events and stop the worker."""
+        await self.flush()
+
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def score_conversation(
+        self,
+        conversation_id: str,
+        name: str,
+        value: float,
+        comment: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Score a conversation using the wrapped monitor.
+
+        Pending events are flushed first so the conversation exists.
+
+        Args:
+            conversation_id: ID of the conversation
+            name: Name of the score
+            value: Score value
+            comment: Optional comment
+            user_id: Optional ID of the user
+        """
+        if hasattr(self.monitor, "score_conversation"):
+            await self.flush()
+            await self.monitor.score_conversation(
+                conversation_id, name, value, comment, user_id=user_id
+            )
+
+    async def add_user_feedback(
+        self,
+        conversation_id: str,
+        score: int,
+        comment: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Add user feedback to a conversation using the wrapped monitor.
+
+        Pending events are flushed first so the conversation exists.
+
+        Args:
+            conversation_id: ID of the conversation
+            score: Feedback score (typically 1-5)
+            comment: Optional feedback comment
+            user_id: Optional ID of the user
+        """
+        if hasattr(self.monitor, "add_user_feedback"):
+            await self.flush()
+            await self.monitor.add_user_feedback(
+                conversation_id, score, comment, user_id=user_id
+            )
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get dispatch statistics.
+
+        Returns:
+            Dictionary with queue size and event counters
+        """
+        return {
+            "queue_size": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "enqueued_events": self.enqueued_events,
+            "delivered_events": self.delivered_events,
+            "dropped_events": self.dropped_events,
+            "failed_events": self.failed_events,
+        }
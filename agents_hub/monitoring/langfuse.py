@@ -469,7 +469,14 @@ class LangfuseMonitor(BaseMonitor):
 
         # Estimate cost if not provided
         if cost is None and input_tokens is not None and output_tokens is not None:
-            cost = estimate_cost(provider, model, input_tokens, output_tokens)
+            cost = estimate_cost(
+                provider,
+                model,
+                input_tokens,
+                output_tokens,
+                cached_tokens=event_data.metadata.get("cached_tokens") or 0,
+                cache_write_tokens=event_data.metadata.get("cache_write_tokens") or 0,
+            )
 
         if not generation_id:
             # Create a new generation if we don't have one
@@ -5,27 +5,19 @@ Utility functions for the monitoring system.
 from typing import Dict, List, Any, Optional, Union, Tuple
 import json
 import logging
+from agents_hub.llm.tokens import get_token_counter
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-# Try to import tiktoken for OpenAI token counting
-try:
-    import tiktoken
-
-    TIKTOKEN_AVAILABLE = True
-except ImportError:
-    TIKTOKEN_AVAILABLE = False
-    logger.warning(
-        "tiktoken is not installed. Token counting for OpenAI models will be approximate. "
-        "Install tiktoken for accurate token counting: pip install tiktoken"
-    )
-
 
 def count_tokens(text: str, model: str) -> int:
     """
     Count the number of tokens in a text string for a specific model.
 
+    Counts are memoized by the shared token counter, so recounting the same
+    text is cheap.
+
     Args:
         text: Text to count tokens for
         model: Model name to use for token counting
@@ -33,20 +25,7 @@ def count_tokens(text: str, model: str) -> int:
     Returns:
         Number of tokens
     """
-    if not text:
-        return 0
-
-    # Use tiktoken for OpenAI models if available
-    if TIKTOKEN_AVAILABLE and model.startswith(("gpt-", "text-davinci-")):
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-            return len(encoding.encode(text))
-        except Exception as e:
-            logger.warning(f"Error using tiktoken for model {model}: {e}")
-
-    # Fallback to approximate token counting
-    # A rough approximation is 4 characters per token for English text
-    return len(text) // 4
+    return get_token_counter().count(text, model)
 
 
 def count_tokens_for_messages(
@@ -62,39 +41,7 @@ def count_tokens_for_messages(
     Returns:
         Dictionary with token counts (input_tokens)
     """
-    if not messages:
-        return {"input_tokens": 0}
-
-    # For OpenAI chat models with tiktoken
-    if TIKTOKEN_AVAILABLE and model.startswith(("gpt-")):
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-
-            # From OpenAI's documentation:
-            # Every message follows <|start|>{role/name}\n{content}<|end|>
-            # If there's a name, the role is omitted
-            num_tokens = 0
-            for message in messages:
-                num_tokens += 4  # <|start|> and <|end|> tokens
-                for key, value in message.items():
-                    num_tokens += len(encoding.encode(str(value)))
-                    if key == "name":  # If there's a name, the role is omitted
-                        num_tokens -= 1  # Role is omitted
-
-            num_tokens += 2  # Every reply is primed with <|start|>assistant<|message|>
-
-            return {"input_tokens": num_tokens}
-        except Exception as e:
-            logger.warning(f"Error using tiktoken for model {model}: {e}")
-
-    # Fallback to approximate token counting
-    total_tokens = 0
-    for message in messages:
-        content = message.get("content", "")
-        if isinstance(content, str):
-            total_tokens += count_tokens(content, model)
-
-    return {"input_tokens": total_tokens}
+    return {"input_tokens": get_token_counter().count_messages(messages, model)}
 
 
 def get_model_pricing(model: str, provider: str) -> Tuple[float, float]:
@@ -223,8 +170,31 @@ def get_model_pricing(model: str, provider: str) -> Tuple[float, float]:
     return default_pricing
 
 
+def get_cache_pricing(provider: str) -> Tuple[float, float]:
+    """
+    Get the price of prompt cache reads and writes relative to input tokens.
+
+    Args:
+        provider: Provider name
+
+    Returns:
+        Tuple of (cache read price factor, cache write price factor)
+    """
+    provider = provider.lower()
+    if provider in ["openai", "openaiprovider"]:
+        return 0.5, 1.0
+    if provider in ["anthropic", "claude", "claudeprovider"]:
+        return 0.1, 1.25
+    return 1.0, 1.0
+
+
 def estimate_cost(
-    provider: str, model: str, input_tokens: int, output_tokens: int
+    provider: str,
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cached_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ) -> float:
     """
     Estimate the cost of an LLM call based on token usage.
@@ -232,21 +202,29 @@ def estimate_cost(
     Args:
         provider: Provider name
         model: Model name
-        input_tokens: Number of input tokens
+        input_tokens: Number of input tokens, including cached tokens
         output_tokens: Number of output tokens
+        cached_tokens: Number of input tokens read from the prompt cache
+        cache_write_tokens: Number of input tokens written to the prompt cache
 
     Returns:
         Estimated cost in USD
     """
     # Get pricing information
     input_price_per_1m, output_price_per_1m = get_model_pricing(model, provider)
+    read_factor, write_factor = get_cache_pricing(provider)
 
     # Convert to price per token
     input_price_per_token = input_price_per_1m / 1_000_000
     output_price_per_token = output_price_per_1m / 1_000_000
 
-    # Calculate cost
-    input_cost = input_tokens * input_price_per_token
+    # Calculate cost, with cached input tokens at their own price
+    uncached_tokens = max(0, input_tokens - cached_tokens - cache_write_tokens)
+    input_cost = input_price_per_token * (
+        uncached_tokens
+        + cached_tokens * read_factor
+        + cache_write_tokens * write_factor
+    )
     output_cost = output_tokens * output_price_per_token
     total_cost = input_cost + output_cost
 
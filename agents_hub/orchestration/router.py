@@ -2,6 +2,7 @@
 Agent Workforce orchestration for the Agents Hub framework.
 """
 
+import json
 import logging
 from typing import Dict, List, Any, Optional, Union
 from pydantic import BaseModel, Field
@@ -106,6 +107,66 @@ class AgentWorkforce:
                 "fallback_reason": str(e),
             }
 
+    def _plan_schema(self) -> Dict[str, Any]:
+        """
+        Build the JSON Schema of an orchestration plan.
+
+        The agent of each subtask is restricted to the names of the available
+        agents.
+
+        Returns:
+            JSON Schema of the plan
+        """
+        subtask = {
+            "type": "object",
+            "properties": {
+                "description": {"type": "string"},
+                "agent": {"type": "string", "enum": list(self.agents.keys())},
+                "order": {"type": "integer"},
+            },
+            "required": ["description", "agent", "order"],
+            "additionalProperties": False,
+        }
+        return {
+            "title": "orchestration_plan",
+            "type": "object",
+            "properties": {"subtasks": {"type": "array", "items": subtask}},
+            "required": ["subtasks"],
+            "additionalProperties": False,
+        }
+
+    def _parse_plan(
+        self, content: str, expected_schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Parse an orchestration plan.
+
+        A structured response is plain JSON; the JSON recovery strategies are
+        only needed for providers that answered with text around it.
+
+        Args:
+            content: Response of the orchestrator
+            expected_schema: Expected keys and types of the plan
+
+        Returns:
+            The plan
+
+        Raises:
+            JSONParsingError: If no valid plan could be extracted
+        """
+        try:
+            plan = json.loads(content)
+        except json.JSONDecodeError:
+            plan = None
+        if isinstance(plan, dict) and all(
+            isinstance(plan.get(key), expected_type)
+            for key, expected_type in expected_schema.items()
+        ):
+            return plan
+
+        logger.debug("Orchestrator response is not plain JSON, recovering it")
+        return extract_json(content, expected_schema)
+
     async def _orchestrated_execution(
         self,
         task: str,
@@ -156,9 +217,11 @@ class AgentWorkforce:
         Available agent names: {list(self.agents.keys())}
         """
 
-        # Get the orchestration plan
+        # Get the orchestration plan, as JSON following the plan schema with
+        # providers that support structured output
         orchestration_result = await self.orchestrator.run(
-            orchestration_prompt, context
+            orchestration_prompt,
+            {**context, "response_schema": self._plan_schema()},
         )
 
         logger.debug(f"Orchestrator response: {orchestration_result}")
@@ -170,7 +233,7 @@ class AgentWorkforce:
                 "subtasks": list,
             }
 
-            plan = extract_json(orchestration_result, expected_schema)
+            plan = self._parse_plan(orchestration_result, expected_schema)
             subtasks = plan.get("subtasks", [])
 
             # Validate subtasks structure
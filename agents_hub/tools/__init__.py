@@ -3,5 +3,6 @@ Tools for the Agents Hub framework.
 """
 
 from agents_hub.tools.base import BaseTool
+from agents_hub.tools.cache import ToolResultCache
 
-__all__ = ["BaseTool"]
+__all__ = ["BaseTool", "ToolResultCache"]
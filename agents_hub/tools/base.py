@@ -2,17 +2,58 @@
 Base Tool interface for the Agents Hub framework.
 """
 
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple, TYPE_CHECKING
+import functools
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from agents_hub.tools.cache import ToolResultCache
+
+
+def _run_through_cache(run: Callable) -> Callable:
+    """Wrap the run() of a tool class to go through the tool's result cache."""
+    
+    @functools.wraps(run)
+    async def wrapper(self, parameters: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Any:
+        # Only the run() of the tool's own class uses the cache, not the ones
+        # it calls with super()
+        if self.result_cache is None or type(self).run is not wrapper:
+            return await run(self, parameters, context)
+        _, result = await self.run_cached(parameters, context)
+        return result
+    
+    return wrapper
+
 
 class BaseTool:
     """
     Base class for tools.
     
     This abstract class defines the interface that all tools must implement.
+    The ``run()`` of subclasses goes through ``result_cache`` when one is set,
+    so cacheable tools are cached whether they are called by an agent or
+    directly.
     """
     
+    # Optional timeout in seconds for a single run; overrides the agent default
+    timeout: Optional[float] = None
+    
+    # Whether results may be served from a ToolResultCache; only set this for
+    # tools whose results depend on nothing but their arguments
+    cacheable: bool = False
+    # Optional time to live in seconds and LRU size limit for cached results;
+    # the cache defaults are used when not set
+    cache_ttl: Optional[float] = None
+    cache_max_entries: Optional[int] = None
+    # Optional ToolResultCache that run() reads from and writes to
+    result_cache: Optional["ToolResultCache"] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        """Route the run() of a tool class through the result cache."""
+        super().__init_subclass__(**kwargs)
+        if "run" in cls.__dict__:
+            cls.run = _run_through_cache(cls.__dict__["run"])
+    
     def __init__(
         self,
         name: str,
@@ -44,6 +85,47 @@ class BaseTool:
         """
         raise NotImplementedError("Subclasses must implement run()")
     
+    async def run_cached(
+        self,
+        parameters: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        cache: Optional["ToolResultCache"] = None,
+    ) -> Tuple[Optional[bool], Any]:
+        """
+        Run the tool through a result cache.
+        
+        Args:
+            parameters: Parameters for the tool
+            context: Optional context information
+            cache: Cache to use instead of ``result_cache``
+            
+        Returns:
+            Tuple of (whether the result was served from the cache, or None if
+            the call was not cached, result of running the tool)
+        """
+        cache = cache or self.result_cache
+        run = type(self).run
+        run = getattr(run, "__wrapped__", run)
+        if cache is None:
+            return None, await run(self, parameters, context)
+        return await cache.call(self, parameters, lambda: run(self, parameters, context))
+    
+    def is_cacheable(self, parameters: Dict[str, Any]) -> bool:
+        """
+        Check whether the result of a call may be cached.
+        
+        Tools that mix read and write operations can override this to cache
+        only their reads. A non-cacheable call to a cacheable tool invalidates
+        the tool's cached results.
+        
+        Args:
+            parameters: Parameters for the tool
+            
+        Returns:
+            True if the result may be cached, False otherwise
+        """
+        return self.cacheable
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the tool to a dictionary representation.
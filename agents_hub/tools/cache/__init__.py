@@ -0,0 +1,7 @@
+"""
+Tool result caching for the Agents Hub framework.
+"""
+
+from agents_hub.tools.cache.base import ToolResultCache
+
+__all__ = ["ToolResultCache"]
@@ -0,0 +1,205 @@
+"""
+Tool result caching for the Agents Hub framework.
+"""
+
+from typing import Dict, Any, Awaitable, Callable, Optional, Tuple
+import hashlib
+import json
+import logging
+from agents_hub.cache.base import BaseCacheBackend
+from agents_hub.cache.in_memory import InMemoryCacheBackend
+from agents_hub.tools.base import BaseTool
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class ToolResultCache:
+    """
+    Memoizing cache for the results of idempotent tools.
+
+    Only tools that declare themselves ``cacheable`` are cached, so tools with
+    side effects are always run. Results are keyed by the tool name and the
+    canonical JSON form of the arguments, so the same call from different
+    conversations or agents is answered from the cache. Error results are
+    never cached.
+
+    Example:
+        ```python
+        cache = ToolResultCache(DiskCacheBackend("~/.cache/agents_hub/tools.db"))
+        researcher = Agent(name="researcher", llm=llm, tools=tools, tool_cache=cache)
+        writer = Agent(name="writer", llm=llm, tools=tools, tool_cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: Optional[BaseCacheBackend] = None,
+        default_ttl: Optional[float] = 300.0,
+        max_entries: int = 1024,
+    ):
+        """
+        Initialize the tool result cache.
+
+        Args:
+            backend: Cache backend (in-memory if not provided)
+            default_ttl: Time to live in seconds for tools without a ``cache_ttl``
+            max_entries: Maximum entries per tool for tools without a
+                ``cache_max_entries``
+        """
+        self.backend = backend or InMemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(tool_name: str, parameters: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a tool call.
+
+        Args:
+            tool_name: Name of the tool
+            parameters: Arguments of the call
+
+        Returns:
+            Cache key
+        """
+        canonical = json.dumps(
+            parameters,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{tool_name}:{digest}"
+
+    async def get(self, tool: BaseTool, parameters: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Look up the cached result of a tool call.
+
+        Args:
+            tool: Tool being called
+            parameters: Arguments of the call
+
+        Returns:
+            Tuple of (whether the result was cached, cached result)
+        """
+        try:
+            hit, value = await self.backend.get(
+                tool.name, self.make_key(tool.name, parameters)
+            )
+        except Exception as e:
+            logger.warning(f"Error reading tool cache for '{tool.name}': {e}")
+            hit, value = False, None
+
+        counters = self._counters.setdefault(tool.name, {"hits": 0, "misses": 0})
+        counters["hits" if hit else "misses"] += 1
+        return hit, value
+
+    async def set(
+        self, tool: BaseTool, parameters: Dict[str, Any], result: Any
+    ) -> None:
+        """
+        Cache the result of a tool call, unless it is an error.
+
+        Args:
+            tool: Tool that was called
+            parameters: Arguments of the call
+            result: Result of the call
+        """
+        if isinstance(result, dict) and "error" in result:
+            return
+
+        ttl = tool.cache_ttl if tool.cache_ttl is not None else self.default_ttl
+        max_entries = tool.cache_max_entries or self.max_entries
+        try:
+            await self.backend.set(
+                tool.name,
+                self.make_key(tool.name, parameters),
+                result,
+                ttl=ttl,
+                max_entries=max_entries,
+            )
+        except Exception as e:
+            logger.warning(f"Error writing tool cache for '{tool.name}': {e}")
+
+    async def call(
+        self,
+        tool: BaseTool,
+        parameters: Dict[str, Any],
+        run: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Optional[bool], Any]:
+        """
+        Run a tool call through the cache.
+
+        Cacheable calls are answered from the cache, or run and cached on a
+        miss. Other calls to a cacheable tool are run and invalidate its
+        cached results.
+
+        Args:
+            tool: Tool being called
+            parameters: Arguments of the call
+            run: Function that runs the tool call
+
+        Returns:
+            Tuple of (whether the result was served from the cache, or None
+            if the call is not cacheable, result of the call)
+        """
+        if not tool.cacheable:
+            return None, await run()
+
+        if not tool.is_cacheable(parameters):
+            result = await run()
+            # A write to a cacheable tool makes its cached reads stale
+            await self.invalidate(tool.name)
+            return None, result
+
+        hit, value = await self.get(tool, parameters)
+        if hit:
+            return True, value
+
+        result = await run()
+        await self.set(tool, parameters, result)
+        return False, result
+
+    async def invalidate(self, tool_name: Optional[str] = None) -> None:
+        """
+        Remove the cached results of a tool.
+
+        Args:
+            tool_name: Name of the tool (None for all tools)
+        """
+        await self.backend.clear(tool_name)
+
+    def tool_stats(self, tool_name: str) -> Dict[str, int]:
+        """
+        Get the hit and miss counters of a tool.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            Dictionary with ``cache_hits`` and ``cache_misses``
+        """
+        counters = self._counters.get(tool_name, {"hits": 0, "misses": 0})
+        return {"cache_hits": counters["hits"], "cache_misses": counters["misses"]}
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the hit and miss counters of all tools.
+
+        Returns:
+            Dictionary with totals and per-tool counters
+        """
+        hits = sum(counters["hits"] for counters in self._counters.values())
+        misses = sum(counters["misses"] for counters in self._counters.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "tools": {
+                name: dict(counters) for name, counters in self._counters.items()
+            },
+        }
@@ -38,6 +38,9 @@ class AWSCDKTool(BaseTool):
         ```
     """
     
+    # CDK operations have side effects, so results must never be cached
+    cacheable = False
+    
     def __init__(self):
         """Initialize the AWS CDK tool."""
         super().__init__(
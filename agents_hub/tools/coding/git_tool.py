@@ -37,6 +37,9 @@ class GitTool(BaseTool):
         ```
     """
     
+    # Git operations have side effects, so results must never be cached
+    cacheable = False
+    
     def __init__(self):
         """Initialize the Git tool."""
         super().__init__(
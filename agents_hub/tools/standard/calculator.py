@@ -13,6 +13,10 @@ class CalculatorTool(BaseTool):
     Calculator tool for performing mathematical calculations.
     """
     
+    # Results depend only on the expression
+    cacheable = True
+    cache_ttl = 3600.0
+    
     def __init__(self):
         """Initialize the calculator tool."""
         super().__init__(
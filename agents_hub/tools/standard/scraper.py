@@ -9,6 +9,7 @@ from bs4 import BeautifulSoup
 import re
 import json
 from agents_hub.tools.base import BaseTool
+from agents_hub.utils.deadline import Deadline
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -17,6 +18,13 @@ logger = logging.getLogger(__name__)
 class ScraperTool(BaseTool):
     """Tool for scraping web content."""
     
+    # Timeout in seconds for fetching a page
+    fetch_timeout: float = 30.0
+    
+    # Page contents can be reused for a while
+    cacheable = True
+    cache_ttl = 600.0
+    
     def __init__(self):
         """Initialize the scraper tool."""
         super().__init__(
@@ -66,8 +74,14 @@ class ScraperTool(BaseTool):
         include_images = parameters.get("include_images", False)
         
         try:
+            # Never wait longer than the run's deadline allows
+            timeout = self.fetch_timeout
+            deadline = Deadline.from_context(context)
+            if deadline:
+                timeout = deadline.timeout_for(timeout)
+            
             # Fetch the page
-            response_text = await self._fetch_url(url)
+            response_text = await self._fetch_url(url, timeout)
             
             # Return HTML if requested
             if extract_type == "html":
@@ -139,12 +153,13 @@ class ScraperTool(BaseTool):
             logger.exception(f"Error scraping URL: {e}")
             return {"error": str(e), "url": url}
     
-    async def _fetch_url(self, url: str) -> str:
+    async def _fetch_url(self, url: str, timeout: float = 30.0) -> str:
         """
         Fetch a URL with proper headers and error handling.
         
         Args:
             url: URL to fetch
+            timeout: Timeout in seconds for the request
             
         Returns:
             Response text
@@ -160,7 +175,7 @@ class ScraperTool(BaseTool):
         }
         
         async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=30) as response:
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
                 response.raise_for_status()
                 return await response.text()
     
@@ -43,6 +43,10 @@ class WebSearchTool(BaseTool):
         ```
     """
     
+    # Search results change slowly enough to be reused for a few minutes
+    cacheable = True
+    cache_ttl = 300.0
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the web search tool.
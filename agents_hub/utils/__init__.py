@@ -5,6 +5,7 @@ This module provides various utilities used across the framework.
 """
 
 from agents_hub.utils.approval import ApprovalInterface
+from agents_hub.utils.deadline import Deadline, DeadlineExceededError
 from agents_hub.utils.json_parser import (
     RobustJSONParser,
     extract_json,
@@ -13,6 +14,8 @@ from agents_hub.utils.json_parser import (
 
 __all__ = [
     "ApprovalInterface",
+    "Deadline",
+    "DeadlineExceededError",
     "RobustJSONParser",
     "extract_json",
     "JSONParsingError",
@@ -0,0 +1,155 @@
+"""
+Request-scoped deadlines for the Agents Hub framework.
+
+A deadline is carried in the run context under the ``deadline`` key, so every
+stage of a run (LLM calls, tools, memory and moderation) can bound its own
+waiting time by what is left of the request's budget.
+"""
+
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+import asyncio
+import inspect
+import time
+
+T = TypeVar("T")
+
+
+class DeadlineExceededError(asyncio.TimeoutError):
+    """Raised when a run does not finish before its deadline."""
+
+    def __init__(self, message: str, operation: Optional[str] = None):
+        super().__init__(message)
+        self.operation = operation
+
+
+class Deadline:
+    """
+    An absolute point in time by which a run must finish.
+
+    Example:
+        ```python
+        # Either pass a relative timeout...
+        await agent.run("Summarize the report", context={"timeout": 20})
+
+        # ...or share one deadline between several calls
+        deadline = Deadline(30)
+        await agent.run("First step", context={"deadline": deadline})
+        await agent.run("Second step", context={"deadline": deadline})
+        ```
+    """
+
+    def __init__(self, timeout: float):
+        """
+        Initialize the deadline.
+
+        Args:
+            timeout: Number of seconds from now until the deadline
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    @classmethod
+    def from_context(cls, context: Optional[Dict[str, Any]]) -> Optional["Deadline"]:
+        """
+        Get the deadline of a run from its context.
+
+        The context may hold a ``Deadline`` under ``deadline``, or a relative
+        timeout in seconds under ``deadline`` or ``timeout``.
+
+        Args:
+            context: Context information of the run
+
+        Returns:
+            The deadline, or None if the run has none
+        """
+        if not context:
+            return None
+
+        value = context.get("deadline")
+        if isinstance(value, Deadline):
+            return value
+        if value is None:
+            value = context.get("timeout")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return cls(value)
+
+        return None
+
+    def remaining(self) -> float:
+        """
+        Get the number of seconds left until the deadline.
+
+        Returns:
+            Seconds left, never negative
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def timeout_for(self, timeout: Optional[float] = None) -> float:
+        """
+        Bound a timeout by the time left until the deadline.
+
+        Args:
+            timeout: Optional timeout of the operation in seconds
+
+        Returns:
+            The smaller of the timeout and the remaining time
+        """
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    async def wait_for(
+        self,
+        awaitable: Awaitable[T],
+        operation: str = "operation",
+        timeout: Optional[float] = None,
+    ) -> T:
+        """
+        Await an operation, cancelling it if the deadline passes first.
+
+        Args:
+            awaitable: Operation to await
+            operation: Name of the operation, used in the error message
+            timeout: Optional timeout of the operation itself in seconds
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before the operation
+                finishes
+            asyncio.TimeoutError: If the operation's own timeout passes first
+        """
+        if self.expired:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise self.error(operation)
+
+        try:
+            return await asyncio.wait_for(awaitable, self.timeout_for(timeout))
+        except asyncio.TimeoutError as e:
+            if isinstance(e, DeadlineExceededError) or not self.expired:
+                raise
+            raise self.error(operation) from None
+
+    def error(self, operation: str = "operation") -> DeadlineExceededError:
+        """
+        Create the error for an operation that ran past the deadline.
+
+        Args:
+            operation: Name of the operation
+
+        Returns:
+            DeadlineExceededError to raise
+        """
+        return DeadlineExceededError(
+            f"Deadline of {self.timeout} seconds exceeded during {operation}",
+            operation=operation,
+        )
+
+    def __repr__(self) -> str:
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining():.3f})"
@@ -28,6 +28,27 @@ class PGVector(BaseTool):
     allowing users to build their own RAG solutions.
     """
 
+    operations = (
+        "create_collection",
+        "list_collections",
+        "delete_collection",
+        "add_document",
+        "add_documents",
+        "search",
+        "delete_document",
+        "get_document",
+        "count_documents",
+    )
+
+    # Read operations are cached; any other operation invalidates them
+    cacheable = True
+    cache_ttl = 60.0
+    read_operations = tuple(
+        operation
+        for operation in operations
+        if operation.startswith(("search", "list_", "get_", "count_"))
+    )
+
     def __init__(
         self,
         llm: BaseLLM,
@@ -62,17 +83,7 @@ class PGVector(BaseTool):
                 "properties": {
                     "operation": {
                         "type": "string",
-                        "enum": [
-                            "create_collection",
-                            "list_collections",
-                            "delete_collection",
-                            "add_document",
-                            "add_documents",
-                            "search",
-                            "delete_document",
-                            "get_document",
-                            "count_documents",
-                        ],
+                        "enum": list(self.operations),
                         "description": "Operation to perform",
                     },
                     "collection_name": {
@@ -237,6 +248,18 @@ class PGVector(BaseTool):
             logger.exception(f"Error initializing PGVector database: {e}")
             raise
 
+    def is_cacheable(self, parameters: Dict[str, Any]) -> bool:
+        """
+        Check whether the result of an operation may be cached.
+
+        Args:
+            parameters: Parameters for the tool
+
+        Returns:
+            True for read operations, False otherwise
+        """
+        return parameters.get("operation") in self.read_operations
+
     async def run(
         self, parameters: Dict[str, Any], context: Optional[Dict[str, Any]] = None
     ) -> Any:
@@ -517,26 +540,26 @@ class PGVector(BaseTool):
                     chunk_method=chunk_method,
                 )
 
+                # Embed the chunks in batched requests
+                embeddings = await self.llm.get_embeddings(chunks)
+
                 # Add each chunk
                 document_ids = []
-                for i, chunk in enumerate(chunks):
-                    # Add chunk metadata
-                    chunk_metadata = metadata.copy() if metadata else {}
-                    chunk_metadata.update(
-                        {
-                            "chunk_index": i,
-                            "chunk_count": len(chunks),
-                        }
-                    )
-
-                    # Generate embedding
-                    embedding = await self.llm.get_embedding(chunk)
+                with psycopg2.connect(**self.connection_params) as conn:
+                    with conn.cursor() as cur:
+                        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+                            # Add chunk metadata
+                            chunk_metadata = metadata.copy() if metadata else {}
+                            chunk_metadata.update(
+                                {
+                                    "chunk_index": i,
+                                    "chunk_count": len(chunks),
+                                }
+                            )
 
-                    # Add to database
-                    document_id = str(uuid.uuid4())
+                            # Add to database
+                            document_id = str(uuid.uuid4())
 
-                    with psycopg2.connect(**self.connection_params) as conn:
-                        with conn.cursor() as cur:
                             # Convert embedding to PostgreSQL vector format
                             embedding_str = f"[{','.join(map(str, embedding))}]"
 
@@ -559,9 +582,9 @@ class PGVector(BaseTool):
                                 ),
                             )
 
-                            conn.commit()
+                            document_ids.append(document_id)
 
-                    document_ids.append(document_id)
+                        conn.commit()
 
                 return {
                     "document_ids": document_ids,
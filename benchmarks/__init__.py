@@ -0,0 +1,18 @@
+"""
+Hot-path microbenchmarks for the Agents Hub framework.
+
+The benchmarks use a deterministic fake LLM, so they measure the overhead of
+the framework itself rather than provider latency. Run them with
+``python -m benchmarks.run``.
+"""
+
+from benchmarks.harness import REGISTRY, BenchmarkResult, benchmark, run_benchmark
+from benchmarks import (
+    bench_agent,
+    bench_cognitive,
+    bench_orchestration,
+    bench_utils,
+    bench_workflows,
+)
+
+__all__ = ["REGISTRY", "BenchmarkResult", "benchmark", "run_benchmark"]
@@ -0,0 +1,74 @@
+"""
+Benchmarks for the agent run loop.
+"""
+
+from benchmarks.fakes import EchoTool, FakeLLM, make_tool_calls
+from benchmarks.harness import benchmark
+from agents_hub.agents.base import Agent
+from agents_hub.memory.backends.in_memory import InMemoryMemory
+from agents_hub.moderation.rule_based import RuleBasedModerator
+
+
+@benchmark("agent.run", group="agent")
+def agent_run(latency: float = 0.0):
+    """A plain run without memory, tools or moderation."""
+    agent = Agent(name="bench", llm=FakeLLM(latency), system_prompt="You are helpful.")
+
+    async def operation():
+        return await agent.run("What is the capital of France?")
+
+    return operation
+
+
+@benchmark("agent.run_with_memory", group="agent")
+def agent_run_with_memory(latency: float = 0.0):
+    """A run that loads and writes history, with input and output moderation."""
+    memory = InMemoryMemory()
+    agent = Agent(
+        name="bench",
+        llm=FakeLLM(latency),
+        memory=memory,
+        moderation=RuleBasedModerator(custom_rules=["forbidden"]),
+        system_prompt="You are helpful.",
+    )
+    context = {"conversation_id": "bench"}
+
+    async def operation():
+        # Keep the history at a steady size so every run does the same work
+        memory.memory["bench"] = memory.memory.get("bench", [])[-10:]
+        return await agent.run("What is the capital of France?", context)
+
+    return operation
+
+
+@benchmark("agent.run_with_tools", group="agent")
+def agent_run_with_tools(latency: float = 0.0):
+    """A run with one round of four parallel tool calls."""
+    tools = [EchoTool(f"tool_{index}") for index in range(4)]
+    agent = Agent(
+        name="bench",
+        llm=FakeLLM(latency, tool_calls=make_tool_calls([t.name for t in tools])),
+        tools=tools,
+        parallel_tool_calls=True,
+    )
+
+    async def operation():
+        return await agent.run("Use every tool.")
+
+    return operation
+
+
+@benchmark("agent.process_tool_calls", group="agent")
+def agent_process_tool_calls(latency: float = 0.0):
+    """One tool round of four calls followed by the final LLM call."""
+    tools = [EchoTool(f"tool_{index}") for index in range(4)]
+    agent = Agent(name="bench", llm=FakeLLM(latency), tools=tools)
+    tool_calls = make_tool_calls([tool.name for tool in tools])
+
+    async def operation():
+        messages = [{"role": "user", "content": "Use every tool."}]
+        return await agent._process_tool_calls(
+            [dict(tool_call) for tool_call in tool_calls], messages, {}
+        )
+
+    return operation
@@ -0,0 +1,22 @@
+"""
+Benchmarks for the cognitive architecture.
+"""
+
+from benchmarks.harness import benchmark
+from agents_hub.cognitive.architecture import CognitiveArchitecture
+
+QUESTION = (
+    "If all mammals are warm-blooded and whales are mammals, are whales "
+    "warm-blooded? Explain the reasoning step by step."
+)
+
+
+@benchmark("cognitive.process", group="cognitive")
+def cognitive_process():
+    """Run a question through every layer of the architecture."""
+    architecture = CognitiveArchitecture()
+
+    async def operation():
+        return await architecture.process(QUESTION, {})
+
+    return operation
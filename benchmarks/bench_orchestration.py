@@ -0,0 +1,75 @@
+"""
+Benchmarks for agent orchestration.
+"""
+
+from benchmarks.fakes import FakeLLM
+from benchmarks.harness import benchmark
+from agents_hub.agents.base import Agent
+from agents_hub.orchestration.agent_selector import AgentSelector
+from agents_hub.orchestration.router import AgentWorkforce
+
+AGENT_SPECS = [
+    ("researcher", "Researches topics and gathers facts from the web"),
+    ("writer", "Writes articles, summaries and documentation"),
+    ("coder", "Writes and reviews Python and TypeScript code"),
+    ("analyst", "Analyzes data, builds reports and computes statistics"),
+    ("planner", "Breaks projects down into tasks and schedules"),
+]
+
+TASK = "Write a short report that analyzes last quarter's sales statistics"
+
+
+def make_agents(latency: float = 0.0):
+    """Create the agents of the benchmark team."""
+    return [
+        Agent(
+            name=name,
+            llm=FakeLLM(latency),
+            description=description,
+            system_prompt=f"You are the {name}. {description}.",
+        )
+        for name, description in AGENT_SPECS
+    ]
+
+
+@benchmark("orchestration.select_best_agent", group="orchestration")
+def select_best_agent():
+    """Score every agent of a five-agent team for a task."""
+    selector = AgentSelector({agent.config.name: agent for agent in make_agents()})
+
+    def operation():
+        return selector.select_best_agent(TASK)
+
+    return operation
+
+
+@benchmark("orchestration.workforce_execute", group="orchestration")
+def workforce_execute(latency: float = 0.0):
+    """Route a task to the best agent and run it."""
+    workforce = AgentWorkforce(agents=make_agents(latency))
+
+    async def operation():
+        return await workforce.execute(TASK)
+
+    return operation
+
+
+@benchmark("orchestration.workforce_execute_orchestrated", group="orchestration")
+def workforce_execute_orchestrated(latency: float = 0.0):
+    """Plan a task with an orchestrator and run three subtasks."""
+    plan = (
+        '{"subtasks": ['
+        '{"description": "Gather the sales figures", "agent": "researcher", "order": 1},'
+        '{"description": "Compute the statistics", "agent": "analyst", "order": 2},'
+        '{"description": "Write the report", "agent": "writer", "order": 3}'
+        "]}"
+    )
+    orchestrator = Agent(name="orchestrator", llm=FakeLLM(latency, content=plan))
+    workforce = AgentWorkforce(
+        agents=make_agents(latency), orchestrator_agent=orchestrator
+    )
+
+    async def operation():
+        return await workforce.execute(TASK)
+
+    return operation
@@ -0,0 +1,66 @@
+"""
+Benchmarks for text utilities.
+"""
+
+from benchmarks.harness import benchmark
+from agents_hub.utils.document.chunking import chunk_text
+from agents_hub.utils.json_parser import RobustJSONParser
+
+PARAGRAPH = (
+    "Agents coordinate through a shared workforce. Each agent has its own "
+    "tools, memory and system prompt. The orchestrator splits a task into "
+    "subtasks and assigns each one to the most suitable agent. "
+)
+DOCUMENT = "\n\n".join(PARAGRAPH * 4 for _ in range(50))
+
+MIXED_JSON = (
+    "Sure! Here is the plan you asked for:\n\n```json\n"
+    '{"subtasks": [{"description": "Research", "agent": "researcher", "order": 1},'
+    ' {"description": "Write", "agent": "writer", "order": 2}]}\n'
+    "```\n\nLet me know if you need anything else."
+)
+
+
+@benchmark("utils.chunk_text_token", group="utils")
+def chunk_text_token():
+    """Chunk a 40 KB document by whitespace tokens."""
+
+    def operation():
+        return chunk_text(DOCUMENT, chunk_size=200, chunk_overlap=20)
+
+    return operation
+
+
+@benchmark("utils.chunk_text_recursive", group="utils")
+def chunk_text_recursive():
+    """Chunk a 40 KB document with the recursive character splitter."""
+
+    def operation():
+        return chunk_text(
+            DOCUMENT, chunk_size=1000, chunk_overlap=100, chunk_method="recursive"
+        )
+
+    return operation
+
+
+@benchmark("utils.json_parse_clean", group="utils")
+def json_parse_clean():
+    """Parse a response that is valid JSON."""
+    parser = RobustJSONParser()
+    content = MIXED_JSON.split("```json\n")[1].split("\n```")[0]
+
+    def operation():
+        return parser.parse(content)
+
+    return operation
+
+
+@benchmark("utils.json_parse_mixed", group="utils")
+def json_parse_mixed():
+    """Parse JSON embedded in explanatory text and a code block."""
+    parser = RobustJSONParser()
+
+    def operation():
+        return parser.parse(MIXED_JSON)
+
+    return operation
@@ -0,0 +1,169 @@
+"""
+Benchmarks for end-to-end workflows, live or replayed from recordings.
+
+By default the workflows run against the fake LLM. With ``--recordings DIR``
+they replay the LLM calls recorded in DIR, one recording per workflow, so
+real responses and latencies are reproduced without a network. Record them
+once with ``--record``, against the provider configured in the environment.
+"""
+
+from typing import Optional
+import os
+import tempfile
+import numpy as np
+from benchmarks.bench_orchestration import AGENT_SPECS
+from benchmarks.fakes import FakeLLM
+from benchmarks.harness import benchmark
+from agents_hub.agents.base import Agent
+from agents_hub.coding.workforce import CodingWorkforce
+from agents_hub.llm.base import BaseLLM
+from agents_hub.llm.replay import recorded_llm
+from agents_hub.orchestration.router import AgentWorkforce
+from agents_hub.utils.document.chunking import chunk_text
+
+WORKFORCE_TASK = (
+    "Research the latest advancements in battery technology and write a "
+    "3-paragraph summary for a technical audience."
+)
+
+PROJECT_DESCRIPTION = (
+    "A task management API with CRUD operations for tasks with an id, a title, "
+    "a status and a due date, and a React frontend to list and edit them."
+)
+
+DOCUMENT = "\n\n".join(
+    f"Section {index}. Agents coordinate through a shared workforce. Each agent "
+    "has its own tools, memory and system prompt. The orchestrator splits a "
+    "task into subtasks and assigns each one to the most suitable agent."
+    for index in range(40)
+)
+
+QUESTION = "How does the orchestrator assign subtasks?"
+
+
+def live_llm() -> BaseLLM:
+    """Create the provider the workflows are recorded against."""
+    from agents_hub.llm.providers import OllamaProvider, OpenAIProvider
+
+    if os.environ.get("OPENAI_API_KEY"):
+        return OpenAIProvider(
+            api_key=os.environ["OPENAI_API_KEY"],
+            model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+        )
+    return OllamaProvider(
+        model=os.environ.get("OLLAMA_MODEL", "llama3"),
+        base_url=os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434"),
+    )
+
+
+def workflow_llm(
+    name: str, latency: float, recordings: Optional[str], record: bool
+) -> BaseLLM:
+    """
+    Create the LLM of a workflow.
+
+    Args:
+        name: Name of the workflow, and of its recording
+        latency: Latency of the fake LLM
+        recordings: Directory of the recordings (None to use the fake LLM)
+        record: Whether to record the live provider instead of replaying
+
+    Returns:
+        The fake LLM, a recording LLM or a replay LLM
+    """
+    if not recordings:
+        return FakeLLM(latency, content='{"subtasks": []}')
+    return recorded_llm(
+        name, live_llm, mode="record" if record else "replay", directory=recordings
+    )
+
+
+@benchmark("workflow.agent_workforce", group="workflow")
+def agent_workforce(
+    latency: float = 0.0, recordings: Optional[str] = None, record: bool = False
+):
+    """Plan a task with an orchestrator and run its subtasks."""
+    llm = workflow_llm("agent_workforce", latency, recordings, record)
+    agents = [
+        Agent(
+            name=name,
+            llm=llm,
+            description=description,
+            system_prompt=f"You are the {name}. {description}.",
+        )
+        for name, description in AGENT_SPECS
+    ]
+    orchestrator = Agent(
+        name="orchestrator",
+        llm=llm,
+        system_prompt="You are a task orchestrator. Break tasks down into subtasks.",
+    )
+    workforce = AgentWorkforce(agents=agents, orchestrator_agent=orchestrator)
+
+    async def operation():
+        return await workforce.execute(WORKFORCE_TASK)
+
+    return operation
+
+
+@benchmark("workflow.coding_workforce", group="workflow")
+def coding_workforce(
+    latency: float = 0.0, recordings: Optional[str] = None, record: bool = False
+):
+    """Run the design and code generation steps of a coding project."""
+    llm = workflow_llm("coding_workforce", latency, recordings, record)
+    roles = [
+        "project_manager",
+        "analyst",
+        "backend_developer",
+        "frontend_developer",
+        "devops_engineer",
+        "security_engineer",
+        "qa_tester",
+    ]
+    workforce = CodingWorkforce(
+        llm_mapping={role: llm for role in roles},
+        project_name="TaskManager",
+        project_description=PROJECT_DESCRIPTION,
+        output_dir=tempfile.mkdtemp(prefix="bench_coding_"),
+    )
+
+    async def operation():
+        # The steps of develop_project, without git and deployment
+        specifications = (
+            await workforce.analyst.analyze_requirements(PROJECT_DESCRIPTION)
+        )["specifications"]
+        await workforce.project_manager.create_project_plan(specifications)
+        api = await workforce.backend_developer.design_api_structure(specifications)
+        await workforce._generate_backend_code(api["api_structure"])
+        components = await workforce.frontend_developer.design_component_structure(
+            specifications
+        )
+        await workforce._generate_frontend_code(components["component_structure"])
+        test_plan = await workforce.qa_tester.create_test_plan(specifications)
+        await workforce._generate_tests(test_plan["test_plan"])
+        await workforce._generate_documentation(specifications)
+
+    return operation
+
+
+@benchmark("workflow.rag", group="workflow")
+def rag(latency: float = 0.0, recordings: Optional[str] = None, record: bool = False):
+    """Embed a document, retrieve the chunks closest to a question and answer it."""
+    llm = workflow_llm("rag", latency, recordings, record)
+    agent = Agent(
+        name="rag",
+        llm=llm,
+        system_prompt="Answer the question using only the given context.",
+    )
+    chunks = chunk_text(DOCUMENT, chunk_size=300, chunk_overlap=50)
+
+    async def operation():
+        vectors = np.array(await llm.get_embeddings(chunks))
+        query = np.array(await llm.get_embedding(QUESTION))
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        scores = vectors @ query / np.maximum(norms, 1e-12)
+        context = "\n\n".join(chunks[index] for index in np.argsort(-scores)[:3])
+        return await agent.run(f"Context:\n{context}\n\nQuestion: {QUESTION}")
+
+    return operation
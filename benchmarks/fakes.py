@@ -0,0 +1,165 @@
+"""
+Deterministic fakes used by the benchmarks.
+"""
+
+from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import json
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.tools.base import BaseTool
+
+
+class FakeLLM(BaseLLM):
+    """
+    Deterministic LLM with a configurable latency.
+
+    The response depends only on the input, so every run does the same work.
+    When ``tool_calls`` is set, calls that offer tools get those tool calls as
+    their response unless the last message is a tool result, so a run takes
+    exactly one tool round.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        content: str = "This is a deterministic response from the fake LLM.",
+        tool_calls: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the fake LLM.
+
+        Args:
+            latency: Seconds to wait before answering (0 to only yield control)
+            content: Text of every response
+            tool_calls: Optional tool calls returned for the first round
+        """
+        self.latency = latency
+        self.content = content
+        self.tool_calls = tool_calls
+        self.calls = 0
+
+    async def generate(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate the scripted response.
+
+        Args:
+            messages: List of messages in the conversation
+            tools: Optional list of tools available to the LLM
+            temperature: Ignored
+            max_tokens: Ignored
+            **kwargs: Ignored
+
+        Returns:
+            LLMResponse object
+        """
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+        if tools and self.tool_calls and messages[-1].get("role") != "tool":
+            return LLMResponse(content="", tool_calls=self.tool_calls)
+
+        return LLMResponse(
+            content=self.content,
+            raw_response={"usage": {"prompt_tokens": 100, "completion_tokens": 12}},
+        )
+
+    async def get_embedding(self, text: str) -> List[float]:
+        """
+        Get a deterministic embedding derived from the text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            A 32-dimensional vector
+        """
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [byte / 255 - 0.5 for byte in digest]
+
+    def get_token_count(self, text: str) -> int:
+        """
+        Count tokens with the 4 characters per token approximation.
+
+        Args:
+            text: Text to count tokens for
+
+        Returns:
+            Number of tokens
+        """
+        return len(text) // 4
+
+    @property
+    def model(self) -> str:
+        """Get the model name."""
+        return "fake"
+
+
+class EchoTool(BaseTool):
+    """Tool that echoes its arguments, after an optional latency."""
+
+    def __init__(self, name: str = "echo", latency: float = 0.0):
+        """
+        Initialize the echo tool.
+
+        Args:
+            name: Name of the tool
+            latency: Seconds to wait before answering
+        """
+        super().__init__(
+            name=name,
+            description="Echo the arguments",
+            parameters={
+                "type": "object",
+                "properties": {"value": {"type": "string"}},
+            },
+        )
+        self.latency = latency
+
+    async def run(
+        self, parameters: Dict[str, Any], context: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Echo the arguments.
+
+        Args:
+            parameters: Parameters for the tool
+            context: Optional context information
+
+        Returns:
+            The arguments
+        """
+        await asyncio.sleep(self.latency)
+        return {"echo": parameters}
+
+
+def make_tool_calls(tool_names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Build OpenAI-style tool calls, one per tool name.
+
+    Args:
+        tool_names: Names of the tools to call
+
+    Returns:
+        List of tool calls
+    """
+    return [
+        {
+            "id": f"call_{index}",
+            "type": "function",
+            "function": {
+                "name": name,
+                "arguments": json.dumps({"value": f"argument {index}"}),
+            },
+        }
+        for index, name in enumerate(tool_names)
+    ]
@@ -0,0 +1,199 @@
+"""
+Benchmark harness for the Agents Hub framework.
+
+Benchmarks are registered with the ``benchmark`` decorator. A registered
+function is a factory: it does the setup and returns the operation to measure,
+either a plain callable or a coroutine function taking no arguments.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+import asyncio
+import gc
+import inspect
+import time
+import tracemalloc
+from pydantic import BaseModel, Field
+from agents_hub.agents.batch import percentile
+
+Operation = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+class BenchmarkResult(BaseModel):
+    """Result of a single benchmark."""
+
+    name: str = Field(..., description="Name of the benchmark")
+    group: str = Field(..., description="Group of the benchmark")
+    iterations: int = Field(..., description="Number of measured iterations")
+    ops_per_sec: float = Field(..., description="Operations per second")
+    p50_us: float = Field(..., description="Median latency in microseconds")
+    p99_us: float = Field(..., description="99th percentile latency in microseconds")
+    alloc_bytes: int = Field(
+        ..., description="Mean peak memory allocated per operation in bytes"
+    )
+    alloc_blocks: int = Field(
+        ..., description="Mean number of memory blocks left allocated per operation"
+    )
+
+
+class Benchmark(BaseModel):
+    """A registered benchmark."""
+
+    name: str = Field(..., description="Name of the benchmark")
+    group: str = Field(..., description="Group of the benchmark")
+    factory: Callable[..., Operation] = Field(
+        ..., description="Function that sets up and returns the operation"
+    )
+
+
+REGISTRY: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str) -> Callable:
+    """
+    Register a benchmark factory.
+
+    The factory is called with the keyword arguments given to ``run_benchmark``
+    that it accepts (for example ``latency``).
+
+    Args:
+        name: Unique name of the benchmark
+        group: Group of the benchmark, e.g. the module under test
+
+    Returns:
+        Decorator that registers the factory
+    """
+
+    def decorator(factory: Callable[..., Operation]) -> Callable[..., Operation]:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        REGISTRY[name] = Benchmark(name=name, group=group, factory=factory)
+        return factory
+
+    return decorator
+
+
+async def _call(operation: Operation) -> Any:
+    """Call an operation, awaiting it if it is asynchronous."""
+    result = operation()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _measure(
+    bench: Benchmark,
+    iterations: int,
+    warmup: int,
+    alloc_iterations: int,
+    options: Dict[str, Any],
+) -> BenchmarkResult:
+    """Measure a benchmark inside a running event loop."""
+    parameters = inspect.signature(bench.factory).parameters
+    operation = bench.factory(
+        **{key: value for key, value in options.items() if key in parameters}
+    )
+
+    for _ in range(warmup):
+        await _call(operation)
+
+    # Time the operations with the garbage collector off to reduce jitter
+    timings: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            op_started_at = time.perf_counter()
+            await _call(operation)
+            timings.append(time.perf_counter() - op_started_at)
+        elapsed = time.perf_counter() - started_at
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    # Measure allocations separately, since tracing slows everything down
+    peak_total = 0
+    blocks_total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await _call(operation)
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            peak_total += max(0, peak - baseline)
+            blocks_total += sum(
+                stat.count_diff for stat in after.compare_to(before, "filename")
+            )
+    finally:
+        tracemalloc.stop()
+
+    runs = max(1, alloc_iterations)
+    return BenchmarkResult(
+        name=bench.name,
+        group=bench.group,
+        iterations=iterations,
+        ops_per_sec=iterations / elapsed if elapsed > 0 else 0.0,
+        p50_us=percentile(timings, 0.50) * 1e6,
+        p99_us=percentile(timings, 0.99) * 1e6,
+        alloc_bytes=peak_total // runs,
+        alloc_blocks=blocks_total // runs,
+    )
+
+
+def run_benchmark(
+    name: str,
+    iterations: int = 1000,
+    warmup: int = 50,
+    alloc_iterations: int = 20,
+    **options: Any,
+) -> BenchmarkResult:
+    """
+    Run a registered benchmark.
+
+    Args:
+        name: Name of the benchmark
+        iterations: Number of measured iterations
+        warmup: Number of unmeasured iterations run first
+        alloc_iterations: Number of iterations traced for allocations
+        **options: Options passed to the benchmark factory, e.g. ``latency``
+
+    Returns:
+        BenchmarkResult with throughput, latency and allocation figures
+    """
+    bench = REGISTRY[name]
+    return asyncio.run(_measure(bench, iterations, warmup, alloc_iterations, options))
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    max_regression: float,
+) -> List[str]:
+    """
+    Compare results with a baseline and list the regressions.
+
+    Args:
+        results: Results of the current run
+        baseline: Baseline results by benchmark name, as saved by the runner
+        max_regression: Largest tolerated relative drop in ops/sec
+
+    Returns:
+        Descriptions of the benchmarks that regressed
+    """
+    regressions = []
+    for result in results:
+        previous: Optional[Dict[str, Any]] = baseline.get(result.name)
+        if not previous or not previous.get("ops_per_sec"):
+            continue
+
+        change = result.ops_per_sec / previous["ops_per_sec"] - 1
+        if change < -max_regression:
+            regressions.append(
+                f"{result.name}: {result.ops_per_sec:,.0f} ops/s vs "
+                f"{previous['ops_per_sec']:,.0f} ops/s baseline ({change:+.1%})"
+            )
+
+    return regressions
@@ -0,0 +1,134 @@
+"""
+Command-line runner for the Agents Hub benchmarks.
+
+Examples:
+    python -m benchmarks.run
+    python -m benchmarks.run --filter agent. --iterations 2000
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --baseline baseline.json --max-regression 0.2
+    python -m benchmarks.run --filter workflow. --recordings recordings/ --record
+    python -m benchmarks.run --filter workflow. --recordings recordings/
+"""
+
+from typing import List, Optional
+import argparse
+import json
+import logging
+import sys
+from benchmarks import REGISTRY, BenchmarkResult, run_benchmark
+from benchmarks.harness import compare
+
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    """
+    Format benchmark results as a text table.
+
+    Args:
+        results: Benchmark results
+
+    Returns:
+        The table
+    """
+    header = (
+        f"{'benchmark':<45} {'ops/sec':>12} {'p50 (us)':>10} "
+        f"{'p99 (us)':>10} {'alloc (B)':>11} {'blocks':>7}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.name:<45} {result.ops_per_sec:>12,.0f} "
+            f"{result.p50_us:>10,.1f} {result.p99_us:>10,.1f} "
+            f"{result.alloc_bytes:>11,} {result.alloc_blocks:>7,}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmarks.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv``)
+
+    Returns:
+        Exit code: 1 if a benchmark regressed against the baseline, else 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--alloc-iterations", type=int, default=20)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Latency of the fake LLM in seconds (0 measures pure overhead)",
+    )
+    parser.add_argument(
+        "--recordings",
+        help="Replay the LLM calls of the workflow benchmarks from this directory",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Run the workflow benchmarks once against the provider configured "
+        "in the environment and record them into --recordings",
+    )
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare with results saved earlier")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Largest tolerated relative drop in ops/sec against the baseline",
+    )
+    args = parser.parse_args(argv)
+    if args.record:
+        if not args.recordings:
+            parser.error("--record requires --recordings")
+        args.iterations, args.warmup, args.alloc_iterations = 1, 0, 0
+
+    # Keep framework logging from dominating the measurements
+    logging.disable(logging.INFO)
+
+    results = []
+    for name in sorted(REGISTRY):
+        if args.filter not in name:
+            continue
+        results.append(
+            run_benchmark(
+                name,
+                iterations=args.iterations,
+                warmup=args.warmup,
+                alloc_iterations=args.alloc_iterations,
+                latency=args.latency,
+                recordings=args.recordings,
+                record=args.record,
+            )
+        )
+
+    print(format_table(results))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(
+                {result.name: result.model_dump() for result in results}, f, indent=2
+            )
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ from dotenv import load_dotenv
 
 from agents_hub import Agent, AgentWorkforce
 from agents_hub.llm.providers import OpenAIProvider, OllamaProvider
+from agents_hub.llm.replay import recorded_llm
 from agents_hub.tools.standard import CalculatorTool
 
 
@@ -16,20 +17,23 @@ async def main():
     # Load environment variables from .env file
     load_dotenv()
     
-    # Create LLM providers
-    if os.environ.get("OPENAI_API_KEY"):
-        print("Using OpenAI provider")
-        llm = OpenAIProvider(
-            api_key=os.environ["OPENAI_API_KEY"],
-            model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
-        )
-    else:
+    # Create the LLM provider; set AGENTS_HUB_LLM_MODE=record to record its
+    # calls, then AGENTS_HUB_LLM_MODE=replay to replay them without a network
+    def create_llm():
+        if os.environ.get("OPENAI_API_KEY"):
+            print("Using OpenAI provider")
+            return OpenAIProvider(
+                api_key=os.environ["OPENAI_API_KEY"],
+                model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+            )
         print("Using Ollama provider (local)")
-        llm = OllamaProvider(
+        return OllamaProvider(
             model=os.environ.get("OLLAMA_MODEL", "llama3"),
             base_url=os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434"),
         )
     
+    llm = recorded_llm("simple_workforce", create_llm)
+    
     # Create a calculator tool
     calculator_tool = CalculatorTool()
     
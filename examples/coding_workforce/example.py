@@ -12,6 +12,7 @@ from dotenv import load_dotenv
 
 from agents_hub.coding import CodingWorkforce
 from agents_hub.llm.providers import OpenAIProvider, ClaudeProvider
+from agents_hub.llm.replay import recorded_llm
 
 # Configure logging
 logging.basicConfig(
@@ -30,18 +31,26 @@ async def main():
     # Load environment variables
     load_dotenv()
 
-    # Check for required API keys
-    if not os.environ.get("OPENAI_API_KEY"):
+    # Check for required API keys, unless replaying recorded calls
+    # (AGENTS_HUB_LLM_MODE=record records them, =replay replays them offline)
+    replaying = os.environ.get("AGENTS_HUB_LLM_MODE") == "replay"
+    if not replaying and not os.environ.get("OPENAI_API_KEY"):
         logger.error("OPENAI_API_KEY environment variable is required")
         return
 
-    if not os.environ.get("ANTHROPIC_API_KEY"):
+    if not replaying and not os.environ.get("ANTHROPIC_API_KEY"):
         logger.error("ANTHROPIC_API_KEY environment variable is required")
         return
 
     # Initialize LLM providers
-    openai_llm = OpenAIProvider(api_key=os.environ["OPENAI_API_KEY"])
-    claude_llm = ClaudeProvider(api_key=os.environ["ANTHROPIC_API_KEY"])
+    openai_llm = recorded_llm(
+        "coding_openai",
+        lambda: OpenAIProvider(api_key=os.environ["OPENAI_API_KEY"]),
+    )
+    claude_llm = recorded_llm(
+        "coding_claude",
+        lambda: ClaudeProvider(api_key=os.environ["ANTHROPIC_API_KEY"]),
+    )
 
     # Create LLM mapping for different agent roles
     llm_mapping = {
@@ -72,6 +72,7 @@ async def main():
         system_prompt="You are a helpful assistant that can perform calculations. Use the calculator tool when needed.",
         description="Assistant with monitoring capabilities",
         monitor=monitor,
+        background_monitoring=True,  # Deliver events without blocking runs
     )
 
     # Example 1: Basic conversation with user ID
@@ -86,6 +87,9 @@ async def main():
     )
     print(f"Response: {response}")
 
+    # Deliver the queued events, so the conversation's trace exists
+    await agent.flush_monitoring()
+
     # Add a score for the conversation
     await monitor.score_conversation(
         conversation_id=conversation_id,
@@ -154,6 +158,9 @@ async def main():
     )
     print(f"Response 3: {response3}")
 
+    # Deliver the queued events, so the conversation's trace exists
+    await agent.flush_monitoring()
+
     # Add a score for the entire conversation
     await monitor.score_conversation(
         conversation_id=conversation_id,
@@ -186,6 +193,9 @@ async def main():
             metadata={"query": query},
         )
 
+    # Deliver the remaining events before the event loop exits
+    await agent.flush_monitoring()
+
     # Example 5: View token usage and cost summary
     print("\n=== Example 5: Token Usage and Cost Summary ===")
     print("Token usage and cost information is automatically tracked")
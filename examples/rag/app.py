@@ -22,6 +22,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from dotenv import load_dotenv
 from agents_hub.llm.providers import OpenAIProvider
+from agents_hub.llm.replay import recorded_llm
 from agents_hub import Agent
 from agents_hub.vector_stores import PGVector
 from agents_hub.tools.standard import ScraperTool
@@ -57,10 +58,14 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Initialize templates
 templates = Jinja2Templates(directory="static")
 
-# Initialize LLM provider
-llm = OpenAIProvider(
-    api_key=os.environ["OPENAI_API_KEY"],
-    model=os.environ.get("OPENAI_MODEL", "gpt-3.5-turbo"),
+# Initialize LLM provider; AGENTS_HUB_LLM_MODE=record records its calls and
+# AGENTS_HUB_LLM_MODE=replay serves them without OpenAI, e.g. for load tests
+llm = recorded_llm(
+    "rag",
+    lambda: OpenAIProvider(
+        api_key=os.environ["OPENAI_API_KEY"],
+        model=os.environ.get("OPENAI_MODEL", "gpt-3.5-turbo"),
+    ),
 )
 
 # Initialize tools
@@ -0,0 +1,123 @@
+"""
+Tests for batch execution with Agent.run_many.
+"""
+
+import asyncio
+import pytest
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+
+
+class CountingLLM(BaseLLM):
+    """LLM that tracks concurrency and fails on a marker word."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, messages, tools=None, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        prompt = messages[-1]["content"]
+        if "fail" in prompt:
+            raise RuntimeError("provider error")
+        return LLMResponse(content=prompt.upper())
+
+
+class TestAgentRunMany:
+    """Test cases for Agent.run_many."""
+
+    @pytest.mark.asyncio
+    async def test_results_and_summary(self):
+        """All inputs are answered and summarized."""
+        llm = CountingLLM()
+        agent = Agent(name="tester", llm=llm)
+
+        batch = agent.run_many([f"p{i}" for i in range(20)], concurrency=4)
+        results = await batch.collect()
+
+        assert [r.output for r in results] == [f"P{i}" for i in range(20)]
+        assert llm.max_active == 4
+        summary = batch.summary
+        assert summary.total == 20
+        assert summary.succeeded == 20
+        assert summary.throughput > 0
+        assert summary.latency_p50 <= summary.latency_p99 <= summary.latency_max
+
+    @pytest.mark.asyncio
+    async def test_inputs_are_pulled_lazily(self):
+        """Inputs are consumed only as workers become free."""
+        pulled = []
+
+        def generate_inputs():
+            for i in range(100):
+                pulled.append(i)
+                yield f"p{i}"
+
+        agent = Agent(name="tester", llm=CountingLLM())
+        batch = agent.run_many(generate_inputs(), concurrency=2)
+
+        async for _ in batch:
+            break
+
+        assert len(pulled) < 10
+
+    @pytest.mark.asyncio
+    async def test_return_exceptions(self):
+        """Failed runs are yielded as results when requested."""
+        agent = Agent(name="tester", llm=CountingLLM())
+
+        batch = agent.run_many(["ok", "fail", "ok"], return_exceptions=True)
+        results = await batch.collect()
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, RuntimeError)
+        assert batch.summary.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_aborts_batch_by_default(self):
+        """Without return_exceptions the first failure is raised."""
+        agent = Agent(name="tester", llm=CountingLLM())
+
+        with pytest.raises(RuntimeError):
+            await agent.run_many(["fail", "ok"]).collect()
+
+    @pytest.mark.asyncio
+    async def test_input_errors_are_raised(self):
+        """An error of the input iterator ends the batch after the started runs."""
+
+        def generate_inputs():
+            yield "a"
+            yield "b"
+            raise ValueError("bad input")
+
+        agent = Agent(name="tester", llm=CountingLLM())
+        batch = agent.run_many(generate_inputs(), concurrency=2)
+        outputs = []
+
+        with pytest.raises(ValueError, match="bad input"):
+            async for result in batch:
+                outputs.append(result.output)
+
+        assert sorted(outputs) == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_each_run_gets_its_own_conversation(self):
+        """Batch items must not share memory history."""
+        seen = []
+        agent = Agent(name="tester", llm=CountingLLM())
+        original_run = agent.run
+
+        async def recording_run(input_text, context=None):
+            seen.append(context["conversation_id"])
+            return await original_run(input_text, context)
+
+        agent.run = recording_run
+        await agent.run_many(["a", "b", "c"]).collect()
+
+        assert len(set(seen)) == 3
@@ -0,0 +1,145 @@
+"""
+Tests for the pre-LLM pipeline of Agent.run.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.memory.base import BaseMemory
+from agents_hub.moderation.base import BaseContentModerator, ModerationResult
+from agents_hub.monitoring.base import BaseMonitor, MonitoringEvent, MonitoringLevel
+
+
+class SlowMemory(BaseMemory):
+    """Memory whose history lookup takes a fixed time."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.saved = []
+
+    async def get_history(self, conversation_id, limit=10, before=None):
+        await asyncio.sleep(self.delay)
+        return [{"user_message": "earlier", "assistant_message": "reply"}]
+
+    async def add_interaction(
+        self, conversation_id, user_message, assistant_message, metadata=None
+    ):
+        self.saved.append((user_message, assistant_message))
+
+
+class SlowModerator(BaseContentModerator):
+    """Moderator that takes a fixed time and flags a given word."""
+
+    def __init__(self, delay: float, blocked_word: str = "forbidden"):
+        self.delay = delay
+        self.blocked_word = blocked_word
+
+    async def moderate(self, text):
+        await asyncio.sleep(self.delay)
+        return ModerationResult(flagged=self.blocked_word in text)
+
+
+class SlowMonitor(BaseMonitor):
+    """Monitor whose backend takes a fixed time per event."""
+
+    def __init__(self, delay: float):
+        super().__init__(level=MonitoringLevel.COMPREHENSIVE)
+        self.delay = delay
+        self.events = []
+
+    async def _track_event(self, event_data):
+        await asyncio.sleep(self.delay)
+        self.events.append(event_data.event_type)
+
+
+class TestAgentRunPipeline:
+    """Test cases for the staged pre-LLM pipeline."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.llm = BaseLLM()
+        self.llm.generate = AsyncMock(return_value=LLMResponse(content="answer"))
+
+    @pytest.mark.asyncio
+    async def test_moderation_and_history_run_concurrently(self):
+        """The history lookup should overlap with input moderation."""
+        agent = Agent(
+            name="tester",
+            llm=self.llm,
+            memory=SlowMemory(0.1),
+            moderation=SlowModerator(0.1),
+        )
+
+        start = time.perf_counter()
+        result = await agent.run("hello")
+        elapsed = time.perf_counter() - start
+
+        # Input moderation overlaps the history lookup; output moderation follows
+        assert result == "answer"
+        assert elapsed < 0.28
+        messages = self.llm.generate.call_args.kwargs["messages"]
+        assert messages[0]["content"] == "earlier"
+
+    @pytest.mark.asyncio
+    async def test_monitoring_is_off_the_critical_path(self):
+        """A slow monitor should not delay the response in the background."""
+        monitor = SlowMonitor(0.05)
+        agent = Agent(
+            name="tester", llm=self.llm, monitor=monitor, background_monitoring=True
+        )
+
+        start = time.perf_counter()
+        await agent.run("hello")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.05
+        await agent.flush_monitoring()
+        assert monitor.events == [
+            MonitoringEvent.CONVERSATION_START,
+            MonitoringEvent.USER_MESSAGE,
+            MonitoringEvent.LLM_CALL,
+            MonitoringEvent.LLM_RESULT,
+            MonitoringEvent.ASSISTANT_MESSAGE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_monitoring_overlaps_the_pipeline_by_default(self):
+        """Tracking the user message should overlap the history lookup."""
+        monitor = SlowMonitor(0.05)
+        agent = Agent(
+            name="tester", llm=self.llm, memory=SlowMemory(0.1), monitor=monitor
+        )
+        called_at = []
+        self.llm.generate.side_effect = lambda **kwargs: (
+            called_at.append(time.perf_counter()) or LLMResponse(content="answer")
+        )
+
+        start = time.perf_counter()
+        await agent.run("hello")
+
+        # History (0.1s) overlaps start and user message (2 x 0.05s), then the
+        # LLM call is tracked (0.05s); in sequence this would take 0.25s
+        assert called_at[0] - start < 0.2
+        assert monitor.events[:3] == [
+            MonitoringEvent.CONVERSATION_START,
+            MonitoringEvent.USER_MESSAGE,
+            MonitoringEvent.LLM_CALL,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_blocked_input_skips_llm(self):
+        """Blocked input should be answered without calling the LLM."""
+        agent = Agent(
+            name="tester",
+            llm=self.llm,
+            memory=SlowMemory(0.0),
+            moderation=SlowModerator(0.0),
+        )
+
+        result = await agent.run("something forbidden")
+
+        assert result == agent.moderation_middleware.input_violation_message
+        self.llm.generate.assert_not_called()
@@ -0,0 +1,236 @@
+"""
+Tests for tool call execution in the base Agent.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock
+from agents_hub.agents.base import Agent
+from agents_hub.agents.cognitive import CognitiveAgent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.tools.base import BaseTool
+
+
+class SleepTool(BaseTool):
+    """Tool that sleeps before echoing its input."""
+
+    def __init__(self, name: str, delay: float):
+        super().__init__(
+            name=name,
+            description="Sleep and echo",
+            parameters={"type": "object", "properties": {}},
+        )
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def run(self, parameters, context=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {"tool": self.name, "echo": parameters.get("value")}
+
+
+def make_tool_call(index: int, name: str, value: str):
+    """Build an OpenAI-style tool call."""
+    return {
+        "id": f"call_{index}",
+        "type": "function",
+        "function": {"name": name, "arguments": json.dumps({"value": value})},
+    }
+
+
+class TestAgentToolCalls:
+    """Test cases for Agent._process_tool_calls."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.llm = BaseLLM()
+        self.llm.generate = AsyncMock(return_value=LLMResponse(content="done"))
+
+    @pytest.mark.asyncio
+    async def test_parallel_tool_calls_preserve_order(self):
+        """Slow tools finishing last should still be appended in call order."""
+        slow = SleepTool("slow", 0.05)
+        fast = SleepTool("fast", 0.0)
+        agent = Agent(
+            name="tester", llm=self.llm, tools=[slow, fast], parallel_tool_calls=True
+        )
+        messages = []
+        tool_calls = [
+            make_tool_call(0, "slow", "a"),
+            make_tool_call(1, "fast", "b"),
+        ]
+
+        result = await agent._process_tool_calls(tool_calls, messages, {})
+
+        assert result == "done"
+        tool_messages = [m for m in messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_0", "call_1"]
+        assert json.loads(tool_messages[0]["content"])["tool"] == "slow"
+
+    @pytest.mark.asyncio
+    async def test_parallel_tool_calls_respect_concurrency_cap(self):
+        """No more than max_concurrent_tools calls should run at once."""
+        tool = SleepTool("sleep", 0.01)
+        agent = Agent(
+            name="tester",
+            llm=self.llm,
+            tools=[tool],
+            parallel_tool_calls=True,
+            max_concurrent_tools=2,
+        )
+        tool_calls = [make_tool_call(i, "sleep", str(i)) for i in range(6)]
+
+        await agent._process_tool_calls(tool_calls, [], {})
+
+        assert tool.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout_returns_error(self):
+        """A tool exceeding its timeout should produce an error result."""
+        tool = SleepTool("slow", 1.0)
+        monitor = AsyncMock()
+        agent = Agent(
+            name="tester",
+            llm=self.llm,
+            tools=[tool],
+            monitor=monitor,
+            tool_timeout=0.01,
+        )
+        messages = []
+
+        await agent._process_tool_calls([make_tool_call(0, "slow", "x")], messages, {})
+
+        content = json.loads(messages[-1]["content"])
+        assert "timed out" in content["error"]
+        monitor.track_error.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_monitoring_fires_for_every_parallel_call(self):
+        """Each tool call should be tracked before and after it runs."""
+        tool = SleepTool("sleep", 0.0)
+        monitor = AsyncMock()
+        agent = Agent(
+            name="tester",
+            llm=self.llm,
+            tools=[tool],
+            monitor=monitor,
+            parallel_tool_calls=True,
+        )
+        tool_calls = [make_tool_call(i, "sleep", str(i)) for i in range(3)]
+
+        await agent._process_tool_calls(tool_calls, [], {})
+
+        assert monitor.track_tool_usage.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_round_is_packed_into_one_assistant_message(self):
+        """All tool calls of a round share one assistant message."""
+        tool = SleepTool("sleep", 0.0)
+        agent = Agent(name="tester", llm=self.llm, tools=[tool])
+        messages = []
+        tool_calls = [make_tool_call(i, "sleep", str(i)) for i in range(3)]
+
+        await agent._process_tool_calls(tool_calls, messages, {}, "Checking")
+
+        assert [m["role"] for m in messages] == ["assistant", "tool", "tool", "tool"]
+        assert messages[0]["content"] == "Checking"
+        assert len(messages[0]["tool_calls"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_tools_can_be_chained_across_rounds(self):
+        """The LLM may request more tools after seeing tool results."""
+        tool = SleepTool("sleep", 0.0)
+        self.llm.generate = AsyncMock(
+            side_effect=[
+                LLMResponse(content="", tool_calls=[make_tool_call(1, "sleep", "b")]),
+                LLMResponse(content="done"),
+            ]
+        )
+        agent = Agent(name="tester", llm=self.llm, tools=[tool])
+        messages = []
+
+        result = await agent._process_tool_calls(
+            [make_tool_call(0, "sleep", "a")], messages, {}
+        )
+
+        assert result == "done"
+        assert self.llm.generate.await_count == 2
+        assert self.llm.generate.call_args_list[0].kwargs["tools"] == [tool]
+        assert [m["role"] for m in messages] == ["assistant", "tool"] * 2
+
+    @pytest.mark.asyncio
+    async def test_max_tool_rounds_forces_final_answer(self):
+        """After max_tool_rounds the LLM is called without tools."""
+        tool = SleepTool("sleep", 0.0)
+        self.llm.generate = AsyncMock(
+            return_value=LLMResponse(
+                content="more", tool_calls=[make_tool_call(0, "sleep", "a")]
+            )
+        )
+        agent = Agent(name="tester", llm=self.llm, tools=[tool], max_tool_rounds=3)
+
+        result = await agent._process_tool_calls(
+            [make_tool_call(0, "sleep", "a")], [], {}
+        )
+
+        assert result == "more"
+        calls = self.llm.generate.call_args_list
+        assert len(calls) == 3
+        assert calls[-1].kwargs["tools"] is None
+
+    @pytest.mark.asyncio
+    async def test_round_figures_are_tracked(self):
+        """Every round reports its tokens and latencies to the monitor."""
+        tool = SleepTool("sleep", 0.0)
+        self.llm.generate = AsyncMock(
+            return_value=LLMResponse(
+                content="done",
+                raw_response={"usage": {"prompt_tokens": 120, "completion_tokens": 8}},
+            )
+        )
+        monitor = AsyncMock()
+        agent = Agent(name="tester", llm=self.llm, tools=[tool], monitor=monitor)
+
+        await agent._process_tool_calls([make_tool_call(0, "sleep", "a")], [], {})
+
+        kwargs = monitor.track_llm_result.call_args.kwargs
+        assert kwargs["input_tokens"] == 120
+        assert kwargs["output_tokens"] == 8
+        assert kwargs["metadata"]["tool_round"] == 1
+        assert kwargs["metadata"]["tool_calls"] == 1
+        assert "llm_latency" in kwargs["metadata"]
+        assert "tool_latency" in kwargs["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_cognitive_agent_runs_tool_calls(self):
+        """A CognitiveAgent runs tool calls through the base tool loop."""
+        tool = SleepTool("sleep", 0.0)
+        self.llm.generate = AsyncMock(
+            side_effect=[
+                LLMResponse(content="", tool_calls=[make_tool_call(0, "sleep", "a")]),
+                LLMResponse(content="tool answer"),
+                LLMResponse(content="direct answer"),
+            ]
+        )
+        architecture = AsyncMock()
+        architecture.process = AsyncMock(return_value={})
+        agent = CognitiveAgent(
+            name="thinker",
+            llm=self.llm,
+            tools=[tool],
+            cognitive_architecture=architecture,
+        )
+
+        result = await agent.run("Use the tool")
+
+        assert result == "direct answer"
+        architecture.process.assert_awaited_once()
+        assert architecture.process.call_args.args[0] == "tool answer"
+        round_messages = self.llm.generate.call_args_list[1].kwargs["messages"]
+        assert [m for m in round_messages if m["role"] == "tool"]
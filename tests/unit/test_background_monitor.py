@@ -0,0 +1,186 @@
+"""
+Tests for the background monitoring dispatcher.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.monitoring.base import BaseMonitor, MonitoringEvent, MonitoringLevel
+from agents_hub.monitoring.dispatcher import BackgroundMonitor
+
+
+class RecordingMonitor(BaseMonitor):
+    """Monitor that records delivered events and batches."""
+
+    def __init__(self, delay: float = 0.0, level=MonitoringLevel.COMPREHENSIVE):
+        super().__init__(level=level)
+        self.delay = delay
+        self.messages = []
+        self.batches = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def _track_events(self, events):
+        self.batches.append(len(events))
+        await super()._track_events(events)
+
+    async def _track_event(self, event_data):
+        await self.release.wait()
+        await asyncio.sleep(self.delay)
+        self.messages.append(event_data.data.get("message"))
+
+
+class TracingMonitor(RecordingMonitor):
+    """Monitor that, like Langfuse, only scores conversations it has seen."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__(delay)
+        self.conversations = set()
+        self.scores = []
+
+    async def _track_event(self, event_data):
+        await super()._track_event(event_data)
+        self.conversations.add(event_data.conversation_id)
+
+    async def score_conversation(
+        self, conversation_id, name, value, comment=None, user_id=None
+    ):
+        if conversation_id in self.conversations:
+            self.scores.append((conversation_id, name, value, user_id))
+
+    async def add_user_feedback(
+        self, conversation_id, score, comment=None, user_id=None
+    ):
+        if conversation_id in self.conversations:
+            self.scores.append((conversation_id, "user_feedback", score, user_id))
+
+
+class TestBackgroundMonitor:
+    """Test cases for BackgroundMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_delivered_in_order(self):
+        """Events should reach the wrapped monitor in the order tracked."""
+        backend = RecordingMonitor()
+        monitor = BackgroundMonitor(backend)
+
+        for i in range(5):
+            await monitor.track_user_message(str(i), conversation_id="c1")
+        await monitor.flush()
+
+        assert backend.messages == ["0", "1", "2", "3", "4"]
+        assert monitor.stats["delivered_events"] == 5
+
+    @pytest.mark.asyncio
+    async def test_tracking_does_not_wait_for_backend(self):
+        """Tracking should return before a slow backend finishes."""
+        backend = RecordingMonitor(delay=0.2)
+        monitor = BackgroundMonitor(backend)
+
+        await asyncio.wait_for(
+            monitor.track_user_message("hi", conversation_id="c1"), timeout=0.05
+        )
+        assert backend.messages == []
+
+        await monitor.close()
+        assert backend.messages == ["hi"]
+
+    @pytest.mark.asyncio
+    async def test_queued_events_are_drained_in_batches(self):
+        """Events queued before the worker runs are delivered in batches."""
+        backend = RecordingMonitor()
+        monitor = BackgroundMonitor(backend, batch_size=4)
+
+        for i in range(6):
+            await monitor.track_user_message(str(i), conversation_id="c1")
+        await monitor.flush()
+
+        assert backend.batches == [4, 2]
+        assert backend.messages == ["0", "1", "2", "3", "4", "5"]
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_overflow_policy(self):
+        """A full queue should drop its oldest event."""
+        backend = RecordingMonitor()
+        backend.release.clear()
+        monitor = BackgroundMonitor(backend, max_queue_size=2, batch_size=1)
+
+        await monitor.track_user_message("0", conversation_id="c1")
+        await asyncio.sleep(0)  # Worker takes "0" and waits on the backend
+        for i in range(1, 4):
+            await monitor.track_user_message(str(i), conversation_id="c1")
+        backend.release.set()
+        await monitor.flush()
+
+        assert backend.messages == ["0", "2", "3"]
+        assert monitor.stats["dropped_events"] == 1
+
+    @pytest.mark.asyncio
+    async def test_block_overflow_policy(self):
+        """A full queue should make the caller wait for room."""
+        backend = RecordingMonitor()
+        backend.release.clear()
+        monitor = BackgroundMonitor(
+            backend, max_queue_size=1, batch_size=1, overflow_policy="block"
+        )
+
+        await monitor.track_user_message("0", conversation_id="c1")
+        await asyncio.sleep(0)
+        await monitor.track_user_message("1", conversation_id="c1")
+        blocked = asyncio.ensure_future(
+            monitor.track_user_message("2", conversation_id="c1")
+        )
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        backend.release.set()
+        await blocked
+        await monitor.flush()
+
+        assert backend.messages == ["0", "1", "2"]
+        assert monitor.stats["dropped_events"] == 0
+
+    @pytest.mark.asyncio
+    async def test_filtering_follows_wrapped_monitor(self):
+        """Events filtered out by the wrapped monitor are never queued."""
+        backend = RecordingMonitor(level=MonitoringLevel.BASIC)
+        monitor = BackgroundMonitor(backend)
+
+        await monitor.track_custom_event("custom", data={}, conversation_id="c1")
+
+        assert monitor.stats["enqueued_events"] == 0
+        assert not monitor.should_track(MonitoringEvent.TOOL_CALL)
+
+    @pytest.mark.asyncio
+    async def test_scoring_right_after_run(self):
+        """Conversation-level calls flush the queue before reaching the backend."""
+        llm = BaseLLM()
+        llm.generate = AsyncMock(return_value=LLMResponse(content="Paris"))
+        backend = TracingMonitor(delay=0.01)
+        agent = Agent(
+            name="assistant", llm=llm, monitor=backend, background_monitoring=True
+        )
+        context = {"conversation_id": "c1", "user_id": "u1"}
+
+        await agent.run("What is the capital of France?", context)
+        await agent.monitor.score_conversation("c1", "relevance", 0.9, user_id="u1")
+        await agent.monitor.add_user_feedback("c1", 5, "Great", user_id="u1")
+
+        assert backend.scores == [
+            ("c1", "relevance", 0.9, "u1"),
+            ("c1", "user_feedback", 5, "u1"),
+        ]
+
+    def test_background_dispatch_is_opt_in(self):
+        """Agents track events inline unless background monitoring is enabled."""
+        backend = RecordingMonitor()
+
+        assert Agent(name="a", llm=BaseLLM(), monitor=backend).monitor is backend
+        assert isinstance(
+            Agent(
+                name="b", llm=BaseLLM(), monitor=backend, background_monitoring=True
+            ).monitor,
+            BackgroundMonitor,
+        )
@@ -0,0 +1,37 @@
+"""
+Smoke tests for the benchmark suite.
+"""
+
+import pytest
+from benchmarks import REGISTRY, run_benchmark
+from benchmarks.harness import BenchmarkResult, compare
+
+
+class TestBenchmarks:
+    """Test cases for the benchmark harness."""
+
+    @pytest.mark.parametrize("name", sorted(REGISTRY))
+    def test_benchmark_runs(self, name):
+        """Every registered benchmark runs and reports figures."""
+        result = run_benchmark(name, iterations=3, warmup=1, alloc_iterations=1)
+
+        assert result.iterations == 3
+        assert result.ops_per_sec > 0
+        assert result.p50_us <= result.p99_us
+
+    def test_compare_reports_regressions(self):
+        """Drops in throughput beyond the tolerance are reported."""
+        result = BenchmarkResult(
+            name="agent.run",
+            group="agent",
+            iterations=10,
+            ops_per_sec=700.0,
+            p50_us=1.0,
+            p99_us=2.0,
+            alloc_bytes=0,
+            alloc_blocks=0,
+        )
+
+        assert compare([result], {"agent.run": {"ops_per_sec": 1000.0}}, 0.25)
+        assert not compare([result], {"agent.run": {"ops_per_sec": 900.0}}, 0.25)
+        assert not compare([result], {}, 0.25)
@@ -0,0 +1,116 @@
+"""
+Tests for token-budgeted context assembly.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from agents_hub.agents.base import Agent
+from agents_hub.agents.context import ContextBuilder
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.tokens import TokenCounter
+
+
+class WordCountLLM(BaseLLM):
+    """LLM whose tokenizer counts whitespace-separated words."""
+
+    def __init__(self):
+        self.counted = []
+
+    def get_token_count(self, text):
+        self.counted.append(text)
+        return len(text.split())
+
+
+def make_history(*turns):
+    """Build a history list from (user, assistant) pairs."""
+    return [{"user_message": u, "assistant_message": a} for u, a in turns]
+
+
+class TestContextBuilder:
+    """Test cases for ContextBuilder."""
+
+    def test_everything_fits(self):
+        """A history within budget is passed through unchanged."""
+        builder = ContextBuilder(WordCountLLM(), max_input_tokens=100)
+        history = make_history(("hi", "hello there"))
+
+        result = builder.build("be nice", history, "how are you")
+
+        assert [m["role"] for m in result.messages] == [
+            "system",
+            "user",
+            "assistant",
+            "user",
+        ]
+        assert result.trimmed_tokens == 0
+        assert result.dropped_turns == 0
+
+    def test_oldest_turns_are_dropped(self):
+        """Turns that do not fit are dropped from the oldest end."""
+        builder = ContextBuilder(
+            WordCountLLM(), max_input_tokens=30, compact_turns=False
+        )
+        history = make_history(
+            ("old question", "word " * 20),
+            ("new question", "short answer"),
+        )
+
+        result = builder.build("", history, "next")
+
+        contents = [m["content"] for m in result.messages]
+        assert contents == ["new question", "short answer", "next"]
+        assert result.dropped_turns == 1
+        assert result.trimmed_tokens == 2 + 20 + 8
+        assert result.input_tokens <= 30
+
+    def test_long_turns_are_compacted(self):
+        """A turn that only fits when truncated is compacted."""
+        builder = ContextBuilder(
+            WordCountLLM(), max_input_tokens=40, compacted_message_tokens=5
+        )
+        history = make_history(("question", "word " * 50))
+
+        result = builder.build("", history, "next")
+
+        assert result.compacted_turns == 1
+        assert result.dropped_turns == 0
+        assert result.messages[1]["content"].endswith("[...]")
+        assert result.trimmed_tokens > 0
+        assert result.input_tokens <= 40
+
+    def test_counts_without_a_tokenizer_use_the_shared_counter(self):
+        """Providers that cannot count fall back to the memoized estimate."""
+        counter = TokenCounter()
+        builder = ContextBuilder(BaseLLM(), max_input_tokens=100)
+        history = make_history(("hi", "a" * 40))
+
+        with patch("agents_hub.agents.context.get_token_counter", return_value=counter):
+            builder.build("system", history, "question")
+            misses = counter.stats["misses"]
+            builder.build("system", history, "question")
+
+            assert builder.count_tokens("a" * 40) == 10
+        assert counter.stats["misses"] == misses
+        assert counter.stats["hits"] > 0
+
+    @pytest.mark.asyncio
+    async def test_agent_reports_trimmed_tokens(self):
+        """The agent should report trimming in its LLM call metadata."""
+        llm = WordCountLLM()
+        llm.generate = AsyncMock(return_value=LLMResponse(content="ok"))
+        memory = AsyncMock()
+        memory.get_history.return_value = make_history(("q", "word " * 100))
+        monitor = AsyncMock()
+        agent = Agent(
+            name="tester",
+            llm=llm,
+            memory=memory,
+            monitor=monitor,
+            max_input_tokens=50,
+        )
+
+        await agent.run("hello")
+
+        metadata = monitor.track_llm_call.call_args.kwargs["metadata"]
+        assert metadata["trimmed_tokens"] > 0
+        assert metadata["context_tokens"] <= 50
@@ -0,0 +1,152 @@
+"""
+Tests for run deadlines and cancellation.
+"""
+
+import asyncio
+import time
+import pytest
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.monitoring.base import BaseMonitor, MonitoringLevel
+from agents_hub.tools.base import BaseTool
+from agents_hub.utils.deadline import Deadline, DeadlineExceededError
+
+
+class SlowLLM(BaseLLM):
+    """LLM that takes a fixed time and records whether it was cancelled."""
+
+    def __init__(self, delay: float, tool_call=None):
+        self.delay = delay
+        self.tool_call = tool_call
+        self.cancelled = False
+
+    async def generate(self, messages, tools=None, **kwargs):
+        if tools and self.tool_call:
+            return LLMResponse(content="", tool_calls=[self.tool_call])
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return LLMResponse(content="answer")
+
+
+class SlowTool(BaseTool):
+    """Tool that takes a fixed time."""
+
+    def __init__(self, delay: float):
+        super().__init__(
+            name="slow",
+            description="A slow tool",
+            parameters={"type": "object", "properties": {}},
+        )
+        self.delay = delay
+
+    async def run(self, parameters, context=None):
+        await asyncio.sleep(self.delay)
+        return {"done": True}
+
+
+class RecordingMonitor(BaseMonitor):
+    """Monitor that records the data of every event."""
+
+    def __init__(self):
+        super().__init__(level=MonitoringLevel.COMPREHENSIVE)
+        self.events = []
+
+    async def _track_event(self, event_data):
+        self.events.append(event_data)
+
+
+class TestDeadline:
+    """Test cases for the Deadline helper."""
+
+    def test_from_context(self):
+        """Deadlines are read from a Deadline object or a relative timeout."""
+        deadline = Deadline(10)
+
+        assert Deadline.from_context({"deadline": deadline}) is deadline
+        assert Deadline.from_context({"timeout": 5}).timeout == 5
+        assert Deadline.from_context({"deadline": 2.5}).timeout == 2.5
+        assert Deadline.from_context({}) is None
+        assert Deadline.from_context(None) is None
+
+    def test_timeout_for_is_bounded_by_remaining_time(self):
+        """Operation timeouts never exceed the time left."""
+        deadline = Deadline(1)
+
+        assert deadline.timeout_for(30) <= 1
+        assert deadline.timeout_for(0.1) == 0.1
+
+    @pytest.mark.asyncio
+    async def test_own_timeout_is_not_reported_as_deadline(self):
+        """An operation's own timeout raises a plain TimeoutError."""
+        deadline = Deadline(10)
+
+        with pytest.raises(asyncio.TimeoutError) as excinfo:
+            await deadline.wait_for(asyncio.sleep(1), "sleep", timeout=0.01)
+
+        assert not isinstance(excinfo.value, DeadlineExceededError)
+
+
+class TestAgentDeadlines:
+    """Test cases for deadlines and cancellation in Agent.run."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_aborts_llm_call(self):
+        """A slow LLM call is cancelled once the deadline passes."""
+        llm = SlowLLM(delay=1.0)
+        monitor = RecordingMonitor()
+        agent = Agent(name="tester", llm=llm, monitor=monitor)
+
+        start = time.perf_counter()
+        with pytest.raises(DeadlineExceededError) as excinfo:
+            await agent.run("hello", context={"timeout": 0.05})
+
+        assert time.perf_counter() - start < 0.5
+        assert excinfo.value.operation == "LLM call"
+        assert llm.cancelled
+
+        await agent.flush_monitoring()
+        cancellation = monitor.events[-1]
+        assert cancellation.data["reason"] == "deadline_exceeded"
+        assert cancellation.metadata["cancelled"] is True
+
+    @pytest.mark.asyncio
+    async def test_deadline_aborts_tool_call(self):
+        """A tool running past the deadline aborts the run."""
+        tool_call = {"id": "call_0", "function": {"name": "slow", "arguments": "{}"}}
+        llm = SlowLLM(delay=0.0, tool_call=tool_call)
+        agent = Agent(name="tester", llm=llm, tools=[SlowTool(1.0)])
+
+        with pytest.raises(DeadlineExceededError) as excinfo:
+            await agent.run("hello", context={"deadline": Deadline(0.05)})
+
+        assert excinfo.value.operation == "tool 'slow'"
+
+    @pytest.mark.asyncio
+    async def test_run_within_deadline(self):
+        """Runs that finish in time are unaffected and the context is untouched."""
+        agent = Agent(name="tester", llm=SlowLLM(delay=0.0))
+        context = {"timeout": 5}
+
+        assert await agent.run("hello", context=context) == "answer"
+        assert context == {"timeout": 5}
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_tracked(self):
+        """Cancelling the run cancels the LLM call and records the event."""
+        llm = SlowLLM(delay=1.0)
+        monitor = RecordingMonitor()
+        agent = Agent(name="tester", llm=llm, monitor=monitor)
+
+        task = asyncio.ensure_future(agent.run("hello"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert llm.cancelled
+        await agent.flush_monitoring()
+        assert monitor.events[-1].data["reason"] == "cancelled"
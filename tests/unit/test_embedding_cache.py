@@ -0,0 +1,94 @@
+"""
+Tests for the content-addressed embedding cache.
+"""
+
+import pytest
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.cache import CachedEmbeddings
+
+
+class CountingEmbeddingLLM(BaseLLM):
+    """LLM that records the texts it embeds."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_embeddings(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+    async def generate(self, messages, tools=None, **kwargs):
+        return LLMResponse(content="generated")
+
+    @property
+    def provider_name(self):
+        return "Test"
+
+    @property
+    def model_name(self):
+        return "test-embedder"
+
+
+class TestCachedEmbeddings:
+    """Test cases for CachedEmbeddings."""
+
+    @pytest.mark.asyncio
+    async def test_misses_are_batched_and_deduplicated(self):
+        """Only unseen texts are embedded, in a single call."""
+        llm = CountingEmbeddingLLM()
+        cached = CachedEmbeddings(llm)
+
+        first = await cached.get_embeddings(["a", "bb", "a"])
+        second = await cached.get_embeddings(["bb", "ccc", "a"])
+
+        assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+        assert second == [[2.0, 0.5], [3.0, 0.5], [1.0, 0.5]]
+        assert llm.calls == [["a", "bb"], ["ccc"]]
+        assert cached.stats["memory_hits"] == 2
+        assert cached.stats["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_persists(self, tmp_path):
+        """Vectors are served from disk by a new cache instance."""
+        path = str(tmp_path / "embeddings.db")
+        first = CachedEmbeddings(CountingEmbeddingLLM(), path=path)
+        await first.get_embeddings(["query"])
+        first.close()
+
+        llm = CountingEmbeddingLLM()
+        second = CachedEmbeddings(llm, path=path)
+        assert await second.get_embedding("query") == [5.0, 0.5]
+        assert llm.calls == []
+        assert second.stats["disk_hits"] == 1
+
+        # Another model does not share the entries
+        other = CachedEmbeddings(llm, path=path, model="other")
+        await other.get_embedding("query")
+        assert llm.calls == [["query"]]
+        second.close()
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_is_lru_bounded(self):
+        """The in-process tier evicts the least recently used vectors."""
+        llm = CountingEmbeddingLLM()
+        cached = CachedEmbeddings(llm, max_memory_entries=2)
+
+        await cached.get_embeddings(["a", "b"])
+        await cached.get_embedding("a")
+        await cached.get_embedding("c")
+        await cached.get_embedding("b")
+
+        assert llm.calls == [["a", "b"], ["c"], ["b"]]
+        assert cached.stats["memory_entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_delegates_to_wrapped_llm(self):
+        """Generation and metadata come from the wrapped LLM."""
+        cached = CachedEmbeddings(CountingEmbeddingLLM())
+
+        response = await cached.generate([{"role": "user", "content": "Hi"}])
+
+        assert response.content == "generated"
+        assert cached.model_name == "test-embedder"
+        assert cached.embedding_model == "Test:test-embedder"
@@ -0,0 +1,122 @@
+"""
+Tests for batched embeddings.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from agents_hub.llm.base import BaseLLM
+from agents_hub.llm.providers.google import GeminiProvider
+from agents_hub.llm.providers.openai import OpenAIProvider
+
+
+class BatchingLLM(BaseLLM):
+    """LLM that records its embedding batches."""
+
+    embedding_batch_size = 3
+    embedding_batch_tokens = 10
+
+    def __init__(self):
+        self.batches = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _embed_batch(self, texts):
+        self.batches.append(list(texts))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [[float(len(text))] for text in texts]
+
+    def get_token_count(self, text):
+        return len(text)
+
+
+class SingleEmbeddingLLM(BaseLLM):
+    """LLM with only a per-item embedding call."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_embedding(self, text):
+        self.calls.append(text)
+        return [float(len(text))]
+
+
+class TestGetEmbeddings:
+    """Test cases for BaseLLM.get_embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_batches_by_count_and_tokens(self):
+        """Batches respect both the item and the token limits."""
+        llm = BatchingLLM()
+        texts = ["a", "bb", "ccc", "dddd", "eeeeeeeeeeee", "f"]
+
+        embeddings = await llm.get_embeddings(texts)
+
+        assert embeddings == [[float(len(text))] for text in texts]
+        assert llm.batches == [["a", "bb", "ccc"], ["dddd"], ["eeeeeeeeeeee"], ["f"]]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than ``concurrency`` batches are in flight."""
+        llm = BatchingLLM()
+
+        await llm.get_embeddings(["x"] * 12, batch_size=1, concurrency=2)
+
+        assert len(llm.batches) == 12
+        assert llm.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_get_embedding(self):
+        """Providers without a batch API embed each text on its own."""
+        llm = SingleEmbeddingLLM()
+
+        embeddings = await llm.get_embeddings(["a", "bb"])
+
+        assert embeddings == [[1.0], [2.0]]
+        assert llm.calls == ["a", "bb"]
+        assert await llm.get_embeddings([]) == []
+
+    @pytest.mark.asyncio
+    async def test_openai_sends_array_input(self):
+        """OpenAI embeds a batch in one request, ordered by index."""
+        llm = OpenAIProvider(api_key="test")
+        data = [
+            SimpleNamespace(index=1, embedding=[2.0]),
+            SimpleNamespace(index=0, embedding=[1.0]),
+        ]
+        llm._client = SimpleNamespace(
+            embeddings=SimpleNamespace(
+                create=AsyncMock(return_value=SimpleNamespace(data=data))
+            )
+        )
+
+        embeddings = await llm.get_embeddings(["a", "b"])
+
+        assert embeddings == [[1.0], [2.0]]
+        llm._client.embeddings.create.assert_awaited_once_with(
+            model="text-embedding-3-small", input=["a", "b"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_gemini_uses_batch_request(self):
+        """Gemini embeds up to 100 texts per batch request."""
+        llm = GeminiProvider(api_key="test")
+
+        async def embed_content_async(model, content, task_type):
+            return {"embedding": [[float(len(text))] for text in content]}
+
+        with patch(
+            "agents_hub.llm.providers.google.genai.embed_content_async",
+            side_effect=embed_content_async,
+        ) as embed:
+            embeddings = await llm.get_embeddings(["a"] * 150)
+
+        assert len(embeddings) == 150
+        assert [len(call.kwargs["content"]) for call in embed.call_args_list] == [
+            100,
+            50,
+        ]
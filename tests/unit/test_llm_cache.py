@@ -0,0 +1,209 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import time
+import pytest
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.cache import CachedLLM
+from agents_hub.cache import RedisCacheBackend
+from agents_hub.monitoring.base import BaseMonitor, MonitoringEvent
+
+
+class CountingLLM(BaseLLM):
+    """LLM that numbers its responses."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        return LLMResponse(
+            content=f"response {self.calls}",
+            raw_response={"usage": {"prompt_tokens": 10, "completion_tokens": 5}},
+        )
+
+    async def stream(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        yield LLMStreamChunk(content="streamed ")
+        yield LLMStreamChunk(content=str(self.calls))
+        yield LLMStreamChunk(done=True)
+
+    @property
+    def provider_name(self):
+        return "Test"
+
+    @property
+    def model_name(self):
+        return "test-model"
+
+
+class FakeRedis:
+    """In-process stand-in for the Redis commands used by the backend."""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = {}
+        self.sets = {}
+
+    async def get(self, name):
+        value, expires_at = self.values.get(name, (None, None))
+        if expires_at is not None and time.time() >= expires_at:
+            del self.values[name]
+            return None
+        return value
+
+    async def set(self, name, value, px=None):
+        self.values[name] = (value, time.time() + px / 1000 if px else None)
+
+    async def delete(self, *names):
+        for name in names:
+            self.values.pop(name, None)
+            self.sorted_sets.pop(name, None)
+
+    async def zadd(self, name, mapping):
+        self.sorted_sets.setdefault(name, {}).update(mapping)
+
+    async def zrem(self, name, *members):
+        for member in members:
+            self.sorted_sets.get(name, {}).pop(member, None)
+
+    async def zcard(self, name):
+        return len(self.sorted_sets.get(name, {}))
+
+    async def zrange(self, name, start, end):
+        members = sorted(self.sorted_sets.get(name, {}).items(), key=lambda m: m[1])
+        end = len(members) if end == -1 else end + 1
+        return [member.encode() for member, _ in members[start:end]]
+
+    async def sadd(self, name, member):
+        self.sets.setdefault(name, set()).add(member)
+
+    async def smembers(self, name):
+        return {member.encode() for member in self.sets.get(name, set())}
+
+
+MESSAGES = [{"role": "user", "content": "What is the capital of France?"}]
+
+
+class RecordingMonitor(BaseMonitor):
+    """Monitor that keeps the events it tracks."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    async def _track_event(self, event_data):
+        self.events.append(event_data)
+
+
+class TestCachedLLM:
+    """Test cases for CachedLLM."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_hit_the_cache(self):
+        """Only the first of identical deterministic requests is generated."""
+        llm = CountingLLM()
+        cached = CachedLLM(llm)
+
+        first = await cached.generate(MESSAGES, temperature=0)
+        second = await cached.generate(MESSAGES, temperature=0)
+        other = await cached.generate(MESSAGES, temperature=0, max_tokens=10)
+
+        assert first.content == second.content == "response 1"
+        assert other.content == "response 2"
+        assert second.cached and not first.cached
+        assert "usage" not in second.raw_response
+        assert cached.stats["hits"] == 1
+        assert cached.stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_hits_report_no_usage(self):
+        """A hit is marked as cached and costs no tokens in monitoring."""
+        monitor = RecordingMonitor()
+        agent = Agent(
+            name="a", llm=CachedLLM(CountingLLM()), monitor=monitor, temperature=0
+        )
+
+        await agent.run("Hello")
+        await agent.run("Hello")
+
+        miss, hit = [
+            event
+            for event in monitor.events
+            if event.event_type == MonitoringEvent.LLM_RESULT
+        ]
+        assert not miss.metadata.get("from_cache")
+        assert hit.metadata["from_cache"] is True
+        assert (hit.input_tokens, hit.output_tokens, hit.cost) == (0, 0, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_requests_bypass_the_cache(self):
+        """Requests above max_temperature or with cache=False are not cached."""
+        llm = CountingLLM()
+        cached = CachedLLM(llm)
+
+        await cached.generate(MESSAGES, temperature=0.7)
+        await cached.generate(MESSAGES, temperature=0.7)
+        await cached.generate(MESSAGES, temperature=0, cache=False)
+
+        assert llm.calls == 3
+        assert cached.stats["bypassed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_disk_backend_and_ttl_from_config(self, tmp_path):
+        """Responses persist on disk and cache_config sets the TTL."""
+        config = {"path": str(tmp_path / "llm.db"), "ttl": 60}
+        await CachedLLM(CountingLLM(), "disk", config).generate(MESSAGES, temperature=0)
+
+        llm = CountingLLM()
+        cached = CachedLLM(llm, "disk", config)
+        response = await cached.generate(MESSAGES, temperature=0)
+
+        assert response.content == "response 1"
+        assert llm.calls == 0
+        assert cached.ttl == 60
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_lru(self):
+        """The Redis backend evicts the least recently used responses."""
+        backend = RedisCacheBackend(client=FakeRedis())
+        llm = CountingLLM()
+        cached = CachedLLM(llm, backend=backend, max_entries=2)
+
+        for question in ["a", "b", "a", "c", "b"]:
+            await cached.generate(
+                [{"role": "user", "content": question}], temperature=0
+            )
+
+        # "b" was evicted when "c" was added, after "a" was used again
+        assert llm.calls == 4
+
+        await cached.clear()
+        await cached.generate([{"role": "user", "content": "a"}], temperature=0)
+        assert llm.calls == 5
+
+    @pytest.mark.asyncio
+    async def test_streams_are_cached(self):
+        """A streamed response is cached and replayed as one chunk."""
+        llm = CountingLLM()
+        cached = CachedLLM(llm)
+
+        first = [chunk async for chunk in cached.stream(MESSAGES, temperature=0)]
+        second = [chunk async for chunk in cached.stream(MESSAGES, temperature=0)]
+
+        assert "".join(chunk.content for chunk in first) == "streamed 1"
+        assert len(second) == 1
+        assert second[0].content == "streamed 1"
+        assert second[0].done
+        assert llm.calls == 1
+
+    def test_unknown_cache_type(self):
+        """An unknown cache type is rejected."""
+        with pytest.raises(ValueError):
+            CachedLLM(CountingLLM(), cache_type="memcached")
@@ -0,0 +1,154 @@
+"""
+Tests for fallback and hedged LLM requests.
+"""
+
+import asyncio
+import pytest
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.fallback import LLMWithFallback
+
+
+class ScriptedLLM(BaseLLM):
+    """LLM with a fixed latency that can fail."""
+
+    def __init__(self, name, latency=0.0, fail=False):
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} is down")
+        return LLMResponse(content=self.name)
+
+    async def stream(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        if self.fail:
+            raise RuntimeError(f"{self.name} is down")
+        yield LLMStreamChunk(content=self.name, done=True)
+
+    async def get_embedding(self, text):
+        return [1.0] if self.name == "primary" else [2.0]
+
+    @property
+    def provider_name(self):
+        return "Test"
+
+    @property
+    def model_name(self):
+        return self.name
+
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+class TestLLMWithFallback:
+    """Test cases for LLMWithFallback."""
+
+    @pytest.mark.asyncio
+    async def test_fails_over_in_order(self):
+        """Failed providers are replaced by the next fallback."""
+        llm = LLMWithFallback(
+            primary=ScriptedLLM("primary", fail=True),
+            fallbacks=[ScriptedLLM("second", fail=True), ScriptedLLM("third")],
+        )
+
+        response = await llm.generate(MESSAGES)
+
+        assert response.content == "third"
+        stats = llm.stats
+        assert stats["failovers"] == 2
+        assert stats["providers"]["Test:primary"]["errors"] == 1
+        assert stats["providers"]["Test:third"]["win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_raises_when_every_provider_fails(self):
+        """The last error is raised once max_retries fallbacks failed."""
+        third = ScriptedLLM("third")
+        llm = LLMWithFallback(
+            primary=ScriptedLLM("primary", fail=True),
+            fallbacks=[ScriptedLLM("second", fail=True), third],
+            max_retries=1,
+        )
+
+        with pytest.raises(RuntimeError, match="second is down"):
+            await llm.generate(MESSAGES)
+        assert third.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_max_retries_is_capped(self):
+        """More retries than fallbacks raise the providers' error."""
+        llm = LLMWithFallback(
+            primary=ScriptedLLM("primary", fail=True),
+            fallbacks=[ScriptedLLM("second", fail=True)],
+            max_retries=3,
+        )
+
+        with pytest.raises(RuntimeError, match="second is down"):
+            await llm.generate(MESSAGES)
+        with pytest.raises(RuntimeError, match="second is down"):
+            [chunk async for chunk in llm.stream(MESSAGES)]
+        assert llm.max_retries == 1
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_primary_and_cancels_loser(self):
+        """A slow primary is hedged and cancelled when the fallback wins."""
+        primary = ScriptedLLM("primary", latency=1.0)
+        fallback = ScriptedLLM("fallback", latency=0.01)
+        llm = LLMWithFallback(
+            primary=primary, fallbacks=[fallback], hedge=True, hedge_delay=0.02
+        )
+
+        response = await llm.generate(MESSAGES)
+        await asyncio.sleep(0)
+
+        assert response.content == "fallback"
+        assert primary.cancelled == 1
+        assert llm.stats["hedges"] == 1
+        assert llm.stats["hedge_wins"] == 1
+        primary_stats = llm.stats["providers"]["Test:primary"]
+        assert primary_stats["cancelled"] == 1
+        # The cancelled primary ran at least until the hedge won
+        assert primary_stats["p50"] >= 0.02
+
+    @pytest.mark.asyncio
+    async def test_hedge_delay_is_learned(self):
+        """Hedging starts once enough primary latencies are recorded."""
+        primary = ScriptedLLM("primary")
+        fallback = ScriptedLLM("fallback")
+        llm = LLMWithFallback(
+            primary=primary, fallbacks=[fallback], hedge=True, min_samples=5
+        )
+
+        for _ in range(5):
+            await llm.generate(MESSAGES)
+        assert fallback.calls == 0
+        assert llm.current_hedge_delay() is not None
+
+        primary.latency = 0.2
+        response = await llm.generate(MESSAGES)
+        assert response.content == "fallback"
+
+    @pytest.mark.asyncio
+    async def test_stream_and_embeddings(self):
+        """Streams fail over; embeddings always come from the primary."""
+        llm = LLMWithFallback(
+            primary=ScriptedLLM("primary", fail=True),
+            fallbacks=[ScriptedLLM("fallback")],
+        )
+
+        chunks = [chunk async for chunk in llm.stream(MESSAGES)]
+
+        assert chunks[0].content == "fallback"
+        assert await llm.get_embedding("text") == [1.0]
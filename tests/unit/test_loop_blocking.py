@@ -0,0 +1,130 @@
+"""
+Tests for the event loop blocking detector.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import AsyncMock
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.monitoring.blocking import (
+    LoopBlockingDetector,
+    blocking_scope,
+    current_scope,
+)
+from agents_hub.tools.base import BaseTool
+
+
+class BlockingTool(BaseTool):
+    """Tool that blocks the event loop with a synchronous sleep."""
+
+    def __init__(self):
+        super().__init__(
+            name="blocking",
+            description="Block the loop",
+            parameters={"type": "object", "properties": {}},
+        )
+
+    async def run(self, parameters, context=None):
+        time.sleep(0.15)
+        return {"done": True}
+
+
+class TestLoopBlockingDetector:
+    """Test cases for LoopBlockingDetector."""
+
+    @pytest.mark.asyncio
+    async def test_scopes_nest_and_reset(self):
+        """Scopes nest inside a task and are inherited by the tasks it starts."""
+        with blocking_scope("agent", "a"):
+            with blocking_scope("tool", "t"):
+                inner = await asyncio.ensure_future(asyncio.sleep(0, current_scope()))
+            assert current_scope() == ("agent:a",)
+
+        assert inner == ("agent:a", "tool:t")
+        assert current_scope() == ()
+
+    @pytest.mark.asyncio
+    async def test_blocking_tool_is_attributed(self):
+        """A blocking tool is reported with its agent, tool and stack."""
+        llm = BaseLLM()
+        llm.generate = AsyncMock(
+            side_effect=[
+                LLMResponse(
+                    content="",
+                    tool_calls=[
+                        {
+                            "id": "call_0",
+                            "function": {
+                                "name": "blocking",
+                                "arguments": json.dumps({}),
+                            },
+                        }
+                    ],
+                ),
+                LLMResponse(content="done"),
+            ]
+        )
+        agent = Agent(name="worker", llm=llm, tools=[BlockingTool()])
+        monitor = AsyncMock()
+
+        async with LoopBlockingDetector(threshold=0.1, monitor=monitor) as detector:
+            await asyncio.ensure_future(agent.run("Block the loop"))
+            await asyncio.sleep(0.06)
+
+        event = detector.events[-1]
+        assert event.scope == ["agent:worker", "tool:blocking"]
+        assert event.duration >= 0.1
+        assert any("time.sleep" in stack for stack in event.stacks)
+        stats = detector.stats
+        assert stats["blocking_events"] == 1
+        assert stats["by_scope"]["agent:worker > tool:blocking"]["count"] == 1
+        assert stats["lag_max"] >= 0.05
+        assert "agent:worker > tool:blocking" in detector.report()
+        data = monitor.track_event.call_args.kwargs["data"]
+        assert data["event"] == "event_loop_blocked"
+
+    @pytest.mark.asyncio
+    async def test_stream_is_scoped(self):
+        """A streamed run is attributed to its agent, but not the consumer."""
+        seen = []
+
+        class ScopedLLM(BaseLLM):
+            async def stream(self, messages, tools=None, **kwargs):
+                seen.append(current_scope())
+                yield LLMStreamChunk(content="a")
+                seen.append(current_scope())
+                yield LLMStreamChunk(content="b", done=True)
+
+        agent = Agent(name="streamer", llm=ScopedLLM())
+
+        async for _ in agent.run_stream("Hello"):
+            assert current_scope() == ()
+
+        assert seen == [("agent:streamer",)] * 2
+
+    @pytest.mark.asyncio
+    async def test_lag_only_mode(self):
+        """Without audit, only the lag is measured and nothing is patched."""
+        original = asyncio.events.Handle._run
+
+        async with LoopBlockingDetector(interval=0.01, audit=False) as detector:
+            assert asyncio.events.Handle._run is original
+            await asyncio.sleep(0.02)
+            time.sleep(0.05)
+            await asyncio.sleep(0.02)
+
+        assert detector.stats["lag_max"] >= 0.03
+        assert detector.stats["blocking_events"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_restores_the_loop(self):
+        """Stopping the detector unpatches the loop callbacks."""
+        original = asyncio.events.Handle._run
+
+        async with LoopBlockingDetector():
+            assert asyncio.events.Handle._run is not original
+
+        assert asyncio.events.Handle._run is original
@@ -0,0 +1,226 @@
+"""
+Tests for the connection pooling of the Ollama provider.
+"""
+
+import asyncio
+import functools
+import json
+import httpx
+import pytest
+from agents_hub.llm.providers.ollama import OllamaProvider
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    """Route the provider's HTTP client to a mock transport."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        if request.url.path == "/api/embeddings":
+            return httpx.Response(200, json={"embedding": [0.1, 0.2]})
+        if request.url.path == "/api/embed":
+            texts = json.loads(request.content)["input"]
+            return httpx.Response(200, json={"embeddings": [[0.1]] * len(texts)})
+        return httpx.Response(
+            200, json={"message": {"role": "assistant", "content": "Hi"}}
+        )
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+    return requests
+
+
+class TestOllamaConnectionPool:
+    """Test cases for the pooled HTTP client of OllamaProvider."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self, requests):
+        """Chat and embedding calls share one client."""
+        async with OllamaProvider(base_url="http://ollama:11434/") as llm:
+            response = await llm.generate([{"role": "user", "content": "Hello"}])
+            embedding = await llm.get_embedding("Hello")
+            client = llm.client
+
+            assert response.content == "Hi"
+            assert embedding == [0.1, 0.2]
+            assert llm.pool_stats["clients_created"] == 1
+            assert str(requests[0].url) == "http://ollama:11434/api/chat"
+
+        assert client.is_closed
+        assert llm.pool_stats["requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_saturation_is_tracked(self, requests):
+        """Requests beyond max_connections are counted as saturated."""
+        llm = OllamaProvider(max_connections=2)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        await asyncio.gather(*(llm.generate(messages) for _ in range(5)))
+        await llm.close()
+
+        stats = llm.pool_stats
+        assert stats["requests"] == 5
+        assert stats["peak_in_flight"] == 5
+        assert stats["saturated_requests"] == 3
+        assert stats["saturation"] == pytest.approx(0.6)
+        assert stats["in_flight"] == 0
+
+    def test_new_client_per_event_loop(self, requests):
+        """A provider used from a new event loop gets a new client."""
+        llm = OllamaProvider()
+
+        asyncio.run(llm.get_embedding("first"))
+        asyncio.run(llm.get_embedding("second"))
+
+        assert llm.pool_stats["clients_created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_embeddings_are_batched(self, requests):
+        """get_embeddings sends lists of texts to /api/embed."""
+        async with OllamaProvider() as llm:
+            embeddings = await llm.get_embeddings(["text"] * 300)
+
+        assert embeddings == [[0.1]] * 300
+        assert [request.url.path for request in requests] == ["/api/embed"] * 2
+
+
+class Nodes:
+    """Mock Ollama nodes, addressed by host name."""
+
+    def __init__(self, *hosts, delays=None):
+        self.hosts = hosts
+        self.delays = delays or {}
+        self.down = set()
+        self.loaded = {host: [] for host in hosts}
+        self.chats = {host: 0 for host in hosts}
+
+    @property
+    def urls(self):
+        return [f"http://{host}:11434" for host in self.hosts]
+
+    async def handler(self, request):
+        host = request.url.host
+        if host in self.down:
+            raise httpx.ConnectError("Connection refused", request=request)
+        if request.url.path == "/api/ps":
+            models = [{"name": name} for name in self.loaded[host]]
+            return httpx.Response(200, json={"models": models})
+        self.chats[host] += 1
+        await asyncio.sleep(self.delays.get(host, 0.01))
+        return httpx.Response(
+            200, json={"message": {"role": "assistant", "content": host}}
+        )
+
+
+@pytest.fixture
+def nodes(monkeypatch):
+    """Route the provider's HTTP clients to three mock nodes."""
+    nodes = Nodes("a", "b", "c")
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        functools.partial(
+            httpx.AsyncClient, transport=httpx.MockTransport(nodes.handler)
+        ),
+    )
+    return nodes
+
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+class TestOllamaEndpointPool:
+    """Test cases for balancing requests between several Ollama nodes."""
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_spreads_requests(self, nodes):
+        """Concurrent requests are spread evenly over the nodes."""
+        async with OllamaProvider(
+            base_url=nodes.urls, health_check_interval=None
+        ) as llm:
+            await asyncio.gather(*(llm.generate(MESSAGES) for _ in range(9)))
+
+        assert nodes.chats == {"a": 3, "b": 3, "c": 3}
+        assert [node["requests"] for node in llm.pool_stats["endpoints"]] == [3, 3, 3]
+
+    @pytest.mark.asyncio
+    async def test_latency_balancing_prefers_fast_nodes(self, nodes):
+        """The latency strategy sends fewer requests to a slow node."""
+        nodes.delays = {"a": 0.05, "b": 0.005, "c": 0.005}
+        async with OllamaProvider(
+            base_url=nodes.urls, balancing="latency", health_check_interval=None
+        ) as llm:
+            for _ in range(5):
+                await asyncio.gather(*(llm.generate(MESSAGES) for _ in range(6)))
+
+        assert nodes.chats["a"] < nodes.chats["b"]
+        assert nodes.chats["a"] < nodes.chats["c"]
+
+    @pytest.mark.asyncio
+    async def test_failing_node_is_ejected_and_readmitted(self, nodes):
+        """A node that refuses connections is failed over, ejected, then re-admitted."""
+        nodes.down.add("a")
+        async with OllamaProvider(
+            base_url=nodes.urls, failure_threshold=2, health_check_interval=None
+        ) as llm:
+            responses = [await llm.generate(MESSAGES) for _ in range(6)]
+            pool = llm.endpoint_pool
+            assert all(response.content in ("b", "c") for response in responses)
+            assert pool.endpoints[0].breaker.state == "open"
+            assert llm.pool_stats["failovers"] >= 2
+
+            nodes.down.clear()
+            await pool.check_health()
+
+            assert pool.endpoints[0].breaker.state == "closed"
+            await asyncio.gather(*(llm.generate(MESSAGES) for _ in range(3)))
+            assert nodes.chats["a"] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_nodes_down(self, nodes):
+        """The connect error is raised when no node is left to fail over to."""
+        nodes.down.update({"a", "b", "c"})
+        async with OllamaProvider(
+            base_url=nodes.urls, health_check_interval=None
+        ) as llm:
+            with pytest.raises(httpx.ConnectError):
+                await llm.generate(MESSAGES)
+
+    @pytest.mark.asyncio
+    async def test_model_affinity(self, nodes):
+        """Requests go to the node where the model is loaded, until it is full."""
+        nodes.loaded["c"] = ["llama3:latest"]
+        async with OllamaProvider(
+            base_url=nodes.urls,
+            model="llama3",
+            model_affinity=True,
+            max_connections=4,
+            health_check_interval=None,
+        ) as llm:
+            await llm.endpoint_pool.check_health()
+            await asyncio.gather(*(llm.generate(MESSAGES) for _ in range(4)))
+
+            assert nodes.chats == {"a": 0, "b": 0, "c": 4}
+            assert llm.pool_stats["affinity_hits"] == 4
+
+            # Requests spill over once the loaded node is saturated
+            await asyncio.gather(*(llm.generate(MESSAGES) for _ in range(6)))
+            assert nodes.chats["c"] == 8
+
+    @pytest.mark.asyncio
+    async def test_health_checks_run_in_background(self, nodes):
+        """The first request starts the periodic health checks."""
+        nodes.loaded["b"] = ["llama3:latest"]
+        async with OllamaProvider(
+            base_url=nodes.urls, health_check_interval=0.01
+        ) as llm:
+            await llm.generate(MESSAGES)
+            await asyncio.sleep(0.05)
+
+            assert llm.pool_stats["health_checks"] >= 3
+            assert llm.endpoint_pool.endpoints[1].has_model("llama3")
@@ -0,0 +1,184 @@
+"""
+Tests for prompt prefix caching and its telemetry.
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.providers.anthropic import ClaudeProvider
+from agents_hub.monitoring.utils import estimate_cost
+from agents_hub.tools.base import BaseTool
+
+
+class EchoTool(BaseTool):
+    """Tool that echoes its arguments."""
+
+    def __init__(self, name: str = "echo"):
+        super().__init__(
+            name=name,
+            description="Echo the arguments",
+            parameters={"type": "object", "properties": {}},
+        )
+
+    async def run(self, parameters, context=None):
+        return parameters
+
+
+CONVERSATION = [
+    {"role": "system", "content": "You are helpful."},
+    {"role": "user", "content": "First question"},
+    {"role": "assistant", "content": "First answer"},
+    {"role": "user", "content": "Second question"},
+    {"role": "assistant", "content": "Second answer"},
+    {"role": "user", "content": "Third question"},
+]
+
+
+class TestClaudePromptCaching:
+    """Test cases for the cache breakpoints of ClaudeProvider."""
+
+    def test_breakpoints_on_tools_system_and_last_user_turns(self):
+        """Tools, system prompt and the last two user messages are cached."""
+        provider = ClaudeProvider(api_key="test")
+
+        request = provider._format_request(CONVERSATION, [EchoTool("a"), EchoTool("b")])
+
+        assert "cache_control" not in request["tools"][0]
+        assert request["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        assert request["system"] == [
+            {
+                "type": "text",
+                "text": "You are helpful.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        messages = request["messages"]
+        assert [message["role"] for message in messages][0] == "user"
+        assert messages[0]["content"] == "First question"
+        for index in (2, 4):
+            assert messages[index]["content"][-1]["cache_control"] == {
+                "type": "ephemeral"
+            }
+        # The caller's messages are left as they were
+        assert CONVERSATION[5]["content"] == "Third question"
+
+    def test_prefix_is_identical_across_turns(self):
+        """The next turn repeats the previous request up to its last breakpoint."""
+
+        def text(message):
+            content = message["content"]
+            if isinstance(content, str):
+                return content
+            return "".join(block["text"] for block in content)
+
+        provider = ClaudeProvider(api_key="test")
+        first = provider._format_request(CONVERSATION[:4], None)
+        second = provider._format_request(CONVERSATION, None)
+
+        assert [text(message) for message in second["messages"][:3]] == [
+            text(message) for message in first["messages"]
+        ]
+        assert first["system"] == second["system"]
+
+    def test_caching_can_be_disabled(self):
+        """Without prompt caching no breakpoints are set."""
+        provider = ClaudeProvider(api_key="test", prompt_caching=False)
+
+        request = provider._format_request(CONVERSATION, [EchoTool()])
+
+        assert "cache_control" not in json.dumps(request)
+
+    @pytest.mark.asyncio
+    async def test_generate_parses_content_blocks(self):
+        """Text and tool use blocks are read, and the usage is kept."""
+        usage = {
+            "input_tokens": 20,
+            "output_tokens": 5,
+            "cache_read_input_tokens": 1500,
+            "cache_creation_input_tokens": 0,
+        }
+        message = SimpleNamespace(
+            content=[
+                SimpleNamespace(type="text", text="Let me check"),
+                SimpleNamespace(
+                    type="tool_use", id="toolu_1", name="echo", input={"value": 1}
+                ),
+            ],
+            model_dump=lambda: {"usage": usage},
+        )
+        provider = ClaudeProvider(api_key="test")
+        create = AsyncMock(return_value=message)
+        provider._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+        response = await provider.generate(CONVERSATION, tools=[EchoTool()])
+
+        assert response.content == "Let me check"
+        assert response.tool_calls[0]["function"]["name"] == "echo"
+        assert json.loads(response.tool_calls[0]["function"]["arguments"]) == {
+            "value": 1
+        }
+        assert create.call_args.kwargs["system"][0]["text"] == "You are helpful."
+
+
+class TestCacheTelemetry:
+    """Test cases for reporting prompt cache usage."""
+
+    @pytest.mark.asyncio
+    async def test_cached_tokens_reach_the_monitor(self):
+        """Cache reads and writes are passed to track_llm_result."""
+        llm = BaseLLM()
+        llm.generate = AsyncMock(
+            side_effect=[
+                LLMResponse(
+                    content="",
+                    tool_calls=[
+                        {
+                            "id": "call_0",
+                            "function": {"name": "echo", "arguments": "{}"},
+                        }
+                    ],
+                    raw_response={
+                        "usage": {
+                            "prompt_tokens": 2000,
+                            "completion_tokens": 10,
+                            "prompt_tokens_details": {"cached_tokens": 1024},
+                        }
+                    },
+                ),
+                LLMResponse(
+                    content="done",
+                    raw_response={
+                        "usage": {
+                            "input_tokens": 10,
+                            "output_tokens": 3,
+                            "cache_read_input_tokens": 1800,
+                            "cache_creation_input_tokens": 200,
+                        }
+                    },
+                ),
+            ]
+        )
+        monitor = AsyncMock()
+        agent = Agent(name="a", llm=llm, tools=[EchoTool()], monitor=monitor)
+
+        await agent.run("Use the tool")
+        await agent.flush_monitoring()
+
+        calls = monitor.track_llm_result.call_args_list
+        assert calls[0].kwargs["cached_tokens"] == 1024
+        assert calls[0].kwargs["cache_write_tokens"] is None
+        assert calls[1].kwargs["cached_tokens"] == 1800
+        assert calls[1].kwargs["cache_write_tokens"] == 200
+        assert calls[1].kwargs["input_tokens"] == 2010
+
+    def test_cached_tokens_are_cheaper(self):
+        """Cache reads are billed at the provider's discounted price."""
+        full = estimate_cost("anthropic", "claude-3-haiku-20240307", 1000, 0)
+        cached = estimate_cost(
+            "anthropic", "claude-3-haiku-20240307", 1000, 0, cached_tokens=1000
+        )
+
+        assert cached == pytest.approx(full * 0.1)
@@ -0,0 +1,134 @@
+"""
+Tests for the tool calls of providers that parse them from their responses.
+"""
+
+import functools
+import json
+import httpx
+import pytest
+from types import SimpleNamespace
+from agents_hub.agents.base import Agent
+from agents_hub.llm.providers.google import GeminiProvider
+from agents_hub.llm.providers.ollama import OllamaProvider
+from agents_hub.tools.base import BaseTool
+
+
+class RecordingTool(BaseTool):
+    """Tool that records the parameters of its runs."""
+
+    def __init__(self):
+        super().__init__(
+            name="echo",
+            description="Echo the text",
+            parameters={
+                "type": "object",
+                "properties": {"text": {"type": "string"}},
+            },
+        )
+        self.calls = []
+
+    async def run(self, parameters, context=None):
+        self.calls.append(parameters)
+        return parameters
+
+
+async def run_both_ways(agent):
+    """Run an agent, then stream it, returning each way's tool runs."""
+    tool = agent.tools[0]
+    await agent.run("Echo hi")
+    ran = list(tool.calls)
+    tool.calls.clear()
+    async for _ in agent.run_stream("Echo hi"):
+        pass
+    return ran, tool.calls
+
+
+def gemini_response(*parts):
+    """Build a Gemini response or stream chunk made of the given parts."""
+    return SimpleNamespace(
+        candidates=[
+            SimpleNamespace(
+                content=SimpleNamespace(parts=list(parts)), model_dump=lambda: {}
+            )
+        ]
+    )
+
+
+class TestProviderToolCalls:
+    """Test cases for the tool calls of generate and stream."""
+
+    @pytest.mark.asyncio
+    async def test_ollama_run_and_stream_agree(self, monkeypatch):
+        """Ollama tool calls have the same shape when generated or streamed."""
+        replies = []
+
+        async def handler(request):
+            payload = json.loads(request.content)
+            # Every other call asks for the tool, the next one answers
+            replies.append(len(replies) % 2)
+            if replies[-1] == 0:
+                content = json.dumps({"tool": "echo", "parameters": {"text": "hi"}})
+            else:
+                content = "Done"
+            message = {"role": "assistant", "content": content}
+            if payload["stream"]:
+                lines = [{"message": message}, {"message": {}, "done": True}]
+                return httpx.Response(
+                    200, text="\n".join(json.dumps(line) for line in lines)
+                )
+            return httpx.Response(200, json={"message": message})
+
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            functools.partial(
+                httpx.AsyncClient, transport=httpx.MockTransport(handler)
+            ),
+        )
+        agent = Agent(name="a", llm=OllamaProvider(), tools=[RecordingTool()])
+
+        ran, streamed = await run_both_ways(agent)
+
+        assert ran == streamed == [{"text": "hi"}]
+
+    @pytest.mark.asyncio
+    async def test_gemini_run_and_stream_agree(self):
+        """Gemini tool calls have the same shape when generated or streamed."""
+        llm = GeminiProvider(api_key="test")
+        call = SimpleNamespace(
+            function_call=SimpleNamespace(name="echo", args={"text": "hi"}), text=""
+        )
+        answer = SimpleNamespace(function_call=None, text="Done")
+        replies = []
+
+        async def send_message_async(content, stream=False, **kwargs):
+            replies.append(len(replies) % 2)
+            response = gemini_response(answer if replies[-1] else call)
+            if not stream:
+                return response
+
+            async def chunks():
+                yield response
+
+            return chunks()
+
+        llm._client = SimpleNamespace(
+            start_chat=lambda history: SimpleNamespace(
+                send_message_async=send_message_async
+            )
+        )
+        agent = Agent(name="a", llm=llm, tools=[RecordingTool()])
+
+        ran, streamed = await run_both_ways(agent)
+        response = await llm.generate(
+            [{"role": "user", "content": "Echo hi"}], tools=agent.tools
+        )
+
+        assert ran == streamed == [{"text": "hi"}]
+        assert response.tool_calls == [
+            {
+                "id": "call_0",
+                "type": "function",
+                "function": {"name": "echo", "arguments": '{"text": "hi"}'},
+            }
+        ]
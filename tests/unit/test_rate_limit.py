@@ -0,0 +1,214 @@
+"""
+Tests for client-side rate limiting of LLM providers.
+"""
+
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.providers.openai import OpenAIProvider
+from agents_hub.llm.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    parse_reset,
+)
+
+
+class LimitedLLM(BaseLLM):
+    """LLM that holds its rate limiter while answering."""
+
+    def __init__(self, rate_limiter, error=None):
+        self.rate_limiter = rate_limiter
+        self.error = error
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def generate(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        async with self._rate_limited(self._request_tokens(messages, max_tokens)):
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            if self.error:
+                raise self.error
+        return LLMResponse(content="ok")
+
+    def get_token_count(self, text):
+        return len(text)
+
+
+def status_error(status, headers=None):
+    """Build the error httpx raises for an error status."""
+    request = httpx.Request("POST", "http://llm/api")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_for_refill(self):
+        """Acquiring past the capacity waits for the refill."""
+        bucket = TokenBucket(per_minute=600, capacity=1)
+
+        started_at = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert time.monotonic() - started_at >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_shared(self):
+        """Providers sharing a limiter stay under its concurrency limit."""
+        limiter = RateLimiter(max_concurrency=2, tokens_per_minute=10**6)
+        first, second = LimitedLLM(limiter), LimitedLLM(limiter)
+
+        await asyncio.gather(
+            *(llm.generate(MESSAGES, max_tokens=10) for llm in [first, second] * 3)
+        )
+
+        assert first.peak_in_flight + second.peak_in_flight <= 3
+        assert limiter.stats["requests"] == 6
+        assert limiter.stats["in_flight"] == 0
+        assert limiter.tokens.tokens == pytest.approx(10**6 - 6 * 15, abs=100)
+
+    @pytest.mark.asyncio
+    async def test_backs_off_on_throttling(self):
+        """A 429 halves the concurrency and pauses for retry-after."""
+        limiter = RateLimiter(max_concurrency=8)
+        llm = LimitedLLM(limiter, error=status_error(429, {"retry-after": "0.1"}))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await llm.generate(MESSAGES)
+
+        assert limiter.concurrency_limit == 4
+        assert limiter.stats["throttled"] == 1
+        assert limiter.stats["paused_for"] > 0.05
+
+        llm.error = None
+        started_at = time.monotonic()
+        await llm.generate(MESSAGES)
+        assert time.monotonic() - started_at >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_recovers_additively(self):
+        """Successful requests grow the concurrency limit back."""
+        limiter = RateLimiter(max_concurrency=4)
+        llm = LimitedLLM(limiter, error=status_error(503))
+        with pytest.raises(httpx.HTTPStatusError):
+            await llm.generate(MESSAGES)
+        assert limiter.concurrency_limit == 2
+
+        llm.error = None
+        for _ in range(6):
+            await llm.generate(MESSAGES)
+
+        assert limiter.concurrency_limit == 4
+
+    @pytest.mark.asyncio
+    async def test_burst_of_errors_backs_off_once(self):
+        """Concurrent 429s of one window lower the limit once, later ones again."""
+        limiter = RateLimiter(max_concurrency=8, default_retry_after=0.0)
+        llm = LimitedLLM(limiter, error=status_error(429, {"retry-after": "0"}))
+
+        await asyncio.gather(
+            *(llm.generate(MESSAGES) for _ in range(8)), return_exceptions=True
+        )
+
+        assert limiter.concurrency_limit == 4
+        assert limiter.stats["throttled"] == 8
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await llm.generate(MESSAGES)
+        assert limiter.concurrency_limit == 2
+
+    def test_shared_across_event_loops(self):
+        """A limiter under contention works from successive and concurrent loops."""
+        limiter = RateLimiter(requests_per_minute=6000, max_concurrency=1)
+        limiter.requests.capacity = 1
+
+        async def burst():
+            llm = LimitedLLM(limiter)
+            await asyncio.gather(*(llm.generate(MESSAGES) for _ in range(3)))
+
+        asyncio.run(burst())
+        asyncio.run(burst())
+
+        worker = threading.Thread(target=asyncio.run, args=(burst(),))
+        worker.start()
+        asyncio.run(burst())
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        assert limiter.stats["requests"] == 12
+        assert limiter.stats["in_flight"] == 0
+
+    def test_rate_limit_headers(self):
+        """Exhausted quotas from headers pause until their reset."""
+        limiter = RateLimiter(requests_per_minute=100)
+
+        limiter.update_from_headers(
+            {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "2s"}
+        )
+
+        assert limiter.requests.tokens == 0
+        assert 1.5 < limiter.stats["paused_for"] <= 2.0
+
+    @pytest.mark.asyncio
+    async def test_headers_of_successful_responses(self):
+        """Providers pass the headers of successful responses to the limiter."""
+        completion = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Hi"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        headers = {
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "2s",
+        }
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json=completion, headers=headers)
+        )
+        limiter = RateLimiter(requests_per_minute=100)
+        llm = OpenAIProvider(
+            api_key="test",
+            rate_limiter=limiter,
+            http_client=httpx.AsyncClient(transport=transport),
+        )
+
+        response = await llm.generate(MESSAGES)
+
+        assert response.content == "Hi"
+        assert limiter.requests.tokens == 0
+        assert limiter.stats["paused_for"] > 1.5
+
+    def test_parse_reset(self):
+        """OpenAI durations and RFC 3339 timestamps are understood."""
+        assert parse_reset("6m0s") == 360
+        assert parse_reset("20ms") == pytest.approx(0.02)
+        assert parse_reset("2000-01-01T00:00:00Z") == 0
+        assert parse_reset("soon") is None
+
+    def test_shared_registry(self):
+        """get_rate_limiter returns one limiter per name."""
+        limiter = get_rate_limiter("test-quota", requests_per_minute=10)
+
+        assert get_rate_limiter("test-quota") is limiter
+        assert get_rate_limiter("other-quota") is not limiter
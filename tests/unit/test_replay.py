@@ -0,0 +1,189 @@
+"""
+Tests for recording and replaying LLM calls.
+"""
+
+import asyncio
+import time
+import pytest
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.replay import (
+    RecordingLLM,
+    ReplayLLM,
+    ReplayMissError,
+    load_recording,
+    lognormal_latency,
+    recorded_llm,
+)
+
+TOOL_CALLS = [
+    {
+        "id": "call_0",
+        "type": "function",
+        "function": {"name": "search", "arguments": '{"query": "x"}'},
+    }
+]
+
+
+class ScriptedLLM(BaseLLM):
+    """LLM that numbers its responses and calls tools for tool requests."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def generate(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if tools:
+            return LLMResponse(content="", tool_calls=TOOL_CALLS)
+        return LLMResponse(
+            content=f"answer {self.calls}",
+            raw_response={"usage": {"prompt_tokens": 10}, "id": "resp"},
+        )
+
+    async def get_embedding(self, text):
+        self.calls += 1
+        return [float(len(text)), 0.5, -1.25]
+
+    @property
+    def provider_name(self):
+        return "Scripted"
+
+    @property
+    def model_name(self):
+        return "scripted-1"
+
+
+def ask(text: str):
+    """Build a single user message."""
+    return [{"role": "user", "content": text}]
+
+
+async def record(path: str, latency: float = 0.0) -> ScriptedLLM:
+    """Record a short session into a file."""
+    scripted = ScriptedLLM(latency)
+    async with RecordingLLM(scripted, path) as llm:
+        await llm.generate(ask("hello"))
+        await llm.generate(ask("hello"))
+        await llm.generate(ask("search"), tools=[{"name": "search"}])
+        await llm.get_embeddings(["a", "bcd"])
+    return scripted
+
+
+class TestReplay:
+    """Test cases for RecordingLLM and ReplayLLM."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        """Responses, tool calls and embeddings replay as recorded, in order."""
+        path = str(tmp_path / "session.jsonl.gz")
+        await record(path)
+
+        replay = ReplayLLM(path, latency=0.0)
+
+        assert (await replay.generate(ask("hello"))).content == "answer 1"
+        assert (await replay.generate(ask("hello"))).content == "answer 2"
+        assert (await replay.generate(ask("hello"))).content == "answer 1"
+        response = await replay.generate(ask("search"), tools=[{"name": "search"}])
+        assert response.tool_calls == TOOL_CALLS
+        assert await replay.get_embeddings(["bcd", "a"]) == [
+            [3.0, 0.5, -1.25],
+            [1.0, 0.5, -1.25],
+        ]
+        assert replay.model_name == "scripted-1"
+        assert replay.stats["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_raw_responses_are_trimmed(self, tmp_path):
+        """Only the usage fields of raw responses are kept by default."""
+        path = str(tmp_path / "session.jsonl")
+        await record(path)
+
+        generations = [r for r in load_recording(path) if r["kind"] == "generate"]
+
+        assert generations[0]["response"]["raw_response"] == {
+            "usage": {"prompt_tokens": 10}
+        }
+
+    @pytest.mark.asyncio
+    async def test_misses(self, tmp_path):
+        """Unknown requests raise in strict mode, or get defaults otherwise."""
+        path = str(tmp_path / "session.jsonl")
+        await record(path)
+
+        with pytest.raises(ReplayMissError):
+            await ReplayLLM(path).generate(ask("unknown"))
+
+        lenient = ReplayLLM(path, strict=False, default_response="n/a")
+        assert (await lenient.generate(ask("unknown"))).content == "n/a"
+        first = await lenient.get_embedding("unknown")
+        assert first == await lenient.get_embedding("unknown")
+        assert len(first) == 3
+
+    @pytest.mark.asyncio
+    async def test_prompt_fallback(self, tmp_path):
+        """A request whose context changed is matched by its last message."""
+        path = str(tmp_path / "session.jsonl")
+        await record(path)
+        replay = ReplayLLM(path, latency=0.0)
+
+        messages = [{"role": "system", "content": "Today is 2030-01-01"}]
+        response = await replay.generate(messages + ask("hello"))
+
+        assert response.content == "answer 1"
+        assert replay.stats["fallback_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_latency(self, tmp_path):
+        """Recorded latencies are replayed, and can be scaled or synthesized."""
+        path = str(tmp_path / "session.jsonl")
+        await record(path, latency=0.05)
+
+        started_at = time.perf_counter()
+        await ReplayLLM(path).generate(ask("hello"))
+        assert time.perf_counter() - started_at >= 0.04
+
+        started_at = time.perf_counter()
+        await ReplayLLM(path, latency_scale=0).generate(ask("hello"))
+        assert time.perf_counter() - started_at < 0.04
+
+        first, second = lognormal_latency(0.1, seed=1), lognormal_latency(0.1, seed=1)
+        latencies = [first({}) for _ in range(1000)]
+        assert latencies[:5] == [second({}) for _ in range(5)]
+        assert 0.08 < sorted(latencies)[500] < 0.12
+
+    @pytest.mark.asyncio
+    async def test_stream_replay(self, tmp_path):
+        """A recorded stream replays in chunks and as a generation."""
+        path = str(tmp_path / "session.jsonl")
+        async with RecordingLLM(ScriptedLLM(), path) as llm:
+            chunks = [chunk async for chunk in llm.stream(ask("story"))]
+        assert chunks[-1].done
+
+        replay = ReplayLLM(path, stream_chunk_size=3, latency=0.0)
+        replayed = [chunk async for chunk in replay.stream(ask("story"))]
+
+        assert "".join(chunk.content for chunk in replayed) == "answer 1"
+        assert len(replayed) == 4 and replayed[-1].done
+        assert (await replay.generate(ask("story"))).content == "answer 1"
+
+    @pytest.mark.asyncio
+    async def test_recorded_llm_modes(self, tmp_path):
+        """The mode selects the live, recording or replay LLM."""
+        directory = str(tmp_path)
+
+        live = recorded_llm("llm", ScriptedLLM, mode="live", directory=directory)
+        recording = recorded_llm("llm", ScriptedLLM, mode="record", directory=directory)
+        await recording.generate(ask("hello"))
+        recording.close()
+
+        def unavailable():
+            raise AssertionError("The live LLM must not be created in replay mode")
+
+        replay = recorded_llm("llm", unavailable, mode="replay", directory=directory)
+
+        assert isinstance(live, ScriptedLLM)
+        assert isinstance(recording, RecordingLLM)
+        assert (await replay.generate(ask("hello"))).content == "answer 1"
@@ -0,0 +1,204 @@
+"""
+Tests for retries and circuit breaking of LLM calls.
+"""
+
+import asyncio
+import gc
+import weakref
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientLLM,
+    RetryBudget,
+    is_retryable,
+)
+
+
+class StatusError(Exception):
+    """Provider error with a status code and headers."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+class FlakyLLM(BaseLLM):
+    """LLM that raises the scripted errors before answering."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def generate(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return LLMResponse(content="ok")
+
+    async def stream(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        yield LLMStreamChunk(content="o")
+        yield LLMStreamChunk(content="k", done=True)
+
+    @property
+    def provider_name(self):
+        return "Flaky"
+
+
+def resilient(llm, **kwargs):
+    """Wrap an LLM without backoff delays and with a private breaker."""
+    kwargs.setdefault("circuit_breaker", CircuitBreaker(name="test"))
+    return ResilientLLM(llm, base_delay=0.0, **kwargs)
+
+
+class TestErrorClassification:
+    """Test cases for is_retryable."""
+
+    def test_classification(self):
+        """Overload, rate limit and network errors are retryable."""
+        assert is_retryable(StatusError(429))
+        assert is_retryable(StatusError(503))
+        assert is_retryable(asyncio.TimeoutError())
+        assert is_retryable(ConnectionResetError())
+        assert not is_retryable(StatusError(400))
+        assert not is_retryable(StatusError(401))
+        assert not is_retryable(ValueError("bad input"))
+        assert not is_retryable(CircuitOpenError("x", 1.0))
+
+
+class TestResilientLLM:
+    """Test cases for ResilientLLM."""
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_errors(self):
+        """Transient errors are retried until the call succeeds."""
+        llm = resilient(FlakyLLM([StatusError(503), StatusError(429)]))
+
+        response = await llm.generate([{"role": "user", "content": "hi"}])
+
+        assert response.content == "ok"
+        assert llm.llm.calls == 3
+        assert llm.stats["retries"] == 2
+        assert llm.stats["circuit"]["consecutive_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fatal_errors_are_not_retried(self):
+        """Client errors are raised on the first attempt."""
+        llm = resilient(FlakyLLM([StatusError(400)]))
+
+        with pytest.raises(StatusError):
+            await llm.generate([])
+
+        assert llm.llm.calls == 1
+        assert llm.stats["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self):
+        """A call gives up after max_retries or when the budget runs out."""
+        llm = resilient(FlakyLLM([StatusError(500)] * 10), max_retries=2)
+        with pytest.raises(StatusError):
+            await llm.generate([])
+        assert llm.llm.calls == 3
+        assert llm.stats["retries_exhausted"] == 1
+
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, window=10.0)
+        llm = resilient(FlakyLLM([StatusError(500)] * 10), retry_budget=budget)
+        with pytest.raises(StatusError):
+            await llm.generate([])
+        assert llm.llm.calls == 2
+        assert llm.stats["budget_exhausted"] == 1
+
+    def test_backoff_honours_retry_after(self):
+        """The delay grows exponentially and respects retry-after."""
+        llm = ResilientLLM(FlakyLLM([]), base_delay=1.0, max_delay=8.0)
+
+        assert all(0 <= llm.backoff(attempt) <= 8.0 for attempt in range(10))
+        assert llm.backoff(0, StatusError(429, {"retry-after": "3"})) >= 3.0
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_probes(self):
+        """The breaker opens after repeated failures and closes after a probe."""
+        breaker = CircuitBreaker(
+            name="test", failure_threshold=2, recovery_timeout=0.05
+        )
+        monitor = AsyncMock()
+        llm = resilient(
+            FlakyLLM([StatusError(503)] * 2),
+            max_retries=0,
+            circuit_breaker=breaker,
+            monitor=monitor,
+        )
+
+        for _ in range(2):
+            with pytest.raises(StatusError):
+                await llm.generate([])
+        with pytest.raises(CircuitOpenError):
+            await llm.generate([])
+        assert llm.llm.calls == 2
+        assert breaker.state == "open"
+
+        await asyncio.sleep(0.06)
+        assert breaker.state == "half_open"
+        assert (await llm.generate([])).content == "ok"
+        assert breaker.state == "closed"
+
+        await asyncio.sleep(0)
+        states = [
+            call.kwargs["data"]["state"]
+            for call in monitor.track_event.call_args_list
+            if call.kwargs["data"]["event"] == "circuit_breaker"
+        ]
+        assert states == ["open", "half_open", "closed"]
+        assert llm.stats["rejected"] == 1
+        assert llm.stats["circuit"]["opened"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_breaker_reports_once(self):
+        """Wrappers sharing a breaker and a monitor report each change once."""
+        breaker = CircuitBreaker(name="shared", failure_threshold=1)
+        monitor = AsyncMock()
+        first = resilient(FlakyLLM([]), circuit_breaker=breaker, monitor=monitor)
+        second = resilient(FlakyLLM([]), circuit_breaker=breaker, monitor=monitor)
+        wrapper = weakref.ref(second)
+
+        breaker.record_failure()
+        await asyncio.sleep(0)
+
+        assert monitor.track_event.call_count == 1
+        assert monitor.track_event.call_args.kwargs["data"]["state"] == "open"
+        del second
+        gc.collect()
+        assert wrapper() is None
+        assert first.circuit_breaker is breaker
+
+    def test_half_open_allows_limited_probes(self):
+        """Only half_open_max_calls probes are let through at once."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+        breaker.record_failure()
+
+        breaker.acquire()
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+        breaker.record_failure()
+        assert breaker._state == "open"
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_before_first_chunk(self):
+        """A stream that fails to start is retried."""
+        llm = resilient(FlakyLLM([StatusError(502)]))
+
+        chunks = [chunk async for chunk in llm.stream([])]
+
+        assert "".join(chunk.content for chunk in chunks) == "ok"
+        assert llm.llm.calls == 2
@@ -0,0 +1,120 @@
+"""
+Tests for the semantic LLM response cache.
+"""
+
+import pytest
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.cache import SemanticCachedLLM
+
+# Paraphrases share a direction; unrelated questions are orthogonal
+VECTORS = {
+    "How do I reset my password?": [1.0, 0.0, 0.0],
+    "How can I reset my password?": [0.98, 0.2, 0.0],
+    "What are your opening hours?": [0.0, 0.0, 1.0],
+}
+
+
+class FAQLLM(BaseLLM):
+    """LLM that numbers its answers and embeds from a fixed table."""
+
+    def __init__(self, answers=None):
+        self.calls = 0
+        self.answers = answers
+
+    async def generate(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        if self.answers:
+            return LLMResponse(content=self.answers.pop(0))
+        return LLMResponse(content=f"answer {self.calls}")
+
+    async def get_embedding(self, text):
+        return VECTORS.get(text, [0.0, 1.0, 0.0])
+
+    @property
+    def provider_name(self):
+        return "Test"
+
+    @property
+    def model_name(self):
+        return "test-model"
+
+
+def ask(question, system="You are a support agent."):
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": question},
+    ]
+
+
+class TestSemanticCachedLLM:
+    """Test cases for SemanticCachedLLM."""
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_hits_the_cache(self):
+        """A similar enough question gets the cached answer."""
+        llm = FAQLLM()
+        cached = SemanticCachedLLM(llm, similarity_threshold=0.95)
+
+        first = await cached.generate(ask("How do I reset my password?"))
+        second = await cached.generate(ask("How can I reset my password?"))
+        third = await cached.generate(ask("What are your opening hours?"))
+
+        assert first.content == second.content == "answer 1"
+        assert third.content == "answer 2"
+        assert second.cached and not first.cached and not third.cached
+        stats = cached.stats
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["similarity"]["histogram"]["0.95"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scopes_and_history(self):
+        """Other system prompts and multi-turn requests are not answered."""
+        llm = FAQLLM()
+        cached = SemanticCachedLLM(llm)
+
+        await cached.generate(ask("How do I reset my password?"))
+        await cached.generate(ask("How do I reset my password?", system="Other"))
+        await cached.generate(
+            [
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello"},
+                {"role": "user", "content": "How do I reset my password?"},
+            ]
+        )
+
+        assert llm.calls == 3
+        assert cached.stats["bypassed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_are_lru_bounded(self):
+        """The least recently used prompt is evicted when a scope is full."""
+        llm = FAQLLM()
+        cached = SemanticCachedLLM(llm, max_entries=1)
+
+        await cached.generate(ask("How do I reset my password?"))
+        await cached.generate(ask("What are your opening hours?"))
+        await cached.generate(ask("How do I reset my password?"))
+
+        assert llm.calls == 3
+        assert cached.stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_audits_sample_false_hits(self):
+        """Audited hits whose fresh answer differs are counted as false hits."""
+        llm = FAQLLM(answers=["How do I reset my password?", "Something else"])
+        cached = SemanticCachedLLM(llm, similarity_threshold=0.95, audit_rate=1.0)
+
+        await cached.generate(ask("How do I reset my password?"))
+        await cached.generate(ask("How can I reset my password?"))
+        await cached.wait_for_audits()
+
+        stats = cached.stats
+        assert stats["audited"] == 1
+        assert stats["false_hits"] == 1
+        assert stats["false_hit_rate"] == 1.0
+        sample = cached.samples[0]
+        assert sample["cached_prompt"] == "How do I reset my password?"
+        assert sample["fresh_response"] == "Something else"
@@ -0,0 +1,135 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import asyncio
+import pytest
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.single_flight import SingleFlightLLM
+
+
+class SlowLLM(BaseLLM):
+    """LLM that counts its calls and answers after a short delay."""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.calls = 0
+        self.embedding_calls = 0
+
+    async def generate(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self.error:
+            raise self.error
+        return LLMResponse(content=messages[-1]["content"].upper())
+
+    async def get_embedding(self, text):
+        self.embedding_calls += 1
+        await asyncio.sleep(0.02)
+        return [float(len(text))]
+
+    @property
+    def provider_name(self):
+        return "Slow"
+
+    @property
+    def model_name(self):
+        return "slow-1"
+
+
+def ask(content):
+    """Build a single user message."""
+    return [{"role": "user", "content": content}]
+
+
+class TestSingleFlightLLM:
+    """Test cases for SingleFlightLLM."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(self):
+        """Concurrent identical requests make one upstream call."""
+        inner = SlowLLM()
+        llm = SingleFlightLLM(inner)
+
+        responses = await asyncio.gather(
+            *(llm.generate(ask("hello")) for _ in range(5)),
+            llm.generate(ask("other")),
+        )
+
+        assert inner.calls == 2
+        assert [response.content for response in responses[:5]] == ["HELLO"] * 5
+        assert responses[0] is not responses[1]
+        assert llm.stats["collapsed"] == 4
+        assert llm.stats["upstream_calls"] == 2
+        assert llm.stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_completed_requests_are_not_reused(self):
+        """Sequential requests each make their own call."""
+        inner = SlowLLM()
+        llm = SingleFlightLLM(inner)
+
+        await llm.generate(ask("hello"))
+        await llm.generate(ask("hello"))
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_the_exception(self):
+        """Every caller of a failed call gets its exception."""
+        inner = SlowLLM(error=RuntimeError("overloaded"))
+        llm = SingleFlightLLM(inner)
+
+        results = await asyncio.gather(
+            *(llm.generate(ask("hello")) for _ in range(3)), return_exceptions=True
+        )
+
+        assert inner.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """The call continues while any caller still waits for it."""
+        inner = SlowLLM()
+        llm = SingleFlightLLM(inner)
+
+        first = asyncio.ensure_future(llm.generate(ask("hello")))
+        second = asyncio.ensure_future(llm.generate(ask("hello")))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).content == "HELLO"
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_opt_out_and_temperature_policy(self):
+        """Opted-out and sampled requests are not coalesced."""
+        inner = SlowLLM()
+        llm = SingleFlightLLM(inner, max_temperature=0.0)
+
+        await asyncio.gather(
+            llm.generate(ask("hello"), temperature=0, single_flight=False),
+            llm.generate(ask("hello"), temperature=0),
+            llm.generate(ask("hello"), temperature=0.7),
+        )
+
+        assert inner.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_embeddings_are_coalesced(self):
+        """Identical embedding requests share one call."""
+        inner = SlowLLM()
+        llm = SingleFlightLLM(inner)
+
+        vectors = await asyncio.gather(*(llm.get_embedding("text") for _ in range(4)))
+        batches = await asyncio.gather(
+            llm.get_embeddings(["a", "bb"]), llm.get_embeddings(["a", "bb"])
+        )
+
+        assert vectors == [[4.0]] * 4
+        assert batches[0] == batches[1] == [[1.0], [2.0]]
+        assert inner.embedding_calls == 3
+        assert llm.stats["operations"]["get_embedding"] == {"calls": 4, "collapsed": 3}
+        assert llm.stats["operations"]["get_embeddings"]["collapsed"] == 1
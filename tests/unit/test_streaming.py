@@ -0,0 +1,150 @@
+"""
+Tests for the streaming API of LLM providers and agents.
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse, LLMStreamChunk
+from agents_hub.llm.providers.openai import OpenAIProvider
+from agents_hub.memory.backends.in_memory import InMemoryMemory
+from agents_hub.tools.base import BaseTool
+
+
+class ScriptedStreamLLM(BaseLLM):
+    """LLM that streams a scripted sequence of rounds."""
+
+    def __init__(self, rounds):
+        self.rounds = list(rounds)
+        self.calls = []
+
+    async def stream(
+        self, messages, tools=None, temperature=0.7, max_tokens=1000, **kwargs
+    ):
+        self.calls.append({"messages": list(messages), "tools": tools})
+        text, tool_calls = self.rounds.pop(0)
+        for word in text.split(" "):
+            yield LLMStreamChunk(content=word + " ")
+        yield LLMStreamChunk(tool_calls=tool_calls, done=True)
+
+
+class EchoTool(BaseTool):
+    """Tool that echoes its input."""
+
+    def __init__(self):
+        super().__init__(
+            name="echo",
+            description="Echo the input",
+            parameters={"type": "object", "properties": {}},
+        )
+
+    async def run(self, parameters, context=None):
+        return {"echo": parameters.get("value")}
+
+
+async def collect(iterator):
+    """Collect all items from an async iterator."""
+    return [item async for item in iterator]
+
+
+class TestStreaming:
+    """Test cases for streaming."""
+
+    @pytest.mark.asyncio
+    async def test_base_stream_falls_back_to_generate(self):
+        """Providers without native streaming yield one final chunk."""
+        llm = BaseLLM()
+        llm.generate = AsyncMock(return_value=LLMResponse(content="hello"))
+
+        chunks = await collect(llm.stream(messages=[]))
+
+        assert len(chunks) == 1
+        assert chunks[0].content == "hello"
+        assert chunks[0].done is True
+
+    @pytest.mark.asyncio
+    async def test_run_stream_yields_tokens_and_writes_memory(self):
+        """Streamed text should be saved to memory once complete."""
+        memory = InMemoryMemory()
+        llm = ScriptedStreamLLM([("Hello there", None)])
+        agent = Agent(name="tester", llm=llm, memory=memory)
+
+        parts = await collect(agent.run_stream("Hi", context={"conversation_id": "c1"}))
+
+        assert parts == ["Hello ", "there "]
+        history = await memory.get_history("c1")
+        assert history[0]["assistant_message"] == "Hello there "
+
+    @pytest.mark.asyncio
+    async def test_run_stream_executes_tool_calls(self):
+        """Tool calls from the stream are run before the follow-up round."""
+        tool_call = {
+            "id": "call_0",
+            "type": "function",
+            "function": {"name": "echo", "arguments": json.dumps({"value": "x"})},
+        }
+        llm = ScriptedStreamLLM([("", [tool_call]), ("Echoed x", None)])
+        agent = Agent(name="tester", llm=llm, tools=[EchoTool()])
+
+        parts = await collect(agent.run_stream("Echo x"))
+
+        assert "".join(parts).strip() == "Echoed x"
+        follow_up = llm.calls[1]
+        assert follow_up["tools"] is not None
+        assert follow_up["messages"][-1]["role"] == "tool"
+
+    @pytest.mark.asyncio
+    async def test_run_stream_stops_offering_tools_after_max_rounds(self):
+        """The follow-up round has no tools once max_tool_rounds is reached."""
+        tool_call = {
+            "id": "call_0",
+            "type": "function",
+            "function": {"name": "echo", "arguments": json.dumps({"value": "x"})},
+        }
+        llm = ScriptedStreamLLM([("", [tool_call]), ("Echoed x", None)])
+        agent = Agent(name="tester", llm=llm, tools=[EchoTool()], max_tool_rounds=1)
+
+        await collect(agent.run_stream("Echo x"))
+
+        assert llm.calls[1]["tools"] is None
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_assembles_tool_call_deltas(self):
+        """Fragmented tool call deltas are assembled into complete calls."""
+
+        def delta_chunk(content=None, tool_calls=None, finish_reason=None):
+            delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+            choice = SimpleNamespace(delta=delta, finish_reason=finish_reason)
+            return SimpleNamespace(choices=[choice])
+
+        def tool_delta(index, id=None, name=None, arguments=None):
+            function = SimpleNamespace(name=name, arguments=arguments)
+            return SimpleNamespace(index=index, id=id, function=function)
+
+        async def fake_stream():
+            yield delta_chunk(content="Let me check")
+            yield delta_chunk(tool_calls=[tool_delta(0, id="call_a", name="echo")])
+            yield delta_chunk(tool_calls=[tool_delta(0, arguments='{"value"')])
+            yield delta_chunk(tool_calls=[tool_delta(0, arguments=': "x"}')])
+            yield delta_chunk(finish_reason="tool_calls")
+
+        provider = OpenAIProvider(api_key="test")
+        provider._client = SimpleNamespace(
+            chat=SimpleNamespace(
+                completions=SimpleNamespace(
+                    create=AsyncMock(return_value=fake_stream())
+                )
+            )
+        )
+
+        chunks = await collect(provider.stream(messages=[]))
+
+        assert chunks[0].content == "Let me check"
+        final = chunks[-1]
+        assert final.done is True
+        assert final.tool_calls[0]["id"] == "call_a"
+        assert json.loads(final.tool_calls[0]["function"]["arguments"]) == {
+            "value": "x"
+        }
@@ -0,0 +1,217 @@
+"""
+Tests for native structured output.
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest.mock import AsyncMock, Mock
+from pydantic import BaseModel
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.llm.cache.responses import request_key
+from agents_hub.llm.providers.anthropic import ClaudeProvider
+from agents_hub.llm.providers.ollama import OllamaProvider
+from agents_hub.llm.providers.openai import OpenAIProvider
+from agents_hub.llm.structured import gemini_response_schema, openai_response_format
+from agents_hub.orchestration.router import AgentWorkforce
+from agents_hub.tools.base import BaseTool
+
+
+class Step(BaseModel):
+    title: str
+    minutes: Optional[int] = None
+
+
+class Recipe(BaseModel):
+    name: str
+    steps: List[Step]
+
+
+STRICT_SCHEMA = {
+    "type": "object",
+    "properties": {"answer": {"type": "string"}},
+    "required": ["answer"],
+    "additionalProperties": False,
+}
+
+
+class EchoTool(BaseTool):
+    """Tool that echoes its arguments."""
+
+    def __init__(self):
+        super().__init__(
+            name="echo",
+            description="Echo the arguments",
+            parameters={"type": "object", "properties": {}},
+        )
+
+    async def run(self, parameters, context=None):
+        return parameters
+
+
+def ask(text: str):
+    """Build a single user message."""
+    return [{"role": "user", "content": text}]
+
+
+class TestSchemaTranslation:
+    """Test cases for translating response schemas to provider formats."""
+
+    def test_openai_response_format(self):
+        """Strict mode is only requested for schemas that satisfy it."""
+        strict = openai_response_format(STRICT_SCHEMA)
+        model = openai_response_format(Recipe)
+
+        assert strict["type"] == "json_schema"
+        assert strict["json_schema"]["strict"] is True
+        assert model["json_schema"]["name"] == "Recipe"
+        assert model["json_schema"]["strict"] is False
+        assert openai_response_format({"type": "object"}) == {"type": "json_object"}
+
+    def test_gemini_response_schema(self):
+        """References are inlined and unsupported keywords are removed."""
+        schema = gemini_response_schema(Recipe)
+        step = schema["properties"]["steps"]["items"]
+
+        assert "$defs" not in schema and "title" not in schema
+        assert set(step["properties"]) == {"title", "minutes"}
+        assert "title" not in step["properties"]["title"]
+        assert gemini_response_schema({"type": "object"}) is None
+
+    def test_cache_key_follows_the_schema(self):
+        """A pydantic model is keyed by its JSON Schema."""
+        key = request_key("m", ask("hi"), None, 0.7, 100, response_schema=Recipe)
+
+        assert key == request_key(
+            "m", ask("hi"), None, 0.7, 100, response_schema=Recipe.model_json_schema()
+        )
+        assert key != request_key("m", ask("hi"), None, 0.7, 100)
+
+
+class TestProviders:
+    """Test cases for the structured output of each provider."""
+
+    @pytest.mark.asyncio
+    async def test_openai_sends_response_format(self):
+        """The schema is sent as the response format, not as an API parameter."""
+        provider = OpenAIProvider(api_key="test")
+        message = SimpleNamespace(content='{"answer": "42"}', tool_calls=None)
+        create = AsyncMock(
+            return_value=SimpleNamespace(
+                choices=[SimpleNamespace(message=message)], model_dump=lambda: {}
+            )
+        )
+        provider._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        response = await provider.generate(ask("?"), response_schema=STRICT_SCHEMA)
+
+        assert json.loads(response.content) == {"answer": "42"}
+        assert "response_schema" not in create.call_args.kwargs
+        assert create.call_args.kwargs["response_format"]["json_schema"]["strict"]
+
+    def test_ollama_format(self):
+        """The schema is the format of the response, unless tools are offered."""
+        llm = OllamaProvider()
+
+        def payload(schema, tools=None):
+            return llm._build_payload(
+                ask("?"), tools, 0.7, 100, False, response_schema=schema
+            )
+
+        assert payload(STRICT_SCHEMA)["format"] == STRICT_SCHEMA
+        assert payload({"type": "object"})["format"] == "json"
+        assert "format" not in payload(STRICT_SCHEMA, [EchoTool()])
+        assert "response_schema" not in payload(STRICT_SCHEMA)["options"]
+
+    @pytest.mark.asyncio
+    async def test_claude_forces_the_response_tool(self):
+        """The input of the forced response tool becomes the JSON content."""
+        provider = ClaudeProvider(api_key="test")
+        message = SimpleNamespace(
+            content=[
+                SimpleNamespace(
+                    type="tool_use",
+                    id="toolu_1",
+                    name=ClaudeProvider.RESPONSE_TOOL,
+                    input={"answer": "42"},
+                )
+            ],
+            model_dump=lambda: {},
+        )
+        create = AsyncMock(return_value=message)
+        provider._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+        response = await provider.generate(ask("?"), response_schema=STRICT_SCHEMA)
+        request = create.call_args.kwargs
+
+        assert json.loads(response.content) == {"answer": "42"}
+        assert response.tool_calls is None
+        assert request["tool_choice"] == {
+            "type": "tool",
+            "name": ClaudeProvider.RESPONSE_TOOL,
+        }
+        assert request["tools"][-1]["input_schema"] == STRICT_SCHEMA
+
+        with_tools = provider._format_request(ask("?"), [EchoTool()], STRICT_SCHEMA)
+        assert with_tools["tool_choice"] == {"type": "any"}
+        assert [tool["name"] for tool in with_tools["tools"]] == [
+            "echo",
+            ClaudeProvider.RESPONSE_TOOL,
+        ]
+
+
+class TestStructuredRuns:
+    """Test cases for requesting structured output from agents and workforces."""
+
+    @pytest.mark.asyncio
+    async def test_agent_passes_the_schema(self):
+        """The schema in the context reaches the LLM, and nothing otherwise."""
+        llm = BaseLLM()
+        llm.generate = AsyncMock(return_value=LLMResponse(content="{}"))
+        agent = Agent(name="a", llm=llm)
+
+        await agent.run("Plain")
+        await agent.run("Structured", {"response_schema": Recipe})
+
+        plain, structured = llm.generate.call_args_list
+        assert "response_schema" not in plain.kwargs
+        assert structured.kwargs["response_schema"] is Recipe
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_plan_schema(self):
+        """The orchestrator answers with the plan schema, parsed as plain JSON."""
+        agents = []
+        for name in ("researcher", "writer"):
+            agent = Mock()
+            agent.config.name = name
+            agent.config.description = f"The {name}"
+            agent.config.system_prompt = f"You are the {name}"
+            agent.run = AsyncMock(return_value=f"{name} result")
+            agent.tools = []
+            agents.append(agent)
+        plan = {
+            "subtasks": [
+                {"description": "Write", "agent": "writer", "order": 2},
+                {"description": "Research", "agent": "researcher", "order": 1},
+            ]
+        }
+        orchestrator = Mock()
+        orchestrator.run = AsyncMock(return_value=json.dumps(plan))
+        workforce = AgentWorkforce(agents=agents, orchestrator_agent=orchestrator)
+
+        result = await workforce.execute("Write a report", {"user_id": "u"})
+
+        planning, summary = orchestrator.run.call_args_list
+        context = planning.args[1]
+        schema = context["response_schema"]
+        assert context["user_id"] == "u"
+        assert openai_response_format(schema)["json_schema"]["strict"] is True
+        agent_schema = schema["properties"]["subtasks"]["items"]["properties"]["agent"]
+        assert agent_schema["enum"] == ["researcher", "writer"]
+        assert [s["agent"] for s in result["subtasks"]] == ["researcher", "writer"]
+        assert "response_schema" not in agents[0].run.call_args.args[1]
+        assert "response_schema" not in summary.args[1]
@@ -0,0 +1,159 @@
+"""
+Tests for the token counting service.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from agents_hub.agents.base import Agent
+from agents_hub.llm import tokens
+from agents_hub.llm.base import LLMResponse
+from agents_hub.llm.providers.ollama import OllamaProvider
+from agents_hub.llm.tokens import TokenCounter, model_family
+from agents_hub.monitoring.utils import count_tokens, count_tokens_for_messages
+
+
+class FakeEncoding:
+    """Encoding that splits on whitespace."""
+
+    name = "fake_base"
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+
+class TestTokenCounter:
+    """Test cases for TokenCounter."""
+
+    def test_model_family(self):
+        """Models map to their tokenizer family by name, then by provider."""
+        assert model_family("gpt-4o-mini") == "openai"
+        assert model_family("claude-3-opus-20240229") == "anthropic"
+        assert model_family("gemini-1.5-pro") == "gemini"
+        assert model_family("llama3", "Ollama") == "llama"
+        assert model_family("llama3") == "default"
+
+    def test_encoders_are_loaded_once(self):
+        """The tiktoken encoder is loaded once per model and reused."""
+        fake_tiktoken = MagicMock()
+        fake_tiktoken.encoding_for_model.return_value = FakeEncoding()
+        counter = TokenCounter()
+
+        with (
+            patch.object(tokens, "tiktoken", fake_tiktoken),
+            patch.object(tokens, "TIKTOKEN_AVAILABLE", True),
+        ):
+            assert counter.count("one two three", "gpt-4o") == 3
+            assert counter.count("four five", "gpt-4o") == 2
+
+        fake_tiktoken.encoding_for_model.assert_called_once_with("gpt-4o")
+
+    def test_failed_encoder_falls_back_to_estimate(self):
+        """An encoding that cannot be loaded is not retried on every call."""
+        fake_tiktoken = MagicMock()
+        fake_tiktoken.encoding_for_model.side_effect = ConnectionError("offline")
+        counter = TokenCounter()
+
+        with (
+            patch.object(tokens, "tiktoken", fake_tiktoken),
+            patch.object(tokens, "TIKTOKEN_AVAILABLE", True),
+        ):
+            first = counter.count("a" * 40, "gpt-4")
+            second = counter.count("b" * 40, "gpt-4")
+
+        assert first == second == 10
+        assert fake_tiktoken.encoding_for_model.call_count == 1
+
+    def test_counts_are_memoized(self):
+        """Recounting the same text for the same family is a cache hit."""
+        counter = TokenCounter()
+
+        counter.count("hello world", "claude-3-haiku")
+        counter.count("hello world", "claude-3-opus")
+        counter.count("hello world", "gemini-1.5-pro")
+
+        assert counter.stats["hits"] == 1
+        assert counter.stats["misses"] == 2
+
+    def test_estimates_per_family(self):
+        """Estimates use the family ratio and count non-ASCII characters."""
+        counter = TokenCounter()
+
+        assert counter.count("a" * 35, "claude-3-haiku") == 10
+        assert counter.count("a" * 38, "llama3", "Ollama") == 10
+        assert counter.count("你好", "gemini-1.5-pro") == 2
+        assert counter.count("", "gemini-1.5-pro") == 0
+
+    def test_calibrate(self):
+        """Calibration moves the ratio towards the reported counts."""
+        counter = TokenCounter()
+
+        counter.calibrate("anthropic", "a" * 300, actual_tokens=100, weight=0.5)
+
+        assert counter.chars_per_token["anthropic"] == 3.25
+
+    def test_calibrate_messages(self):
+        """Reported prompt tokens calibrate the estimate, minus the framing."""
+        counter = TokenCounter()
+        messages = [{"role": "user", "content": "a" * 296}]
+
+        # 300 characters, 3 reply priming and 4 framing tokens
+        counter.calibrate_messages(
+            messages, "llama3", "Ollama", actual_tokens=157, weight=0.5
+        )
+
+        assert counter.chars_per_token["llama"] == 2.9
+
+    def test_calibrate_messages_skips_exact_counts(self):
+        """Models counted with tiktoken are not calibrated."""
+        counter = TokenCounter()
+        counter._encoders["gpt-4o"] = FakeEncoding()
+
+        counter.calibrate_messages(
+            [{"role": "user", "content": "hi"}], "gpt-4o", None, actual_tokens=100
+        )
+
+        assert counter.chars_per_token == tokens.CHARS_PER_TOKEN
+
+    @pytest.mark.asyncio
+    async def test_agents_calibrate_with_reported_usage(self):
+        """Agents feed the prompt tokens providers report to the counter."""
+        counter = TokenCounter()
+        llm = MagicMock(spec=OllamaProvider, model="llama3", provider_name="Ollama")
+        llm.generate = AsyncMock(
+            return_value=LLMResponse(
+                content="ok", raw_response={"prompt_eval_count": 500}
+            )
+        )
+        agent = Agent(name="a", llm=llm, system_prompt="", monitor=None)
+
+        with patch("agents_hub.agents.base.get_token_counter", return_value=counter):
+            await agent.run("hello")
+
+        assert counter.chars_per_token["llama"] < tokens.CHARS_PER_TOKEN["llama"]
+
+    def test_count_messages(self):
+        """Message lists count framing tokens and multi-part content."""
+        counter = TokenCounter()
+        messages = [
+            {"role": "system", "content": "a" * 36},
+            {
+                "role": "user",
+                "content": [{"type": "text", "text": "a" * 32}],
+                "name": "bob",
+            },
+        ]
+
+        # 2 messages * 4 framing + 3 reply priming, 9 + 8 content tokens,
+        # 4 role tokens (2 + 2), 1 name token plus 1 for the name field
+        assert counter.count_messages(messages, "llama3", "Ollama") == 36
+        assert counter.count_messages([], "llama3") == 0
+
+    def test_monitoring_helpers_use_the_shared_counter(self):
+        """The monitoring helpers keep their return shapes."""
+        # Agents in other tests calibrate the process-wide counter
+        with patch.object(tokens, "_TOKEN_COUNTER", TokenCounter()):
+            assert count_tokens("a" * 40, "llama3") == 10
+            result = count_tokens_for_messages(
+                [{"role": "user", "content": "hi"}], "x"
+            )
+        assert result == {"input_tokens": 9}
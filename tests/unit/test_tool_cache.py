@@ -0,0 +1,221 @@
+"""
+Tests for the tool result cache.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock
+from agents_hub.agents.base import Agent
+from agents_hub.llm.base import BaseLLM, LLMResponse
+from agents_hub.tools.base import BaseTool
+from agents_hub.cache import InMemoryCacheBackend, DiskCacheBackend
+from agents_hub.tools.cache import ToolResultCache
+
+
+class CountingTool(BaseTool):
+    """Tool that counts its runs and supports a write operation."""
+
+    def __init__(self, name: str = "lookup", cacheable: bool = True):
+        super().__init__(
+            name=name,
+            description="Look up a value",
+            parameters={"type": "object", "properties": {}},
+        )
+        self.cacheable = cacheable
+        self.runs = 0
+
+    def is_cacheable(self, parameters):
+        return self.cacheable and parameters.get("operation") != "write"
+
+    async def run(self, parameters, context=None):
+        self.runs += 1
+        if parameters.get("fail"):
+            return {"error": "failed"}
+        return {"value": parameters.get("key"), "run": self.runs}
+
+
+def make_tool_call(name: str, arguments: dict):
+    """Build an OpenAI-style tool call."""
+    return {
+        "id": "call_0",
+        "function": {"name": name, "arguments": json.dumps(arguments)},
+    }
+
+
+class TestToolResultCache:
+    """Test cases for ToolResultCache and its backends."""
+
+    def test_key_is_canonical(self):
+        """Argument order and formatting do not change the key."""
+        first = ToolResultCache.make_key("search", {"q": "x", "limit": 5})
+        second = ToolResultCache.make_key("search", {"limit": 5, "q": "x"})
+
+        assert first == second
+        assert first != ToolResultCache.make_key("other", {"q": "x", "limit": 5})
+
+    @pytest.mark.asyncio
+    async def test_per_tool_lru_limit(self):
+        """Each tool keeps at most its own number of entries."""
+        cache = ToolResultCache(max_entries=10)
+        tool = CountingTool()
+        tool.cache_max_entries = 2
+
+        for key in ["a", "b"]:
+            await cache.set(tool, {"key": key}, key)
+        await cache.get(tool, {"key": "a"})  # "a" becomes most recently used
+        await cache.set(tool, {"key": "c"}, "c")
+
+        assert (await cache.get(tool, {"key": "a"}))[0]
+        assert not (await cache.get(tool, {"key": "b"}))[0]
+        assert (await cache.get(tool, {"key": "c"}))[0]
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        """Entries are not returned after their TTL."""
+        backend = InMemoryCacheBackend()
+
+        await backend.set("tool", "key", "value", ttl=0.01)
+        await asyncio.sleep(0.02)
+
+        assert await backend.get("tool", "key") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_disk_backend_persists(self, tmp_path):
+        """The disk backend keeps entries across instances."""
+        path = str(tmp_path / "cache" / "tools.db")
+        backend = DiskCacheBackend(path)
+        await backend.set("tool", "key", {"value": [1, 2]}, ttl=60)
+        await backend.set("tool", "old", "x", ttl=-1)
+        backend.close()
+
+        reopened = DiskCacheBackend(path)
+        assert await reopened.get("tool", "key") == (True, {"value": [1, 2]})
+        assert await reopened.get("tool", "old") == (False, None)
+
+        await reopened.set("tool", "a", 1, max_entries=2)
+        await reopened.set("tool", "b", 2, max_entries=2)
+        assert await reopened.get("tool", "key") == (False, None)
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_direct_runs_use_the_result_cache(self):
+        """Calling run() directly goes through the tool's result cache."""
+        tool = CountingTool()
+        tool.result_cache = ToolResultCache()
+
+        first = await tool.run({"key": "x"})
+        second = await tool.run({"key": "x"})
+        await tool.run({"operation": "write"})
+        third = await tool.run({"key": "x"})
+
+        assert first == second == {"value": "x", "run": 1}
+        assert third["run"] == 3
+        assert tool.result_cache.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_super_runs_are_looked_up_once(self):
+        """A run() that calls its parent's run() is only cached once."""
+
+        class DerivedTool(CountingTool):
+            async def run(self, parameters, context=None):
+                return await super().run(parameters, context)
+
+        tool = DerivedTool()
+        tool.result_cache = ToolResultCache()
+
+        await tool.run({"key": "x"})
+        await tool.run({"key": "x"})
+
+        assert tool.runs == 1
+        assert tool.result_cache.stats["misses"] == 1
+
+
+class TestAgentToolCache:
+    """Test cases for tool caching in the Agent."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.llm = BaseLLM()
+        self.llm.generate = AsyncMock(return_value=LLMResponse(content="done"))
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_are_served_from_cache(self):
+        """Identical calls across agents run the tool only once."""
+        cache = ToolResultCache()
+        tool = CountingTool()
+        monitor = AsyncMock()
+        first = Agent(name="a", llm=self.llm, tools=[tool], tool_cache=cache)
+        second = Agent(
+            name="b", llm=self.llm, tools=[tool], tool_cache=cache, monitor=monitor
+        )
+        call = make_tool_call("lookup", {"key": "x"})
+
+        result_a = await first._execute_tool_call(dict(call), {})
+        result_b = await second._execute_tool_call(dict(call), {})
+
+        assert result_a == result_b == {"value": "x", "run": 1}
+        assert tool.runs == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        metadata = monitor.track_tool_usage.call_args.kwargs["metadata"]
+        assert metadata["cache_hit"] is True
+        assert metadata["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_tools_always_run(self):
+        """Tools that do not declare themselves cacheable are never cached."""
+        cache = ToolResultCache()
+        tool = CountingTool(cacheable=False)
+        agent = Agent(name="a", llm=self.llm, tools=[tool], tool_cache=cache)
+        call = make_tool_call("lookup", {"key": "x"})
+
+        await agent._execute_tool_call(dict(call), {})
+        await agent._execute_tool_call(dict(call), {})
+
+        assert tool.runs == 2
+        assert cache.stats["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Error results are retried on the next call."""
+        tool = CountingTool()
+        agent = Agent(
+            name="a", llm=self.llm, tools=[tool], tool_cache=ToolResultCache()
+        )
+        call = make_tool_call("lookup", {"key": "x", "fail": True})
+
+        await agent._execute_tool_call(dict(call), {})
+        await agent._execute_tool_call(dict(call), {})
+
+        assert tool.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_reads(self):
+        """A non-cacheable call to a cacheable tool clears its entries."""
+        tool = CountingTool()
+        agent = Agent(
+            name="a", llm=self.llm, tools=[tool], tool_cache=ToolResultCache()
+        )
+        read = make_tool_call("lookup", {"key": "x"})
+
+        await agent._execute_tool_call(dict(read), {})
+        await agent._execute_tool_call(
+            make_tool_call("lookup", {"operation": "write"}), {}
+        )
+        result = await agent._execute_tool_call(dict(read), {})
+
+        assert result["run"] == 3
+
+    def test_pgvector_read_operations_exist(self):
+        """PGVector only caches operations it implements."""
+        from agents_hub.vector_stores.pgvector import PGVector
+
+        assert set(PGVector.read_operations) == {
+            "search",
+            "list_collections",
+            "get_document",
+            "count_documents",
+        }
+        for operation in PGVector.operations:
+            assert callable(getattr(PGVector, f"_{operation}", None)), operation